@@ -383,20 +383,20 @@ def analyze_user_build_from_token(characters: Optional[List[Dict]] = None) -> Op
         characters: 캐릭터 목록 (이미 가져온 경우). None이면 새로 가져옴.
     """
 
-    from poe_oauth import load_token, get_user_characters
+    from poe_api_client import get_poe_api_client, PoeAuthError
 
-    # 토큰 로드
-    token = load_token()
-    if not token:
-        print("[ERROR] No OAuth token found. Please authenticate first.")
+    # 토큰 로드 (만료 임박 시 자동 갱신)
+    client = get_poe_api_client()
+    try:
+        access_token = client.access_token()
+    except PoeAuthError as e:
+        print(f"[ERROR] {e}")
         return None
 
-    access_token = token.get('access_token')
-
-    # 캐릭터 목록 가져오기 (이미 있으면 재사용, Rate Limit 방지)
+    # 캐릭터 목록 가져오기 (이미 있으면 재사용, 공용 클라이언트 캐시로 Rate Limit 방지)
     if characters is None:
         try:
-            characters_data = get_user_characters(access_token)
+            characters_data = client.get_characters()
             characters = characters_data.get('characters', [])
         except Exception as e:
             print(f"[ERROR] Failed to get characters: {e}")
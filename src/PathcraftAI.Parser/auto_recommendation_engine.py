@@ -22,6 +22,9 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import argparse
 
+from build_catalog import get_build_catalog, build_matches_class, build_cost
+from ladder_aggregate import meta_builds, similar_builds
+
 # UTF-8 설정
 if sys.platform == 'win32':
     if sys.stdout.encoding != 'utf-8':
@@ -52,67 +55,16 @@ def apply_build_filters(
     """
     filtered_recommendations = []
 
-    # 클래스 → 어센던시 매핑
-    CLASS_ASCENDANCIES = {
-        "witch": ["occultist", "necromancer", "elementalist"],
-        "shadow": ["assassin", "saboteur", "trickster"],
-        "ranger": ["deadeye", "raider", "pathfinder"],
-        "duelist": ["slayer", "gladiator", "champion"],
-        "marauder": ["juggernaut", "berserker", "chieftain"],
-        "templar": ["inquisitor", "hierophant", "guardian"],
-        "scion": ["ascendant"]
-    }
-
     for category in recommendations:
         builds = category.get("builds", [])
 
-        # 클래스 필터
+        # 클래스 필터 (class/ascendancy/title/build_keyword에서 클래스 또는 어센던시 이름)
         if char_class:
-            class_lower = char_class.lower()
-            # 어센던시 목록 생성
-            ascendancies = CLASS_ASCENDANCIES.get(class_lower, [class_lower])
-
-            filtered_builds = []
-            for b in builds:
-                # 기존 필드 체크
-                match = (
-                    class_lower in (b.get("class", "") or "").lower()
-                    or class_lower in (b.get("ascendancy", "") or "").lower()
-                    or class_lower in (b.get("ascendancy_class", "") or "").lower()
-                )
-
-                # title에서 클래스/어센던시 찾기
-                title = (b.get("title", "") or "").lower()
-                if not match:
-                    for asc in ascendancies:
-                        if asc in title:
-                            match = True
-                            break
+            builds = [b for b in builds if build_matches_class(b, char_class)]
 
-                # build_keyword에서도 찾기
-                keyword = (b.get("build_keyword", "") or "").lower()
-                if not match and keyword:
-                    for asc in ascendancies:
-                        if asc in keyword:
-                            match = True
-                            break
-
-                if match:
-                    filtered_builds.append(b)
-
-            builds = filtered_builds
-
-        # 예산 필터 (estimated_cost 또는 budget 필드)
+        # 예산 필터 (estimated_cost 또는 budget 필드, 가격 정보 없으면 포함)
         if budget:
-            filtered_builds = []
-            for b in builds:
-                cost = b.get("estimated_cost") or b.get("budget") or b.get("price")
-                if cost is None:
-                    # 가격 정보 없으면 포함 (기본적으로)
-                    filtered_builds.append(b)
-                elif cost <= budget:
-                    filtered_builds.append(b)
-            builds = filtered_builds
+            builds = [b for b in builds if build_cost(b) is None or build_cost(b) <= budget]
 
         # 정렬
         if sort_order == "views":
@@ -202,48 +154,16 @@ def load_user_characters_from_oauth() -> Optional[List[Dict]]:
         캐릭터 목록 또는 None
     """
     try:
-        from poe_oauth import load_token, save_token, get_user_characters, refresh_access_token
-
-        # 토큰 로드
-        token_data = load_token()
-        if not token_data:
-            print("[WARNING] No OAuth token found. Please authenticate first.", file=sys.stderr)
-            return None
+        from poe_api_client import get_poe_api_client, PoeAuthError
 
-        # 토큰 만료 확인 및 자동 갱신
-        if 'expires_at' in token_data:
-            expires_at = datetime.fromisoformat(token_data['expires_at'])
-            now = datetime.now()
-
-            # 토큰이 만료되었거나 1시간 이내에 만료될 경우 갱신
-            if now >= expires_at or (expires_at - now).total_seconds() < 3600:
-                print(f"[INFO] Access token expired or expiring soon, refreshing...", file=sys.stderr)
-
-                try:
-                    # CLIENT_ID는 환경변수 또는 기본값 사용
-                    client_id = os.environ.get('POE_CLIENT_ID', 'pathcraftai')
-                    refresh_token = token_data.get('refresh_token')
-
-                    if not refresh_token:
-                        print("[WARNING] No refresh token found. Please re-authenticate.", file=sys.stderr)
-                        return None
-
-                    # 토큰 갱신
-                    new_token_data = refresh_access_token(client_id, refresh_token)
-                    save_token(new_token_data)
-                    token_data = new_token_data
-
-                except Exception as refresh_error:
-                    print(f"[WARNING] Failed to refresh token: {refresh_error}", file=sys.stderr)
-                    print("[INFO] Please re-authenticate using 'Connect POE Account' button", file=sys.stderr)
-                    return None
-
-        access_token = token_data.get('access_token')
-        if not access_token:
+        # 공용 클라이언트가 토큰 만료 1시간 전 자동 갱신, 응답은 짧게 캐시 (비교/업그레이드 단계와 공유)
+        try:
+            characters_data = get_poe_api_client().get_characters()
+        except PoeAuthError as auth_error:
+            print(f"[WARNING] {auth_error}", file=sys.stderr)
+            print("[INFO] Please re-authenticate using 'Connect POE Account' button", file=sys.stderr)
             return None
 
-        # 캐릭터 가져오기
-        characters_data = get_user_characters(access_token)
         characters = characters_data.get('characters', [])
 
         if not characters:
@@ -364,7 +284,9 @@ def get_auto_recommendations(
 
     # 4-1. 인기 빌드 (poe.ninja 기반)
     print("[PHASE 1/4] Loading popular builds from poe.ninja...", file=sys.stderr)
-    popular_builds = get_popular_builds(league, limit=5)
+    popular_builds = get_popular_builds(
+        league, limit=5, char_class=char_class, budget=budget, sort_order=sort_order
+    )
     if popular_builds:
         recommendations.append({
             "category": "popular",
@@ -379,7 +301,9 @@ def get_auto_recommendations(
     # 4-2. 스트리머 빌드
     if include_streamers:
         print("[PHASE 2/4] Loading streamer builds...", file=sys.stderr)
-        streamer_builds = get_streamer_builds_cached(league, limit=5)
+        streamer_builds = get_streamer_builds_cached(
+            league, limit=5, char_class=char_class, budget=budget
+        )
         if streamer_builds:
             recommendations.append({
                 "category": "streamer",
@@ -391,38 +315,38 @@ def get_auto_recommendations(
             print(f"[OK] Found {len(streamer_builds)} streamer builds", file=sys.stderr)
         print(file=sys.stderr)
 
-    # 4-3. 메타 빌드 (현재 시즌 강력한 빌드들) - DISABLED (래더 데이터 로딩 너무 느림)
-    # print("[PHASE 3/4] Loading meta builds...", file=sys.stderr)
-    # meta_builds = get_meta_builds(league, league_phase, limit=5)
-    # if meta_builds:
-    #     recommendations.append({
-    #         "category": "meta",
-    #         "title": "💎 Current Meta Builds",
-    #         "subtitle": f"Strongest builds for {league_phase} league",
-    #         "builds": meta_builds,
-    #         "count": len(meta_builds)
-    #     })
-    #     print(f"[OK] Found {len(meta_builds)} meta builds", file=sys.stderr)
+    # 4-3. 메타 빌드 (현재 시즌 강력한 빌드들, 래더 요약)
+    print("[PHASE 3/4] Loading meta builds...", file=sys.stderr)
+    meta = get_meta_builds(league, league_phase, limit=5)
+    if meta:
+        recommendations.append({
+            "category": "meta",
+            "title": "💎 Current Meta Builds",
+            "subtitle": f"Strongest builds for {league_phase} league",
+            "builds": meta,
+            "count": len(meta)
+        })
+        print(f"[OK] Found {len(meta)} meta builds", file=sys.stderr)
     print(file=sys.stderr)
 
-    # 4-3.5. 사용자 캐릭터 기반 추천 (OAuth 연동 시) - DISABLED (래더 데이터 사용)
-    # if user_context.get('has_characters') and user_context.get('main_class'):
-    #     print("[PHASE 3.5/4] Loading personalized builds based on your main character...", file=sys.stderr)
-    #     personalized_builds = get_similar_class_builds(
-    #         league,
-    #         user_context['main_class'],
-    #         limit=5
-    #     )
-    #     if personalized_builds:
-    #         recommendations.insert(0, {
-    #             "category": "personalized",
-    #             "title": f"🎯 Recommended for Your {user_context['main_class']}",
-    #             "subtitle": f"Based on your Lv{user_context.get('main_level', '?')} {user_context['main_class']}",
-    #             "builds": personalized_builds,
-    #             "count": len(personalized_builds)
-    #         })
-    #         print(f"[OK] Found {len(personalized_builds)} personalized builds", file=sys.stderr)
-    #     print(file=sys.stderr)
+    # 4-3.5. 사용자 캐릭터 기반 추천 (OAuth 연동 시)
+    if user_context.get('has_characters') and user_context.get('main_class'):
+        print("[PHASE 3.5/4] Loading personalized builds based on your main character...", file=sys.stderr)
+        personalized_builds = get_similar_class_builds(
+            league,
+            user_context['main_class'],
+            limit=5
+        )
+        if personalized_builds:
+            recommendations.insert(0, {
+                "category": "personalized",
+                "title": f"🎯 Recommended for Your {user_context['main_class']}",
+                "subtitle": f"Based on your Lv{user_context.get('main_level', '?')} {user_context['main_class']}",
+                "builds": personalized_builds,
+                "count": len(personalized_builds)
+            })
+            print(f"[OK] Found {len(personalized_builds)} personalized builds", file=sys.stderr)
+        print(file=sys.stderr)
 
     # 4-4. 리그 시작 전이라면 pre-season 빌드
     if league_phase == "pre_season":
@@ -441,7 +365,7 @@ def get_auto_recommendations(
     print(file=sys.stderr)
     print("=" * 80, file=sys.stderr)
 
-    # 필터 적용
+    # 필터 적용 (카탈로그 카테고리는 조회 시 이미 적용됨 - 나머지 카테고리용, 같은 규칙)
     if char_class or budget or sort_order != "views":
         print(f"[FILTER] Applying filters: class={char_class}, budget={budget}, sort={sort_order}", file=sys.stderr)
         recommendations = apply_build_filters(
@@ -950,7 +874,7 @@ def filter_builds_by_streamer(streamer_name: str, league: str, limit: int = 10)
         print(f"[INFO] Searching YouTube for streamer: {channel_name}", file=sys.stderr)
 
         try:
-            from youtube_build_collector import search_youtube_builds
+            from youtube_build_collector import search_youtube_builds, extract_pob_links
 
             # 리그 버전 추출 (Keepers -> 3.27)
             league_version = "3.27"  # 기본값
@@ -959,14 +883,11 @@ def filter_builds_by_streamer(streamer_name: str, league: str, limit: int = 10)
 
             # YouTube에서 해당 채널의 빌드 검색
             # POB 링크 없어도 결과 반환하도록 수정
-            from googleapiclient.discovery import build as youtube_build
-            import os
+            from youtube_client import get_youtube_client
 
-            api_key = os.environ.get('YOUTUBE_API_KEY')
-            if api_key:
+            youtube = get_youtube_client()
+            if youtube.available:
                 try:
-                    youtube = youtube_build('youtube', 'v3', developerKey=api_key)
-
                     # 채널명으로 직접 검색
                     # 한국어 채널인지 확인
                     is_korean = any(ord(c) >= 0xAC00 and ord(c) <= 0xD7A3 for c in channel_name)
@@ -987,35 +908,30 @@ def filter_builds_by_streamer(streamer_name: str, league: str, limit: int = 10)
                     days_back = 180 if is_korean else 60
                     published_after = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%dT00:00:00Z')
 
-                    search_response = youtube.search().list(
-                        q=search_query,
-                        part='id,snippet',
-                        maxResults=limit * 2,  # 필터링 후 줄어들 수 있어서 더 많이 검색
+                    search_items = youtube.search(
+                        search_query,
+                        max_results=limit * 2,  # 필터링 후 줄어들 수 있어서 더 많이 검색
                         type='video',
                         order='date',  # 최신순으로 정렬
                         publishedAfter=published_after,  # 최근 2개월 영상만
                         relevanceLanguage=relevance_lang
-                    ).execute()
+                    )
+
+                    # 비디오 상세 정보 (검색 결과 전체를 한 번에 조회)
+                    videos = youtube.video_details([item['id']['videoId'] for item in search_items])
 
-                    for item in search_response.get('items', []):
+                    for item in search_items:
                         video_id = item['id']['videoId']
                         snippet = item['snippet']
 
-                        # 비디오 상세 정보 가져오기
-                        video_response = youtube.videos().list(
-                            part='snippet,statistics',
-                            id=video_id
-                        ).execute()
-
-                        if not video_response.get('items'):
+                        video_data = videos.get(video_id)
+                        if not video_data:
                             continue
 
-                        video_data = video_response['items'][0]
                         description = video_data['snippet']['description']
                         statistics = video_data['statistics']
 
                         # POB 링크 추출 (없어도 OK)
-                        from youtube_build_collector import extract_pob_links
                         pob_links = extract_pob_links(description)
 
                         # 썸네일 URL 추출
@@ -1215,14 +1131,7 @@ def filter_builds_by_streamer(streamer_name: str, league: str, limit: int = 10)
 
     # 6. 기존 캐시 검색 (fallback)
     if not filtered:
-        streamer_builds = get_streamer_builds_cached(league, limit=50)
-        for build in streamer_builds:
-            streamer = build.get('streamer_name', '').lower()
-            channel = build.get('channel', '').lower()
-            if search_term in streamer or search_term in channel:
-                filtered.append(build)
-                if len(filtered) >= limit:
-                    break
+        filtered = get_build_catalog().search_streamer(league, search_term, limit=limit)
 
     return filtered
 
@@ -1267,7 +1176,20 @@ def find_similar_builds_to_pob(pob_url: str, league: str, limit: int = 10) -> Li
 
         print(f"[INFO] Reference: {ref_class} / {ref_ascendancy} / {ref_main_skill}", file=sys.stderr)
 
-        # 유사 빌드 검색 (인기 빌드 + 스트리머 빌드에서 검색)
+        # 래더/스트리머 빌드 전체에서 가중 Jaccard 유사도 검색 (MinHash/LSH 인덱스, numpy 필요)
+        from build_similarity_index import get_similarity_index, pob_xml_features
+        index = get_similarity_index()
+        if index is not None and index.size:
+            results = index.query(pob_xml_features(pob_xml), league=league, limit=limit)
+            print(f"[OK] Searched {index.size} indexed builds", file=sys.stderr)
+            if results:
+                for build in results:
+                    build['similarity_score'] = build['similarity']
+                    build.setdefault('source', 'ladder')
+                return results
+            print(f"[INFO] No indexed builds for league {league}, scoring popular/streamer builds", file=sys.stderr)
+
+        # 인덱스가 없거나 해당 리그 결과가 없으면 인기 빌드 + 스트리머 빌드에서 점수 계산
         all_builds = []
         all_builds.extend(get_popular_builds(league, limit=50))
         all_builds.extend(get_streamer_builds_cached(league, limit=50))
@@ -1334,22 +1256,24 @@ def analyze_user_context(characters: Optional[List[Dict]]) -> Dict:
     }
 
 
-def get_popular_builds(league: str, limit: int = 5) -> List[Dict]:
+def get_popular_builds(
+    league: str,
+    limit: int = 5,
+    char_class: Optional[str] = None,
+    budget: Optional[int] = None,
+    sort_order: str = "views"
+) -> List[Dict]:
     """
     POE.Ninja + YouTube 빌드 데이터베이스에서 인기 빌드 가져오기
 
+    빌드 카탈로그에서 필터/정렬을 적용해 조회한다 (popular_builds_{league}.json 색인).
+
     Returns:
         YouTube 빌드 목록 (POE.Ninja 데이터 기반 키워드)
     """
+    catalog = get_build_catalog()
 
-    # POE.Ninja + YouTube 통합 빌드 데이터베이스 로드
-    build_data_file = os.path.join(
-        os.path.dirname(__file__),
-        "build_data",
-        f"popular_builds_{league}.json"
-    )
-
-    if not os.path.exists(build_data_file):
+    if not catalog.has_source(league, "popular"):
         # Mock 데이터 반환 (테스트용)
         return [
             {
@@ -1368,22 +1292,17 @@ def get_popular_builds(league: str, limit: int = 5) -> List[Dict]:
             }
         ][:limit]
 
-    with open(build_data_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    # YouTube 빌드 가져오기
-    youtube_builds = data.get('youtube_builds', [])
-
-    # views 기준으로 정렬 (인기도)
-    builds_sorted = sorted(
-        youtube_builds,
-        key=lambda b: b.get('views', 0),
-        reverse=True
+    youtube_builds = catalog.query(
+        league, "popular",
+        char_class=char_class,
+        budget=budget,
+        order_by=sort_order,
+        limit=limit
     )
 
     # 빌드 정보 포맷 정리
     formatted_builds = []
-    for build in builds_sorted[:limit]:
+    for build in youtube_builds:
         formatted_builds.append({
             "title": build.get('title', 'Unknown Build'),
             "channel": build.get('channel', 'Unknown Channel'),
@@ -1428,53 +1347,30 @@ def load_korean_translations() -> Dict:
     return {}
 
 
-def get_streamer_builds_cached(league: str, limit: int = 5) -> List[Dict]:
-    """캐시된 스트리머 빌드 로드"""
-
-    streamer_index = os.path.join(
-        os.path.dirname(__file__),
-        "build_data",
-        "streamer_builds",
-        f"index_{league}.json"
+def get_streamer_builds_cached(
+    league: str,
+    limit: int = 5,
+    char_class: Optional[str] = None,
+    budget: Optional[int] = None
+) -> List[Dict]:
+    """캐시된 스트리머 빌드 로드 (스트리머별 가장 높은 레벨의 빌드, 빌드 카탈로그 조회)"""
+    return get_build_catalog().query(
+        league, "streamer",
+        char_class=char_class,
+        budget=budget,
+        order_by="level",
+        limit=limit,
+        top_only=True
     )
 
-    if not os.path.exists(streamer_index):
-        return []
-
-    with open(streamer_index, 'r', encoding='utf-8') as f:
-        index = json.load(f)
-
-    # 각 스트리머의 대표 빌드 하나씩 가져오기
-    all_builds = []
-
-    for streamer_name, info in index.get('streamers', {}).items():
-        if not info['characters']:
-            continue
-
-        # 스트리머별 빌드 파일 로드
-        streamer_file = os.path.join(
-            os.path.dirname(__file__),
-            "build_data",
-            "streamer_builds",
-            f"{streamer_name.replace(' ', '_')}_{league}.json"
-        )
-
-        if os.path.exists(streamer_file):
-            with open(streamer_file, 'r', encoding='utf-8') as f:
-                builds = json.load(f)
-                if builds:
-                    # 가장 높은 레벨의 빌드
-                    top_build = max(builds, key=lambda b: b.get('level', 0))
-                    top_build['streamer_name'] = streamer_name
-                    all_builds.append(top_build)
-
-    return all_builds[:limit]
-
 
 def get_meta_builds(league: str, league_phase: str, limit: int = 5) -> List[Dict]:
-    """현재 메타 빌드 가져오기"""
+    """현재 메타 빌드 가져오기 (래더 요약의 인기 어센던시 순)"""
+
+    builds = meta_builds(league, limit=limit)
+    if builds is not None:
+        return builds
 
-    # ladder cache에서 상위 랭커들의 빌드 가져오기
     ladder_cache_dir = os.path.join(
         os.path.dirname(__file__),
         "build_data",
@@ -1500,32 +1396,7 @@ def get_meta_builds(league: str, league_phase: str, limit: int = 5) -> List[Dict
             }
         ][:limit]
 
-    # 최신 캐시 파일 찾기
-    cache_files = [
-        f for f in os.listdir(ladder_cache_dir)
-        if f.endswith('.json') and league.lower() in f.lower()
-    ]
-
-    if not cache_files:
-        return []
-
-    # 가장 최근 파일
-    latest_cache = max(
-        cache_files,
-        key=lambda f: os.path.getmtime(os.path.join(ladder_cache_dir, f))
-    )
-
-    cache_file = os.path.join(ladder_cache_dir, latest_cache)
-
-    with open(cache_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    builds = data.get('builds', [])
-
-    # 랭크 순 정렬
-    builds_sorted = sorted(builds, key=lambda b: b.get('rank', 9999))
-
-    return builds_sorted[:limit]
+    return []
 
 
 def get_preseason_practice_builds(league: str, limit: int = 5) -> List[Dict]:
@@ -1577,7 +1448,14 @@ def get_similar_class_builds(league: str, user_class: str, limit: int = 5) -> Li
         유사한 클래스의 인기 빌드 목록
     """
 
-    # ladder cache에서 같은 클래스 빌드 찾기
+    # 래더 요약에서 같은 어센던시의 상위 캐릭터
+    builds = similar_builds(league, user_class, limit=limit)
+    if builds is not None:
+        # personalized 플래그 추가
+        for build in builds:
+            build['personalized'] = True
+        return builds
+
     ladder_cache_dir = os.path.join(
         os.path.dirname(__file__),
         "build_data",
@@ -1605,42 +1483,7 @@ def get_similar_class_builds(league: str, user_class: str, limit: int = 5) -> Li
             }
         ][:limit]
 
-    # 최신 캐시 파일 찾기
-    cache_files = [
-        f for f in os.listdir(ladder_cache_dir)
-        if f.endswith('.json') and league.lower() in f.lower()
-    ]
-
-    if not cache_files:
-        return []
-
-    # 가장 최근 파일
-    latest_cache = max(
-        cache_files,
-        key=lambda f: os.path.getmtime(os.path.join(ladder_cache_dir, f))
-    )
-
-    cache_file = os.path.join(ladder_cache_dir, latest_cache)
-
-    with open(cache_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    builds = data.get('builds', [])
-
-    # 같은 ascendancy class 필터링
-    similar_builds = [
-        b for b in builds
-        if b.get('ascendancy_class', '').lower() == user_class.lower()
-    ]
-
-    # 랭크 순 정렬
-    similar_builds_sorted = sorted(similar_builds, key=lambda b: b.get('rank', 9999))
-
-    # personalized 플래그 추가
-    for build in similar_builds_sorted:
-        build['personalized'] = True
-
-    return similar_builds_sorted[:limit]
+    return []
 
 
 if __name__ == "__main__":
@@ -5,11 +5,24 @@ Awakened POE Trade의 한국어 데이터에서 번역 매핑 추출
 
 이 스크립트는 tools/awakened-poe-trade/renderer/public/data/ko/ 디렉토리의
 ndjson 파일들을 파싱하여 영어-한국어 번역 매핑을 생성합니다.
+
+update_awakened_translations()는 ndjson을 한 줄씩 읽어 네임스페이스별 샤드
+(data/awakened/<NAMESPACE>.json)로 나누고, 원본 해시가 바뀐 샤드만 다시 씁니다.
+원본이 바뀌었을 때만 awakened_translations.json을 ndjson 줄 순서대로 키별 병합해 스트리밍으로 다시 기록합니다.
 """
 
 import os
 import json
-from typing import Dict, List, Any
+import hashlib
+import shutil
+import sqlite3
+import tempfile
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+SHARD_DIR_NAME = "awakened"
+STATS_SHARD = "STATS"
+COMBINED_SECTIONS = ("items", "items_kr", "stats", "stats_kr")
 
 
 def extract_items_translations(items_path: str) -> Dict[str, Dict]:
@@ -81,44 +94,34 @@ def extract_stats_translations(stats_path: str) -> Dict[str, Dict]:
         print(f"[WARN] 파일을 찾을 수 없음: {stats_path}")
         return translations
 
-    with open(stats_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            if not line.strip():
-                continue
-
-            try:
-                stat = json.loads(line)
-                en_ref = stat.get('ref', '')
-                matchers = stat.get('matchers', [])
-                trade_ids = stat.get('trade', {}).get('ids', {})
+    for en_ref, kr_text, trade_ids in iter_stat_translations(stats_path):
+        translations['stats'][en_ref] = kr_text
+        translations['stats_kr'][kr_text] = en_ref
 
-                if not en_ref or not matchers:
-                    continue
+        # Trade ID와 번역 매핑
+        for id_type, ids in trade_ids.items():
+            for stat_id in ids:
+                translations['stats_trade_ids'][stat_id] = {
+                    'en': en_ref,
+                    'kr': kr_text
+                }
 
-                # 첫 번째 매처에서 한국어 번역 추출
-                kr_text = ''
-                for matcher in matchers:
-                    if 'string' in matcher:
-                        kr_text = matcher['string']
-                        break
-
-                if kr_text:
-                    translations['stats'][en_ref] = kr_text
-                    translations['stats_kr'][kr_text] = en_ref
-
-                    # Trade ID와 번역 매핑
-                    for id_type, ids in trade_ids.items():
-                        for stat_id in ids:
-                            translations['stats_trade_ids'][stat_id] = {
-                                'en': en_ref,
-                                'kr': kr_text
-                            }
+    return translations
 
-            except json.JSONDecodeError as e:
-                print(f"[WARN] JSON 파싱 오류: {e}")
-                continue
 
-    return translations
+def default_awakened_data_dir() -> str:
+    """기본 경로: tools/awakened-poe-trade/renderer/public/data/ko"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(os.path.dirname(script_dir))
+    return os.path.join(
+        project_root,
+        "tools",
+        "awakened-poe-trade",
+        "renderer",
+        "public",
+        "data",
+        "ko"
+    )
 
 
 def extract_all_awakened_translations(awakened_data_dir: str = None) -> Dict:
@@ -133,18 +136,7 @@ def extract_all_awakened_translations(awakened_data_dir: str = None) -> Dict:
         통합된 번역 데이터
     """
     if awakened_data_dir is None:
-        # 기본 경로 설정
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(script_dir))
-        awakened_data_dir = os.path.join(
-            project_root,
-            "tools",
-            "awakened-poe-trade",
-            "renderer",
-            "public",
-            "data",
-            "ko"
-        )
+        awakened_data_dir = default_awakened_data_dir()
 
     print(f"[INFO] Awakened POE Trade 데이터 디렉토리: {awakened_data_dir}")
 
@@ -183,6 +175,257 @@ def extract_all_awakened_translations(awakened_data_dir: str = None) -> Dict:
     return all_translations
 
 
+def file_sha256(path: str) -> Optional[str]:
+    """파일 해시 (청크 단위로 읽음)"""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_item_translations(items_path: str) -> Iterator[Tuple[str, str, str]]:
+    """items.ndjson을 한 줄씩 읽어 (namespace, 영어, 한국어) 반환"""
+    with open(items_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"[WARN] JSON 파싱 오류: {e}")
+                continue
+
+            en_name = item.get('refName', '')
+            kr_name = item.get('name', '')
+            if en_name and kr_name:
+                yield item.get('namespace', 'UNKNOWN'), en_name, kr_name
+
+
+def iter_stat_translations(stats_path: str) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """stats.ndjson을 한 줄씩 읽어 (영어, 한국어, trade ids) 반환"""
+    with open(stats_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                stat = json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"[WARN] JSON 파싱 오류: {e}")
+                continue
+
+            en_ref = stat.get('ref', '')
+            matchers = stat.get('matchers', [])
+            if not en_ref or not matchers:
+                continue
+
+            # 첫 번째 매처에서 한국어 번역 추출
+            kr_text = ''
+            for matcher in matchers:
+                if 'string' in matcher:
+                    kr_text = matcher['string']
+                    break
+
+            if kr_text:
+                yield en_ref, kr_text, stat.get('trade', {}).get('ids', {})
+
+
+def _write_json_atomic(path: str, data: Any):
+    """압축 JSON 저장 (임시 파일 -> 교체)"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def _spill_items_by_namespace(items_path: str, spill_dir: str) -> Dict[str, Tuple[str, str]]:
+    """
+    items.ndjson을 네임스페이스별 임시 ndjson으로 분할 (1회 순회)
+
+    Returns:
+        {namespace: (임시 파일 경로, 내용 해시)}
+    """
+    handles = {}
+    digests = {}
+    try:
+        for namespace, en_name, kr_name in iter_item_translations(items_path):
+            if namespace not in handles:
+                spill_path = os.path.join(spill_dir, f"{namespace}.ndjson")
+                handles[namespace] = open(spill_path, 'w', encoding='utf-8')
+                digests[namespace] = hashlib.sha256()
+            line = json.dumps([en_name, kr_name], ensure_ascii=False) + "\n"
+            handles[namespace].write(line)
+            digests[namespace].update(line.encode('utf-8'))
+    finally:
+        for handle in handles.values():
+            handle.close()
+
+    return {
+        namespace: (os.path.join(spill_dir, f"{namespace}.ndjson"), digests[namespace].hexdigest())
+        for namespace in handles
+    }
+
+
+def _build_item_shard(spill_path: str) -> Dict[str, Dict[str, str]]:
+    """네임스페이스 1개 분량의 items / items_kr 샤드"""
+    shard = {"items": {}, "items_kr": {}}
+    with open(spill_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            en_name, kr_name = json.loads(line)
+            shard['items'][en_name] = kr_name
+            shard['items_kr'][kr_name] = en_name
+    return shard
+
+
+def _write_combined_file(output_file: str, items_path: str, stats_path: str):
+    """
+    awakened_translations.json 스트리밍 기록 (읽는 쪽이 쓰는 items, items_kr, stats, stats_kr만)
+
+    ndjson 줄 순서대로 키별로 병합한다 (같은 키는 처음 나온 위치, 마지막 값 -
+    extract_items_translations / extract_stats_translations와 동일). 병합은 임시 SQLite 파일에서
+    하고 키를 하나씩 기록하므로 메모리 사용량이 번역 수와 무관하다.
+    네임스페이스 구분과 trade ID는 샤드 파일에 남아 있다.
+    """
+    work_dir = tempfile.mkdtemp(prefix="awakened_combined_")
+    conn = sqlite3.connect(os.path.join(work_dir, "combined.db"))
+    try:
+        for table in COMBINED_SECTIONS:
+            conn.execute(f"CREATE TABLE {table} (key TEXT PRIMARY KEY, pos INTEGER, value TEXT)")
+
+        def merge(table: str, pairs: Iterator[Tuple[str, str]]):
+            conn.executemany(
+                f"INSERT INTO {table} VALUES (?, ?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                ((key, pos, value) for pos, (key, value) in enumerate(pairs))
+            )
+
+        if os.path.exists(items_path):
+            merge('items', ((en, kr) for _, en, kr in iter_item_translations(items_path)))
+            merge('items_kr', ((kr, en) for _, en, kr in iter_item_translations(items_path)))
+        if os.path.exists(stats_path):
+            merge('stats', ((en, kr) for en, kr, _ in iter_stat_translations(stats_path)))
+            merge('stats_kr', ((kr, en) for en, kr, _ in iter_stat_translations(stats_path)))
+        conn.commit()
+
+        tmp_path = output_file + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write('{"source":"awakened-poe-trade","version":"latest"')
+            for table in COMBINED_SECTIONS:
+                f.write(f',"{table}":{{')
+                rows = conn.execute(f"SELECT key, value FROM {table} ORDER BY pos")
+                for n, (key, value) in enumerate(rows):
+                    if n:
+                        f.write(',')
+                    f.write(json.dumps(key, ensure_ascii=False))
+                    f.write(':')
+                    f.write(json.dumps(value, ensure_ascii=False))
+                f.write('}')
+            f.write('}')
+        os.replace(tmp_path, output_file)
+    finally:
+        conn.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def update_awakened_translations(
+    awakened_data_dir: str = None,
+    output_dir: str = DATA_DIR,
+    force: bool = False
+) -> Dict[str, Any]:
+    """
+    Awakened POE Trade 번역 증분 갱신
+
+    1. items.ndjson / stats.ndjson 해시가 이전과 같으면 아무것도 하지 않음
+    2. items.ndjson을 한 번 순회하며 네임스페이스별로 분할, 해시가 바뀐 샤드만 재작성
+    3. 변경이 있을 때만 awakened_translations.json을 다시 기록 (줄 순서대로 키별 병합)
+
+    Args:
+        awakened_data_dir: Awakened POE Trade 한국어 데이터 디렉토리
+        output_dir: 출력 디렉토리
+        force: 해시와 관계없이 모든 샤드 재작성
+
+    Returns:
+        {"changed": bool, "rewritten": [namespace, ...], "namespaces": [...]}
+    """
+    if awakened_data_dir is None:
+        awakened_data_dir = default_awakened_data_dir()
+
+    items_path = os.path.join(awakened_data_dir, "items.ndjson")
+    stats_path = os.path.join(awakened_data_dir, "stats.ndjson")
+    shard_dir = os.path.join(output_dir, SHARD_DIR_NAME)
+    manifest_path = os.path.join(shard_dir, "manifest.json")
+    output_file = os.path.join(output_dir, "awakened_translations.json")
+    os.makedirs(shard_dir, exist_ok=True)
+
+    manifest = {}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    items_hash = file_sha256(items_path)
+    stats_hash = file_sha256(stats_path)
+    if items_hash is None and stats_hash is None:
+        print(f"[WARN] 파일을 찾을 수 없음: {awakened_data_dir}")
+        return {"changed": False, "rewritten": [], "namespaces": manifest.get('item_namespaces', [])}
+
+    if (items_hash == manifest.get('items_ndjson')
+            and stats_hash == manifest.get('stats_ndjson')
+            and os.path.exists(output_file)):
+        print("[INFO] Awakened 원본 변경 없음 - 건너뜀")
+        return {"changed": False, "rewritten": [], "namespaces": manifest.get('item_namespaces', [])}
+
+    shard_hashes = manifest.get('shards', {})
+    new_hashes = {}
+    rewritten = []
+
+    # 아이템: 네임스페이스별 분할 후 변경된 샤드만 재작성
+    item_namespaces = []
+    if items_hash is not None:
+        spill_dir = tempfile.mkdtemp(prefix="awakened_")
+        try:
+            spilled = _spill_items_by_namespace(items_path, spill_dir)
+            for namespace, (spill_path, digest) in sorted(spilled.items()):
+                item_namespaces.append(namespace)
+                new_hashes[namespace] = digest
+                shard_path = os.path.join(shard_dir, f"{namespace}.json")
+                if shard_hashes.get(namespace) == digest and os.path.exists(shard_path):
+                    continue
+                _write_json_atomic(shard_path, _build_item_shard(spill_path))
+                rewritten.append(namespace)
+        finally:
+            shutil.rmtree(spill_dir, ignore_errors=True)
+
+    # 스탯: 원본 해시가 바뀐 경우에만 재작성
+    if stats_hash is not None:
+        new_hashes[STATS_SHARD] = stats_hash
+        stats_shard_path = os.path.join(shard_dir, f"{STATS_SHARD}.json")
+        if shard_hashes.get(STATS_SHARD) != stats_hash or not os.path.exists(stats_shard_path):
+            _write_json_atomic(stats_shard_path, extract_stats_translations(stats_path))
+            rewritten.append(STATS_SHARD)
+
+    # 사라진 네임스페이스 샤드 정리
+    for namespace in set(shard_hashes) - set(new_hashes):
+        stale_path = os.path.join(shard_dir, f"{namespace}.json")
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
+        rewritten.append(namespace)
+
+    changed = bool(rewritten) or not os.path.exists(output_file)
+    if changed:
+        _write_combined_file(output_file, items_path, stats_path)
+
+    _write_json_atomic(manifest_path, {
+        'items_ndjson': items_hash,
+        'stats_ndjson': stats_hash,
+        'item_namespaces': item_namespaces,
+        'shards': new_hashes
+    })
+
+    print(f"[OK] 재작성된 샤드: {', '.join(rewritten) if rewritten else '없음'}")
+    return {"changed": changed, "rewritten": rewritten, "namespaces": item_namespaces}
+
+
 def merge_with_existing(new_data: Dict, existing_path: str) -> Dict:
     """
     기존 번역 데이터와 병합
@@ -217,14 +460,26 @@ def main():
                         help='출력 디렉토리')
     parser.add_argument('--merge', type=str,
                         help='기존 번역 파일과 병합')
+    parser.add_argument('--force', action='store_true',
+                        help='원본 해시와 관계없이 모든 샤드 재작성')
 
     args = parser.parse_args()
 
+    # 병합이 없으면 샤드 증분 갱신
+    if not args.merge:
+        result = update_awakened_translations(args.awakened_dir, args.output, force=args.force)
+        print("\n" + "=" * 50)
+        print("[완료] Awakened POE Trade 번역 데이터 갱신")
+        print(f"  변경: {'예' if result['changed'] else '아니오'}")
+        print(f"  네임스페이스: {', '.join(result['namespaces'])}")
+        print("=" * 50)
+        return
+
     # 번역 추출
     translations = extract_all_awakened_translations(args.awakened_dir)
 
-    # 기존 데이터와 병합 (옵션)
-    if args.merge and os.path.exists(args.merge):
+    # 기존 데이터와 병합
+    if os.path.exists(args.merge):
         print(f"\n[INFO] 기존 데이터와 병합: {args.merge}")
         translations = merge_with_existing(translations, args.merge)
 
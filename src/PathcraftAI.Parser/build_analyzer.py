@@ -4,8 +4,11 @@
 Build Analyzer - 수집된 빌드 데이터를 종합 분석하여 LLM 프롬프트 생성
 """
 
+import atexit
 import json
 import os
+import sqlite3
+import sys
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
@@ -157,122 +160,191 @@ def analyze_gear_patterns(builds: List[Dict]) -> Dict[str, Any]:
         'popular_uniques': [{'name': name, 'count': count} for name, count in top_items]
     }
 
-def create_build_analysis_prompt(
-    keyword: str,
-    builds: List[Dict],
-    item_data: Optional[Dict],
-    patch_notes: List[Dict]
-) -> str:
+# ---------------------------------------------------------------------------
+# 프롬프트 컨텍스트 블록
+#
+# 프롬프트는 "안정적인 블록 -> 가변 블록" 순서로 조립한다.
+# 앞부분(지시문, 패치 노트, 커뮤니티 통계)이 요청 간에 바이트 단위로 동일하면
+# OpenAI/Anthropic의 prompt caching이 prefix를 재사용할 수 있다.
+# 날짜, 가격처럼 매번 바뀌는 값은 항상 마지막 블록에만 넣는다.
+# ---------------------------------------------------------------------------
+
+CONTEXT_INDEX_FILE = os.path.join(os.path.dirname(__file__), "build_data", "prompt_context_index.json")
+CONTEXT_INDEX_VERSION = 1
+CONTEXT_INDEX_MAX_KEYWORDS = 256  # 키워드별 집계 최대 개수 (오래 안 쓴 것부터 제거)
+CONTEXT_INDEX_SAVE_EVERY = 16     # 새 키워드 집계 몇 개마다 디스크에 저장 (나머지는 종료 시)
+DEFAULT_PROMPT_TOKEN_BUDGET = 6000
+BLOCK_SEPARATOR = "\n\n---\n\n"
+
+# 모든 빌드를 대상으로 한 집계 키 (키워드와 매칭되는 빌드가 없을 때 사용)
+ALL_BUILDS_KEY = "*"
+
+_context_index_cache: Optional[Dict] = None
+_context_index_unsaved = 0
+_reddit_builds_cache: Optional[List[Dict]] = None
+
+
+def estimate_tokens(text: str) -> int:
     """
-    LLM에게 전달할 종합 분석 프롬프트 생성
+    토큰 수 추정 (tokenizer 의존성 없이)
 
-    Args:
-        keyword: 검색 키워드 (예: "Death's Oath")
-        builds: 수집된 빌드 데이터
-        item_data: poe.ninja 아이템 데이터
-        patch_notes: 최신 패치 노트
+    영문은 약 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 약 1토큰으로 계산
+    """
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return (len(text) - non_ascii) // 4 + non_ascii + 1
 
-    Returns:
-        LLM 프롬프트 (마크다운 형식)
+
+def _make_block(block_id: str, text: str, required: bool = False, heads: Optional[str] = None) -> Dict[str, Any]:
     """
-    # 패턴 분석
-    passive_analysis = analyze_passive_tree_patterns(builds)
-    gem_analysis = analyze_gem_patterns(builds)
-    gear_analysis = analyze_gear_patterns(builds)
+    프롬프트 블록 생성
 
-    # 프롬프트 생성
-    prompt = f"""# Path of Exile Build Analysis Request
+    heads: 제목 블록이면 뒤따르는 블록 ID 접두사 (해당 블록이 하나라도 들어갈 때만 포함)
+    """
+    block = {
+        'id': block_id,
+        'text': text.strip(),
+        'tokens': estimate_tokens(text.strip()),
+        'required': required
+    }
+    if heads:
+        block['heads'] = heads
+    return block
 
-## User Request
-사용자가 요청한 빌드: **{keyword}**
+
+def render_preamble_block() -> str:
+    """고정 지시문 블록 (요청마다 동일 - 캐시 가능한 prefix)"""
+    return """# Path of Exile Build Analysis Request
 
 ## Current League Context
 - **League**: Keepers (3.27 - Keepers of the Flame)
-- **Date**: {datetime.now().strftime('%Y-%m-%d')}
-- **Analysis Date**: {datetime.now().isoformat()}
 
----
+## Analysis Task
 
-## 1. Item Data from poe.ninja
+Using the data sections below, provide a comprehensive build guide for the build named in **User Request**, optimized for the **Keepers (3.27)** league, with the following sections:
 
-"""
+### 1. Build Overview
+- Summary of the build concept
+- Strengths and weaknesses
+- Recommended ascendancy (based on community data)
+- Leveling difficulty and budget requirements
 
-    if item_data:
-        prompt += f"""### {item_data['name']}
-- **Base Type**: {item_data.get('baseType', 'N/A')}
-- **Level Required**: {item_data.get('levelRequired', 'N/A')}
-- **Current Price**: {item_data.get('chaosValue', 0):.1f} chaos / {item_data.get('divineValue', 0):.2f} divine
-- **Listings**: {item_data.get('listingCount', 0)} items available
-- **Price Trend**: {item_data.get('sparkLine', {}).get('totalChange', 0):.1f}% change (7 days)
+### 2. Passive Tree Recommendations
+- Analyze the collected passive tree URLs
+- Identify common keystones and clusters
+- Recommend the most efficient path
+- Highlight any variations based on budget/playstyle
 
-**Explicit Modifiers:**
-"""
-        for mod in item_data.get('explicitModifiers', []):
-            prompt += f"- {mod.get('text', '')}\n"
+### 3. Gem Setup
+- Main skill gem links (6L priority)
+- Essential support gems
+- Utility skills and auras
+- Alternative gem options
 
-        if item_data.get('mutatedModifiers'):
-            prompt += "\n**Foulborn (Mutated) Modifiers:**\n"
-            for mod in item_data['mutatedModifiers']:
-                prompt += f"- {mod.get('text', '')}\n"
-    else:
-        prompt += f"*No item data found for '{keyword}'*\n"
+### 4. Gear Progression
+- League start / budget gear (< 50 chaos total)
+- Mid-tier upgrades (50-200 chaos)
+- End-game BiS items
+- Current market prices from poe.ninja data
+
+### 5. Patch 3.27 Optimization
+- How recent balance changes affect this build
+- Any new mechanics or items to leverage
+- Recommended adjustments for Keepers league
 
-    prompt += f"""
+### 6. Leveling Guide
+- Act 1-10 skill progression
+- When to transition to main skill
+- Key items to look for while leveling
+
+### 7. Common Mistakes to Avoid
+- Based on community feedback and build data
 
----
+Please format the response in clear markdown with bullet points and numbered lists for readability."""
 
-## 2. Community Builds Analysis ({len(builds)} builds collected)
 
-### Ascendancy Distribution
+def render_patch_block(patch: Dict) -> str:
+    """패치 노트 1개 요약 블록"""
+    reaction = patch.get('community_reaction', {})
+    return f"""### {patch.get('patch_id', 'N/A')} - {patch.get('date', 'N/A')}
+- **Title**: {patch.get('title', 'N/A')}
+- **URL**: {patch.get('official_url', 'N/A')}
+- **Community Reaction**: {reaction.get('upvotes', 0)} upvotes, {reaction.get('comments', 0)} comments"""
+
+
+def render_relevant_patches_block(keyword: str, exclude: List[str], limit: int = 3) -> str:
+    """키워드(스킬/아이템)를 언급한 패치 노트 블록 - 패치 노트 전문 검색 인덱스 사용"""
+    from patch_note_index import find_relevant_patch_notes
+
+    # 인덱스가 없거나 깨졌거나 FTS5가 없으면 이 섹션만 생략
+    try:
+        found = find_relevant_patch_notes(keyword, limit=limit + len(exclude))
+    except (sqlite3.Error, OSError) as e:
+        print(f"[WARN] Patch note search failed for '{keyword}': {e}", file=sys.stderr)
+        return ""
+
+    results = [r for r in found if r['patch_id'] not in exclude][:limit]
+    if not results:
+        return ""
+
+    text = f"## Patch Notes Mentioning {keyword}\n"
+    for result in results:
+        text += f"""
+### {result['patch_id']} - {result['date']}
+- **Title**: {result['title']}
+- **URL**: {result['url'] or 'N/A'}
+- **Excerpt**: {result['snippet']}
 """
+    return text
+
+
+def render_community_block(builds: List[Dict]) -> str:
+    """커뮤니티 빌드 통계 블록 (어센던시/젬/유니크 분포)"""
+    passive_analysis = analyze_passive_tree_patterns(builds)
+    gem_analysis = analyze_gem_patterns(builds)
+    gear_analysis = analyze_gear_patterns(builds)
+
+    text = f"## Community Builds Analysis ({len(builds)} builds collected)\n\n### Ascendancy Distribution\n"
     for asc, count in passive_analysis['ascendancy_distribution'].items():
         percentage = (count / passive_analysis['total_builds']) * 100
-        prompt += f"- **{asc}**: {count} builds ({percentage:.1f}%)\n"
+        text += f"- **{asc}**: {count} builds ({percentage:.1f}%)\n"
 
-    prompt += f"""
-### Popular Main Skills
-"""
+    text += "\n### Popular Main Skills\n"
     for skill in gem_analysis['main_skills']:
-        prompt += f"- **{skill['name']}**: {skill['count']} builds\n"
+        text += f"- **{skill['name']}**: {skill['count']} builds\n"
 
-    prompt += f"""
-### Popular Support Gems
-"""
+    text += "\n### Popular Support Gems\n"
     for support in gem_analysis['popular_supports'][:5]:
-        prompt += f"- **{support['name']}**: {support['count']} occurrences\n"
+        text += f"- **{support['name']}**: {support['count']} occurrences\n"
 
-    prompt += f"""
-### Popular Unique Items
-"""
+    text += "\n### Popular Unique Items\n"
     for item in gear_analysis['popular_uniques'][:10]:
-        prompt += f"- **{item['name']}**: {item['count']} builds\n"
+        text += f"- **{item['name']}**: {item['count']} builds\n"
 
-    prompt += f"""
+    return text
 
----
 
-## 3. Passive Tree URLs
+def render_passive_tree_block(builds: List[Dict]) -> str:
+    """패시브 트리 URL 블록"""
+    passive_analysis = analyze_passive_tree_patterns(builds)
 
-"""
+    text = "## Passive Tree URLs\n"
     for i, tree in enumerate(passive_analysis['passive_trees'][:5], 1):
-        prompt += f"""
+        text += f"""
 ### Build {i}: {tree['build_name']} ({tree['ascendancy']})
 **Passive Tree**: [{tree['url'][:80]}...]({tree['url']})
 """
+    return text
 
-    prompt += f"""
-
----
 
-## 4. Detailed Build Examples
-
-"""
+def render_build_examples_block(builds: List[Dict]) -> str:
+    """상세 빌드 예시 블록 (상위 3개)"""
+    text = "## Detailed Build Examples\n"
     for i, build in enumerate(builds[:3], 1):
         meta = build.get('meta', {})
         source = build.get('source', {})
         reddit = source.get('reddit_post', {})
 
-        prompt += f"""
+        text += f"""
 ### Build {i}: {meta.get('build_name', 'Unknown')}
 
 **Reddit Post**: [{reddit.get('title', 'N/A')[:60]}...]({reddit.get('url', '')})
@@ -287,100 +359,365 @@ def create_build_analysis_prompt(
 """
         for stage in build.get('progression_stages', [])[:1]:
             for skill_name, setup in list(stage.get('gem_setups', {}).items())[:3]:
-                prompt += f"- **{skill_name}**: {setup.get('links', 'N/A')}\n"
+                text += f"- **{skill_name}**: {setup.get('links', 'N/A')}\n"
 
-        prompt += f"""
-**Key Gear:**
-"""
+        text += "\n**Key Gear:**\n"
         for stage in build.get('progression_stages', [])[:1]:
             gear = stage.get('gear_recommendation', {})
             for slot, item_info in list(gear.items())[:5]:
                 item_name = item_info.get('name', 'N/A')
                 if item_name and item_name not in ['None', 'Unknown']:
-                    prompt += f"- **{slot}**: {item_name}\n"
+                    text += f"- **{slot}**: {item_name}\n"
 
-    prompt += f"""
+    return text
 
----
 
-## 5. Recent Patch Notes Context
+def render_item_block(keyword: str, item_data: Optional[Dict]) -> str:
+    """poe.ninja 아이템 데이터 블록 (가격 포함 - 가변)"""
+    text = "## Item Data from poe.ninja\n\n"
 
-"""
-    for patch in patch_notes[:3]:
-        prompt += f"""
-### {patch.get('patch_id', 'N/A')} - {patch.get('date', 'N/A')}
-- **Title**: {patch.get('title', 'N/A')}
-- **URL**: {patch.get('official_url', 'N/A')}
-- **Community Reaction**: {patch.get('community_reaction', {}).get('upvotes', 0)} upvotes, {patch.get('community_reaction', {}).get('comments', 0)} comments
+    if not item_data:
+        return text + f"*No item data found for '{keyword}'*\n"
+
+    text += f"""### {item_data['name']}
+- **Base Type**: {item_data.get('baseType', 'N/A')}
+- **Level Required**: {item_data.get('levelRequired', 'N/A')}
+- **Current Price**: {item_data.get('chaosValue', 0):.1f} chaos / {item_data.get('divineValue', 0):.2f} divine
+- **Listings**: {item_data.get('listingCount', 0)} items available
+- **Price Trend**: {item_data.get('sparkLine', {}).get('totalChange', 0):.1f}% change (7 days)
 
+**Explicit Modifiers:**
 """
+    for mod in item_data.get('explicitModifiers', []):
+        text += f"- {mod.get('text', '')}\n"
 
-    prompt += f"""
+    if item_data.get('mutatedModifiers'):
+        text += "\n**Foulborn (Mutated) Modifiers:**\n"
+        for mod in item_data['mutatedModifiers']:
+            text += f"- {mod.get('text', '')}\n"
 
----
+    return text
 
-## Analysis Task
 
-Based on the above data, please provide a comprehensive build guide for **{keyword}** optimized for the **Keepers (3.27)** league with the following sections:
+def render_request_block(keyword: str) -> str:
+    """사용자 요청 블록 (항상 마지막 - 날짜 포함)"""
+    return f"""## User Request
+사용자가 요청한 빌드: **{keyword}**
 
-### 1. Build Overview
-- Summary of the build concept
-- Strengths and weaknesses
-- Recommended ascendancy (based on community data)
-- Leveling difficulty and budget requirements
+- **Analysis Date**: {datetime.now().strftime('%Y-%m-%d')}"""
 
-### 2. Passive Tree Recommendations
-- Analyze the collected passive tree URLs
-- Identify common keystones and clusters
-- Recommend the most efficient path
-- Highlight any variations based on budget/playstyle
 
-### 3. Gem Setup
-- Main skill gem links (6L priority)
-- Essential support gems
-- Utility skills and auras
-- Alternative gem options
+def build_keyword_context(builds: List[Dict]) -> Dict[str, Any]:
+    """빌드 목록으로부터 키워드 컨텍스트 블록(렌더링 완료 텍스트) 생성"""
+    blocks = [
+        _make_block('community', render_community_block(builds)),
+        _make_block('passive_trees', render_passive_tree_block(builds)),
+        _make_block('build_examples', render_build_examples_block(builds)),
+    ]
+    return {
+        'build_count': len(builds),
+        'blocks': blocks
+    }
 
-### 4. Gear Progression
-- League start / budget gear (< 50 chaos total)
-- Mid-tier upgrades (50-200 chaos)
-- End-game BiS items
-- Current market prices from poe.ninja data
 
-### 5. Patch 3.27 Optimization
-- How recent balance changes affect this build
-- Any new mechanics or items to leverage
-- Recommended adjustments for Keepers league
+def pack_prompt_blocks(blocks: List[Dict], token_budget: int = DEFAULT_PROMPT_TOKEN_BUDGET) -> str:
+    """
+    토큰 예산 안에서 프롬프트 블록 조립
 
-### 6. Leveling Guide
-- Act 1-10 skill progression
-- When to transition to main skill
-- Key items to look for while leveling
+    required 블록은 항상 포함하고, 나머지는 순서대로 예산이 남는 만큼만 포함한다.
+    제목 블록(heads)은 딸린 블록이 들어갈 때 그 앞에 함께 넣고, 혼자서는 넣지 않는다.
+    블록 순서는 바꾸지 않으므로 앞쪽 안정 블록의 prefix가 유지된다.
 
-### 7. Common Mistakes to Avoid
-- Based on community feedback and build data
+    Args:
+        blocks: _make_block() 형식의 블록 리스트 (안정 -> 가변 순서)
+        token_budget: 최대 토큰 수 (추정치)
 
-Please format the response in clear markdown with bullet points and numbered lists for readability.
-"""
+    Returns:
+        조립된 프롬프트
+    """
+    separator_tokens = estimate_tokens(BLOCK_SEPARATOR)
+    remaining = token_budget - sum(b['tokens'] + separator_tokens for b in blocks if b['required'])
+
+    selected = []
+    header = None
+    for block in blocks:
+        if block.get('heads'):
+            header = block
+            continue
+        if header and not block['id'].startswith(header['heads']):
+            header = None
 
-    return prompt
+        cost = block['tokens'] + separator_tokens
+        if header:
+            cost += header['tokens'] + separator_tokens
+        if block['required'] or cost <= remaining:
+            if header:
+                selected.append(header)
+                header = None
+            selected.append(block)
+            if not block['required']:
+                remaining -= cost
 
-def generate_build_recommendation(keyword: str = "Death's Oath") -> str:
+    return BLOCK_SEPARATOR.join(b['text'] for b in selected) + "\n"
+
+
+def _assemble_blocks(
+    keyword: str,
+    keyword_context: Dict[str, Any],
+    patch_blocks: List[Dict],
+    item_data: Optional[Dict],
+    relevant_patches: str = ""
+) -> List[Dict]:
+    """블록을 안정 -> 가변 순서로 나열"""
+    blocks = [_make_block('preamble', render_preamble_block(), required=True)]
+
+    if patch_blocks:
+        blocks.append(_make_block('patch_header', "## Recent Patch Notes Context", heads='patch:'))
+        blocks.extend(patch_blocks)
+
+    blocks.extend(keyword_context['blocks'])
+    if relevant_patches:
+        blocks.append(_make_block('relevant_patches', relevant_patches))
+    blocks.append(_make_block('item_data', render_item_block(keyword, item_data)))
+    blocks.append(_make_block('request', render_request_block(keyword), required=True))
+    return blocks
+
+
+def create_build_analysis_prompt(
+    keyword: str,
+    builds: List[Dict],
+    item_data: Optional[Dict],
+    patch_notes: List[Dict],
+    token_budget: int = DEFAULT_PROMPT_TOKEN_BUDGET
+) -> str:
+    """
+    LLM에게 전달할 종합 분석 프롬프트 생성
+
+    Args:
+        keyword: 검색 키워드 (예: "Death's Oath")
+        builds: 수집된 빌드 데이터
+        item_data: poe.ninja 아이템 데이터
+        patch_notes: 최신 패치 노트
+        token_budget: 프롬프트 토큰 예산
+
+    Returns:
+        LLM 프롬프트 (마크다운 형식)
+    """
+    patch_blocks = [
+        _make_block(f"patch:{p.get('patch_id', i)}", render_patch_block(p))
+        for i, p in enumerate(patch_notes[:3])
+    ]
+    blocks = _assemble_blocks(keyword, build_keyword_context(builds), patch_blocks, item_data)
+    return pack_prompt_blocks(blocks, token_budget)
+
+
+# ---------------------------------------------------------------------------
+# 컨텍스트 인덱스 (사전 계산 + 버전 관리)
+# ---------------------------------------------------------------------------
+
+def _file_signature(path: str) -> str:
+    """파일 변경 감지용 시그니처 (mtime + size)"""
+    if not os.path.exists(path):
+        return "missing"
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _context_source_signature() -> str:
+    """인덱스 원본 데이터(Reddit 빌드 인덱스, 패치 인덱스) 시그니처"""
+    return "|".join([
+        _file_signature(os.path.join(REDDIT_BUILDS_DIR, "index.json")),
+        _file_signature(os.path.join(PATCH_NOTES_DIR, "patch_index.json")),
+    ])
+
+
+def _normalize_keyword(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+def _get_reddit_builds() -> List[Dict]:
+    """Reddit 빌드 로드 (프로세스 내 1회)"""
+    global _reddit_builds_cache
+    if _reddit_builds_cache is None:
+        _reddit_builds_cache = load_reddit_builds()
+    return _reddit_builds_cache
+
+
+def _filter_builds_by_keyword(builds: List[Dict], keyword: str) -> List[Dict]:
+    """빌드 이름 또는 Reddit 제목에 키워드가 포함된 빌드"""
+    needle = _normalize_keyword(keyword)
+    matched = []
+    for build in builds:
+        build_name = build.get('meta', {}).get('build_name', '').lower()
+        title = build.get('source', {}).get('reddit_post', {}).get('title', '').lower()
+        if needle in build_name or needle in title:
+            matched.append(build)
+    return matched
+
+
+def _save_context_index(index: Dict):
+    os.makedirs(os.path.dirname(CONTEXT_INDEX_FILE), exist_ok=True)
+    tmp_file = CONTEXT_INDEX_FILE + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False)
+    os.replace(tmp_file, CONTEXT_INDEX_FILE)
+
+
+def flush_context_index():
+    """아직 저장하지 않은 키워드 집계를 디스크에 저장 (종료 시 자동 호출)"""
+    global _context_index_unsaved
+    if _context_index_cache is not None and _context_index_unsaved:
+        _save_context_index(_context_index_cache)
+        _context_index_unsaved = 0
+
+
+atexit.register(flush_context_index)
+
+
+def rebuild_context_index() -> Dict:
+    """
+    컨텍스트 인덱스 재생성
+
+    패치 노트 요약 블록과 전체 빌드 집계 블록을 미리 렌더링한다.
+    키워드별 집계는 처음 요청될 때 추가된다 (get_keyword_context).
+    """
+    global _context_index_cache, _context_index_unsaved, _reddit_builds_cache
+    _reddit_builds_cache = None
+
+    builds = _get_reddit_builds()
+    patch_notes = load_latest_patch_notes(count=3)
+
+    index = {
+        'version': CONTEXT_INDEX_VERSION,
+        'source_signature': _context_source_signature(),
+        'built_at': datetime.now().isoformat(),
+        'patch_blocks': [
+            _make_block(f"patch:{p.get('patch_id', i)}", render_patch_block(p))
+            for i, p in enumerate(patch_notes)
+        ],
+        'keywords': {
+            ALL_BUILDS_KEY: build_keyword_context(builds)
+        }
+    }
+
+    _save_context_index(index)
+    _context_index_cache = index
+    _context_index_unsaved = 0
+    return index
+
+
+def load_context_index() -> Dict:
+    """
+    컨텍스트 인덱스 로드
+
+    메모리 캐시 -> 디스크 순으로 확인하고, 버전이나 원본 시그니처가 다르면 재생성
+    """
+    global _context_index_cache
+    signature = _context_source_signature()
+
+    index = _context_index_cache
+    if index is None and os.path.exists(CONTEXT_INDEX_FILE):
+        try:
+            with open(CONTEXT_INDEX_FILE, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            index = None
+
+    if (index is None
+            or index.get('version') != CONTEXT_INDEX_VERSION
+            or index.get('source_signature') != signature):
+        return rebuild_context_index()
+
+    _context_index_cache = index
+    return index
+
+
+def get_keyword_context(keyword: str, index: Optional[Dict] = None) -> Dict[str, Any]:
+    """
+    키워드별 컨텍스트 블록 조회 (없으면 계산 후 인덱스에 추가)
+
+    키워드와 매칭되는 빌드가 없으면 전체 빌드 집계를 사용.
+    키워드 집계는 최근 사용 순으로 CONTEXT_INDEX_MAX_KEYWORDS개까지만 유지하고,
+    디스크에는 CONTEXT_INDEX_SAVE_EVERY개마다 (그리고 종료 시) 저장한다.
+    """
+    global _context_index_unsaved
+    if index is None:
+        index = load_context_index()
+
+    key = _normalize_keyword(keyword)
+    keywords = index['keywords']
+    if key in keywords:
+        keywords[key] = keywords.pop(key)  # 최근 사용으로 이동
+        return keywords[key]
+
+    matched = _filter_builds_by_keyword(_get_reddit_builds(), keyword)
+    if not matched:
+        return keywords[ALL_BUILDS_KEY]
+
+    keywords[key] = build_keyword_context(matched)
+    for old_key in [k for k in keywords if k != ALL_BUILDS_KEY][:-CONTEXT_INDEX_MAX_KEYWORDS]:
+        del keywords[old_key]
+
+    _context_index_unsaved += 1
+    if _context_index_unsaved >= CONTEXT_INDEX_SAVE_EVERY:
+        _save_context_index(index)
+        _context_index_unsaved = 0
+    return keywords[key]
+
+
+def create_indexed_build_prompt(
+    keyword: str,
+    item_data: Optional[Dict] = None,
+    token_budget: int = DEFAULT_PROMPT_TOKEN_BUDGET
+) -> str:
+    """
+    사전 계산된 컨텍스트 인덱스로 프롬프트 생성
+
+    create_build_analysis_prompt와 같은 블록 구성이지만 빌드/패치 노트를
+    매번 디스크에서 읽고 집계하지 않는다.
+
+    Args:
+        keyword: 검색 키워드
+        item_data: poe.ninja 아이템 데이터 (None이면 조회)
+        token_budget: 프롬프트 토큰 예산
+
+    Returns:
+        LLM 프롬프트 (마크다운 형식)
+    """
+    index = load_context_index()
+    if item_data is None:
+        item_data = load_item_data(keyword)
+
+    patch_blocks = index['patch_blocks'][:3]
+    blocks = _assemble_blocks(
+        keyword,
+        get_keyword_context(keyword, index),
+        patch_blocks,
+        item_data,
+        render_relevant_patches_block(keyword, exclude=[b['id'].split(':', 1)[1] for b in patch_blocks])
+    )
+    return pack_prompt_blocks(blocks, token_budget)
+
+def generate_build_recommendation(
+    keyword: str = "Death's Oath",
+    token_budget: int = DEFAULT_PROMPT_TOKEN_BUDGET
+) -> str:
     """
     빌드 추천 리포트 생성
 
     Args:
         keyword: 검색 키워드
+        token_budget: 프롬프트 토큰 예산
 
     Returns:
         LLM 프롬프트 (마크다운)
     """
     print(f"[INFO] Generating build analysis for: {keyword}")
 
-    # 데이터 로드
-    print("[INFO] Loading Reddit builds...")
-    builds = load_reddit_builds()
-    print(f"[OK] Loaded {len(builds)} builds")
+    # 컨텍스트 인덱스 로드 (원본 변경 시에만 재생성)
+    print("[INFO] Loading context index...")
+    index = load_context_index()
+    print(f"[OK] Context index built at {index['built_at']}")
 
     print(f"[INFO] Loading item data for '{keyword}'...")
     item_data = load_item_data(keyword)
@@ -389,13 +726,10 @@ def generate_build_recommendation(keyword: str = "Death's Oath") -> str:
     else:
         print(f"[WARN] No item data found for '{keyword}'")
 
-    print("[INFO] Loading recent patch notes...")
-    patch_notes = load_latest_patch_notes(count=3)
-    print(f"[OK] Loaded {len(patch_notes)} patch notes")
-
     # 프롬프트 생성
     print("[INFO] Creating analysis prompt...")
-    prompt = create_build_analysis_prompt(keyword, builds, item_data, patch_notes)
+    prompt = create_indexed_build_prompt(keyword, item_data=item_data, token_budget=token_budget)
+    print(f"[OK] Prompt: ~{estimate_tokens(prompt)} tokens (budget {token_budget})")
 
     return prompt
 
@@ -405,11 +739,16 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Build Analyzer')
     parser.add_argument('--keyword', type=str, required=True, help='Build keyword (e.g., "Death\'s Oath")')
     parser.add_argument('--output', type=str, help='Output file for the analysis prompt')
+    parser.add_argument('--token-budget', type=int, default=DEFAULT_PROMPT_TOKEN_BUDGET, help='Prompt token budget')
+    parser.add_argument('--rebuild-index', action='store_true', help='Force rebuild of the context index')
 
     args = parser.parse_args()
 
+    if args.rebuild_index:
+        rebuild_context_index()
+
     # 분석 생성
-    prompt = generate_build_recommendation(keyword=args.keyword)
+    prompt = generate_build_recommendation(keyword=args.keyword, token_budget=args.token_budget)
 
     # 출력
     if args.output:
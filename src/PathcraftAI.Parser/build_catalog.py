@@ -0,0 +1,465 @@
+# -*- coding: utf-8 -*-
+
+"""
+Build Catalog
+추천 엔진용 통합 빌드 카탈로그 (SQLite, build_data/build_catalog.db)
+
+수집기들이 남기는 build_data JSON을 한 테이블로 색인한다:
+    popular   build_data/popular_builds_{league}.json  (youtube_builds)
+    streamer  build_data/streamer_builds/index_{league}.json 에 등록된 스트리머별 파일
+
+래더 캐시는 ladder_aggregate의 리그/어센던시 요약으로 조회한다.
+
+refresh()는 원본 파일의 mtime/크기만 비교해 바뀐 파일만 다시 색인하므로,
+추천 요청은 파일을 매번 읽는 대신 인덱스 조회 몇 번으로 끝난다.
+클래스 필터는 색인 시 추출한 클래스/어센던시 태그(build_tags)로 조회한다.
+
+사용 예:
+    from build_catalog import get_build_catalog
+    catalog = get_build_catalog()
+    builds = catalog.query("Keepers", "popular", char_class="Witch", budget=300, order_by="views")
+"""
+
+import glob
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+BUILD_DATA_DIR = os.path.join(os.path.dirname(__file__), "build_data")
+BUILD_CATALOG_DB = os.path.join(BUILD_DATA_DIR, "build_catalog.db")
+
+# 같은 프로세스에서 연속 조회 시 파일 상태 확인 간격 (초)
+REFRESH_INTERVAL = 5.0
+
+# 클래스 → 어센던시 매핑
+CLASS_ASCENDANCIES = {
+    "witch": ["occultist", "necromancer", "elementalist"],
+    "shadow": ["assassin", "saboteur", "trickster"],
+    "ranger": ["deadeye", "raider", "pathfinder"],
+    "duelist": ["slayer", "gladiator", "champion"],
+    "marauder": ["juggernaut", "berserker", "chieftain"],
+    "templar": ["inquisitor", "hierophant", "guardian"],
+    "scion": ["ascendant"]
+}
+
+KNOWN_CLASS_NAMES = set(CLASS_ASCENDANCIES) | {
+    asc for ascendancies in CLASS_ASCENDANCIES.values() for asc in ascendancies
+}
+
+# 정렬 기준 → ORDER BY 절 (각각 인덱스 사용)
+ORDER_CLAUSES = {
+    "views": "views DESC",
+    "likes": "likes DESC",
+    "date": "published_at DESC",
+    "price": "estimated_cost ASC",
+    "level": "level DESC"
+}
+
+_TEXT_FIELDS = ("class", "ascendancy", "ascendancy_class", "title", "build_keyword")
+
+
+def class_filter_names(char_class: str) -> List[str]:
+    """클래스 필터 이름 목록 (클래스면 본인 + 어센던시, 아니면 입력 그대로)"""
+    class_lower = char_class.lower()
+    if class_lower in CLASS_ASCENDANCIES:
+        return [class_lower] + CLASS_ASCENDANCIES[class_lower]
+    return [class_lower]
+
+
+def build_search_text(build: Dict) -> str:
+    """클래스 필터 대상 텍스트 (class/ascendancy/title/build_keyword, 소문자)"""
+    return "\n".join((build.get(field) or "").lower() for field in _TEXT_FIELDS)
+
+
+def build_class_tags(build: Dict) -> List[str]:
+    """빌드 텍스트에 등장하는 클래스/어센던시 이름"""
+    text = build_search_text(build)
+    return sorted(name for name in KNOWN_CLASS_NAMES if name in text)
+
+
+def build_matches_class(build: Dict, char_class: str) -> bool:
+    """클래스 필터 일치 여부 (카탈로그 조회와 같은 규칙)"""
+    text = build_search_text(build)
+    return any(name in text for name in class_filter_names(char_class))
+
+
+def build_cost(build: Dict) -> Optional[float]:
+    """예산 비교용 가격 (estimated_cost > budget > price)"""
+    return build.get("estimated_cost") or build.get("budget") or build.get("price")
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class BuildCatalog:
+    """build_data 빌드 소스 통합 색인"""
+
+    def __init__(self, db_path: str = BUILD_CATALOG_DB, data_dir: str = BUILD_DATA_DIR):
+        self.db_path = db_path
+        self.data_dir = data_dir
+        self.streamer_dir = os.path.join(data_dir, "streamer_builds")
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                source TEXT,
+                league TEXT,
+                streamer TEXT,
+                mtime_ns INTEGER,
+                size INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS builds (
+                id INTEGER PRIMARY KEY,
+                file TEXT,
+                source TEXT,
+                league TEXT,
+                position INTEGER,
+                streamer TEXT,
+                title TEXT,
+                channel TEXT,
+                char_class TEXT,
+                ascendancy TEXT,
+                keyword TEXT,
+                search_text TEXT,
+                views INTEGER,
+                likes INTEGER,
+                published_at TEXT,
+                estimated_cost REAL,
+                level INTEGER,
+                is_top INTEGER,
+                payload TEXT
+            );
+            CREATE TABLE IF NOT EXISTS build_tags (
+                tag TEXT,
+                build_id INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS idx_builds_file ON builds (file);
+            CREATE INDEX IF NOT EXISTS idx_builds_views ON builds (league, source, views);
+            CREATE INDEX IF NOT EXISTS idx_builds_likes ON builds (league, source, likes);
+            CREATE INDEX IF NOT EXISTS idx_builds_date ON builds (league, source, published_at);
+            CREATE INDEX IF NOT EXISTS idx_builds_cost ON builds (league, source, estimated_cost);
+            CREATE INDEX IF NOT EXISTS idx_builds_class ON builds (league, char_class);
+            CREATE INDEX IF NOT EXISTS idx_builds_keyword ON builds (league, keyword);
+            CREATE INDEX IF NOT EXISTS idx_builds_streamer ON builds (league, streamer);
+            CREATE INDEX IF NOT EXISTS idx_build_tags ON build_tags (tag, build_id);
+            CREATE INDEX IF NOT EXISTS idx_build_tags_build ON build_tags (build_id);
+            """
+        )
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+
+    def _discover(self, known: Dict[str, Tuple]) -> Dict[str, Dict]:
+        """현재 색인 대상 파일 {path: {source, league, streamer}}"""
+        sources = {}
+
+        for path in glob.glob(os.path.join(self.data_dir, "popular_builds_*.json")):
+            league = os.path.basename(path)[len("popular_builds_"):-len(".json")]
+            sources[path] = {"source": "popular", "league": league, "streamer": None}
+
+        # 스트리머: 인덱스 파일이 바뀌었을 때만 다시 읽고, 아니면 기존 목록 사용
+        for index_path in glob.glob(os.path.join(self.streamer_dir, "index_*.json")):
+            league = os.path.basename(index_path)[len("index_"):-len(".json")]
+            sources[index_path] = {"source": "streamer_index", "league": league, "streamer": None}
+
+            known_entry = known.get(index_path)
+            if known_entry and known_entry[3:] == _file_signature(index_path):
+                for path, (source, file_league, streamer, *_) in known.items():
+                    if source == "streamer" and file_league == league:
+                        sources[path] = {"source": "streamer", "league": league, "streamer": streamer}
+                continue
+
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+            except Exception as e:
+                print(f"[WARN] Failed to read {index_path}: {e}", file=sys.stderr)
+                continue
+            for streamer_name, info in index.get("streamers", {}).items():
+                if not info.get("characters"):
+                    continue
+                path = os.path.join(self.streamer_dir, f"{streamer_name.replace(' ', '_')}_{league}.json")
+                sources[path] = {"source": "streamer", "league": league, "streamer": streamer_name}
+
+        return sources
+
+    def _load_builds(self, path: str, source: str, streamer: Optional[str]) -> List[Dict]:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if source == "popular":
+            return data.get("youtube_builds", [])
+        if source == "streamer":
+            builds = data if isinstance(data, list) else []
+            for build in builds:
+                build["streamer_name"] = streamer
+            return builds
+        return []
+
+    def _insert_builds(self, path: str, source: str, league: str, builds: List[Dict]) -> None:
+        top_index = None
+        if source == "streamer" and builds:
+            # 스트리머 대표 빌드 = 가장 높은 레벨
+            top_index = max(range(len(builds)), key=lambda i: builds[i].get("level", 0) or 0)
+
+        for position, build in enumerate(builds):
+            ascendancy = build.get("ascendancy_class") or build.get("ascendancy") or ""
+            cursor = self._conn.execute(
+                """
+                INSERT INTO builds (
+                    file, source, league, position, streamer, title, channel,
+                    char_class, ascendancy, keyword, search_text,
+                    views, likes, published_at, estimated_cost, level, is_top, payload
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    path, source, league, position,
+                    (build.get("streamer_name") or "").lower() or None,
+                    build.get("title") or build.get("character_name") or "",
+                    (build.get("channel") or "").lower() or None,
+                    (build.get("class") or "").lower() or None,
+                    ascendancy.lower() or None,
+                    (build.get("build_keyword") or "").lower() or None,
+                    build_search_text(build),
+                    build.get("views", 0) or 0,
+                    build.get("likes", 0) or 0,
+                    build.get("published_at") or "",
+                    build_cost(build),
+                    build.get("level", 0) or 0,
+                    1 if position == top_index else 0,
+                    json.dumps(build, ensure_ascii=False)
+                )
+            )
+            self._conn.executemany(
+                "INSERT INTO build_tags (tag, build_id) VALUES (?, ?)",
+                [(tag, cursor.lastrowid) for tag in build_class_tags(build)]
+            )
+
+    def _remove_file(self, path: str) -> None:
+        self._conn.execute(
+            "DELETE FROM build_tags WHERE build_id IN (SELECT id FROM builds WHERE file = ?)",
+            (path,)
+        )
+        self._conn.execute("DELETE FROM builds WHERE file = ?", (path,))
+        self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        원본 파일과 증분 동기화
+
+        mtime/크기가 바뀐 파일만 다시 색인하고, 대상에서 빠진 파일의 빌드는 삭제한다.
+
+        Args:
+            force: REFRESH_INTERVAL 안이라도 파일 상태 확인
+
+        Returns:
+            다시 색인한 파일 수
+        """
+        with self._lock:
+            if not force and time.monotonic() - self._last_refresh < REFRESH_INTERVAL:
+                return 0
+
+            known = {
+                row[0]: row[1:]
+                for row in self._conn.execute(
+                    "SELECT path, source, league, streamer, mtime_ns, size FROM files"
+                ).fetchall()
+            }
+            sources = self._discover(known)
+
+            updated = 0
+            for path in set(known) - set(sources):
+                self._remove_file(path)
+                updated += 1
+
+            for path, info in sources.items():
+                signature = _file_signature(path)
+                if signature is None:
+                    if path in known:
+                        self._remove_file(path)
+                        updated += 1
+                    continue
+                if path in known and known[path][3:] == signature:
+                    continue
+
+                try:
+                    builds = self._load_builds(path, info["source"], info["streamer"])
+                except Exception as e:
+                    print(f"[WARN] Failed to index {path}: {e}", file=sys.stderr)
+                    continue
+
+                self._remove_file(path)
+                self._insert_builds(path, info["source"], info["league"], builds)
+                self._conn.execute(
+                    "INSERT INTO files (path, source, league, streamer, mtime_ns, size) VALUES (?, ?, ?, ?, ?, ?)",
+                    (path, info["source"], info["league"], info["streamer"], *signature)
+                )
+                updated += 1
+
+            self._conn.commit()
+            self._last_refresh = time.monotonic()
+            return updated
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def has_source(self, league: str, source: str) -> bool:
+        """리그에 해당 소스 파일이 색인되어 있는지"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM files WHERE league = ? AND source = ? LIMIT 1",
+                (league, source)
+            ).fetchone()
+        return row is not None
+
+    def query(
+        self,
+        league: str,
+        source: str,
+        char_class: Optional[str] = None,
+        budget: Optional[float] = None,
+        order_by: str = "views",
+        limit: int = 5,
+        top_only: bool = False
+    ) -> List[Dict]:
+        """
+        빌드 조회
+
+        Args:
+            league: 리그 이름
+            source: "popular" | "streamer"
+            char_class: 클래스/어센던시 필터 (apply_build_filters와 같은 규칙)
+            budget: 최대 예산 (chaos, 가격 정보 없는 빌드는 포함)
+            order_by: ORDER_CLAUSES 키
+            limit: 최대 결과 수
+            top_only: 스트리머별 대표 빌드만
+
+        Returns:
+            원본 빌드 딕셔너리 목록
+        """
+        where = ["b.league = ?", "b.source = ?"]
+        params: List = [league, source]
+
+        if char_class:
+            names = class_filter_names(char_class)
+            known_names = [name for name in names if name in KNOWN_CLASS_NAMES]
+            other_names = [name for name in names if name not in KNOWN_CLASS_NAMES]
+            clauses = []
+            if known_names:
+                clauses.append(
+                    f"b.id IN (SELECT build_id FROM build_tags WHERE tag IN ({', '.join('?' * len(known_names))}))"
+                )
+                params.extend(known_names)
+            for name in other_names:
+                clauses.append("instr(b.search_text, ?) > 0")
+                params.append(name)
+            where.append("(" + " OR ".join(clauses) + ")")
+
+        if budget:
+            where.append("(b.estimated_cost IS NULL OR b.estimated_cost <= ?)")
+            params.append(budget)
+
+        if top_only:
+            where.append("b.is_top = 1")
+
+        order = ORDER_CLAUSES.get(order_by, ORDER_CLAUSES["views"])
+        sql = (
+            f"SELECT b.payload FROM builds b WHERE {' AND '.join(where)} "
+            f"ORDER BY b.{order}, b.position LIMIT ?"
+        )
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def search_streamer(self, league: str, term: str, limit: int = 10) -> List[Dict]:
+        """스트리머 이름/채널 부분 일치 검색 (스트리머별 대표 빌드)"""
+        term = term.lower()
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT payload FROM builds
+                WHERE league = ? AND source = 'streamer' AND is_top = 1
+                  AND (instr(streamer, ?) > 0 OR instr(channel, ?) > 0)
+                ORDER BY level DESC
+                LIMIT ?
+                """,
+                (league, term, term, limit)
+            ).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_catalog: Optional[BuildCatalog] = None
+_default_catalog_lock = threading.Lock()
+
+
+def get_build_catalog(refresh: bool = True) -> BuildCatalog:
+    """
+    공유 빌드 카탈로그 (프로세스 내 1개)
+
+    Args:
+        refresh: 원본 파일과 증분 동기화 여부 (REFRESH_INTERVAL 안에서는 생략)
+    """
+    global _default_catalog
+    with _default_catalog_lock:
+        if _default_catalog is None:
+            os.makedirs(BUILD_DATA_DIR, exist_ok=True)
+            _default_catalog = BuildCatalog()
+    if refresh:
+        _default_catalog.refresh()
+    return _default_catalog
+
+
+def refresh_build_catalog() -> None:
+    """수집기가 build_data에 저장한 직후 호출 (실패해도 수집 결과에는 영향 없음)"""
+    try:
+        updated = get_build_catalog(refresh=False).refresh(force=True)
+        if updated:
+            print(f"[OK] Build catalog updated ({updated} files)", file=sys.stderr)
+    except Exception as e:
+        print(f"[WARN] Build catalog refresh failed: {e}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build Catalog')
+    parser.add_argument('--league', type=str, help='League to query')
+    parser.add_argument('--source', type=str, default='popular', choices=['popular', 'streamer'])
+    parser.add_argument('--class', type=str, default=None, dest='char_class', help='Class/ascendancy filter')
+    parser.add_argument('--sort', type=str, default='views', choices=sorted(ORDER_CLAUSES))
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--rebuild', action='store_true', help='Drop and rebuild the catalog')
+
+    args = parser.parse_args()
+
+    if args.rebuild and os.path.exists(BUILD_CATALOG_DB):
+        os.remove(BUILD_CATALOG_DB)
+
+    catalog = get_build_catalog(refresh=False)
+    print(f"[OK] Re-indexed {catalog.refresh(force=True)} changed files")
+
+    if args.league:
+        for build in catalog.query(args.league, args.source, char_class=args.char_class,
+                                   order_by=args.sort, limit=args.limit):
+            print(f"  {build.get('title') or build.get('character_name', '?')}")
@@ -50,20 +50,10 @@ def generate_build_guide_with_llm(
     # Step 1: 빌드 분석 프롬프트 생성
     print("[Step 1/3] Generating analysis prompt...")
 
-    from build_analyzer import (
-        load_reddit_builds,
-        load_item_data,
-        load_latest_patch_notes,
-        create_build_analysis_prompt
-    )
-
-    # 데이터 로드
-    builds = load_reddit_builds()
-    item_data = load_item_data(keyword)
-    patch_notes = load_latest_patch_notes(count=3)
+    from build_analyzer import create_indexed_build_prompt
 
-    # 프롬프트 생성
-    prompt = create_build_analysis_prompt(keyword, builds, item_data, patch_notes)
+    # 프롬프트 생성 (사전 계산된 컨텍스트 인덱스 사용)
+    prompt = create_indexed_build_prompt(keyword)
 
     # 임시 파일에 저장
     temp_prompt_file = f"temp_prompt_{keyword.replace(' ', '_')}.md"
@@ -3,32 +3,107 @@
 """
 Build Search Manager
 사용자 요청에 대해 다중 소스에서 빌드를 검색하고 관리
-- 로컬 캐시 우선 검색 (즉시)
-- 빠른 소스 검색 (5-10초)
-- 백그라운드 추가 수집 (비동기)
+- 캐시 우선 검색 (즉시, 오래된 결과도 먼저 반환하고 백그라운드에서 갱신)
+- 캐시가 없으면 빠른 소스 검색 (5-10초)
+- 백그라운드 추가 수집 (search_job_queue 워커 프로세스)
+
+소스별 결과는 search_job_queue의 SQLite 캐시에 저장되고, 갱신 작업은 같은 키워드끼리
+합쳐져 큐에 남는다. 워커 프로세스(python build_search_manager.py --serve)가 없으면
+검색 시 자동으로 띄우며, 워커는 자주 찾는 키워드를 만료 전에 미리 갱신한다.
 """
 
 import json
 import os
-import time
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
-import threading
+import subprocess
+import sys
+from typing import List, Dict
 
 # 기존 수집기들
 from pob_link_collector import collect_builds_from_reddit
 from ladder_cache_builder import search_cache
 from poe_ninja_fetcher import load_item_data
+from search_job_queue import get_search_job_queue
 
-CACHE_DIR = os.path.join(os.path.dirname(__file__), "build_data", "search_cache")
 PRECACHED_BUILDS = os.path.join(os.path.dirname(__file__), "build_data", "precached_popular_builds.json")
+WORKER_LOG = os.path.join(os.path.dirname(__file__), "build_data", "search_worker.log")
+
+# 리그 -> YouTube 검색용 패치 버전
+LEAGUE_VERSIONS = {"Keepers": "3.27"}
+DEFAULT_LEAGUE_VERSION = "3.27"
+
+# 자동 실행한 워커는 이 시간(초) 동안 작업이 없으면 종료
+WORKER_IDLE_EXIT = 900
+
+
+def fetch_ladder_builds(keyword: str, league: str) -> List[Dict]:
+    """로컬 래더 캐시 검색 (매우 빠름, < 1초)"""
+    return search_cache(league=league, item=keyword, limit=20)
+
+
+def fetch_reddit_builds(keyword: str, league: str) -> List[Dict]:
+    """Reddit 검색 (빠름, 5-10초)"""
+    return collect_builds_from_reddit(max_builds=5, keyword=keyword)
+
+
+def fetch_youtube_builds(keyword: str, league: str) -> List[Dict]:
+    """YouTube 검색 (백그라운드 할당량 사용, 할당량이 모자라면 예외로 재시도)"""
+    from youtube_build_collector import collect_youtube_builds
+
+    league_version = LEAGUE_VERSIONS.get(league, DEFAULT_LEAGUE_VERSION)
+    builds = collect_youtube_builds([keyword], league_version=league_version, max_results=5).get(keyword)
+    if builds is None:
+        raise RuntimeError("YouTube quota deferred")
+    return builds
+
+
+# (이름, 수집 함수, ttl, 빠른 소스 여부) - 결과 병합 순서
+SEARCH_SOURCES = [
+    ("ladder", fetch_ladder_builds, 6 * 3600, True),
+    ("reddit", fetch_reddit_builds, 12 * 3600, True),
+    ("youtube", fetch_youtube_builds, 24 * 3600, False),
+]
+
+
+def get_build_search_queue():
+    """검색 소스를 등록한 작업 큐"""
+    queue = get_search_job_queue()
+    for name, fetch, ttl, _ in SEARCH_SOURCES:
+        if name not in queue.sources:
+            queue.register_source(name, fetch, ttl=ttl)
+    return queue
+
+
+def ensure_worker_process() -> bool:
+    """
+    워커 프로세스가 없으면 백그라운드로 실행
+
+    Returns:
+        새로 실행했으면 True
+    """
+    queue = get_build_search_queue()
+    if queue.worker_alive():
+        return False
+
+    args = [sys.executable, os.path.abspath(__file__), "--serve", "--idle-exit", str(WORKER_IDLE_EXIT)]
+    kwargs = {}
+    if sys.platform == 'win32':
+        kwargs['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs['start_new_session'] = True
+
+    os.makedirs(os.path.dirname(WORKER_LOG), exist_ok=True)
+    with open(WORKER_LOG, 'a', encoding='utf-8') as log:
+        subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=log, stderr=log,
+                         cwd=os.path.dirname(os.path.abspath(__file__)), **kwargs)
+    print("[INFO] Started background search worker")
+    return True
+
 
 class BuildSearchManager:
     """빌드 검색 및 캐시 관리"""
 
     def __init__(self):
-        self.cache_dir = CACHE_DIR
-        os.makedirs(self.cache_dir, exist_ok=True)
+        self.queue = get_build_search_queue()
 
         # 인기 빌드 사전 로드
         self.popular_builds = self._load_popular_builds()
@@ -62,72 +137,75 @@ class BuildSearchManager:
         Returns:
             {
                 "status": "success",
-                "source": "cache|reddit|ladder|mixed",
+                "source": "cache|mixed",
                 "results": [...],
                 "count": 3,
                 "background_collecting": True|False,
+                "stale": True|False,
                 "message": "..."
             }
         """
         print(f"\n[SEARCH] Searching for: {keyword}")
         print("=" * 60)
 
-        # Phase 1: 로컬 캐시 확인 (즉시)
+        self.queue.record_hit(keyword, league)
+
+        # Phase 1: 캐시 확인 (즉시) - 오래된 결과도 사용하고 갱신은 큐에 넣음
         print("[Phase 1] Checking local cache...")
-        cached_results = self._search_local_cache(keyword, league)
+        entries = {}
+        for name, _, _, _ in SEARCH_SOURCES:
+            entry = self.queue.cached(keyword, league, name)
+            if entry is not None:
+                entries[name] = entry
+
+        cached_results = self._merge_sources(entries)
+        refresh_sources = [name for name, _, _, _ in SEARCH_SOURCES
+                           if name not in entries or not entries[name]['fresh']]
 
         if len(cached_results) >= 3:
             print(f"[OK] Found {len(cached_results)} builds in cache (instant)")
 
+            stale = any(not entry['fresh'] for entry in entries.values())
             result = {
                 "status": "success",
                 "source": "cache",
                 "results": cached_results[:max_results],
                 "count": len(cached_results[:max_results]),
                 "background_collecting": False,
+                "stale": stale,
                 "message": f"Found {len(cached_results)} builds from cache (instant)"
             }
 
-            # 캐시가 오래되었으면 백그라운드 업데이트
-            if self._is_cache_stale(keyword, league):
-                if background_collect:
-                    self._start_background_collection(keyword, league)
-                    result["background_collecting"] = True
-                    result["message"] += " - Updating in background..."
+            # 오래되었거나 없는 소스는 백그라운드 업데이트
+            if refresh_sources and background_collect:
+                self._schedule_refresh(keyword, league, refresh_sources)
+                result["background_collecting"] = True
+                result["message"] += " - Updating in background..."
 
             return result
 
-        # Phase 2: 빠른 소스 검색 (Reddit + 로컬 래더 캐시)
-        print("[Phase 2] Searching fast sources (Reddit + Ladder cache)...")
-        fast_results = []
-
-        # 2-1. Reddit 검색 (빠름, 5-10초)
-        print("  [2-1] Searching Reddit...")
-        try:
-            reddit_builds = collect_builds_from_reddit(max_builds=5, keyword=keyword)
-            fast_results.extend(self._normalize_build_source(reddit_builds, "reddit"))
-            print(f"  [OK] Found {len(reddit_builds)} from Reddit")
-        except Exception as e:
-            print(f"  [WARN] Reddit search failed: {e}")
-
-        # 2-2. 로컬 래더 캐시 검색 (매우 빠름, < 1초)
-        print("  [2-2] Searching ladder cache...")
-        try:
-            ladder_results = search_cache(league=league, item=keyword, limit=5)
-            fast_results.extend(self._normalize_build_source(ladder_results, "ladder"))
-            print(f"  [OK] Found {len(ladder_results)} from ladder cache")
-        except Exception as e:
-            print(f"  [WARN] Ladder cache search failed: {e}")
+        # Phase 2: 빠른 소스 검색 (로컬 래더 캐시 + Reddit) - 같은 키워드 수집 중이면 결과 공유
+        print("[Phase 2] Searching fast sources (Ladder cache + Reddit)...")
+        for name, _, _, fast in SEARCH_SOURCES:
+            if not fast or (name in entries and entries[name]['fresh']):
+                continue
+            print(f"  Searching {name}...")
+            try:
+                builds = self.queue.fetch(keyword, league, name)
+                entries[name] = {'builds': builds, 'fresh': True}
+                refresh_sources.remove(name)
+                print(f"  [OK] Found {len(builds)} from {name}")
+            except Exception as e:
+                print(f"  [WARN] {name} search failed: {e}")
 
-        # 결과 저장
-        if fast_results:
-            self._save_to_cache(keyword, league, fast_results)
+        fast_results = self._merge_sources(entries)
 
-        # Phase 3: 백그라운드 추가 수집 시작 (선택)
-        if background_collect and len(fast_results) < 10:
-            print("[Phase 3] Starting background collection...")
-            self._start_background_collection(keyword, league)
-            background_msg = f" - Collecting more builds in background (2-5 min)"
+        # Phase 3: 나머지 소스는 백그라운드 수집 (선택)
+        background = background_collect and bool(refresh_sources)
+        if background:
+            print("[Phase 3] Queueing background collection...")
+            self._schedule_refresh(keyword, league, refresh_sources)
+            background_msg = " - Collecting more builds in background (2-5 min)"
         else:
             background_msg = ""
 
@@ -138,54 +216,27 @@ class BuildSearchManager:
             "source": "mixed",
             "results": fast_results[:max_results],
             "count": len(fast_results[:max_results]),
-            "background_collecting": background_collect and len(fast_results) < 10,
-            "message": f"Found {len(fast_results)} builds from Reddit + Ladder{background_msg}"
+            "background_collecting": background,
+            "stale": False,
+            "message": f"Found {len(fast_results)} builds from {' + '.join(entries) or 'no sources'}{background_msg}"
         }
 
-    def _search_local_cache(self, keyword: str, league: str) -> List[Dict]:
-        """로컬 캐시에서 검색"""
-        cache_file = os.path.join(self.cache_dir, f"{keyword.replace(' ', '_')}_{league}.json")
-
-        if not os.path.exists(cache_file):
-            return []
-
-        # 캐시 파일 읽기
-        with open(cache_file, 'r', encoding='utf-8') as f:
-            cache_data = json.load(f)
-
-        return cache_data.get("builds", [])
-
-    def _is_cache_stale(self, keyword: str, league: str, max_age_hours: int = 24) -> bool:
-        """캐시가 오래되었는지 확인"""
-        cache_file = os.path.join(self.cache_dir, f"{keyword.replace(' ', '_')}_{league}.json")
-
-        if not os.path.exists(cache_file):
-            return True
-
-        # 파일 수정 시간 확인
-        file_time = datetime.fromtimestamp(os.path.getmtime(cache_file))
-        age = datetime.now() - file_time
-
-        return age > timedelta(hours=max_age_hours)
-
-    def _save_to_cache(self, keyword: str, league: str, builds: List[Dict]):
-        """검색 결과를 캐시에 저장"""
-        cache_file = os.path.join(self.cache_dir, f"{keyword.replace(' ', '_')}_{league}.json")
-
-        cache_data = {
-            "metadata": {
-                "keyword": keyword,
-                "league": league,
-                "cached_at": datetime.now().isoformat(),
-                "build_count": len(builds)
-            },
-            "builds": builds
-        }
-
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, ensure_ascii=False, indent=2)
-
-        print(f"[CACHE] Saved {len(builds)} builds to cache")
+    def _merge_sources(self, entries: Dict[str, Dict]) -> List[Dict]:
+        """소스별 결과 병합 (SEARCH_SOURCES 순서, POB 링크 기준 중복 제거)"""
+        seen = set()
+        merged = []
+        for name, _, _, _ in SEARCH_SOURCES:
+            if name not in entries:
+                continue
+            for build in self._normalize_build_source(entries[name]['builds'], name):
+                source = build.get('source')
+                pob_link = (source.get('pob_link') if isinstance(source, dict) else None) or build.get('pob_link')
+                if pob_link:
+                    if pob_link in seen:
+                        continue
+                    seen.add(pob_link)
+                merged.append(build)
+        return merged
 
     def _normalize_build_source(self, builds: List[Dict], source: str) -> List[Dict]:
         """빌드 데이터에 소스 정보 추가"""
@@ -193,59 +244,14 @@ class BuildSearchManager:
             build['data_source'] = source
         return builds
 
-    def _start_background_collection(self, keyword: str, league: str):
-        """백그라운드에서 추가 빌드 수집"""
-        def background_task():
-            print(f"\n[BACKGROUND] Starting deep collection for {keyword}...")
-
-            all_builds = []
-
-            # 래더 깊이 스캔 (시간 소요)
-            try:
-                from ladder_item_filter import scan_ladder_for_item
-                ladder_builds = scan_ladder_for_item(
-                    league=league,
-                    item_name=keyword,
-                    max_characters=500,  # 500명 스캔
-                    max_builds=20
-                )
-                all_builds.extend(self._normalize_build_source(ladder_builds, "ladder_deep"))
-                print(f"[BACKGROUND] Found {len(ladder_builds)} from deep ladder scan")
-            except Exception as e:
-                print(f"[BACKGROUND] Ladder scan failed: {e}")
-
-            # 공식 포럼 스캔 (TODO: 구현 필요)
-            # try:
-            #     forum_builds = search_poe_forum(keyword)
-            #     all_builds.extend(self._normalize_build_source(forum_builds, "forum"))
-            # except Exception as e:
-            #     print(f"[BACKGROUND] Forum search failed: {e}")
-
-            # 캐시 업데이트
-            if all_builds:
-                existing = self._search_local_cache(keyword, league)
-                combined = existing + all_builds
-
-                # 중복 제거 (POB 링크 기준)
-                seen = set()
-                unique_builds = []
-                for build in combined:
-                    pob_link = build.get('source', {}).get('pob_link') or build.get('pob_link')
-                    if pob_link and pob_link not in seen:
-                        seen.add(pob_link)
-                        unique_builds.append(build)
-                    elif not pob_link:
-                        unique_builds.append(build)
-
-                self._save_to_cache(keyword, league, unique_builds)
-                print(f"[BACKGROUND] Collection complete! Total: {len(unique_builds)} builds")
-            else:
-                print(f"[BACKGROUND] No additional builds found")
-
-        # 백그라운드 스레드 시작
-        thread = threading.Thread(target=background_task, daemon=True)
-        thread.start()
-        print("[INFO] Background collection started (non-blocking)")
+    def _schedule_refresh(self, keyword: str, league: str, sources: List[str]):
+        """갱신 작업 큐에 추가 (같은 키워드/소스의 대기 작업이 있으면 합쳐짐)"""
+        added = sum(self.queue.enqueue(keyword, league, name, priority=1) for name in sources)
+        print(f"[INFO] Queued {added} refresh jobs ({', '.join(sources)})")
+        try:
+            ensure_worker_process()
+        except Exception as e:
+            print(f"[WARN] Failed to start background worker: {e}")
 
 def quick_search_demo(keyword: str):
     """빠른 검색 데모"""
@@ -281,12 +287,22 @@ if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description='Build Search Manager')
-    parser.add_argument('keyword', type=str, help='Search keyword (e.g., "Death\'s Oath")')
+    parser.add_argument('keyword', type=str, nargs='?', help='Search keyword (e.g., "Death\'s Oath")')
     parser.add_argument('--league', type=str, default='Keepers', help='League name')
     parser.add_argument('--no-background', action='store_true', help='Disable background collection')
+    parser.add_argument('--serve', action='store_true', help='Run background search workers')
+    parser.add_argument('--workers', type=int, default=2, help='Worker threads (--serve)')
+    parser.add_argument('--idle-exit', type=float, default=None, help='Exit after N idle seconds (--serve)')
 
     args = parser.parse_args()
 
+    if args.serve:
+        get_build_search_queue().serve(workers=args.workers, idle_exit=args.idle_exit)
+        sys.exit(0)
+
+    if not args.keyword:
+        parser.error("keyword is required")
+
     manager = BuildSearchManager()
     result = manager.search_builds(
         keyword=args.keyword,
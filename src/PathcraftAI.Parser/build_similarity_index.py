@@ -0,0 +1,603 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Build Similarity Index
+래더/수집 빌드 전체에 대한 유사 빌드 검색 (MinHash + LSH, 가중 Jaccard 재정렬)
+
+빌드 특징 (가중치만큼 토큰 복제 → 가중 Jaccard):
+    node:<패시브 해시>      1   (키스톤/어센던시 노드 포함)
+    asc:<어센던시>         12
+    class:<클래스>          3
+    unique:<유니크>         5
+    skill:<메인 스킬>      15
+    gem:<젬>                1   (POB만 - 래더 데이터에는 메인 스킬만 있음)
+
+build_data/similarity_index/ 에 원본 파일 1개당 세그먼트 1개:
+    1행: 헤더 JSON {"format", "format_version", "count", "leagues", "blocks": {이름: [오프셋, 바이트, dtype, shape]}}
+    이후: sig (n×128 uint32), band_keys/band_docs (32×n, 밴드별 정렬), features/feature_offsets,
+          league_codes, docs (JSON lines) / doc_offsets
+manifest.json은 원본 파일 mtime/크기를 기록해 바뀐 파일의 세그먼트만 다시 만든다.
+
+검색: 밴드 키 이진 탐색(32회) → 후보의 시그니처 추정 유사도 → 상위 후보만 특징 집합으로 정확한 Jaccard.
+후보가 모자라면 리그 전체 시그니처를 스캔한다.
+
+사용 예:
+    from build_similarity_index import get_similarity_index, pob_xml_features
+    index = get_similarity_index()
+    results = index.query(pob_xml_features(xml), league="Keepers", limit=10)
+"""
+
+import os
+import sys
+import glob
+import json
+import mmap
+import zlib
+import hashlib
+import threading
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterable, List, Optional, Set
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+BUILD_DATA_DIR = os.path.join(os.path.dirname(__file__), "build_data")
+SIMILARITY_INDEX_DIR = os.path.join(BUILD_DATA_DIR, "similarity_index")
+
+SEGMENT_FORMAT = "build_similarity_segment"
+SEGMENT_FORMAT_VERSION = 2  # 2: 문서에 source (ladder/streamer) 기록
+
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+RERANK_FACTOR = 10  # 정확한 Jaccard로 다시 계산할 후보 수 = limit × RERANK_FACTOR
+
+FEATURE_WEIGHTS = {
+    "node": 1,
+    "asc": 12,
+    "class": 3,
+    "unique": 5,
+    "skill": 15,
+    "gem": 1
+}
+
+_SEED = 0x5EED_B01D
+_BAND_MIX = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+
+
+# ----------------------------------------------------------------------
+# 특징 추출
+# ----------------------------------------------------------------------
+
+def _add(features: Set[str], kind: str, value) -> None:
+    if value is None or value == "":
+        return
+    value = str(value).strip().lower()
+    if not value:
+        return
+    for copy in range(FEATURE_WEIGHTS[kind]):
+        features.add(f"{kind}:{value}#{copy}")
+
+
+def ladder_build_features(build: Dict) -> Set[str]:
+    """parse_build_data 형식 빌드 -> 특징 토큰"""
+    features: Set[str] = set()
+    items = build.get('items') or {}
+    for node in (build.get('passive_tree') or {}).get('allocated_nodes', []):
+        _add(features, "node", node)
+    _add(features, "asc", build.get('ascendancy') or build.get('ascendancy_class'))
+    _add(features, "class", build.get('class'))
+    for unique in items.get('unique_items', []):
+        _add(features, "unique", unique)
+    _add(features, "skill", items.get('main_skill') or build.get('main_skill'))
+    return features
+
+
+def pob_xml_features(pob_xml: str) -> Set[str]:
+    """POB XML -> 특징 토큰 (활성 트리, 장착 유니크, 활성 젬, 가장 큰 링크의 메인 스킬)"""
+    root = ET.fromstring(pob_xml)
+    features: Set[str] = set()
+
+    build = root.find('Build')
+    if build is not None:
+        _add(features, "asc", build.get('ascendClassName'))
+        _add(features, "class", build.get('className'))
+
+    tree = root.find('Tree')
+    if tree is not None:
+        spec = tree.find("./Spec[@active='true']")
+        if spec is None:
+            spec = tree.find('Spec')
+        if spec is not None:
+            for node in (spec.get('nodes') or '').split(','):
+                _add(features, "node", node)
+
+    items = root.find('Items')
+    if items is not None:
+        for item in items.findall('.//Item'):
+            lines = [line.strip() for line in (item.text or '').strip().split('\n')]
+            if len(lines) > 1 and 'UNIQUE' in lines[0].upper():
+                _add(features, "unique", lines[1])
+
+    main_skill, main_links = None, 0
+    skills = root.find('Skills')
+    if skills is not None:
+        for skill in skills.findall('.//Skill'):
+            if skill.get('enabled', 'false').lower() != 'true':
+                continue
+            gems = [gem.get('nameSpec') for gem in skill.findall('Gem') if gem.get('nameSpec')]
+            for gem in gems:
+                _add(features, "gem", gem)
+            actives = [gem for gem in gems if 'support' not in gem.lower()]
+            if actives and len(gems) > main_links:
+                main_skill, main_links = actives[0], len(gems)
+    _add(features, "skill", main_skill)
+
+    return features
+
+
+def feature_hashes(features: Iterable[str]) -> "np.ndarray":
+    """특징 토큰 -> 정렬된 고유 uint32 해시"""
+    return np.unique(np.fromiter((zlib.crc32(f.encode('utf-8')) for f in features), dtype=np.uint32))
+
+
+def _normalize_league(league: Optional[str]) -> str:
+    return (league or "").lower().replace(' ', '_')
+
+
+class MinHasher:
+    """multiply-shift 해시 NUM_PERM개로 MinHash 시그니처 계산"""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = _SEED):
+        rng = np.random.default_rng(seed)
+        self.seeds = rng.integers(0, 2 ** 32, size=num_perm, dtype=np.uint64)
+        self.mults = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+
+    def signature(self, hashes: "np.ndarray") -> "np.ndarray":
+        if len(hashes) == 0:
+            return np.full(len(self.seeds), np.iinfo(np.uint32).max, dtype=np.uint32)
+        values = ((hashes.astype(np.uint64)[:, None] ^ self.seeds[None, :]) * self.mults[None, :]) >> np.uint64(32)
+        return values.min(axis=0).astype(np.uint32)
+
+
+def band_keys(signatures: "np.ndarray") -> "np.ndarray":
+    """시그니처 (n×NUM_PERM) -> 밴드 키 (BANDS×n uint64)"""
+    sig = signatures.reshape(len(signatures), BANDS, ROWS).astype(np.uint64)
+    keys = np.zeros(sig.shape[:2], dtype=np.uint64)
+    for row in range(ROWS):
+        keys = (keys ^ sig[:, :, row]) * np.uint64(_BAND_MIX[row % len(_BAND_MIX)])
+    return keys.T.copy()
+
+
+def weighted_jaccard(a: "np.ndarray", b: "np.ndarray") -> float:
+    """정렬된 고유 해시 배열의 Jaccard (가중치는 토큰 복제로 반영됨)"""
+    if len(a) == 0 and len(b) == 0:
+        return 0.0
+    shared = len(np.intersect1d(a, b, assume_unique=True))
+    return shared / (len(a) + len(b) - shared)
+
+
+# ----------------------------------------------------------------------
+# 세그먼트 파일
+# ----------------------------------------------------------------------
+
+def write_segment(
+    path: str,
+    builds: List[Dict],
+    hasher: MinHasher,
+    default_league: str = "",
+    source: str = "ladder",
+    streamer_name: Optional[str] = None
+) -> int:
+    """빌드 목록 -> 세그먼트 파일 (임시 파일 후 교체). 저장한 빌드 수 반환"""
+    leagues: List[str] = []
+    league_index: Dict[str, int] = {}
+    signatures, features, offsets, codes, docs = [], [], [0], [], []
+
+    for build in builds:
+        hashes = feature_hashes(ladder_build_features(build))
+        if len(hashes) == 0:
+            continue
+        league = _normalize_league(build.get('league') or default_league)
+        if league not in league_index:
+            league_index[league] = len(leagues)
+            leagues.append(league)
+
+        signatures.append(hasher.signature(hashes))
+        features.append(hashes)
+        offsets.append(offsets[-1] + len(hashes))
+        codes.append(league_index[league])
+        items = build.get('items') or {}
+        docs.append({
+            'character_name': build.get('character_name', ''),
+            'account_name': build.get('account_name', ''),
+            'class': build.get('class', ''),
+            'ascendancy_class': build.get('ascendancy') or build.get('ascendancy_class', ''),
+            'level': build.get('level', 0),
+            'rank': build.get('rank'),
+            'main_skill': items.get('main_skill') or build.get('main_skill'),
+            'unique_items': items.get('unique_items', []),
+            'league': build.get('league') or default_league,
+            'source': source,
+            'streamer_name': build.get('streamer_name') or streamer_name
+        })
+
+    count = len(docs)
+    sig = np.array(signatures, dtype=np.uint32).reshape(count, NUM_PERM)
+    keys = band_keys(sig) if count else np.zeros((BANDS, 0), dtype=np.uint64)
+    order = np.argsort(keys, axis=1, kind='stable')
+    doc_lines = [json.dumps(doc, ensure_ascii=False).encode('utf-8') for doc in docs]
+
+    arrays = {
+        'sig': sig,
+        'band_keys': np.take_along_axis(keys, order, axis=1),
+        'band_docs': order.astype(np.uint32),
+        'features': np.concatenate(features) if features else np.zeros(0, dtype=np.uint32),
+        'feature_offsets': np.array(offsets, dtype=np.uint64),
+        'league_codes': np.array(codes, dtype=np.uint16),
+        'doc_offsets': np.cumsum([0] + [len(line) for line in doc_lines], dtype=np.uint64)
+    }
+
+    blocks = {}
+    payloads = []
+    offset = 0
+    for name, array in arrays.items():
+        data = np.ascontiguousarray(array).tobytes()
+        blocks[name] = [offset, len(data), array.dtype.str, list(array.shape)]
+        padded = data + b"\0" * (-len(data) % 8)
+        payloads.append(padded)
+        offset += len(padded)
+    docs_blob = b"".join(doc_lines)
+    blocks['docs'] = [offset, len(docs_blob), None, None]
+    payloads.append(docs_blob)
+
+    header = {
+        'format': SEGMENT_FORMAT,
+        'format_version': SEGMENT_FORMAT_VERSION,
+        'num_perm': NUM_PERM,
+        'bands': BANDS,
+        'count': count,
+        'leagues': leagues,
+        'blocks': blocks
+    }
+    header_line = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode('utf-8') + b"\n"
+    header_line += b" " * (-len(header_line) % 8)  # 블록 정렬
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header_line)
+        for payload in payloads:
+            f.write(payload)
+    os.replace(tmp_path, path)
+    return count
+
+
+class Segment:
+    """세그먼트 파일 읽기 (mmap, 필요한 배열만 접근)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        header_line = self._file.readline()
+        self.header = json.loads(header_line)
+        if self.header.get('format') != SEGMENT_FORMAT or self.header.get('num_perm') != NUM_PERM:
+            self._file.close()
+            raise ValueError(f"Not a compatible similarity segment: {path}")
+        self._base = len(header_line)
+        while self._base % 8:
+            self._base += 1
+        self.count = self.header['count']
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.count else None
+        self.leagues = self.header['leagues']
+        self._arrays = {}
+
+    def array(self, name: str) -> "np.ndarray":
+        if name not in self._arrays:
+            offset, length, dtype, shape = self.header['blocks'][name]
+            array = np.frombuffer(self._map, dtype=np.dtype(dtype), count=int(np.prod(shape)) if shape else 0,
+                                  offset=self._base + offset)
+            self._arrays[name] = array.reshape(shape)
+        return self._arrays[name]
+
+    def league_mask(self, league: Optional[str]) -> Optional["np.ndarray"]:
+        """리그 필터 (None이면 전체, 해당 리그 없으면 빈 배열 대신 False 마스크)"""
+        if not league:
+            return None
+        league = _normalize_league(league)
+        if league not in self.leagues:
+            return np.zeros(self.count, dtype=bool)
+        return self.array('league_codes') == self.leagues.index(league)
+
+    def candidates(self, keys: "np.ndarray") -> "np.ndarray":
+        """밴드 키가 하나라도 같은 문서 번호"""
+        band_keys_array = self.array('band_keys')
+        band_docs = self.array('band_docs')
+        found = []
+        for band in range(BANDS):
+            row = band_keys_array[band]
+            lo = np.searchsorted(row, keys[band], side='left')
+            hi = np.searchsorted(row, keys[band], side='right')
+            if hi > lo:
+                found.append(band_docs[band][lo:hi])
+        if not found:
+            return np.zeros(0, dtype=np.uint32)
+        return np.unique(np.concatenate(found))
+
+    def features(self, doc: int) -> "np.ndarray":
+        offsets = self.array('feature_offsets')
+        return self.array('features')[int(offsets[doc]):int(offsets[doc + 1])]
+
+    def doc(self, doc: int) -> Dict:
+        offset, _, _, _ = self.header['blocks']['docs']
+        offsets = self.array('doc_offsets')
+        start = self._base + offset + int(offsets[doc])
+        return json.loads(self._map[start:self._base + offset + int(offsets[doc + 1])].decode('utf-8'))
+
+    def close(self) -> None:
+        self._arrays.clear()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+
+# ----------------------------------------------------------------------
+# 인덱스
+# ----------------------------------------------------------------------
+
+class BuildSimilarityIndex:
+    """래더/수집 빌드 유사도 인덱스 (원본 파일별 세그먼트)"""
+
+    def __init__(self, index_dir: str = SIMILARITY_INDEX_DIR, data_dir: str = BUILD_DATA_DIR):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for the build similarity index")
+        self.index_dir = index_dir
+        self.data_dir = data_dir
+        self.manifest_path = os.path.join(index_dir, "manifest.json")
+        self.hasher = MinHasher()
+        self._segments: Dict[str, Segment] = {}
+        self._lock = threading.Lock()
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> Dict:
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+                if manifest.get('version') == SEGMENT_FORMAT_VERSION and manifest.get('num_perm') == NUM_PERM:
+                    return manifest
+            except Exception as e:
+                print(f"[WARN] Similarity manifest unreadable, rebuilding: {e}", file=sys.stderr)
+        return {'version': SEGMENT_FORMAT_VERSION, 'num_perm': NUM_PERM, 'segments': {}}
+
+    def _save_manifest(self) -> None:
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _discover(self) -> Dict[str, Dict]:
+        """색인 대상 원본 파일 {경로: {league, source, streamer}}"""
+        sources = {}
+        for path in glob.glob(os.path.join(self.data_dir, "ladder_cache", "*_ladder_cache.json")):
+            league = os.path.basename(path)[:-len("_ladder_cache.json")]
+            sources[path] = {'league': league, 'source': 'ladder', 'streamer': None}
+        for path in glob.glob(os.path.join(self.data_dir, "builds_*.json")):
+            sources[path] = {'league': "", 'source': 'ladder', 'streamer': None}
+
+        # 스트리머 파일 이름은 index_{league}.json의 스트리머 목록에서 (build_catalog와 같은 규칙)
+        streamer_dir = os.path.join(self.data_dir, "streamer_builds")
+        registered = {}
+        for index_path in glob.glob(os.path.join(streamer_dir, "index_*.json")):
+            league = os.path.basename(index_path)[len("index_"):-len(".json")]
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    streamers = json.load(f).get('streamers', {})
+            except Exception as e:
+                print(f"[WARN] Failed to read {index_path}: {e}", file=sys.stderr)
+                continue
+            for streamer_name in streamers:
+                path = os.path.join(streamer_dir, f"{streamer_name.replace(' ', '_')}_{league}.json")
+                registered[path] = {'league': league, 'source': 'streamer', 'streamer': streamer_name}
+        for path in glob.glob(os.path.join(streamer_dir, "*.json")):
+            if not os.path.basename(path).startswith("index_"):
+                sources[path] = registered.get(path, {'league': "", 'source': 'streamer', 'streamer': None})
+        return sources
+
+    @staticmethod
+    def _load_builds(path: str) -> List[Dict]:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return data.get('builds', [])
+        return data if isinstance(data, list) else []
+
+    def _segment_path(self, source: str) -> str:
+        return os.path.join(self.index_dir, hashlib.sha1(source.encode('utf-8')).hexdigest()[:16] + ".seg")
+
+    def _drop(self, source: str) -> None:
+        segment = self._segments.pop(source, None)
+        if segment is not None:
+            segment.close()
+        entry = self.manifest['segments'].pop(source, None)
+        if entry and os.path.exists(entry['file']):
+            os.remove(entry['file'])
+
+    def refresh(self) -> int:
+        """바뀐 원본 파일의 세그먼트만 다시 만들기. 다시 만든 세그먼트 수 반환"""
+        with self._lock:
+            os.makedirs(self.index_dir, exist_ok=True)
+            sources = self._discover()
+            updated = 0
+
+            for source in set(self.manifest['segments']) - set(sources):
+                self._drop(source)
+                updated += 1
+
+            for source, info in sources.items():
+                try:
+                    stat = os.stat(source)
+                except OSError:
+                    continue
+                entry = self.manifest['segments'].get(source)
+                if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size \
+                        and os.path.exists(entry['file']):
+                    continue
+
+                try:
+                    builds = self._load_builds(source)
+                except Exception as e:
+                    print(f"[WARN] Failed to index {source}: {e}", file=sys.stderr)
+                    continue
+
+                self._drop(source)
+                segment_path = self._segment_path(source)
+                count = write_segment(segment_path, builds, self.hasher, info['league'],
+                                      source=info['source'], streamer_name=info['streamer'])
+                self.manifest['segments'][source] = {
+                    'file': segment_path,
+                    'mtime_ns': stat.st_mtime_ns,
+                    'size': stat.st_size,
+                    'count': count
+                }
+                updated += 1
+
+            if updated:
+                self._save_manifest()
+            return updated
+
+    def _open_segments(self) -> List[Segment]:
+        with self._lock:
+            for source, entry in self.manifest['segments'].items():
+                if source not in self._segments and entry['count'] and os.path.exists(entry['file']):
+                    self._segments[source] = Segment(entry['file'])
+            return list(self._segments.values())
+
+    @property
+    def size(self) -> int:
+        return sum(entry['count'] for entry in self.manifest['segments'].values())
+
+    def query(self, features: Set[str], league: Optional[str] = None, limit: int = 10) -> List[Dict]:
+        """
+        특징 집합과 가장 비슷한 빌드 top-k (가중 Jaccard 내림차순)
+
+        Args:
+            features: ladder_build_features / pob_xml_features 결과
+            league: 리그 필터 (None이면 전체)
+            limit: 결과 수
+
+        Returns:
+            빌드 요약 목록 (similarity: 0~1)
+        """
+        query_hashes = feature_hashes(features)
+        if len(query_hashes) == 0:
+            return []
+        query_sig = self.hasher.signature(query_hashes)
+        query_keys = band_keys(query_sig[None, :])[:, 0]
+        segments = self._open_segments()
+        rerank = max(limit * RERANK_FACTOR, limit)
+
+        def estimate(segment, docs):
+            if len(docs) == 0:
+                return docs, np.zeros(0)
+            estimates = (segment.array('sig')[docs] == query_sig).mean(axis=1)
+            return docs, estimates
+
+        # 1) LSH 후보
+        pools = []
+        total = 0
+        for segment in segments:
+            docs = segment.candidates(query_keys)
+            mask = segment.league_mask(league)
+            if mask is not None and len(docs):
+                docs = docs[mask[docs]]
+            total += len(docs)
+            pools.append((segment, *estimate(segment, docs)))
+
+        # 2) 후보가 모자라면 시그니처 전체 스캔
+        if total < limit:
+            pools = []
+            for segment in segments:
+                mask = segment.league_mask(league)
+                docs = np.arange(segment.count, dtype=np.uint32) if mask is None else np.nonzero(mask)[0]
+                pools.append((segment, *estimate(segment, docs)))
+
+        # 3) 추정치 상위 후보만 정확한 Jaccard
+        ranked = []
+        for segment, docs, estimates in pools:
+            if len(docs) > rerank:
+                keep = np.argpartition(-estimates, rerank - 1)[:rerank]
+                docs = docs[keep]
+            for doc in docs:
+                ranked.append((weighted_jaccard(query_hashes, segment.features(int(doc))), segment, int(doc)))
+
+        ranked.sort(key=lambda r: r[0], reverse=True)
+        results = []
+        for similarity, segment, doc in ranked[:limit]:
+            build = segment.doc(doc)
+            build['similarity'] = round(similarity, 4)
+            results.append(build)
+        return results
+
+    def close(self) -> None:
+        with self._lock:
+            for segment in self._segments.values():
+                segment.close()
+            self._segments.clear()
+
+
+_default_index: Optional[BuildSimilarityIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_similarity_index(refresh: bool = True) -> Optional[BuildSimilarityIndex]:
+    """
+    공유 유사도 인덱스 (numpy 없으면 None)
+
+    Args:
+        refresh: 원본 파일과 증분 동기화 여부
+    """
+    global _default_index
+    if not NUMPY_AVAILABLE:
+        return None
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = BuildSimilarityIndex()
+    if refresh:
+        _default_index.refresh()
+    return _default_index
+
+
+def refresh_similarity_index() -> None:
+    """수집기가 래더/스트리머 빌드를 저장한 직후 호출 (실패해도 수집 결과에는 영향 없음)"""
+    try:
+        index = get_similarity_index(refresh=False)
+        if index is not None and index.refresh():
+            print(f"[OK] Similarity index updated ({index.size} builds)", file=sys.stderr)
+    except Exception as e:
+        print(f"[WARN] Similarity index refresh failed: {e}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build Similarity Index')
+    parser.add_argument('--pob-xml', type=str, help='POB XML file to search with')
+    parser.add_argument('--league', type=str, default=None, help='League filter')
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    index = get_similarity_index()
+    if index is None:
+        print("[ERROR] numpy is required")
+        sys.exit(1)
+    print(f"[OK] {index.size} builds indexed in {len(index.manifest['segments'])} segments")
+
+    if args.pob_xml:
+        with open(args.pob_xml, 'r', encoding='utf-8') as f:
+            features = pob_xml_features(f.read())
+        for build in index.query(features, league=args.league, limit=args.limit):
+            print(f"  {build['similarity']:.3f}  {build['character_name']:20s} "
+                  f"{build['ascendancy_class']:13s} {build.get('main_skill') or ''}")
@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Character Snapshot History
+OAuth로 가져온 캐릭터 상태를 이전 스냅샷 대비 diff로 저장
+
+- build_data/character_snapshots/<realm>_<캐릭터>.jsonl
+  첫 줄은 전체 스냅샷, 이후는 변경분(diff)만 한 줄씩 추가
+  (슬롯별 아이템 요약 추가/제거/교체, 바뀐 스탯의 새 값, 레벨 등)
+- 변경이 없으면 아무것도 기록하지 않음
+- diff가 MAX_DIFFS를 넘으면 최근 KEEP_DIFFS개만 남기고 압축
+- 분석 결과(비교/갭/업그레이드 단계)는 <파일>.analysis.json에 리비전과 함께 저장해
+  compare_build/upgrade_path가 바뀐 슬롯/스탯만 다시 계산
+- 오버레이용 "마지막 확인 이후 변경 사항"은 재분석 없이 기록만 읽어서 제공
+
+사용법:
+    python character_snapshots.py --character MyChar          # 최근 변경 사항
+    python character_snapshots.py --character MyChar --json   # 오버레이용 JSON
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+# UTF-8 설정
+if sys.platform == 'win32':
+    if sys.stdout.encoding != 'utf-8':
+        sys.stdout.reconfigure(encoding='utf-8')
+    if sys.stderr.encoding != 'utf-8':
+        sys.stderr.reconfigure(encoding='utf-8')
+
+SNAPSHOT_DIR = Path(__file__).parent / "build_data" / "character_snapshots"
+
+MAX_DIFFS = 100   # 이 개수를 넘으면 압축
+KEEP_DIFFS = 20   # 압축 후 남길 최근 diff 수
+
+# 캐릭터 기본 정보 중 diff로 추적하는 필드 (experience는 매번 바뀌므로 제외)
+TRACKED_FIELDS = ("level", "class", "league")
+
+STAT_PRECISION = 4  # 스탯 소수점 자리 (재계산 오차로 변경이 기록되지 않도록)
+
+# 캐릭터당 하나뿐인 장비 슬롯 (나머지는 위치까지 포함해 구분)
+EQUIPMENT_SLOTS = {
+    "Weapon", "Weapon2", "Offhand", "Offhand2", "Helm", "BodyArmour",
+    "Gloves", "Boots", "Amulet", "Ring", "Ring2", "Belt"
+}
+
+# 슬롯이 바뀌면 다시 계산해야 하는 스탯 (스탯 값 자체가 같아도)
+DEFENSE_STATS = {"life", "energy_shield", "fire_res", "cold_res", "lightning_res", "chaos_res"}
+WEAPON_SLOTS = {"Weapon", "Weapon2", "Offhand", "Offhand2"}
+DPS_SLOTS = WEAPON_SLOTS | {"BodyArmour", "PassiveJewels"}  # 무기 + 링크/주얼
+
+
+def slot_stats(slot: str) -> Set[str]:
+    """슬롯 변경 시 영향받는 스탯 키"""
+    base = slot.split(":", 1)[0]
+    if base == "Flask":
+        return set()
+    if base in DPS_SLOTS:
+        return DEFENSE_STATS | {"dps"}
+    return DEFENSE_STATS
+
+
+def item_slot(item: Dict) -> str:
+    """아이템 슬롯 키 (플라스크/주얼처럼 같은 inventoryId가 여러 개면 위치 포함)"""
+    inventory_id = item.get('inventoryId', 'Unknown')
+    if inventory_id in EQUIPMENT_SLOTS:
+        return inventory_id
+    return f"{inventory_id}:{item.get('x', 0)}"
+
+
+def max_links(item: Dict) -> int:
+    """가장 큰 링크 그룹 크기"""
+    groups: Dict[int, int] = {}
+    for socket in item.get('sockets', []) or []:
+        group = socket.get('group', 0)
+        groups[group] = groups.get(group, 0) + 1
+    return max(groups.values(), default=0)
+
+
+def summarize_item(item: Dict) -> Dict:
+    """스냅샷에 저장할 아이템 요약 (모드는 해시만)"""
+    mods = []
+    for key in ('enchantMods', 'implicitMods', 'explicitMods', 'craftedMods', 'fracturedMods'):
+        mods.extend(item.get(key, []) or [])
+    gems = sorted(gem.get('typeLine', '') for gem in item.get('socketedItems', []) or [])
+
+    summary = {
+        "name": item.get('name', ''),
+        "typeLine": item.get('typeLine', ''),
+        "frameType": item.get('frameType', 0),
+        "ilvl": item.get('ilvl', 0),
+        "links": max_links(item),
+        "mods": hashlib.sha1("\n".join(mods).encode('utf-8')).hexdigest()[:12],
+    }
+    if gems:
+        summary["gems"] = hashlib.sha1("\n".join(gems).encode('utf-8')).hexdigest()[:12]
+    return summary
+
+
+def item_label(summary: Optional[Dict]) -> str:
+    if not summary:
+        return ""
+    name = summary.get('name') or ''
+    type_line = summary.get('typeLine') or ''
+    return f"{name} {type_line}".strip()
+
+
+def build_snapshot(character_data: Dict, stats: Optional[Dict] = None) -> Dict:
+    """OAuth 캐릭터 응답(+계산된 스탯)으로 스냅샷 생성"""
+    character = character_data.get('character', character_data)
+    items = list(character.get('equipment', []) or character_data.get('items', []) or [])
+    items.extend(character.get('jewels', []) or [])
+
+    snapshot = {field: character.get(field) for field in TRACKED_FIELDS if character.get(field) is not None}
+    snapshot["slots"] = {item_slot(item): summarize_item(item) for item in items}
+    snapshot["stats"] = {
+        key: round(value, STAT_PRECISION) if isinstance(value, float) else value
+        for key, value in (stats or {}).items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    }
+    return snapshot
+
+
+def diff_snapshots(old: Dict, new: Dict) -> Dict:
+    """두 스냅샷의 변경분 (변경 없으면 빈 dict)"""
+    diff: Dict = {}
+
+    fields = {field: new.get(field) for field in TRACKED_FIELDS if old.get(field) != new.get(field)}
+    if fields:
+        diff["fields"] = fields
+
+    old_slots, new_slots = old.get("slots", {}), new.get("slots", {})
+    slots = {
+        slot: new_slots.get(slot)
+        for slot in set(old_slots) | set(new_slots)
+        if old_slots.get(slot) != new_slots.get(slot)
+    }
+    if slots:
+        diff["slots"] = slots
+
+    # 바뀐 스탯은 새 값 그대로 저장 (증감을 더해 복원하면 부동소수 오차가 쌓임), 사라진 스탯은 None
+    old_stats, new_stats = old.get("stats", {}), new.get("stats", {})
+    stats = {
+        key: new_stats.get(key)
+        for key in set(old_stats) | set(new_stats)
+        if old_stats.get(key) != new_stats.get(key)
+    }
+    if stats:
+        diff["stat_values"] = stats
+
+    return diff
+
+
+def apply_diff(snapshot: Dict, diff: Dict) -> Dict:
+    """스냅샷에 diff 적용 (새 dict 반환)"""
+    result = dict(snapshot)
+    result.update(diff.get("fields", {}))
+
+    slots = dict(snapshot.get("slots", {}))
+    for slot, item in diff.get("slots", {}).items():
+        if item is None:
+            slots.pop(slot, None)
+        else:
+            slots[slot] = item
+    result["slots"] = slots
+
+    stats = dict(snapshot.get("stats", {}))
+    for key, delta in diff.get("stats", {}).items():  # 이전 형식 (증감)
+        stats[key] = stats.get(key, 0) + delta
+    for key, value in diff.get("stat_values", {}).items():
+        if value is None:
+            stats.pop(key, None)
+        else:
+            stats[key] = value
+    result["stats"] = stats
+    return result
+
+
+def stat_deltas(before: Dict, diff: Dict) -> Dict[str, float]:
+    """diff의 스탯 증감 (이전 스냅샷 기준)"""
+    deltas = dict(diff.get("stats", {}))
+    old_stats = before.get("stats", {})
+    for key, value in diff.get("stat_values", {}).items():
+        delta = (value or 0) - old_stats.get(key, 0)
+        deltas[key] = round(delta, STAT_PRECISION) if isinstance(delta, float) else delta
+    return deltas
+
+
+def describe_diff(before: Dict, diff: Dict) -> Dict:
+    """오버레이용 변경 요약 (이전 스냅샷 기준)"""
+    added, removed, replaced = [], [], []
+    old_slots = before.get("slots", {})
+    for slot, item in sorted(diff.get("slots", {}).items()):
+        previous = old_slots.get(slot)
+        if previous is None:
+            added.append({"slot": slot, "item": item_label(item)})
+        elif item is None:
+            removed.append({"slot": slot, "item": item_label(previous)})
+        else:
+            entry = {"slot": slot, "from": item_label(previous), "to": item_label(item)}
+            if item.get("links") != previous.get("links"):
+                entry["links"] = [previous.get("links"), item.get("links")]
+            replaced.append(entry)
+
+    fields = {
+        field: {"from": before.get(field), "to": value}
+        for field, value in diff.get("fields", {}).items()
+    }
+    return {
+        "fields": fields,
+        "added": added,
+        "removed": removed,
+        "replaced": replaced,
+        "stat_deltas": dict(sorted(stat_deltas(before, diff).items())),
+    }
+
+
+class CharacterSnapshotStore:
+    """캐릭터별 스냅샷 히스토리 (전체 1개 + diff 누적)"""
+
+    def __init__(self, snapshot_dir: Path = SNAPSHOT_DIR):
+        self.snapshot_dir = Path(snapshot_dir)
+        self._lock = threading.Lock()
+        self._memo: Dict[Path, tuple] = {}
+
+    def _path(self, character_name: str, realm: str = 'pc') -> Path:
+        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in character_name)
+        return self.snapshot_dir / f"{realm}_{safe_name}.jsonl"
+
+    def _records(self, path: Path) -> List[Dict]:
+        """기록 읽기 (파일이 바뀌지 않았으면 메모 사용)"""
+        try:
+            stat = path.stat()
+        except OSError:
+            return []
+        signature = (stat.st_mtime_ns, stat.st_size)
+        memo = self._memo.get(path)
+        if memo and memo[0] == signature:
+            return memo[1]
+
+        records = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break  # 쓰다 만 마지막 줄
+        self._memo[path] = (signature, records)
+        return records
+
+    @staticmethod
+    def _replay(records: List[Dict]) -> Optional[Dict]:
+        snapshot = None
+        for record in records:
+            if "full" in record:
+                snapshot = record["full"]
+            elif snapshot is not None:
+                snapshot = apply_diff(snapshot, record["diff"])
+        return snapshot
+
+    def latest(self, character_name: str, realm: str = 'pc') -> Optional[Dict]:
+        """최신 스냅샷 ({'revision': n, 'taken_at': t, ...} 또는 None)"""
+        records = self._records(self._path(character_name, realm))
+        snapshot = self._replay(records)
+        if snapshot is None:
+            return None
+        return {**snapshot, "revision": records[-1]["rev"], "taken_at": records[-1]["taken_at"]}
+
+    def record(
+        self,
+        character_name: str,
+        character_data: Dict,
+        stats: Optional[Dict] = None,
+        realm: str = 'pc'
+    ) -> Dict:
+        """새 OAuth 응답 기록
+
+        Returns:
+            {'revision': n, 'changed': bool, 'first': bool, 'changes': describe_diff 결과}
+        """
+        new = build_snapshot(character_data, stats)
+        path = self._path(character_name, realm)
+
+        with self._lock:
+            records = self._records(path)
+            previous = self._replay(records)
+            now = time.time()
+
+            if previous is None:
+                self._write(path, [{"rev": 1, "taken_at": now, "full": new}])
+                return {"revision": 1, "changed": True, "first": True, "changes": None}
+
+            revision = records[-1]["rev"]
+            diff = diff_snapshots(previous, new)
+            if not diff:
+                return {"revision": revision, "changed": False, "first": False,
+                        "changes": describe_diff(previous, {})}
+
+            record = {"rev": revision + 1, "taken_at": now, "diff": diff}
+            diff_count = sum(1 for r in records if "diff" in r)
+            if diff_count + 1 > MAX_DIFFS:
+                self._compact(path, records + [record])
+            else:
+                self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+
+            return {"revision": revision + 1, "changed": True, "first": False,
+                    "changes": describe_diff(previous, diff)}
+
+    def _write(self, path: Path, records: List[Dict]) -> None:
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+        os.replace(tmp_path, path)
+
+    def _compact(self, path: Path, records: List[Dict]) -> None:
+        """최근 KEEP_DIFFS개 diff만 남기고 그 앞은 전체 스냅샷 하나로 합침"""
+        head, tail = records[:-KEEP_DIFFS], records[-KEEP_DIFFS:]
+        base = {"rev": head[-1]["rev"], "taken_at": head[-1]["taken_at"], "full": self._replay(head)}
+        self._write(path, [base] + tail)
+
+    def changes_since(self, character_name: str, revision: int, realm: str = 'pc') -> Optional[Dict]:
+        """revision 이후 바뀐 슬롯/스탯
+
+        Returns:
+            {'revision': 최신, 'slots': set, 'stats': set(슬롯 영향 포함)}
+            revision 이후 기록이 압축돼 알 수 없으면 None (전체 재계산)
+        """
+        records = self._records(self._path(character_name, realm))
+        if not records:
+            return None
+        if records[0]["rev"] > revision:
+            return None
+
+        slots: Set[str] = set()
+        stats: Set[str] = set()
+        for record in records:
+            if record["rev"] <= revision or "diff" not in record:
+                continue
+            diff = record["diff"]
+            slots.update(diff.get("slots", {}))
+            stats.update(diff.get("stats", {}))
+            stats.update(diff.get("stat_values", {}))
+        for slot in slots:
+            stats |= slot_stats(slot)
+        return {"revision": records[-1]["rev"], "slots": slots, "stats": stats}
+
+    def history(self, character_name: str, limit: int = 10, realm: str = 'pc') -> List[Dict]:
+        """최근 변경 기록 (오버레이 진행 상황용, 최신순)"""
+        records = self._records(self._path(character_name, realm))
+        snapshot = None
+        entries = []
+        for record in records:
+            if "full" in record:
+                snapshot = record["full"]
+                continue
+            if snapshot is None:
+                continue
+            entries.append({"revision": record["rev"], "taken_at": record["taken_at"],
+                            **describe_diff(snapshot, record["diff"])})
+            snapshot = apply_diff(snapshot, record["diff"])
+        return entries[::-1][:limit]
+
+    # ------------------------------------------------------------------
+    # 분석 결과 캐시
+    # ------------------------------------------------------------------
+
+    def _analysis_path(self, character_name: str, realm: str) -> Path:
+        return self._path(character_name, realm).with_suffix(".analysis.json")
+
+    def load_analysis(self, character_name: str, kind: str, target_key: str, realm: str = 'pc') -> Optional[Dict]:
+        """저장된 분석 결과 ({'revision', 'target_key', 'result'}), 목표가 다르면 None"""
+        try:
+            with open(self._analysis_path(character_name, realm), 'r', encoding='utf-8') as f:
+                entry = json.load(f).get(kind)
+        except (OSError, ValueError):
+            return None
+        if not entry or entry.get("target_key") != target_key:
+            return None
+        return entry
+
+    def save_analysis(
+        self,
+        character_name: str,
+        kind: str,
+        target_key: str,
+        revision: int,
+        result,
+        realm: str = 'pc'
+    ) -> None:
+        path = self._analysis_path(character_name, realm)
+        with self._lock:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            data[kind] = {"revision": revision, "target_key": target_key, "result": result}
+            self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+
+    def incremental(self, character_name: str, kind: str, target_key: str, realm: str = 'pc'):
+        """이전 분석 결과와 그 이후 변경분
+
+        Returns:
+            (이전 result 또는 None, 바뀐 스탯 set 또는 None, 최신 revision)
+            None이면 전체 재계산
+        """
+        latest = self.latest(character_name, realm)
+        if latest is None:
+            return None, None, 0
+        cached = self.load_analysis(character_name, kind, target_key, realm)
+        if cached is None:
+            return None, None, latest["revision"]
+        changes = self.changes_since(character_name, cached["revision"], realm)
+        if changes is None:
+            return None, None, latest["revision"]
+        return cached["result"], changes["stats"], latest["revision"]
+
+
+def stats_key(stats: Dict) -> str:
+    """목표 스탯 식별 키 (목표가 바뀌면 전체 재계산)"""
+    return hashlib.sha1(json.dumps(stats, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+
+
+_store: Optional[CharacterSnapshotStore] = None
+_store_lock = threading.Lock()
+
+
+def get_snapshot_store() -> CharacterSnapshotStore:
+    """프로세스 공용 스냅샷 저장소"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = CharacterSnapshotStore()
+        return _store
+
+
+def format_changes(entry: Dict) -> Iterable[str]:
+    for field, change in entry.get("fields", {}).items():
+        yield f"  {field}: {change['from']} -> {change['to']}"
+    for item in entry.get("added", []):
+        yield f"  + {item['slot']}: {item['item']}"
+    for item in entry.get("removed", []):
+        yield f"  - {item['slot']}: {item['item']}"
+    for item in entry.get("replaced", []):
+        links = f" ({item['links'][0]}L -> {item['links'][1]}L)" if "links" in item else ""
+        yield f"  * {item['slot']}: {item['from']} -> {item['to']}{links}"
+    for key, delta in entry.get("stat_deltas", {}).items():
+        yield f"  {key}: {delta:+,}"
+
+
+def main():
+    import argparse
+    from datetime import datetime
+
+    parser = argparse.ArgumentParser(description='캐릭터 변경 기록 조회')
+    parser.add_argument('--character', required=True, help='캐릭터 이름')
+    parser.add_argument('--realm', default='pc', help='realm (pc/poe2)')
+    parser.add_argument('--limit', type=int, default=10, help='표시할 기록 수')
+    parser.add_argument('--json', action='store_true', help='JSON 출력 (오버레이용)')
+    args = parser.parse_args()
+
+    store = get_snapshot_store()
+    latest = store.latest(args.character, args.realm)
+    history = store.history(args.character, args.limit, args.realm)
+
+    if args.json:
+        print(json.dumps({
+            "character": args.character,
+            "revision": latest["revision"] if latest else 0,
+            "last_checked": latest["taken_at"] if latest else None,
+            "history": history
+        }, ensure_ascii=False, indent=2))
+        return
+
+    if latest is None:
+        print(f"[INFO] No snapshots for {args.character}")
+        return
+
+    print(f"{args.character}: revision {latest['revision']}, Lv{latest.get('level')} {latest.get('class')}")
+    for entry in history:
+        taken_at = datetime.fromtimestamp(entry["taken_at"]).strftime("%Y-%m-%d %H:%M")
+        print(f"[{taken_at}] revision {entry['revision']}")
+        for line in format_changes(entry):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
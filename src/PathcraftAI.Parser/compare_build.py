@@ -11,9 +11,10 @@
 import json
 import sys
 import argparse
-from typing import Dict, Optional
+from typing import Dict, Optional, Set, Tuple
 from smart_build_analyzer import SmartBuildAnalyzer
 from poe_oauth import get_character_items
+from character_snapshots import get_snapshot_store, stats_key, format_changes
 
 # UTF-8 설정
 if sys.platform == 'win32':
@@ -25,10 +26,21 @@ if sys.platform == 'win32':
 
 def get_current_character_stats(access_token: str, character_name: str) -> Dict:
     """
-    현재 캐릭터의 통계 가져오기
+    현재 캐릭터의 통계 가져오기 (스냅샷 기록 포함)
+    """
+    stats, _ = fetch_character_stats(access_token, character_name)
+    return stats
+
+
+def fetch_character_stats(access_token: str, character_name: str) -> Tuple[Dict, Optional[Dict]]:
+    """
+    현재 캐릭터의 통계 + 이전 확인 이후 변경 사항
+
+    가져온 캐릭터는 스냅샷 히스토리에 diff로 기록된다.
 
     Returns:
-        {
+        (통계, 스냅샷 기록) 튜플
+        통계: {
             'life': 2800,
             'es': 0,
             'fire_res': 45,
@@ -36,6 +48,7 @@ def get_current_character_stats(access_token: str, character_name: str) -> Dict:
             'lightning_res': 60,
             'chaos_res': -60
         }
+        스냅샷 기록: {'revision': n, 'changed': bool, 'first': bool, 'changes': {...}}
     """
     print(f"[1/3] Fetching current character: {character_name}...")
 
@@ -50,7 +63,7 @@ def get_current_character_stats(access_token: str, character_name: str) -> Dict:
         print(f"  ✓ Character loaded: Lv{character_info.get('level')} {character_info.get('class')}")
 
         # 임시: 기본값 반환 (나중에 실제 파싱 구현)
-        return {
+        stats = {
             'life': 0,  # 아이템 파싱 필요
             'es': 0,
             'dps': 0,
@@ -60,9 +73,12 @@ def get_current_character_stats(access_token: str, character_name: str) -> Dict:
             'chaos_res': 0,
         }
 
+        snapshot = get_snapshot_store().record(character_name, character_data, stats)
+        return stats, snapshot
+
     except Exception as e:
         print(f"  ✗ Error: {e}")
-        return {}
+        return {}, None
 
 
 def get_pob_target_stats(pob_url: str, silent: bool = False) -> Dict:
@@ -104,100 +120,113 @@ def calculate_gap(current: float, target: float) -> tuple:
         return (gap, "⚠️")
 
 
-def generate_comparison_json(current_stats: Dict, target_stats: Dict) -> Dict:
+# (표시 이름, 스탯 키, 단위)
+COMPARISON_STATS = [
+    ('DPS', 'dps', None),
+    ('Life', 'life', None),
+    ('Energy Shield', 'energy_shield', None),
+    ('Fire Res', 'fire_res', '%'),
+    ('Cold Res', 'cold_res', '%'),
+    ('Lightning Res', 'lightning_res', '%'),
+    ('Chaos Res', 'chaos_res', '%'),
+]
+
+# 우선 업그레이드 카테고리별 의존 스탯
+PRIORITY_STATS = {
+    'DPS': {'dps'},
+    'Life': {'life'},
+    'Resistances': {'fire_res', 'cold_res', 'lightning_res'},
+}
+
+
+def comparison_row(stat_name: str, stat_key: str, unit: Optional[str], current_stats: Dict, target_stats: Dict) -> Dict:
+    current = current_stats.get(stat_key, 0)
+    target = target_stats.get(stat_key, 0)
+    row = {
+        'stat': stat_name,
+        'current': current,
+        'target': target,
+        'gap': current - target,
+        'status': 'ok' if current >= target else 'warning'
+    }
+    if unit:
+        row['unit'] = unit
+    return row
+
+
+def priority_upgrade(category: str, current_stats: Dict, target_stats: Dict) -> Optional[Dict]:
+    """카테고리별 우선 업그레이드 (필요 없으면 None)"""
+    if category == 'DPS':
+        gap_dps = current_stats.get('dps', 0) - target_stats.get('dps', 0)
+        if gap_dps < 0 and abs(gap_dps) > 10000:
+            return {
+                'priority': 1,
+                'category': 'DPS',
+                'description': f'Increase DPS ({abs(gap_dps):,.0f} needed)',
+                'suggestion': 'Get 6-link setup or better weapon'
+            }
+
+    elif category == 'Life':
+        gap_life = current_stats.get('life', 0) - target_stats.get('life', 0)
+        if gap_life < 0 and abs(gap_life) > 500:
+            return {
+                'priority': 2,
+                'category': 'Life',
+                'description': f'Increase Life ({abs(gap_life):,} HP needed)',
+                'suggestion': 'Add Life nodes on passive tree or better gear'
+            }
+
+    elif category == 'Resistances':
+        uncapped_res = []
+        for res_name, res_key, _ in COMPARISON_STATS[3:6]:
+            current_res = current_stats.get(res_key, 0)
+            target_res = target_stats.get(res_key, 75)
+            if current_res < target_res:
+                uncapped_res.append({'name': res_name, 'gap': target_res - current_res})
+
+        if uncapped_res:
+            return {
+                'priority': 3,
+                'category': 'Resistances',
+                'description': 'Cap Resistances',
+                'suggestion': ', '.join([f"{res['name']}: +{res['gap']}%" for res in uncapped_res])
+            }
+
+    return None
+
+
+def generate_comparison_json(
+    current_stats: Dict,
+    target_stats: Dict,
+    previous: Optional[Dict] = None,
+    changed_stats: Optional[Set[str]] = None
+) -> Dict:
     """
     비교 데이터를 JSON 형식으로 생성 (C# 연동용)
-    """
-    comparison_data = []
-    priority_upgrades = []
-
-    # DPS
-    current_dps = current_stats.get('dps', 0)
-    target_dps = target_stats.get('dps', 0)
-    comparison_data.append({
-        'stat': 'DPS',
-        'current': current_dps,
-        'target': target_dps,
-        'gap': current_dps - target_dps,
-        'status': 'ok' if current_dps >= target_dps else 'warning'
-    })
 
-    # Life
-    current_life = current_stats.get('life', 0)
-    target_life = target_stats.get('life', 0)
-    comparison_data.append({
-        'stat': 'Life',
-        'current': current_life,
-        'target': target_life,
-        'gap': current_life - target_life,
-        'status': 'ok' if current_life >= target_life else 'warning'
-    })
-
-    # Energy Shield
-    current_es = current_stats.get('energy_shield', 0)
-    target_es = target_stats.get('energy_shield', 0)
-    comparison_data.append({
-        'stat': 'Energy Shield',
-        'current': current_es,
-        'target': target_es,
-        'gap': current_es - target_es,
-        'status': 'ok' if current_es >= target_es else 'warning'
-    })
-
-    # Resistances
-    resistances = [
-        ('Fire Res', 'fire_res'),
-        ('Cold Res', 'cold_res'),
-        ('Lightning Res', 'lightning_res'),
-        ('Chaos Res', 'chaos_res'),
-    ]
-
-    for res_name, res_key in resistances:
-        current_res = current_stats.get(res_key, 0)
-        target_res = target_stats.get(res_key, 0)
-        comparison_data.append({
-            'stat': res_name,
-            'current': current_res,
-            'target': target_res,
-            'gap': current_res - target_res,
-            'status': 'ok' if current_res >= target_res else 'warning',
-            'unit': '%'
-        })
-
-    # Priority Upgrades
-    gap_dps = current_dps - target_dps
-    gap_life = current_life - target_life
-
-    if gap_dps < 0 and abs(gap_dps) > 10000:
-        priority_upgrades.append({
-            'priority': 1,
-            'category': 'DPS',
-            'description': f'Increase DPS ({abs(gap_dps):,.0f} needed)',
-            'suggestion': 'Get 6-link setup or better weapon'
-        })
-
-    if gap_life < 0 and abs(gap_life) > 500:
-        priority_upgrades.append({
-            'priority': 2,
-            'category': 'Life',
-            'description': f'Increase Life ({abs(gap_life):,} HP needed)',
-            'suggestion': 'Add Life nodes on passive tree or better gear'
-        })
+    Args:
+        previous: 같은 목표에 대한 이전 결과 (스냅샷 히스토리에 저장된 것)
+        changed_stats: previous 이후 바뀐 스탯 키 (None이면 전체 재계산)
+    """
+    incremental = previous is not None and changed_stats is not None
+    previous_rows = {row['stat']: row for row in previous['comparison']} if incremental else {}
+    previous_upgrades = {up['category']: up for up in previous['priority_upgrades']} if incremental else {}
 
-    uncapped_res = []
-    for res_name, res_key in resistances[:3]:
-        current_res = current_stats.get(res_key, 0)
-        target_res = target_stats.get(res_key, 75)
-        if current_res < target_res:
-            uncapped_res.append({'name': res_name, 'gap': target_res - current_res})
+    comparison_data = []
+    for stat_name, stat_key, unit in COMPARISON_STATS:
+        if incremental and stat_key not in changed_stats and stat_name in previous_rows:
+            comparison_data.append(previous_rows[stat_name])
+        else:
+            comparison_data.append(comparison_row(stat_name, stat_key, unit, current_stats, target_stats))
 
-    if uncapped_res:
-        priority_upgrades.append({
-            'priority': 3,
-            'category': 'Resistances',
-            'description': 'Cap Resistances',
-            'suggestion': ', '.join([f"{res['name']}: +{res['gap']}%" for res in uncapped_res])
-        })
+    priority_upgrades = []
+    for category, stat_keys in PRIORITY_STATS.items():
+        if incremental and not (stat_keys & changed_stats):
+            upgrade = previous_upgrades.get(category)
+        else:
+            upgrade = priority_upgrade(category, current_stats, target_stats)
+        if upgrade:
+            priority_upgrades.append(upgrade)
 
     return {
         'comparison': comparison_data,
@@ -207,6 +236,31 @@ def generate_comparison_json(current_stats: Dict, target_stats: Dict) -> Dict:
     }
 
 
+def generate_tracked_comparison_json(
+    character_name: str,
+    current_stats: Dict,
+    target_stats: Dict,
+    snapshot: Optional[Dict] = None
+) -> Dict:
+    """스냅샷 히스토리 기준으로 바뀐 스탯만 다시 비교하고 결과 저장
+
+    Args:
+        snapshot: fetch_character_stats가 반환한 기록 (있으면 'changes'로 포함)
+    """
+    store = get_snapshot_store()
+    target_key = stats_key(target_stats)
+    previous, changed_stats, revision = store.incremental(character_name, "compare", target_key)
+
+    result = generate_comparison_json(current_stats, target_stats, previous, changed_stats)
+    if revision:
+        store.save_analysis(character_name, "compare", target_key, revision, result)
+
+    result = dict(result)
+    result['revision'] = revision
+    result['changes'] = snapshot.get('changes') if snapshot else None
+    return result
+
+
 def compare_builds(current_stats: Dict, target_stats: Dict):
     """
     현재 vs 목표 비교 대시보드 출력
@@ -324,6 +378,8 @@ def main():
         print("=" * 80)
         print()
 
+    snapshot = None
+
     # Mock 모드
     if args.mock:
         if not args.json:
@@ -355,8 +411,8 @@ def main():
             print(f"❌ Invalid token file format")
             return
 
-        # 1. 현재 캐릭터 통계
-        current_stats = get_current_character_stats(access_token, args.character)
+        # 1. 현재 캐릭터 통계 (+ 마지막 확인 이후 변경 사항)
+        current_stats, snapshot = fetch_character_stats(access_token, args.character)
 
     # 2. POB 목표 통계
     target_stats = get_pob_target_stats(args.pob, silent=args.json)
@@ -365,10 +421,17 @@ def main():
     if current_stats and target_stats:
         if args.json:
             # JSON 출력 모드 (C# 연동용)
-            result = generate_comparison_json(current_stats, target_stats)
+            if snapshot:
+                result = generate_tracked_comparison_json(args.character, current_stats, target_stats, snapshot)
+            else:
+                result = generate_comparison_json(current_stats, target_stats)
             print(json.dumps(result, ensure_ascii=False, indent=2))
         else:
             # 일반 텍스트 출력 모드
+            if snapshot and snapshot.get('changes'):
+                print("\nChanges since last check:")
+                for line in format_changes(snapshot['changes']):
+                    print(line)
             compare_builds(current_stats, target_stats)
     else:
         if args.json:
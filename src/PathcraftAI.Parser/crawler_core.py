@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Crawler Core
+poedb.tw 등 HTML 크롤러 공용 페치 계층
+
+- 호스트별 토큰 버킷 (동시 요청이 있어도 호스트당 초당 요청 수 제한)
+- URL 키 HTML 스냅샷 캐시 (build_data/html_cache) + TTL
+- TTL이 지난 스냅샷은 ETag / Last-Modified 조건부 GET으로 재검증 (304면 본문 전송 없음)
+- offline 모드: 스냅샷만 사용 (파서 수정 후 네트워크 없이 재실행)
+
+사용 예:
+    from crawler_core import CrawlerSession
+    crawler = CrawlerSession(headers=HEADERS, requests_per_second=0.67)
+    html = crawler.fetch("https://poedb.tw/us/Quest")
+    pages = crawler.fetch_many(urls)   # {url: html 또는 예외}
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+from urllib.parse import urldefrag, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+HTML_CACHE_DIR = Path(__file__).parent / "build_data" / "html_cache"
+DEFAULT_SNAPSHOT_TTL = 7 * 24 * 3600  # 스냅샷 유효 시간 (초)
+DEFAULT_REQUESTS_PER_SECOND = 1.0
+DEFAULT_BURST = 2
+
+
+class CrawlerHTTPError(Exception):
+    """페이지 요청이 오류 상태 코드를 반환"""
+
+    def __init__(self, status_code: int, url: str):
+        super().__init__(f"HTTP {status_code} for {url}")
+        self.status_code = status_code
+        self.url = url
+
+
+class SnapshotMissing(Exception):
+    """offline 모드에서 스냅샷이 없는 URL"""
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int = DEFAULT_BURST):
+        """
+        Args:
+            rate: 초당 토큰 보충 수
+            burst: 최대 토큰 수 (연속 요청 허용량)
+        """
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """토큰 1개를 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class SnapshotCache:
+    """URL 키 HTML 스냅샷 저장소 (본문 + 메타데이터 파일)"""
+
+    def __init__(self, cache_dir: Union[str, Path] = HTML_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def _paths(self, url: str):
+        key = self.key(url)
+        base = self.cache_dir / key[:2]
+        return base / f"{key}.html", base / f"{key}.json"
+
+    def load(self, url: str) -> Optional[Dict]:
+        """스냅샷 메타데이터 + 본문 (없으면 None)"""
+        body_path, meta_path = self._paths(url)
+        if not body_path.exists() or not meta_path.exists():
+            return None
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            meta['body'] = body_path.read_bytes()
+            return meta
+        except Exception:
+            return None
+
+    def store(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str], encoding: Optional[str]) -> None:
+        body_path, meta_path = self._paths(url)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_body = body_path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_body.write_bytes(body)
+        os.replace(tmp_body, body_path)
+        self.touch(url, {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'encoding': encoding,
+            'size': len(body)
+        })
+
+    def touch(self, url: str, meta: Dict) -> None:
+        """메타데이터 저장 (fetched_at 갱신)"""
+        _, meta_path = self._paths(url)
+        meta = {k: v for k, v in meta.items() if k != 'body'}
+        meta['fetched_at'] = time.time()
+        tmp_meta = meta_path.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_meta, meta_path)
+
+
+class CrawlerSession:
+    """호스트별 속도 제한 + 스냅샷 캐시를 갖춘 HTML 페치 세션"""
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        ttl: Optional[float] = DEFAULT_SNAPSHOT_TTL,
+        cache_dir: Union[str, Path] = HTML_CACHE_DIR,
+        offline: bool = False,
+        max_workers: int = 4,
+        timeout: float = 30,
+        verbose: bool = True
+    ):
+        """
+        Args:
+            headers: 요청 헤더
+            requests_per_second: 호스트당 초당 요청 수
+            burst: 호스트당 연속 요청 허용량
+            ttl: 스냅샷 유효 시간 (초, 0이면 항상 재검증, None이면 만료 없음)
+            cache_dir: 스냅샷 디렉토리
+            offline: True면 네트워크 없이 스냅샷만 사용
+            max_workers: fetch_many 동시 요청 수
+            timeout: 요청 타임아웃 (초)
+            verbose: 네트워크 요청마다 URL 출력
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.ttl = ttl
+        self.offline = offline
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.verbose = verbose
+        self.cache = SnapshotCache(cache_dir)
+        self.stats = {"cached": 0, "not_modified": 0, "downloaded": 0}
+
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        adapter = HTTPAdapter(pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.requests_per_second, self.burst)
+            return self._buckets[host]
+
+    def _count(self, status: str) -> None:
+        with self._lock:
+            self.stats[status] += 1
+
+    @staticmethod
+    def _decode(snapshot: Dict) -> str:
+        return snapshot['body'].decode(snapshot.get('encoding') or 'utf-8', errors='replace')
+
+    def fetch(self, url: str) -> str:
+        """
+        페이지 HTML (스냅샷 우선)
+
+        URL의 #fragment는 무시한다 (같은 페이지).
+
+        Raises:
+            CrawlerHTTPError: 오류 상태 코드
+            SnapshotMissing: offline 모드에서 스냅샷 없음
+        """
+        url = urldefrag(url)[0]
+        snapshot = self.cache.load(url)
+
+        if snapshot is not None:
+            age = time.time() - snapshot.get('fetched_at', 0)
+            if self.offline or self.ttl is None or age < self.ttl:
+                self._count("cached")
+                return self._decode(snapshot)
+        elif self.offline:
+            raise SnapshotMissing(url)
+
+        headers = {}
+        if snapshot is not None:
+            if snapshot.get('etag'):
+                headers['If-None-Match'] = snapshot['etag']
+            if snapshot.get('last_modified'):
+                headers['If-Modified-Since'] = snapshot['last_modified']
+
+        self._bucket(url).acquire()
+        if self.verbose:
+            print(f"  Fetching: {url}")
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+
+        if response.status_code == 304 and snapshot is not None:
+            self.cache.touch(url, snapshot)
+            self._count("not_modified")
+            return self._decode(snapshot)
+
+        if response.status_code != 200:
+            raise CrawlerHTTPError(response.status_code, url)
+
+        self.cache.store(
+            url,
+            response.content,
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+            response.encoding
+        )
+        self._count("downloaded")
+        return response.text
+
+    def fetch_many(self, urls: Iterable[str]) -> Dict[str, Union[str, Exception]]:
+        """
+        여러 페이지를 동시에 가져오기 (호스트별 속도 제한은 그대로 적용)
+
+        Returns:
+            {url: HTML 또는 발생한 예외}  입력 순서 유지
+        """
+        urls = list(dict.fromkeys(urls))
+
+        def fetch_one(url):
+            try:
+                return self.fetch(url)
+            except Exception as e:
+                return e
+
+        if not urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as executor:
+            return dict(zip(urls, executor.map(fetch_one, urls)))
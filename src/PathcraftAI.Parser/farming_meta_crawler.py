@@ -872,6 +872,26 @@ STRATEGIES_3_27 = [
 ]
 
 
+def classify_build_power(dps: int, ehp: int):
+    """빌드 파워 등급 결정 (DPS 또는 EHP 둘 중 하나가 높아도 인정)
+
+    Returns:
+        (power_level, 표시 이름, 추천 티어)
+    """
+    # Glass Cannon (높은 DPS, 낮은 EHP) 또는 Tank (낮은 DPS, 높은 EHP) 모두 고려
+    if dps >= 50000000 and ehp >= 100000:  # 50M+ DPS, 100k+ EHP
+        return "god_tier", "갓 티어 (God Tier)", "S+"
+    if (dps >= 20000000 and ehp >= 50000) or (dps >= 50000000 and ehp >= 20000):  # 고DPS 글캐 허용
+        return "high", "하이 티어 (High)", "S"
+    if (dps >= 5000000 and ehp >= 30000) or (dps >= 10000000 and ehp >= 10000) or (dps >= 3000000 and ehp >= 50000):
+        # 미드 티어: 밸런스 빌드 OR 글캐 OR 탱커
+        return "medium", "미드 티어 (Medium)", "A"
+    if (dps >= 1000000 and ehp >= 15000) or (dps >= 5000000 and ehp >= 3000) or (dps >= 500000 and ehp >= 30000):
+        # 로우 티어: 밸런스 OR 글캐(레벨링중) OR 탱커
+        return "low", "로우 티어 (Low)", "B"
+    return "starter", "스타터 (Starter)", "Beginner"
+
+
 class FarmingMetaManager:
     """파밍 메타 데이터 관리자"""
 
@@ -883,6 +903,7 @@ class FarmingMetaManager:
             "3.27": STRATEGIES_3_27
         }
         self.league_info = LEAGUE_INFO
+        self._setup_optimizer = None
 
     def get_strategies_by_league(self, version: str) -> List[FarmingStrategy]:
         """리그별 전략 가져오기"""
@@ -933,16 +954,25 @@ class FarmingMetaManager:
 
         return recommendations[:10]
 
-    def get_strategies_by_build_power(self, dps: int, ehp: int, clear_speed: str = "medium") -> Dict:
+    def get_strategies_by_build_power(
+        self,
+        dps: int,
+        ehp: int,
+        clear_speed: str = "medium",
+        budget_per_map: Optional[float] = None,
+        optimizer=None
+    ) -> Dict:
         """빌드 파워에 따른 전략 추천
 
         Args:
             dps: 빌드 DPS
             ehp: Effective HP
             clear_speed: 클리어 속도 (slow, medium, fast, very_fast)
+            budget_per_map: 맵당 스카랍 예산 (chaos). 지정하면 현재 가격 기준 최적 세팅 포함
+            optimizer: 재사용할 FarmingSetupOptimizer (없으면 poe.ninja 가격으로 생성)
 
         Returns:
-            티어별 추천 전략
+            티어별 추천 전략 (budget_per_map 지정 시 "optimized_setup" 포함)
         """
         recommendations = {
             "build_power": "",
@@ -955,30 +985,8 @@ class FarmingMetaManager:
             "tips": []
         }
 
-        # 빌드 파워 등급 결정 (DPS 또는 EHP 둘 중 하나가 높아도 인정)
-        # Glass Cannon (높은 DPS, 낮은 EHP) 또는 Tank (낮은 DPS, 높은 EHP) 모두 고려
-        if dps >= 50000000 and ehp >= 100000:  # 50M+ DPS, 100k+ EHP
-            power_level = "god_tier"
-            recommendations["build_power"] = "갓 티어 (God Tier)"
-            recommendations["recommended_tier"] = "S+"
-        elif (dps >= 20000000 and ehp >= 50000) or (dps >= 50000000 and ehp >= 20000):  # 고DPS 글캐 허용
-            power_level = "high"
-            recommendations["build_power"] = "하이 티어 (High)"
-            recommendations["recommended_tier"] = "S"
-        elif (dps >= 5000000 and ehp >= 30000) or (dps >= 10000000 and ehp >= 10000) or (dps >= 3000000 and ehp >= 50000):
-            # 미드 티어: 밸런스 빌드 OR 글캐 OR 탱커
-            power_level = "medium"
-            recommendations["build_power"] = "미드 티어 (Medium)"
-            recommendations["recommended_tier"] = "A"
-        elif (dps >= 1000000 and ehp >= 15000) or (dps >= 5000000 and ehp >= 3000) or (dps >= 500000 and ehp >= 30000):
-            # 로우 티어: 밸런스 OR 글캐(레벨링중) OR 탱커
-            power_level = "low"
-            recommendations["build_power"] = "로우 티어 (Low)"
-            recommendations["recommended_tier"] = "B"
-        else:
-            power_level = "starter"
-            recommendations["build_power"] = "스타터 (Starter)"
-            recommendations["recommended_tier"] = "Beginner"
+        power_level, recommendations["build_power"], recommendations["recommended_tier"] = \
+            classify_build_power(dps, ehp)
 
         # 전략 매핑
         strategy_mapping = {
@@ -1052,14 +1060,34 @@ class FarmingMetaManager:
         }
         recommendations["tips"] = speed_tips.get(clear_speed, speed_tips["medium"])
 
+        # 예산/빌드 파워 제약 최적 세팅
+        if budget_per_map is not None:
+            optimizer = optimizer or self._get_setup_optimizer()
+            recommendations["optimized_setup"] = optimizer.optimize(budget_per_map, power_level)
+
         return recommendations
 
-    def get_strategy_combinations(self, primary_strategy: str, budget: str = "medium") -> Dict:
+    def _get_setup_optimizer(self):
+        """poe.ninja 현재 가격 기반 FarmingSetupOptimizer (인스턴스 내 재사용)"""
+        if self._setup_optimizer is None:
+            from farming_optimizer import FarmingSetupOptimizer
+            self._setup_optimizer = FarmingSetupOptimizer.from_live_prices()
+        return self._setup_optimizer
+
+    def get_strategy_combinations(
+        self,
+        primary_strategy: str,
+        budget: str = "medium",
+        budget_per_map: Optional[float] = None,
+        optimizer=None
+    ) -> Dict:
         """전략 조합 추천
 
         Args:
             primary_strategy: 메인 전략 이름
             budget: 예산 (low, medium, high, very_high)
+            budget_per_map: 맵당 스카랍 예산 (chaos). 지정하면 메인 전략 고정 최적 조합 포함
+            optimizer: 재사용할 FarmingSetupOptimizer (없으면 poe.ninja 가격으로 생성)
 
         Returns:
             조합 추천 정보
@@ -1200,6 +1228,13 @@ class FarmingMetaManager:
         if primary.build_requirements:
             result["warnings"].append(f"📋 빌드 요구사항: {', '.join(primary.build_requirements)}")
 
+        # 메인 전략 고정 최적 조합 (빌드 파워 제약 없이 예산 기준)
+        if budget_per_map is not None:
+            optimizer = optimizer or self._get_setup_optimizer()
+            strategy_key = optimizer.find_strategy_key(primary_strategy)
+            if strategy_key:
+                result["optimized_setup"] = optimizer.optimize(budget_per_map, "god_tier", primary=strategy_key)
+
         return result
 
     def export_to_json(self, output_path: Optional[str] = None):
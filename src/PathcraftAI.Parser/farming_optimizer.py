@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Farming Setup Optimizer
+맵당 예산(chaos)과 빌드 파워 안에서 시간당 순수익이 최대인 전략 + 스카랍 조합 탐색
+
+- 후보: farming_strategies.json의 전략별 스카랍 세팅 (StrategyProfitMatrix 행)
+- 맵 안에서 메인 메커닉 1개 + 보조 메커닉을 조합 (보조는 COMBO_PROFIT_FACTOR만큼 수익 반영)
+- 제약: 맵당 스카랍 비용 <= 예산, 스카랍 수 <= MAP_DEVICE_SCARAB_SLOTS, 빌드 파워별 허용 투자 수준
+- 전략마다 세팅 0~1개를 고르는 다중 선택 배낭 문제로 풀고, 부분 문제는 메모이즈
+- 스카랍이 필요 없는 맵 외부 콘텐츠(강탈, 델브 등)는 단독 실행 후보로 비교
+
+사용 예:
+    optimizer = FarmingSetupOptimizer.from_live_prices("Keepers")
+    plan = optimizer.optimize(budget_per_map=40, power_level="medium")
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+from farming_strategy_system import (
+    MAPS_PER_HOUR,
+    fetch_poe_ninja_currency,
+    fetch_poe_ninja_scarabs,
+    get_divine_chaos_ratio,
+    get_profit_matrix,
+)
+
+# 맵 장치 스카랍 슬롯 수
+MAP_DEVICE_SCARAB_SLOTS = 5
+
+# 보조 메커닉 수익 반영 비율 (조합 시 메인 대비 약 30% 증가 추정)
+COMBO_PROFIT_FACTOR = 0.3
+
+# 빌드 파워 등급 (FarmingMetaManager.get_strategies_by_build_power와 동일)
+POWER_LEVELS = ["starter", "low", "medium", "high", "god_tier"]
+
+# 빌드 파워별 허용 투자 수준
+POWER_ALLOWED_INVESTMENTS = {
+    "starter": {"none", "low"},
+    "low": {"none", "low", "low-medium"},
+    "medium": {"none", "low", "low-medium", "medium", "medium-high"},
+    "high": {"none", "low", "low-medium", "medium", "medium-high", "high"},
+    "god_tier": {"none", "low", "low-medium", "medium", "medium-high", "high", "very_high"},
+}
+
+# 빌드 파워별 DPS 하한 (전략의 min_dps 요구사항 비교용)
+POWER_LEVEL_DPS = {
+    "starter": 0,
+    "low": 1_000_000,
+    "medium": 5_000_000,
+    "high": 20_000_000,
+    "god_tier": 50_000_000,
+}
+
+
+class FarmingSetupOptimizer:
+    """가격 스냅샷 1개에 대한 전략/스카랍 조합 최적화기"""
+
+    def __init__(self, scarab_prices: Dict[str, float], divine_ratio: float):
+        self.divine_ratio = divine_ratio
+        self.matrix = get_profit_matrix()
+        evaluation = self.matrix.evaluate(scarab_prices, divine_ratio)
+        self._evaluation = evaluation
+        self._memo: Dict[Tuple[str, Optional[str]], Dict] = {}
+        self._groups: Dict[Tuple[str, Optional[str]], List[Tuple[str, Tuple[int, ...]]]] = {}
+        self._plans: Dict[Tuple[int, str, Optional[str]], Dict] = {}
+
+        # 행(전략 x 투자 수준)별 맵당 비용(정수 chaos, 올림), 스카랍 수, 시간당 수입
+        self.row_cost = [math.ceil(float(c) - 1e-9) for c in evaluation["cost_per_map"]]
+        self.row_slots = [sum(qty for _, qty in entries) for entries in self.matrix.row_entries]
+        self.row_income = [float(i) for i in evaluation["income_per_hour"]]
+        self.row_cost_per_hour = [float(c) for c in evaluation["cost_per_hour"]]
+
+        # 전략별 수입 (스카랍 세팅이 없는 단독 전략용)
+        self.strategy_income = {}
+        for key, strategy in self.matrix.strategies.items():
+            expected = strategy.get("expected_profit", {})
+            self.strategy_income[key] = (
+                (expected.get("chaos_per_hour") or 0)
+                + (expected.get("divine_per_hour") or 0) * divine_ratio
+            )
+
+    @classmethod
+    def from_live_prices(cls, league: str = "Keepers") -> "FarmingSetupOptimizer":
+        """poe.ninja 현재 가격으로 생성"""
+        currency_prices = fetch_poe_ninja_currency(league)
+        return cls(fetch_poe_ninja_scarabs(league), get_divine_chaos_ratio(currency_prices))
+
+    def _allowed(self, strategy_key: str, power_level: str) -> bool:
+        """빌드 파워 제약 (투자 수준, 최소 DPS)"""
+        strategy = self.matrix.strategies[strategy_key]
+        if strategy.get("investment", "medium") not in POWER_ALLOWED_INVESTMENTS[power_level]:
+            return False
+        min_dps = strategy.get("build_requirements", {}).get("min_dps", 0)
+        return POWER_LEVEL_DPS[power_level] >= min_dps
+
+    def _candidates(self, power_level: str, primary: Optional[str]) -> List[Tuple[str, Tuple[int, ...]]]:
+        """맵 내 조합 후보: [(전략 키, 세팅 행 묶음)] (primary가 있으면 맨 앞)"""
+        cache_key = (power_level, primary)
+        if cache_key not in self._groups:
+            groups = []
+            for key, rows in self.matrix.strategy_rows.items():
+                if rows and (key == primary or self._allowed(key, power_level)):
+                    group = tuple(r for r in rows if self.row_slots[r] <= MAP_DEVICE_SCARAB_SLOTS)
+                    if group:
+                        groups.append((key, group))
+            groups.sort(key=lambda g: g[0] != primary)
+            self._groups[cache_key] = groups
+        return self._groups[cache_key]
+
+    def _solve(self, power_level: str, primary: Optional[str], budget: int):
+        """다중 선택 배낭 DP (메모이즈)
+
+        상태: (전략 번호, 남은 슬롯, 남은 예산, 메인 선택 여부)
+        값: 시간당 순수익, 선택한 (행, 메인 여부) 목록
+        """
+        groups = self._candidates(power_level, primary)
+        memo = self._memo.setdefault((power_level, primary), {})
+
+        def best(i: int, slots: int, money: int, has_primary: bool):
+            if i == len(groups):
+                return (0.0, ()) if has_primary else (-math.inf, ())
+
+            state = (i, slots, money, has_primary)
+            cached = memo.get(state)
+            if cached is not None:
+                return cached
+
+            # 고정 메인 전략은 건너뛸 수 없음
+            must_take = primary is not None and i == 0
+            result = (-math.inf, ()) if must_take else best(i + 1, slots, money, has_primary)
+
+            for row in groups[i][1]:
+                cost, used = self.row_cost[row], self.row_slots[row]
+                if cost > money or used > slots:
+                    continue
+
+                # 메인(미선택 시) 또는 보조로 추가 (고정 메인은 메인으로만)
+                roles = (True,) if must_take else ((False, True) if not has_primary else (False,))
+                for as_primary in roles:
+                    factor = 1.0 if as_primary else COMBO_PROFIT_FACTOR
+                    gain = self.row_income[row] * factor - self.row_cost_per_hour[row]
+                    value, picks = best(i + 1, slots - used, money - cost, has_primary or as_primary)
+                    if value + gain > result[0]:
+                        result = (value + gain, ((row, as_primary),) + picks)
+
+            memo[state] = result
+            return result
+
+        return best(0, MAP_DEVICE_SCARAB_SLOTS, budget, False)
+
+    def optimize(self, budget_per_map: int, power_level: str = "medium", primary: Optional[str] = None) -> Dict:
+        """
+        예산/빌드 파워 조건에서 시간당 순수익 최대 세팅
+
+        Args:
+            budget_per_map: 맵당 스카랍 예산 (chaos)
+            power_level: starter / low / medium / high / god_tier
+            primary: 메인 전략 고정 (farming_strategies.json 키, 예: "legion")
+
+        Returns:
+            {"type": "map" | "standalone", "net_chaos_per_hour", "cost_per_map",
+             "strategies": [...], "scarabs": [...]}  후보가 없으면 {"error": ...}
+        """
+        if power_level not in POWER_ALLOWED_INVESTMENTS:
+            return {"error": f"알 수 없는 빌드 파워: {power_level}"}
+        if primary is not None and not self.matrix.strategy_rows.get(primary):
+            primary_strategy = self.matrix.strategies.get(primary)
+            if primary_strategy is None:
+                return {"error": f"전략을 찾을 수 없음: {primary}"}
+            return self._standalone_plan(primary)
+
+        budget = max(int(budget_per_map), 0)
+        cache_key = (budget, power_level, primary)
+        if cache_key in self._plans:
+            return self._plans[cache_key]
+
+        groups = self._candidates(power_level, primary)
+        if primary is not None and (not groups or groups[0][0] != primary):
+            return {"error": f"맵 장치 슬롯에 맞는 세팅이 없음: {primary}"}
+
+        value, picks = self._solve(power_level, primary, budget)
+        plan = self._map_plan(value, picks) if picks else None
+
+        # 맵 외부 단독 전략과 비교 (메인 고정 시 제외)
+        if primary is None:
+            for key, rows in self.matrix.strategy_rows.items():
+                if rows or not self._allowed(key, power_level):
+                    continue
+                if plan is None or self.strategy_income[key] > plan["net_chaos_per_hour"]:
+                    plan = self._standalone_plan(key)
+
+        plan = plan or {"error": "조건에 맞는 전략이 없습니다"}
+        self._plans[cache_key] = plan
+        return plan
+
+    def _map_plan(self, value: float, picks: Tuple[Tuple[int, bool], ...]) -> Dict:
+        strategies = []
+        scarabs = []
+        for row, is_primary in picks:
+            key, level = self.matrix.rows[row]
+            strategy = self.matrix.strategies[key]
+            strategies.append({
+                "strategy_key": key,
+                "name": strategy.get("name"),
+                "name_ko": strategy.get("name_ko"),
+                "investment_level": level,
+                "role": "primary" if is_primary else "secondary",
+                "cost_per_map": float(self._evaluation["cost_per_map"][row]),
+            })
+            for col, qty in self.matrix.row_entries[row]:
+                scarabs.append({"name": self.matrix.scarab_names[col], "quantity": qty})
+
+        cost_per_map = sum(s["cost_per_map"] for s in strategies)
+        return {
+            "type": "map",
+            "net_chaos_per_hour": value,
+            "net_divine_per_hour": value / self.divine_ratio if self.divine_ratio > 0 else 0,
+            "cost_per_map": cost_per_map,
+            "cost_per_hour": cost_per_map * MAPS_PER_HOUR,
+            "scarab_slots": sum(s["quantity"] for s in scarabs),
+            "strategies": strategies,
+            "scarabs": scarabs,
+        }
+
+    def _standalone_plan(self, key: str) -> Dict:
+        strategy = self.matrix.strategies[key]
+        income = self.strategy_income[key]
+        return {
+            "type": "standalone",
+            "net_chaos_per_hour": income,
+            "net_divine_per_hour": income / self.divine_ratio if self.divine_ratio > 0 else 0,
+            "cost_per_map": 0,
+            "cost_per_hour": 0,
+            "scarab_slots": 0,
+            "strategies": [{
+                "strategy_key": key,
+                "name": strategy.get("name"),
+                "name_ko": strategy.get("name_ko"),
+                "investment_level": strategy.get("investment"),
+                "role": "primary",
+                "cost_per_map": 0,
+            }],
+            "scarabs": [],
+        }
+
+    def find_strategy_key(self, name: str) -> Optional[str]:
+        """전략 이름 -> farming_strategies.json 키 (예: "Legion Farming" -> "legion")"""
+        normalized = name.lower().replace(" farming", "").strip()
+        for key, strategy in self.matrix.strategies.items():
+            if normalized in (key, key.replace("_", " "), (strategy.get("name") or "").lower()):
+                return key
+        return None
@@ -7,9 +7,16 @@ Farming Strategy System
 
 import sys
 import json
-from typing import List, Dict, Optional
+import os
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # UTF-8 설정
 if sys.platform == 'win32':
     if sys.stdout.encoding != 'utf-8':
@@ -986,15 +993,23 @@ def main():
 # 리그 페이즈 + 동적 스카랍 조합 시스템
 # =============================================================================
 
-import requests
 from pathlib import Path
 
+from poe_ninja_client import get_poe_ninja_client
+
+FARMING_STRATEGIES_FILE = Path(__file__).parent / "data" / "farming_strategies.json"
+
+# 시간당 맵 수 추정 (평균 5분/맵 = 12맵/시간)
+MAPS_PER_HOUR = 12
+
+# 파밍 전략용 가격 허용 나이 (초) - 공용 가격 저장소에서 이보다 오래된 데이터는 새로 요청
+PRICE_MAX_AGE = 600
+
 # JSON 데이터 로드
 def load_farming_strategies() -> Dict:
     """farming_strategies.json 로드"""
-    json_path = Path(__file__).parent / "data" / "farming_strategies.json"
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
+        with open(FARMING_STRATEGIES_FILE, 'r', encoding='utf-8') as f:
             return json.load(f)
     except Exception as e:
         print(f"Error loading farming_strategies.json: {e}")
@@ -1005,10 +1020,7 @@ def load_farming_strategies() -> Dict:
 def fetch_poe_ninja_currency(league: str = "Keepers") -> Dict[str, float]:
     """poe.ninja에서 커런시 가격 가져오기"""
     try:
-        url = f"https://poe.ninja/api/data/currencyoverview?league={league}&type=Currency"
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = get_poe_ninja_client().get_overview(league, "Currency", max_age=PRICE_MAX_AGE)
 
         prices = {}
         for item in data.get("lines", []):
@@ -1026,10 +1038,7 @@ def fetch_poe_ninja_currency(league: str = "Keepers") -> Dict[str, float]:
 def fetch_poe_ninja_scarabs(league: str = "Keepers") -> Dict[str, float]:
     """poe.ninja에서 스카랍 가격 가져오기"""
     try:
-        url = f"https://poe.ninja/api/data/itemoverview?league={league}&type=Scarab"
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = get_poe_ninja_client().get_overview(league, "Scarab", max_age=PRICE_MAX_AGE)
 
         prices = {}
         for item in data.get("lines", []):
@@ -1047,10 +1056,7 @@ def fetch_poe_ninja_scarabs(league: str = "Keepers") -> Dict[str, float]:
 def fetch_poe_ninja_items(league: str = "Keepers", item_type: str = "Essence") -> Dict[str, float]:
     """poe.ninja에서 아이템 가격 가져오기"""
     try:
-        url = f"https://poe.ninja/api/data/itemoverview?league={league}&type={item_type}"
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = get_poe_ninja_client().get_overview(league, item_type, max_age=PRICE_MAX_AGE)
 
         prices = {}
         for item in data.get("lines", []):
@@ -1166,10 +1172,153 @@ def get_league_phase_guide(
 
 
 # 동적 수익 계산
+def _parse_scarab_entry(scarab: str) -> Tuple[str, int]:
+    """스카랍 설정 문자열 파싱 ("Essence Scarab x2" -> ("Essence Scarab", 2))"""
+    if " x" in scarab:
+        name, qty = scarab.rsplit(" x", 1)
+        return name, int(qty)
+    return scarab, 1
+
+
+class StrategyProfitMatrix:
+    """전략 x 투자 수준 x 스카랍 수량 행렬
+
+    farming_strategies.json을 한 번 컴파일해 두고, 가격이 갱신되면
+    evaluate()의 행렬-벡터 곱 한 번으로 모든 전략/투자 수준의 비용과 ROI를 계산한다.
+    NumPy가 없으면 같은 계산을 희소 행 단위로 수행한다.
+    """
+
+    def __init__(self, strategies_data: Dict):
+        self.strategies: Dict[str, Dict] = strategies_data.get("strategies", {})
+        self.rows: List[Tuple[str, str]] = []          # (전략 키, 투자 수준)
+        self.strategy_rows: Dict[str, List[int]] = {}
+        self.scarab_names: List[str] = []
+        self.row_entries: List[List[Tuple[int, int]]] = []  # 설정 순서의 (스카랍 열, 수량)
+        self.estimated_cost: List[float] = []
+        chaos_per_hour = []
+        divine_per_hour = []
+
+        columns: Dict[str, int] = {}
+        for strategy_key, strategy in self.strategies.items():
+            expected = strategy.get("expected_profit", {})
+            row_ids = []
+            for investment_level, setup in (strategy.get("scarab_setup") or {}).items():
+                if not isinstance(setup, dict):
+                    continue
+
+                entries = []
+                for scarab in setup.get("scarabs", []):
+                    name, qty = _parse_scarab_entry(scarab)
+                    if name not in columns:
+                        columns[name] = len(self.scarab_names)
+                        self.scarab_names.append(name)
+                    entries.append((columns[name], qty))
+
+                row_ids.append(len(self.rows))
+                self.rows.append((strategy_key, investment_level))
+                self.row_entries.append(entries)
+                self.estimated_cost.append(setup.get("cost_per_map", 0))
+                chaos_per_hour.append(expected.get("chaos_per_hour", 0))
+                divine_per_hour.append(expected.get("divine_per_hour", 0))
+            self.strategy_rows[strategy_key] = row_ids
+
+        if NUMPY_AVAILABLE:
+            self.quantities = np.zeros((len(self.rows), len(self.scarab_names)))
+            for row, entries in enumerate(self.row_entries):
+                for col, qty in entries:
+                    self.quantities[row, col] += qty
+            self.chaos_per_hour = np.asarray(chaos_per_hour, dtype=float)
+            self.divine_per_hour = np.asarray(divine_per_hour, dtype=float)
+        else:
+            self.chaos_per_hour = chaos_per_hour
+            self.divine_per_hour = divine_per_hour
+
+    def price_vector(self, scarab_prices: Dict[str, float]):
+        """스카랍 열 순서의 가격 벡터 (가격 없는 스카랍은 0)"""
+        prices = [scarab_prices.get(name, 0) for name in self.scarab_names]
+        return np.asarray(prices, dtype=float) if NUMPY_AVAILABLE else prices
+
+    def evaluate(self, scarab_prices: Dict[str, float], divine_ratio: float) -> Dict:
+        """모든 전략/투자 수준의 비용, 수익, ROI 계산
+
+        Returns:
+            {"prices", "cost_per_map", "cost_per_hour", "income_per_hour",
+             "net_per_hour", "net_in_divine", "roi_percent"} (행 순서 배열)
+        """
+        prices = self.price_vector(scarab_prices)
+
+        if NUMPY_AVAILABLE:
+            cost_per_map = self.quantities @ prices
+            cost_per_hour = cost_per_map * MAPS_PER_HOUR
+            income = self.chaos_per_hour + self.divine_per_hour * divine_ratio
+            net = income - cost_per_hour
+            with np.errstate(divide='ignore', invalid='ignore'):
+                roi = np.where(cost_per_hour > 0, net / np.where(cost_per_hour > 0, cost_per_hour, 1) * 100, np.inf)
+            net_in_divine = net / divine_ratio if divine_ratio > 0 else np.zeros_like(net)
+        else:
+            cost_per_map = [sum(prices[col] * qty for col, qty in entries) for entries in self.row_entries]
+            cost_per_hour = [cost * MAPS_PER_HOUR for cost in cost_per_map]
+            income = [c + d * divine_ratio for c, d in zip(self.chaos_per_hour, self.divine_per_hour)]
+            net = [i - c for i, c in zip(income, cost_per_hour)]
+            roi = [n / c * 100 if c > 0 else float('inf') for n, c in zip(net, cost_per_hour)]
+            net_in_divine = [n / divine_ratio if divine_ratio > 0 else 0 for n in net]
+
+        return {
+            "prices": prices,
+            "cost_per_map": cost_per_map,
+            "cost_per_hour": cost_per_hour,
+            "income_per_hour": income,
+            "net_per_hour": net,
+            "net_in_divine": net_in_divine,
+            "roi_percent": roi
+        }
+
+    def option(self, row: int, evaluation: Dict) -> Dict:
+        """행 1개의 투자 옵션 정보 (calculate_strategy_profit 형식)"""
+        prices = evaluation["prices"]
+        scarab_details = []
+        for col, qty in self.row_entries[row]:
+            price = float(prices[col])
+            if price > 0:
+                scarab_details.append({
+                    "name": self.scarab_names[col],
+                    "quantity": qty,
+                    "unit_price": price,
+                    "total": price * qty
+                })
+
+        return {
+            "scarabs": scarab_details,
+            "estimated_cost_per_map": self.estimated_cost[row],
+            "actual_cost_per_map": float(evaluation["cost_per_map"][row]),
+            "cost_per_hour": float(evaluation["cost_per_hour"][row]),
+            "expected_profit_per_hour": float(evaluation["income_per_hour"][row]),
+            "net_profit_per_hour": float(evaluation["net_per_hour"][row]),
+            "net_profit_in_divine": float(evaluation["net_in_divine"][row]),
+            "roi_percent": float(evaluation["roi_percent"][row])
+        }
+
+
+_profit_matrix: Optional[StrategyProfitMatrix] = None
+_profit_matrix_mtime: Optional[float] = None
+
+
+def get_profit_matrix() -> StrategyProfitMatrix:
+    """컴파일된 전략 수익 행렬 (farming_strategies.json이 바뀌면 다시 컴파일)"""
+    global _profit_matrix, _profit_matrix_mtime
+
+    mtime = os.path.getmtime(FARMING_STRATEGIES_FILE) if FARMING_STRATEGIES_FILE.exists() else None
+    if _profit_matrix is None or mtime != _profit_matrix_mtime:
+        _profit_matrix = StrategyProfitMatrix(load_farming_strategies())
+        _profit_matrix_mtime = mtime
+    return _profit_matrix
+
+
 def calculate_strategy_profit(
     strategy_name: str,
     scarab_prices: Dict[str, float],
-    divine_ratio: float
+    divine_ratio: float,
+    evaluation: Optional[Dict] = None
 ) -> Dict:
     """전략의 실제 수익 계산
 
@@ -1177,18 +1326,18 @@ def calculate_strategy_profit(
         strategy_name: 전략 이름
         scarab_prices: 스카랍 가격 딕셔너리
         divine_ratio: Divine:Chaos 비율
+        evaluation: 같은 가격으로 미리 계산한 StrategyProfitMatrix.evaluate() 결과
 
     Returns:
         수익 정보
     """
-    strategies_data = load_farming_strategies()
-    strategy = strategies_data.get("strategies", {}).get(strategy_name)
+    matrix = get_profit_matrix()
+    strategy = matrix.strategies.get(strategy_name)
 
     if not strategy:
         return {"error": f"전략 '{strategy_name}'을 찾을 수 없습니다"}
 
-    scarab_setup = strategy.get("scarab_setup", {})
-    if not scarab_setup:
+    if not strategy.get("scarab_setup", {}):
         return {
             "strategy": strategy_name,
             "scarab_cost": 0,
@@ -1196,66 +1345,14 @@ def calculate_strategy_profit(
             "net_profit": "N/A (스카랍 불필요)"
         }
 
-    # 각 투자 수준별 계산
-    results = {}
-
-    for investment_level, setup in scarab_setup.items():
-        if not isinstance(setup, dict):
-            continue
-
-        scarabs = setup.get("scarabs", [])
-        estimated_cost = setup.get("cost_per_map", 0)
-
-        # 실제 스카랍 가격 계산
-        actual_cost = 0
-        scarab_details = []
-
-        for scarab in scarabs:
-            # "x2" 같은 수량 처리
-            qty = 1
-            scarab_name = scarab
-            if " x" in scarab:
-                parts = scarab.rsplit(" x", 1)
-                scarab_name = parts[0]
-                qty = int(parts[1])
+    if evaluation is None:
+        evaluation = matrix.evaluate(scarab_prices, divine_ratio)
 
-            price = scarab_prices.get(scarab_name, 0)
-            total = price * qty
-            actual_cost += total
-
-            if price > 0:
-                scarab_details.append({
-                    "name": scarab_name,
-                    "quantity": qty,
-                    "unit_price": price,
-                    "total": total
-                })
-
-        # 예상 수익
-        expected = strategy.get("expected_profit", {})
-        chaos_per_hour = expected.get("chaos_per_hour", 0)
-        divine_per_hour = expected.get("divine_per_hour", 0)
-
-        # Divine을 Chaos로 환산
-        total_chaos_per_hour = chaos_per_hour + (divine_per_hour * divine_ratio)
-
-        # 시간당 맵 수 추정 (평균 5분/맵 = 12맵/시간)
-        maps_per_hour = 12
-        cost_per_hour = actual_cost * maps_per_hour
-
-        net_profit_per_hour = total_chaos_per_hour - cost_per_hour
-        roi = (net_profit_per_hour / cost_per_hour * 100) if cost_per_hour > 0 else float('inf')
-
-        results[investment_level] = {
-            "scarabs": scarab_details,
-            "estimated_cost_per_map": estimated_cost,
-            "actual_cost_per_map": actual_cost,
-            "cost_per_hour": cost_per_hour,
-            "expected_profit_per_hour": total_chaos_per_hour,
-            "net_profit_per_hour": net_profit_per_hour,
-            "net_profit_in_divine": net_profit_per_hour / divine_ratio if divine_ratio > 0 else 0,
-            "roi_percent": roi
-        }
+    # 각 투자 수준별 결과
+    results = {
+        matrix.rows[row][1]: matrix.option(row, evaluation)
+        for row in matrix.strategy_rows[strategy_name]
+    }
 
     return {
         "strategy": strategy_name,
@@ -1265,34 +1362,24 @@ def calculate_strategy_profit(
     }
 
 
-# 최적 스카랍 조합 추천
-def get_optimal_farming_strategies(
+def rank_farming_strategies(
+    scarab_prices: Dict[str, float],
+    divine_ratio: float,
     budget: str = "medium",
     build_tags: List[str] = None,
-    league_phase: str = "mid",
-    league: str = "Keepers"
-) -> Dict:
-    """현재 가격 기반 최적 파밍 전략 추천
-
-    Args:
-        budget: "low", "medium", "high"
-        build_tags: 빌드 태그 목록
-        league_phase: "early", "mid", "late"
-        league: 리그 이름
+    league_phase: str = "mid"
+) -> List[Dict]:
+    """주어진 가격으로 모든 전략을 평가해 ROI 순으로 정렬
 
-    Returns:
-        최적 전략 목록
+    가격 갱신 후 재정렬만 필요할 때 사용 (네트워크 요청 없음)
     """
     if build_tags is None:
         build_tags = []
 
-    # 가격 데이터 가져오기
-    currency_prices = fetch_poe_ninja_currency(league)
-    scarab_prices = fetch_poe_ninja_scarabs(league)
-    divine_ratio = get_divine_chaos_ratio(currency_prices)
-
-    strategies_data = load_farming_strategies()
-    all_strategies = strategies_data.get("strategies", {})
+    matrix = get_profit_matrix()
+    evaluation = matrix.evaluate(scarab_prices, divine_ratio)
+    roi = evaluation["roi_percent"]
+    cost = evaluation["cost_per_map"]
 
     # 투자 수준 매핑
     budget_map = {
@@ -1301,10 +1388,11 @@ def get_optimal_farming_strategies(
         "high": ["none", "low", "medium", "high", "very_high"]
     }
     allowed_investments = budget_map.get(budget, ["low", "medium"])
+    max_cost = {"low": 20, "medium": 50}.get(budget)
 
     results = []
 
-    for strategy_key, strategy in all_strategies.items():
+    for strategy_key, strategy in matrix.strategies.items():
         # 투자 수준 체크
         investment = strategy.get("investment", "medium")
         if investment not in allowed_investments:
@@ -1318,37 +1406,17 @@ def get_optimal_farming_strategies(
         # 빌드 요구사항 체크
         build_reqs = strategy.get("build_requirements", {})
         req_tags = build_reqs.get("tags", [])
+        tag_match = sum(1 for tag in req_tags if tag in build_tags)
 
-        tag_match = 0
-        for tag in req_tags:
-            if tag in build_tags:
-                tag_match += 1
-
-        # 수익 계산
-        profit_info = calculate_strategy_profit(strategy_key, scarab_prices, divine_ratio)
-
-        # 최고 ROI 투자 옵션 찾기
-        best_option = None
-        best_roi = -float('inf')
-
-        investment_options = profit_info.get("investment_options", {})
-        for level, option in investment_options.items():
-            # 예산에 맞는지 체크
-            cost = option.get("actual_cost_per_map", 0)
-            if budget == "low" and cost > 20:
-                continue
-            elif budget == "medium" and cost > 50:
+        # 예산 내 최고 ROI 투자 옵션 (동점이면 먼저 나온 옵션)
+        best_row = None
+        for row in matrix.strategy_rows[strategy_key]:
+            if max_cost is not None and cost[row] > max_cost:
                 continue
+            if best_row is None or roi[row] > roi[best_row]:
+                best_row = row
 
-            roi = option.get("roi_percent", 0)
-            if roi > best_roi:
-                best_roi = roi
-                best_option = {
-                    "investment_level": level,
-                    **option
-                }
-
-        if best_option:
+        if best_row is not None:
             results.append({
                 "strategy_key": strategy_key,
                 "name": strategy.get("name"),
@@ -1357,13 +1425,50 @@ def get_optimal_farming_strategies(
                 "description_ko": strategy.get("description_ko"),
                 "tag_match_score": tag_match,
                 "build_requirements": req_tags,
-                "best_option": best_option,
+                "best_option": {
+                    "investment_level": matrix.rows[best_row][1],
+                    **matrix.option(best_row, evaluation)
+                },
                 "atlas_nodes": strategy.get("atlas_nodes", []),
                 "execution_guide": strategy.get("execution_guide", {})
             })
 
     # ROI로 정렬
     results.sort(key=lambda x: x["best_option"]["roi_percent"], reverse=True)
+    return results
+
+
+# 최적 스카랍 조합 추천
+def get_optimal_farming_strategies(
+    budget: str = "medium",
+    build_tags: List[str] = None,
+    league_phase: str = "mid",
+    league: str = "Keepers"
+) -> Dict:
+    """현재 가격 기반 최적 파밍 전략 추천
+
+    Args:
+        budget: "low", "medium", "high"
+        build_tags: 빌드 태그 목록
+        league_phase: "early", "mid", "late"
+        league: 리그 이름
+
+    Returns:
+        최적 전략 목록
+    """
+    # 가격 데이터 가져오기 (두 카테고리 동시 요청 후 저장소에서 파싱)
+    get_poe_ninja_client().fetch_overviews(league, ["Currency", "Scarab"], max_age=PRICE_MAX_AGE)
+    currency_prices = fetch_poe_ninja_currency(league)
+    scarab_prices = fetch_poe_ninja_scarabs(league)
+    divine_ratio = get_divine_chaos_ratio(currency_prices)
+
+    results = rank_farming_strategies(
+        scarab_prices,
+        divine_ratio,
+        budget=budget,
+        build_tags=build_tags,
+        league_phase=league_phase
+    )
 
     return {
         "league": league,
@@ -3,6 +3,10 @@
 """
 POB (Path of Building) 게임 데이터 다운로더
 POB GitHub에서 게임 데이터를 다운로드하여 JSON으로 변환
+
+Lua 데이터는 lua_table_parser의 단일 패스 토크나이저로 파싱하며,
+--parse-all은 파일 단위 작업을 프로세스 풀로 분산하고 원본 해시가 바뀐
+출력 파일만 다시 생성한다.
 """
 
 import requests
@@ -11,15 +15,12 @@ import os
 import re
 import subprocess
 import glob
-from typing import Dict, Any, Optional, List
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
-try:
-    import slpp
-    SLPP_AVAILABLE = True
-except ImportError:
-    SLPP_AVAILABLE = False
-    print("[Warning] slpp not installed. Lua parsing unavailable.")
+from lua_table_parser import parse_lua_chunk, LuaParseError
 
 # POB GitHub Data URL
 POB_DATA_BASE_URL = "https://raw.githubusercontent.com/PathOfBuildingCommunity/PathOfBuilding/master/src/Data"
@@ -70,30 +71,43 @@ def download_file(url: str) -> Optional[str]:
 
 def simple_lua_to_dict(lua_content: str) -> Dict[str, Any]:
     """
-    간단한 Lua 테이블을 Python dict로 변환
-    slpp 라이브러리 사용 또는 수동 파싱
+    Lua 데이터 파일을 Python dict로 변환
 
     Args:
         lua_content: Lua 코드 문자열
 
     Returns:
-        Python dictionary
-    """
-    if SLPP_AVAILABLE:
-        try:
-            # slpp로 Lua 파싱
-            # "return { ... }" 형식 추출
-            match = re.search(r'return\s*(\{.*\})', lua_content, re.DOTALL)
-            if match:
-                lua_table = match.group(1)
-                data = slpp.slpp.decode(lua_table)
-                return data
-        except Exception as e:
-            print(f"[WARN] slpp parsing failed: {e}")
+        "return { ... }" 파일이면 반환 테이블, 그 외에는 변수 이름별 대입 값
 
-    # Fallback: 간단한 수동 파싱 (제한적)
-    print("[WARN] Using fallback Lua parser (limited functionality)")
-    return {"_raw": lua_content[:1000], "_note": "Lua parsing requires slpp library"}
+    Raises:
+        LuaParseError: 파싱 실패 (빈 결과로 덮어쓰지 않도록 호출자가 처리)
+    """
+    chunk = parse_lua_chunk(lua_content)
+
+    if 'return' in chunk:
+        return chunk['return']
+    return chunk
+
+def _table_items(table: Any) -> List[Tuple[Any, Any]]:
+    """Lua 테이블(dict 또는 list)의 (키, 값) 목록"""
+    if isinstance(table, dict):
+        return list(table.items())
+    if isinstance(table, list):
+        return list(enumerate(table, 1))
+    return []
+
+def _positional_values(table: Any) -> List[Any]:
+    """Lua 테이블의 위치 값 (1, 2, ... 정수 키)"""
+    if isinstance(table, list):
+        return table
+    if not isinstance(table, dict):
+        return []
+    values = []
+    index = 1
+    while index in table:
+        values.append(table[index])
+        index += 1
+    return values
 
 def extract_unique_items(lua_content: str) -> Dict[str, Any]:
     """
@@ -204,29 +218,12 @@ def extract_skill_gems(lua_content: str) -> Dict[str, Any]:
     """
     gems = {}
 
-    # 젬 블록 추출: 각 젬은 { 로 시작하고 }, 로 끝남
-    # name = "..." 패턴으로 블록 시작점 찾기
-    # 블록 끝은 다음 블록 시작 전까지
-
-    # 모든 name = "..." 위치 찾기
-    name_pattern = r'name\s*=\s*"([^"]+)"'
-    name_matches = list(re.finditer(name_pattern, lua_content))
-
-    for i, name_match in enumerate(name_matches):
-        gem_name = name_match.group(1)
-        start_pos = name_match.start()
-
-        # 다음 젬 시작 위치 또는 파일 끝
-        if i + 1 < len(name_matches):
-            end_pos = name_matches[i + 1].start()
-        else:
-            end_pos = len(lua_content)
-
-        gem_content = lua_content[start_pos:end_pos]
+    for _, entry in _table_items(simple_lua_to_dict(lua_content)):
+        if not isinstance(entry, dict) or 'name' not in entry:
+            continue
 
-        # gameId 추출
-        game_id_match = re.search(r'gameId\s*=\s*"([^"]+)"', gem_content)
-        gem_id = game_id_match.group(1) if game_id_match else gem_name
+        gem_name = entry['name']
+        gem_id = entry.get('gameId') or gem_name
 
         gem_data = {
             "gem_id": gem_id,
@@ -235,24 +232,19 @@ def extract_skill_gems(lua_content: str) -> Dict[str, Any]:
         }
 
         # tagString 추출 (읽기 쉬운 태그)
-        tag_string_match = re.search(r'tagString\s*=\s*"([^"]*)"', gem_content)
-        if tag_string_match:
-            gem_data["tagString"] = tag_string_match.group(1)
+        tag_string = entry.get('tagString')
+        if isinstance(tag_string, str):
+            gem_data["tagString"] = tag_string
             # tagString에서 태그 리스트 생성
-            tags = [t.strip().lower() for t in tag_string_match.group(1).split(',') if t.strip()]
-            gem_data["tags"] = tags
+            gem_data["tags"] = [t.strip().lower() for t in tag_string.split(',') if t.strip()]
         else:
             gem_data["tags"] = []
             gem_data["tagString"] = ""
 
         # 스탯 요구사항 추출
-        req_str = re.search(r'reqStr\s*=\s*(\d+)', gem_content)
-        req_dex = re.search(r'reqDex\s*=\s*(\d+)', gem_content)
-        req_int = re.search(r'reqInt\s*=\s*(\d+)', gem_content)
-
-        gem_data["reqStr"] = int(req_str.group(1)) if req_str else 0
-        gem_data["reqDex"] = int(req_dex.group(1)) if req_dex else 0
-        gem_data["reqInt"] = int(req_int.group(1)) if req_int else 0
+        gem_data["reqStr"] = int(entry.get('reqStr') or 0)
+        gem_data["reqDex"] = int(entry.get('reqDex') or 0)
+        gem_data["reqInt"] = int(entry.get('reqInt') or 0)
 
         # 젬 색상 결정 (주요 스탯 기반)
         if gem_data["reqInt"] > gem_data["reqStr"] and gem_data["reqInt"] > gem_data["reqDex"]:
@@ -265,14 +257,13 @@ def extract_skill_gems(lua_content: str) -> Dict[str, Any]:
             gem_data["color"] = "white"
 
         # naturalMaxLevel 추출
-        max_level = re.search(r'naturalMaxLevel\s*=\s*(\d+)', gem_content)
-        gem_data["naturalMaxLevel"] = int(max_level.group(1)) if max_level else 20
+        gem_data["naturalMaxLevel"] = int(entry.get('naturalMaxLevel') or 20)
 
         # 서포트 젬 여부
-        gem_data["isSupport"] = "support" in gem_data["tagString"].lower() or "Support" in gem_data.get("name", "")
+        gem_data["isSupport"] = "support" in gem_data["tagString"].lower() or "Support" in gem_name
 
         # Vaal 젬 여부
-        gem_data["isVaal"] = "vaal" in gem_data.get("name", "").lower() or "vaalGem" in gem_content
+        gem_data["isVaal"] = "vaal" in gem_name.lower() or bool(entry.get('vaalGem'))
 
         # 젬 ID에서 간단한 키 생성
         simple_id = gem_id.split("/")[-1].replace("SkillGem", "").replace("SupportGem", "")
@@ -310,13 +301,17 @@ def download_pob_data() -> bool:
             continue
 
         # Lua를 JSON으로 변환
-        if data_name == "uniques":
-            parsed_data = extract_unique_items(content)
-        elif data_name == "gems":
-            parsed_data = extract_skill_gems(content)
-        else:
-            # 기본 파싱
-            parsed_data = simple_lua_to_dict(content)
+        try:
+            if data_name == "uniques":
+                parsed_data = extract_unique_items(content)
+            elif data_name == "gems":
+                parsed_data = extract_skill_gems(content)
+            else:
+                # 기본 파싱
+                parsed_data = simple_lua_to_dict(content)
+        except LuaParseError as e:
+            print(f"[ERROR] Failed to parse {data_name}: {e}")
+            continue
 
         # JSON 파일로 저장
         output_file = os.path.join(GAME_DATA_DIR, f"{data_name}.json")
@@ -556,89 +551,54 @@ def extract_mod_data(lua_content: str, file_name: str = "") -> Dict[str, Any]:
     """
     mods = {}
 
-    # 각 줄을 처리 (한 줄에 하나의 모드)
-    for line in lua_content.split('\n'):
-        line = line.strip()
-        if not line.startswith('["'):
-            continue
-
-        # 모드 ID 추출
-        mod_id_match = re.match(r'\["([^"]+)"\]\s*=\s*\{(.+)\},?\s*$', line)
-        if not mod_id_match:
+    for mod_id, entry in _table_items(simple_lua_to_dict(lua_content)):
+        if not isinstance(mod_id, str) or not isinstance(entry, dict):
             continue
 
-        mod_id = mod_id_match.group(1)
-        mod_content = mod_id_match.group(2)
-
         mod_data = {
             "mod_id": mod_id,
             "source": file_name
         }
 
         # type (Prefix/Suffix)
-        type_match = re.search(r'type\s*=\s*"([^"]+)"', mod_content)
-        if type_match:
-            mod_data["type"] = type_match.group(1)
+        if isinstance(entry.get('type'), str):
+            mod_data["type"] = entry['type']
 
         # affix 이름
-        affix_match = re.search(r'affix\s*=\s*"([^"]*)"', mod_content)
-        if affix_match:
-            mod_data["affix"] = affix_match.group(1)
-
-        # 모드 텍스트 (따옴표로 감싸진 문자열 중 키=값 형태가 아닌 것)
-        # 예: "+(8-12) to Strength"
-        stat_texts = []
-        for m in re.finditer(r'"([^"]+)"', mod_content):
-            text = m.group(1)
-            # 키=값 형태가 아닌 독립적인 문자열 (앞에 = 가 없음)
-            start = m.start()
-            if start > 0 and mod_content[start-1] != '=' and mod_content[start-2:start] != '= ':
-                # affix, type, group 값이 아닌지 확인
-                if text not in [mod_data.get("type", ""), mod_data.get("affix", "")]:
-                    # weightKey, modTags 안의 값이 아닌지 확인
-                    if not any(text == k for k in ["ring", "amulet", "belt", "default", "attribute", "resource", "life", "mana", "damage", "physical", "attack", "caster", "speed", "critical"]):
-                        stat_texts.append(text)
-
-        # 더 정확한 스탯 추출: 괄호나 숫자 포함된 것
-        stats = []
-        for text in stat_texts:
-            if any(c in text for c in ['(', '+', '-', '%']) or any(c.isdigit() for c in text):
-                stats.append(text)
+        if isinstance(entry.get('affix'), str):
+            mod_data["affix"] = entry['affix']
+
+        # 모드 텍스트 = 테이블의 위치 값 (예: "+(8-12) to Strength")
+        stats = [text for text in _positional_values(entry) if isinstance(text, str) and text]
         if stats:
             mod_data["stats"] = stats
 
         # level
-        level_match = re.search(r'level\s*=\s*(\d+)', mod_content)
-        if level_match:
-            mod_data["level"] = int(level_match.group(1))
+        if isinstance(entry.get('level'), (int, float)):
+            mod_data["level"] = int(entry['level'])
 
         # group
-        group_match = re.search(r'group\s*=\s*"([^"]+)"', mod_content)
-        if group_match:
-            mod_data["group"] = group_match.group(1)
+        if isinstance(entry.get('group'), str):
+            mod_data["group"] = entry['group']
 
         # statOrder (stat IDs)
-        stat_order_match = re.search(r'statOrder\s*=\s*\{([^}]+)\}', mod_content)
-        if stat_order_match:
-            stat_ids = re.findall(r'\d+', stat_order_match.group(1))
-            mod_data["stat_order"] = [int(sid) for sid in stat_ids]
+        stat_order = _positional_values(entry.get('statOrder'))
+        if stat_order:
+            mod_data["stat_order"] = [int(sid) for sid in stat_order]
 
         # modTags
-        mod_tags_match = re.search(r'modTags\s*=\s*\{([^}]+)\}', mod_content)
-        if mod_tags_match:
-            tags = re.findall(r'"([^"]+)"', mod_tags_match.group(1))
+        tags = _positional_values(entry.get('modTags'))
+        if tags:
             mod_data["tags"] = tags
 
         # weightKey (item types)
-        weight_key_match = re.search(r'weightKey\s*=\s*\{([^}]+)\}', mod_content)
-        if weight_key_match:
-            keys = re.findall(r'"([^"]+)"', weight_key_match.group(1))
+        keys = _positional_values(entry.get('weightKey'))
+        if keys:
             mod_data["weight_keys"] = keys
 
         # weightVal
-        weight_val_match = re.search(r'weightVal\s*=\s*\{([^}]+)\}', mod_content)
-        if weight_val_match:
-            vals = re.findall(r'\d+', weight_val_match.group(1))
+        vals = _positional_values(entry.get('weightVal'))
+        if vals:
             mod_data["weight_vals"] = [int(v) for v in vals]
 
         mods[mod_id] = mod_data
@@ -661,51 +621,40 @@ def extract_item_bases(lua_content: str, category: str = "") -> Dict[str, Any]:
     """
     bases = {}
 
-    # 베이스 아이템 패턴
-    pattern = r'\["([^"]+)"\]\s*=\s*\{([^}]+(?:\{[^}]*\}[^}]*)*)\}'
-    matches = re.finditer(pattern, lua_content, re.DOTALL)
+    chunk = simple_lua_to_dict(lua_content)
+    # Bases/*.lua: itemBases["Name"] = { ... } 대입문
+    tables = [value for value in chunk.values() if isinstance(value, dict)] if isinstance(chunk, dict) else []
 
-    for match in matches:
-        base_name = match.group(1)
-        base_content = match.group(2)
+    for table in tables:
+        for base_name, entry in table.items():
+            if not isinstance(base_name, str) or not isinstance(entry, dict):
+                continue
 
-        base_data = {
-            "name": base_name,
-            "category": category
-        }
-
-        # type
-        type_match = re.search(r'type\s*=\s*"([^"]+)"', base_content)
-        if type_match:
-            base_data["type"] = type_match.group(1)
-
-        # implicit
-        implicit_match = re.search(r'implicit\s*=\s*"([^"]*)"', base_content)
-        if implicit_match:
-            base_data["implicit"] = implicit_match.group(1)
-
-        # 요구사항
-        req = {}
-        req_level = re.search(r'req\s*=\s*\{[^}]*level\s*=\s*(\d+)', base_content)
-        if req_level:
-            req["level"] = int(req_level.group(1))
-
-        req_str = re.search(r'req\s*=\s*\{[^}]*str\s*=\s*(\d+)', base_content)
-        if req_str:
-            req["str"] = int(req_str.group(1))
+            base_data = {
+                "name": base_name,
+                "category": category
+            }
 
-        req_dex = re.search(r'req\s*=\s*\{[^}]*dex\s*=\s*(\d+)', base_content)
-        if req_dex:
-            req["dex"] = int(req_dex.group(1))
+            # type
+            if isinstance(entry.get('type'), str):
+                base_data["type"] = entry['type']
 
-        req_int = re.search(r'req\s*=\s*\{[^}]*int\s*=\s*(\d+)', base_content)
-        if req_int:
-            req["int"] = int(req_int.group(1))
+            # implicit
+            if isinstance(entry.get('implicit'), str):
+                base_data["implicit"] = entry['implicit']
 
-        if req:
-            base_data["req"] = req
+            # 요구사항
+            req_table = entry.get('req')
+            if isinstance(req_table, dict):
+                req = {
+                    key: int(req_table[key])
+                    for key in ('level', 'str', 'dex', 'int')
+                    if isinstance(req_table.get(key), (int, float))
+                }
+                if req:
+                    base_data["req"] = req
 
-        bases[base_name] = base_data
+            bases[base_name] = base_data
 
     return bases
 
@@ -774,37 +723,124 @@ def extract_stat_descriptions(lua_content: str) -> Dict[str, Any]:
 
     Returns:
         {
-            "stat_id": {
+            "base_maximum_life": {
                 "id": 1482,
-                "text": ["+# to maximum Life"],
-                "negated": False
+                "stats": ["base_maximum_life"],
+                "text": ["{0:+d} to maximum Life"]
             }
         }
     """
     stats = {}
 
-    # 스탯 설명 패턴은 복잡한 Lua 구조
-    # 간단한 패턴으로 주요 데이터 추출
-
-    # 스탯 ID와 텍스트 매핑
-    pattern = r'\[(\d+)\]\s*=\s*\{[^}]*text\s*=\s*"([^"]+)"'
-    matches = re.finditer(pattern, lua_content)
+    # 설명 블록: [n] = { [1] = { {limit=..., text="..."}, ... }, stats = { "stat_id", ... } }
+    for index, entry in _table_items(simple_lua_to_dict(lua_content)):
+        if not isinstance(index, int) or not isinstance(entry, dict):
+            continue
 
-    for match in matches:
-        stat_id = match.group(1)
-        text = match.group(2)
+        stat_ids = [sid for sid in _positional_values(entry.get('stats')) if isinstance(sid, str)]
+        variants = entry.get(1) if isinstance(entry.get(1), (list, dict)) else []
+        texts = [
+            variant['text'] for variant in _positional_values(variants)
+            if isinstance(variant, dict) and isinstance(variant.get('text'), str)
+        ]
+        if not stat_ids or not texts:
+            continue
 
-        stats[stat_id] = {
-            "id": int(stat_id),
-            "text": text
+        description = {
+            "id": index,
+            "stats": stat_ids,
+            "text": texts
         }
+        for stat_id in stat_ids:
+            stats[stat_id] = description
 
     return stats
 
-def parse_all_pob_data() -> bool:
+# 파서 출력 형식이 바뀌면 올려서 기존 출력을 모두 다시 생성
+PARSER_VERSION = 2
+
+MOD_FILES = [
+    "ModItem.lua", "ModFlask.lua", "ModJewel.lua",
+    "ModJewelAbyss.lua", "ModJewelCluster.lua",
+    "ModVeiled.lua", "ModMaster.lua"
+]
+
+# (출력 파일, 파서 종류, POB_DATA_DIR 기준 원본 패턴)
+PARSE_OUTPUTS = [
+    ("gems.json", "gems", ["Gems.lua"]),
+    ("uniques.json", "uniques", ["Uniques/*.lua"]),
+    ("mods.json", "mods", MOD_FILES),
+    ("item_bases.json", "bases", ["Bases/**/*.lua"]),
+    ("pantheons.json", "pantheons", ["Pantheons.lua"]),
+    ("essence.json", "essence", ["Essence.lua"]),
+    ("cluster_jewels.json", "cluster", ["ClusterJewels.lua"]),
+    ("stat_descriptions.json", "stats", ["StatDescriptions/*.lua"]),
+]
+
+def _resolve_sources(patterns: List[str]) -> List[str]:
+    """원본 패턴 -> 존재하는 Lua 파일 목록 (패턴 순서, 패턴 내 정렬)"""
+    sources = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(os.path.join(POB_DATA_DIR, pattern), recursive=True))
+        sources.extend(path for path in matches if path not in sources)
+    return sources
+
+def _source_hash(sources: List[str]) -> str:
+    """원본 파일 내용 + 파서 버전 해시"""
+    digest = hashlib.sha256(f"parser-v{PARSER_VERSION}".encode())
+    for path in sources:
+        digest.update(os.path.relpath(path, POB_DATA_DIR).replace(os.sep, '/').encode('utf-8'))
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+def _parse_data_file(job: Tuple[str, str]) -> Tuple[str, Any, Optional[str]]:
+    """
+    Lua 파일 1개 파싱 (프로세스 풀 작업 단위)
+
+    Args:
+        job: (파서 종류, 파일 경로)
+
+    Returns:
+        (파일 경로, 파싱 결과, 오류 메시지 또는 None)
+    """
+    kind, path = job
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        if kind == "gems":
+            data = extract_skill_gems(content)
+        elif kind == "uniques":
+            data = extract_unique_items(content)
+        elif kind == "mods":
+            data = extract_mod_data(content, os.path.basename(path))
+        elif kind == "bases":
+            data = extract_item_bases(content, os.path.basename(os.path.dirname(path)))
+        elif kind == "pantheons":
+            data = extract_pantheons(content)
+        elif kind == "essence":
+            data = extract_essence(content)
+        elif kind == "stats":
+            data = extract_stat_descriptions(content)
+        else:
+            data = simple_lua_to_dict(content)
+        return path, data, None
+    except Exception as e:
+        return path, {}, str(e)
+
+def parse_all_pob_data(force: bool = False, workers: Optional[int] = None) -> bool:
     """
     POB 저장소의 모든 데이터를 파싱하여 JSON으로 저장
 
+    원본 Lua 파일 해시가 이전 실행(metadata.json의 source_hashes)과 같은 출력은
+    건너뛰고, 나머지 파일은 프로세스 풀에서 병렬로 파싱한다.
+
+    Args:
+        force: 해시와 무관하게 모든 출력 재생성
+        workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 처리)
+
     Returns:
         성공 여부
     """
@@ -823,96 +859,93 @@ def parse_all_pob_data() -> bool:
     print(f"[INFO] POB Version: {pob_version}")
     print()
 
+    previous = get_metadata() or {}
+    previous_hashes = previous.get("source_hashes", {})
+    previous_files = previous.get("files", {})
+
     metadata = {
         "version": pob_version,
         "parsed_at": datetime.now().isoformat(),
-        "files": {}
+        "parser_version": PARSER_VERSION,
+        "files": {},
+        "source_hashes": {}
     }
 
-    # 1. 젬 데이터 (기존)
-    print("[1/8] Parsing Gems.lua...")
-    gems_path = os.path.join(POB_DATA_DIR, "Gems.lua")
-    if os.path.exists(gems_path):
-        with open(gems_path, 'r', encoding='utf-8') as f:
-            gems = extract_skill_gems(f.read())
-        save_json("gems.json", gems, metadata)
-
-    # 2. 유니크 아이템
-    print("[2/8] Parsing Uniques.lua...")
-    uniques_path = os.path.join(POB_DATA_DIR, "Uniques")
-    if os.path.exists(uniques_path):
-        all_uniques = {}
-        for lua_file in glob.glob(os.path.join(uniques_path, "*.lua")):
-            with open(lua_file, 'r', encoding='utf-8') as f:
-                uniques = extract_unique_items(f.read())
-                all_uniques.update(uniques)
-        save_json("uniques.json", all_uniques, metadata)
-
-    # 3. 모드 데이터
-    print("[3/8] Parsing Mod files...")
-    mod_files = [
-        "ModItem.lua", "ModFlask.lua", "ModJewel.lua",
-        "ModJewelAbyss.lua", "ModJewelCluster.lua",
-        "ModVeiled.lua", "ModMaster.lua"
-    ]
-    all_mods = {}
-    for mod_file in mod_files:
-        mod_path = os.path.join(POB_DATA_DIR, mod_file)
-        if os.path.exists(mod_path):
-            with open(mod_path, 'r', encoding='utf-8') as f:
-                mods = extract_mod_data(f.read(), mod_file)
-                all_mods.update(mods)
-                print(f"  - {mod_file}: {len(mods)} mods")
-    save_json("mods.json", all_mods, metadata)
-
-    # 4. 아이템 베이스
-    print("[4/8] Parsing Base items...")
-    bases_dir = os.path.join(POB_DATA_DIR, "Bases")
-    all_bases = {}
-    if os.path.exists(bases_dir):
-        for lua_file in glob.glob(os.path.join(bases_dir, "**", "*.lua"), recursive=True):
-            category = os.path.basename(os.path.dirname(lua_file))
-            with open(lua_file, 'r', encoding='utf-8') as f:
-                bases = extract_item_bases(f.read(), category)
-                all_bases.update(bases)
-        print(f"  - Total: {len(all_bases)} bases")
-    save_json("item_bases.json", all_bases, metadata)
-
-    # 5. 판테온
-    print("[5/8] Parsing Pantheons.lua...")
-    pantheon_path = os.path.join(POB_DATA_DIR, "Pantheons.lua")
-    if os.path.exists(pantheon_path):
-        with open(pantheon_path, 'r', encoding='utf-8') as f:
-            pantheons = extract_pantheons(f.read())
-        save_json("pantheons.json", pantheons, metadata)
-
-    # 6. 에센스
-    print("[6/8] Parsing Essence.lua...")
-    essence_path = os.path.join(POB_DATA_DIR, "Essence.lua")
-    if os.path.exists(essence_path):
-        with open(essence_path, 'r', encoding='utf-8') as f:
-            essences = extract_essence(f.read())
-        save_json("essence.json", essences, metadata)
-
-    # 7. 클러스터 주얼
-    print("[7/8] Parsing ClusterJewels.lua...")
-    cluster_path = os.path.join(POB_DATA_DIR, "ClusterJewels.lua")
-    if os.path.exists(cluster_path):
-        with open(cluster_path, 'r', encoding='utf-8') as f:
-            cluster = simple_lua_to_dict(f.read())
-        save_json("cluster_jewels.json", cluster, metadata)
-
-    # 8. 스탯 설명
-    print("[8/8] Parsing StatDescriptions...")
-    stat_desc_dir = os.path.join(POB_DATA_DIR, "StatDescriptions")
-    all_stats = {}
-    if os.path.exists(stat_desc_dir):
-        for lua_file in glob.glob(os.path.join(stat_desc_dir, "*.lua")):
-            with open(lua_file, 'r', encoding='utf-8') as f:
-                stats = extract_stat_descriptions(f.read())
-                all_stats.update(stats)
-        print(f"  - Total: {len(all_stats)} stat descriptions")
-    save_json("stat_descriptions.json", all_stats, metadata)
+    # 1. 변경된 출력 찾기
+    stale = []
+    for filename, kind, patterns in PARSE_OUTPUTS:
+        sources = _resolve_sources(patterns)
+        if not sources:
+            print(f"[SKIP] {filename}: no source files")
+            continue
+
+        source_hash = _source_hash(sources)
+        key = filename.replace(".json", "")
+        unchanged = (
+            not force
+            and previous_hashes.get(filename) == source_hash
+            and key in previous_files
+            and os.path.exists(os.path.join(GAME_DATA_DIR, filename))
+        )
+        if unchanged:
+            metadata["files"][key] = previous_files[key]
+            metadata["source_hashes"][filename] = source_hash
+            print(f"[SKIP] {filename}: unchanged ({len(sources)} source files)")
+            continue
+
+        stale.append((filename, kind, sources, source_hash))
+
+    if not stale:
+        print("[OK] All outputs up to date")
+
+    # 2. 파일 단위 병렬 파싱
+    jobs = [(kind, path) for _, kind, sources, _ in stale for path in sources]
+    results = {}
+    if jobs:
+        print(f"[INFO] Parsing {len(jobs)} Lua files for {len(stale)} outputs...")
+        if workers == 1 or len(jobs) == 1:
+            for path, data, error in map(_parse_data_file, jobs):
+                results[path] = (data, error)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for path, data, error in pool.map(_parse_data_file, jobs):
+                    results[path] = (data, error)
+
+    # 3. 원본 순서대로 병합 후 저장
+    any_failed = False
+    for filename, kind, sources, source_hash in stale:
+        failed = False
+        if len(sources) == 1 and kind not in ("mods", "bases", "stats"):
+            data, error = results[sources[0]]
+            if error:
+                print(f"[ERROR] {os.path.basename(sources[0])}: {error}")
+                failed = True
+            merged = data
+        else:
+            merged = {}
+            for path in sources:
+                data, error = results[path]
+                if error:
+                    print(f"[ERROR] {os.path.basename(path)}: {error}")
+                    failed = True
+                    continue
+                merged.update(data)
+                if kind == "mods":
+                    print(f"  - {os.path.basename(path)}: {len(data)} mods")
+            if kind in ("bases", "stats"):
+                print(f"  - Total: {len(merged)} {'bases' if kind == 'bases' else 'stat descriptions'}")
+
+        # 실패한 출력은 저장하지 않고(기존 파일 유지) 해시도 기록하지 않아 다음 실행에서 다시 파싱
+        if failed:
+            any_failed = True
+            key = filename.replace(".json", "")
+            if key in previous_files and os.path.exists(os.path.join(GAME_DATA_DIR, filename)):
+                metadata["files"][key] = previous_files[key]
+            print(f"[ERROR] {filename}: not saved, will retry on next run")
+            continue
+
+        save_json(filename, merged, metadata)
+        metadata["source_hashes"][filename] = source_hash
 
     # 메타데이터 저장
     try:
@@ -926,11 +959,12 @@ def parse_all_pob_data() -> bool:
     print("=" * 60)
     print("Parse Summary:")
     print(f"  - Files generated: {len(metadata['files'])}")
+    print(f"  - Files reparsed: {len(stale)}")
     print(f"  - Total entries: {sum(f.get('entries', 0) for f in metadata['files'].values())}")
     print(f"  - Data directory: {GAME_DATA_DIR}")
     print("=" * 60)
 
-    return True
+    return not any_failed
 
 def save_json(filename: str, data: Dict, metadata: Dict):
     """JSON 파일 저장 헬퍼"""
@@ -957,6 +991,8 @@ if __name__ == "__main__":
     parser.add_argument('--clone', action='store_true', help='Clone or update POB repository')
     parser.add_argument('--update', action='store_true', help='Update POB repository (same as --clone)')
     parser.add_argument('--parse-all', action='store_true', help='Parse all POB data to JSON')
+    parser.add_argument('--force', action='store_true', help='Reparse all files even if sources are unchanged (with --parse-all)')
+    parser.add_argument('--workers', type=int, default=None, help='Parser processes for --parse-all (default: CPU count)')
     parser.add_argument('--check', action='store_true', help='Check data integrity')
     parser.add_argument('--stats', action='store_true', help='Show data statistics')
     parser.add_argument('--load', type=str, help='Load specific data type (uniques, gems, mods, etc.)')
@@ -970,7 +1006,7 @@ if __name__ == "__main__":
             print("[INFO] Repository ready. Run --parse-all to extract data.")
 
     elif args.parse_all:
-        success = parse_all_pob_data()
+        success = parse_all_pob_data(force=args.force, workers=args.workers)
         if success:
             check_data_integrity()
 
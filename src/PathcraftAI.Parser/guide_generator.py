@@ -413,13 +413,13 @@ class GuideGenerator:
 
         # 빌드 정보 추출
         build_info = self.extract_build_info(xml_content)
+        return self._guide_for_build(build_info, self.find_matching_build(build_info))
 
+    def _guide_for_build(self, build_info: Dict, matching_build: Optional[Dict]) -> Dict[str, Any]:
+        """추출한 빌드 정보와 매칭된 빌드 템플릿으로 가이드 생성"""
         # 아키타입 감지
         archetype = self.detect_archetype(build_info)
 
-        # 매칭되는 빌드 템플릿 찾기
-        matching_build = self.find_matching_build(build_info)
-
         # 가이드 병합
         guide = {
             "build_info": build_info,
@@ -462,12 +462,22 @@ class GuideGenerator:
 
     def generate_ui_compatible_guide(self, pob_code: str) -> Dict[str, Any]:
         """UI에서 사용하는 형식으로 가이드 생성"""
-        guide = self.generate_guide(pob_code)
+        xml_content = self.decode_pob_code(pob_code)
+        if not xml_content:
+            return {"error": "POB 코드 디코딩 실패"}
 
-        if "error" in guide:
-            return guide
+        build_info = self.extract_build_info(xml_content)
+        matching_build = self.find_matching_build(build_info)
+
+        # 빌드 특화 템플릿이 없으면 leveling_guide_store --build로 미리 생성한 가이드 사용
+        if matching_build is None:
+            prebuilt = self._prebuilt_ui_guide(build_info)
+            if prebuilt:
+                prebuilt["archetype"] = self.detect_archetype(build_info)
+                return prebuilt
+
+        guide = self._guide_for_build(build_info, matching_build)
 
-        build_info = guide.get("build_info", {})
         archetype_guide = guide.get("archetype_guide", {})
         build_specific = guide.get("build_specific", {})
         common = guide.get("common", {})
@@ -587,6 +597,19 @@ class GuideGenerator:
 
         return ui_guide
 
+    def _prebuilt_ui_guide(self, build_info: Dict) -> Optional[Dict[str, Any]]:
+        """미리 생성한 스킬 × 어센던시 가이드 (없거나 저장소를 열 수 없으면 None)"""
+        try:
+            from leveling_guide_store import LEVELING_GUIDES_DB, get_prebuilt_guide, to_ui_guide
+            if not os.path.exists(LEVELING_GUIDES_DB):
+                return None
+            guide = get_prebuilt_guide(build_info.get("main_skill", ""), build_info.get("ascendancy", ""),
+                                       korean=True, read_only=True)
+        except Exception as e:
+            print(f"[WARN] Prebuilt leveling guide lookup failed: {e}", file=sys.stderr)
+            return None
+        return to_ui_guide(guide) if guide else None
+
     def print_guide(self, guide: Dict) -> None:
         """가이드를 읽기 쉽게 출력"""
         if "error" in guide:
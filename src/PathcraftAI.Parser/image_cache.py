@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Image Cache
+poecdn 아이콘/이미지 로컬 캐시 (URL 해시 키 + 내용 해시 중복 제거)
+
+- 매니페스트(game_data/images/manifest.json): URL 해시 -> {url, blob, etag, last_modified, size, checked_at}
+- 파일은 내용 sha256 기준 blobs/<2자리>/<sha256>.<ext> 에 한 번만 저장
+  (카테고리가 달라도 같은 아이콘은 파일 1개, 파일명 충돌 없음)
+- 재검증은 ETag / Last-Modified 조건부 GET - 바뀌지 않은 아이콘은 304로 본문 전송 없음
+- 요청은 poe_ninja_client의 공용 연결 풀 사용, 동시 다운로드 수 제한
+- 이전 레이아웃(images/<category>/<파일명>)에 이미 있는 아이콘은 처음 요청될 때 blob으로 가져옴 (재다운로드 없음)
+- 매니페스트는 sync()가 끝날 때, 단건 fetch는 MANIFEST_SAVE_EVERY개마다 / 종료 시 저장
+
+오버레이/UI는 lookup()만 사용해 네트워크 없이 로컬 경로를 얻는다.
+
+사용 예:
+    from image_cache import get_image_cache
+    cache = get_image_cache()
+    stats = cache.sync(icon_urls)          # 리그 전체 아이콘 동기화 (변경분만 전송)
+    path = cache.lookup(icon_url)          # 디스크에 있으면 경로, 없으면 None
+"""
+
+import os
+import json
+import time
+import atexit
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from poe_ninja_client import PoeNinjaClient, get_poe_ninja_client
+
+IMAGE_CDN_BASE = "https://web.poecdn.com"
+IMAGES_DIR = os.path.join(os.path.dirname(__file__), "game_data", "images")
+MANIFEST_VERSION = 1
+
+# 마지막 확인 후 이 시간(초)이 지나야 조건부 GET으로 재검증
+DEFAULT_REVALIDATE_AFTER = 24 * 3600
+DEFAULT_MAX_DOWNLOADS = 8
+MANIFEST_SAVE_EVERY = 50
+
+
+def normalize_image_url(image_url: str) -> str:
+    """상대 경로 URL을 CDN 전체 URL로 변환"""
+    if image_url.startswith('//'):
+        return f"https:{image_url}"
+    if image_url.startswith('/'):
+        return f"{IMAGE_CDN_BASE}{image_url}"
+    return image_url
+
+
+def url_key(url: str) -> str:
+    """매니페스트 키 (정규화된 URL의 sha1)"""
+    return hashlib.sha1(normalize_image_url(url).encode('utf-8')).hexdigest()
+
+
+class ImageCache:
+    """URL 해시 키 / 내용 해시 저장 이미지 캐시"""
+
+    def __init__(
+        self,
+        root: str = IMAGES_DIR,
+        client: Optional[PoeNinjaClient] = None,
+        max_workers: int = DEFAULT_MAX_DOWNLOADS
+    ):
+        """
+        Args:
+            root: 캐시 디렉토리 (매니페스트와 blobs/ 저장)
+            client: HTTP 클라이언트 (None이면 공용 poe.ninja 클라이언트)
+            max_workers: 동시 다운로드 수
+        """
+        self.root = root
+        self.blob_dir = os.path.join(root, "blobs")
+        self.manifest_path = os.path.join(root, "manifest.json")
+        self._client = client
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        self.entries: Dict[str, Dict] = self._load_manifest()
+        self._legacy = self._scan_legacy_files()
+
+    @property
+    def client(self) -> PoeNinjaClient:
+        if self._client is None:
+            self._client = get_poe_ninja_client()
+        return self._client
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') != MANIFEST_VERSION:
+                return {}
+            return manifest.get('entries', {})
+        except Exception as e:
+            print(f"[WARN] Image manifest unreadable, starting fresh: {e}")
+            return {}
+
+    def _scan_legacy_files(self) -> Dict[str, List[str]]:
+        """이전 images/<category>/<파일명> 레이아웃의 파일 (파일명 -> 경로 목록)"""
+        legacy: Dict[str, List[str]] = {}
+        if not os.path.isdir(self.root):
+            return legacy
+        for name in os.listdir(self.root):
+            category_dir = os.path.join(self.root, name)
+            if name == "blobs" or not os.path.isdir(category_dir):
+                continue
+            for filename in os.listdir(category_dir):
+                if not filename.endswith('.tmp'):
+                    legacy.setdefault(filename, []).append(os.path.join(category_dir, filename))
+        return legacy
+
+    def _import_legacy(self, url: str, key: str) -> Optional[Dict]:
+        """이전 레이아웃에 같은 파일명이 있으면 blob으로 가져와 매니페스트에 추가"""
+        paths = self._legacy.get(os.path.basename(urlparse(url).path))
+        if not paths:
+            return None
+        try:
+            contents = set()
+            for path in paths:
+                with open(path, 'rb') as f:
+                    contents.add(f.read())
+            modified = max(os.path.getmtime(path) for path in paths)
+        except OSError:
+            return None
+        if len(contents) != 1:
+            return None  # 카테고리마다 다른 이미지면 어느 URL의 것인지 알 수 없음
+
+        content = contents.pop()
+        entry = {
+            'url': url,
+            'blob': self._store(content, url),
+            'etag': None,
+            'last_modified': formatdate(modified, usegmt=True),
+            'size': len(content),
+            'checked_at': time.time()
+        }
+        with self._lock:
+            self.entries[key] = entry
+            self._unsaved += 1
+        return entry
+
+    def save_manifest(self) -> None:
+        """매니페스트 저장 (임시 파일 후 교체)"""
+        os.makedirs(self.root, exist_ok=True)
+        with self._lock:
+            manifest = {
+                'version': MANIFEST_VERSION,
+                'updated_at': time.time(),
+                'entries': dict(self.entries)
+            }
+            self._unsaved = 0
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+
+    def flush(self, min_unsaved: int = 1) -> None:
+        """저장하지 않은 변경이 min_unsaved개 이상이면 매니페스트 저장"""
+        if self._unsaved >= min_unsaved:
+            self.save_manifest()
+
+    def _blob_path(self, blob: str) -> str:
+        return os.path.join(self.blob_dir, blob[:2], blob)
+
+    def lookup(self, image_url: str) -> Optional[str]:
+        """디스크에 있는 이미지 경로 (네트워크 요청 없음)"""
+        entry = self.entries.get(url_key(image_url))
+        if not entry:
+            return None
+        path = self._blob_path(entry['blob'])
+        return path if os.path.exists(path) else None
+
+    def _store(self, content: bytes, url: str) -> str:
+        """내용 해시로 blob 저장 (이미 있으면 재사용)"""
+        ext = os.path.splitext(urlparse(url).path)[1].lower() or ".png"
+        blob = hashlib.sha256(content).hexdigest() + ext
+        path = self._blob_path(blob)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        return blob
+
+    def fetch(self, image_url: str, revalidate_after: Optional[float] = DEFAULT_REVALIDATE_AFTER) -> Tuple[Optional[str], str]:
+        """
+        이미지 1개 확보
+
+        Args:
+            image_url: 전체 또는 상대 URL
+            revalidate_after: 마지막 확인 후 이 시간(초)이 지났으면 조건부 GET
+                              (None이면 디스크에 있는 한 재검증하지 않음)
+
+        Returns:
+            (로컬 경로 또는 None, 상태) 상태: "cached" | "not_modified" | "downloaded" | "failed"
+        """
+        url = normalize_image_url(image_url)
+        key = url_key(url)
+        entry = self.entries.get(key) or self._import_legacy(url, key)
+        path = self._blob_path(entry['blob']) if entry else None
+        on_disk = path is not None and os.path.exists(path)
+
+        if on_disk and (revalidate_after is None or time.time() - entry.get('checked_at', 0) < revalidate_after):
+            return path, "cached"
+
+        headers = {}
+        if on_disk:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = self.client.get(url, headers=headers or None, timeout=10)
+        except Exception as e:
+            print(f"[WARN] Failed to download image {image_url}: {e}")
+            return (path if on_disk else None), "failed"
+
+        now = time.time()
+        if response.status_code == 304 and on_disk:
+            with self._lock:
+                entry['checked_at'] = now
+                self._unsaved += 1
+            return path, "not_modified"
+
+        content = response.content
+        blob = self._store(content, url)
+        with self._lock:
+            self.entries[key] = {
+                'url': url,
+                'blob': blob,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'size': len(content),
+                'checked_at': now
+            }
+            self._unsaved += 1
+        return self._blob_path(blob), "downloaded"
+
+    def sync(
+        self,
+        image_urls: Iterable[str],
+        revalidate_after: Optional[float] = DEFAULT_REVALIDATE_AFTER
+    ) -> Dict[str, int]:
+        """
+        여러 이미지를 동시에 확보하고 매니페스트 저장
+
+        Returns:
+            {"cached", "not_modified", "downloaded", "failed", "available"} 개수
+        """
+        urls = list(dict.fromkeys(normalize_image_url(u) for u in image_urls if u))
+        stats = {"cached": 0, "not_modified": 0, "downloaded": 0, "failed": 0, "available": 0}
+        if not urls:
+            return stats
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as executor:
+            results = executor.map(lambda u: self.fetch(u, revalidate_after), urls)
+            for path, status in results:
+                stats[status] += 1
+                if path:
+                    stats["available"] += 1
+
+        self.flush()
+        return stats
+
+    def prune(self) -> int:
+        """매니페스트에서 참조하지 않는 blob 삭제
+
+        Returns:
+            삭제한 파일 수
+        """
+        referenced = {entry['blob'] for entry in self.entries.values()}
+        removed = 0
+        if not os.path.isdir(self.blob_dir):
+            return 0
+        for dirpath, _, filenames in os.walk(self.blob_dir):
+            for filename in filenames:
+                if filename not in referenced:
+                    os.remove(os.path.join(dirpath, filename))
+                    removed += 1
+        return removed
+
+
+_default_cache: Optional[ImageCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_image_cache() -> ImageCache:
+    """프로세스 공용 이미지 캐시 (game_data/images)"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ImageCache()
+            atexit.register(_default_cache.flush)
+        return _default_cache
@@ -904,24 +904,14 @@ class PriceChecker:
             if name_lower == "chaos orb" or name == "카오스 오브":
                 return self._format_price_result(1, divine_rate)
 
-            from poe_ninja_api import PriceCache
-            import requests
-            cache = PriceCache()
+            from poe_ninja_client import get_poe_ninja_client
+            client = get_poe_ninja_client()
 
             # 일반 Currency와 시즌 화폐 모두 체크
             currency_types = ["Currency"]
 
             for currency_type in currency_types:
-                cache_key = f"{self.league}_{currency_type}"
-                cached_data = cache.get(cache_key)
-
-                if not cached_data:
-                    url = f"https://poe.ninja/api/data/currencyoverview"
-                    params = {"league": self.league, "type": currency_type}
-                    response = requests.get(url, params=params, timeout=10)
-                    response.raise_for_status()
-                    cached_data = response.json()
-                    cache.set(cache_key, cached_data)
+                cached_data = client.get_overview(self.league, currency_type)
 
                 if cached_data:
                     lines = cached_data.get('lines', [])
@@ -944,20 +934,12 @@ class PriceChecker:
             # Delirium Orb, Catalyst, Artifact 등
             special_currency_types = ["DeliriumOrb", "Artifact"]
 
-            for api_type in special_currency_types:
-                cache_key = f"{self.league}_{api_type}"
-                cached_data = cache.get(cache_key)
+            overviews = client.fetch_overviews(self.league, special_currency_types)
 
+            for api_type in special_currency_types:
+                cached_data = overviews.get(api_type)
                 if not cached_data:
-                    url = f"https://poe.ninja/api/data/itemoverview"
-                    params = {"league": self.league, "type": api_type}
-                    try:
-                        response = requests.get(url, params=params, timeout=10)
-                        response.raise_for_status()
-                        cached_data = response.json()
-                        cache.set(cache_key, cached_data)
-                    except:
-                        continue
+                    continue
 
                 if cached_data:
                     lines = cached_data.get('lines', [])
@@ -982,20 +964,9 @@ class PriceChecker:
             eng_name = self.parser.translate_korean_name(name, "divination")
 
             # DivinationCard 타입 조회
-            cache_key = f"{self.league}_DivinationCard"
-            from poe_ninja_api import PriceCache
-            cache = PriceCache()
-            cached_data = cache.get(cache_key)
-
-            if not cached_data:
-                # 캐시 없으면 API 직접 호출
-                import requests
-                url = f"https://poe.ninja/api/data/itemoverview"
-                params = {"league": self.league, "type": "DivinationCard"}
-                response = requests.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                cached_data = response.json()
-                cache.set(cache_key, cached_data)
+            from poe_ninja_client import get_poe_ninja_client
+            client = get_poe_ninja_client()
+            cached_data = client.get_overview(self.league, "DivinationCard")
 
             if cached_data:
                 lines = cached_data.get('lines', [])
@@ -1023,30 +994,21 @@ class PriceChecker:
             # 유니크 카테고리들
             unique_types = ["UniqueWeapon", "UniqueArmour", "UniqueAccessory", "UniqueJewel", "UniqueFlask"]
 
-            from poe_ninja_api import PriceCache
-            import requests
-            cache = PriceCache()
+            from poe_ninja_client import get_poe_ninja_client
+            client = get_poe_ninja_client()
 
             name_lower = eng_name.lower()
             links = item_info.get("links", 0)
             corrupted = item_info.get("corrupted", False)
             implicits = item_info.get("implicits", [])
 
-            for utype in unique_types:
-                cache_key = f"{self.league}_{utype}"
-                cached_data = cache.get(cache_key)
+            # 저장소에 없는 카테고리만 동시에 요청 (실패한 카테고리는 None)
+            overviews = client.fetch_overviews(self.league, unique_types)
 
-                # 캐시가 없으면 API 호출
+            for utype in unique_types:
+                cached_data = overviews.get(utype)
                 if not cached_data:
-                    try:
-                        url = f"https://poe.ninja/api/data/itemoverview"
-                        params = {"league": self.league, "type": utype}
-                        response = requests.get(url, params=params, timeout=10)
-                        response.raise_for_status()
-                        cached_data = response.json()
-                        cache.set(cache_key, cached_data)
-                    except Exception:
-                        continue
+                    continue
 
                 lines = cached_data.get('lines', [])
 
@@ -1156,19 +1118,9 @@ class PriceChecker:
                         else:
                             eng_name = f"Vaal {eng_base}"
 
-            cache_key = f"{self.league}_SkillGem"
-            from poe_ninja_api import PriceCache
-            cache = PriceCache()
-            cached_data = cache.get(cache_key)
-
-            if not cached_data:
-                import requests
-                url = f"https://poe.ninja/api/data/itemoverview"
-                params = {"league": self.league, "type": "SkillGem"}
-                response = requests.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                cached_data = response.json()
-                cache.set(cache_key, cached_data)
+            from poe_ninja_client import get_poe_ninja_client
+            client = get_poe_ninja_client()
+            cached_data = client.get_overview(self.league, "SkillGem")
 
             if cached_data:
                 lines = cached_data.get('lines', [])
@@ -1334,19 +1286,9 @@ class PriceChecker:
             if not api_type:
                 return None
 
-            cache_key = f"{self.league}_{api_type}"
-            from poe_ninja_api import PriceCache
-            cache = PriceCache()
-            cached_data = cache.get(cache_key)
-
-            if not cached_data:
-                import requests
-                url = f"https://poe.ninja/api/data/itemoverview"
-                params = {"league": self.league, "type": api_type}
-                response = requests.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                cached_data = response.json()
-                cache.set(cache_key, cached_data)
+            from poe_ninja_client import get_poe_ninja_client
+            client = get_poe_ninja_client()
+            cached_data = client.get_overview(self.league, api_type)
 
             if cached_data:
                 lines = cached_data.get('lines', [])
@@ -1374,22 +1316,12 @@ class PriceChecker:
             # 한글 이름 영문 번역
             eng_name = self.parser.translate_korean_name(name, "map")
 
-            from poe_ninja_api import PriceCache
-            cache = PriceCache()
+            from poe_ninja_client import get_poe_ninja_client
+            client = get_poe_ninja_client()
 
             # 고유 맵
             if rarity == "Unique":
-                cache_key = f"{self.league}_UniqueMap"
-                cached_data = cache.get(cache_key)
-
-                if not cached_data:
-                    import requests
-                    url = f"https://poe.ninja/api/data/itemoverview"
-                    params = {"league": self.league, "type": "UniqueMap"}
-                    response = requests.get(url, params=params, timeout=10)
-                    response.raise_for_status()
-                    cached_data = response.json()
-                    cache.set(cache_key, cached_data)
+                cached_data = client.get_overview(self.league, "UniqueMap")
 
                 if cached_data:
                     lines = cached_data.get('lines', [])
@@ -1409,17 +1341,7 @@ class PriceChecker:
 
             if is_blighted or is_blight_ravaged:
                 map_type = "BlightRavagedMap" if is_blight_ravaged else "BlightedMap"
-                cache_key = f"{self.league}_{map_type}"
-                cached_data = cache.get(cache_key)
-
-                if not cached_data:
-                    import requests
-                    url = f"https://poe.ninja/api/data/itemoverview"
-                    params = {"league": self.league, "type": map_type}
-                    response = requests.get(url, params=params, timeout=10)
-                    response.raise_for_status()
-                    cached_data = response.json()
-                    cache.set(cache_key, cached_data)
+                cached_data = client.get_overview(self.league, map_type)
 
                 if cached_data:
                     lines = cached_data.get('lines', [])
@@ -1433,21 +1355,11 @@ class PriceChecker:
 
             # 일반/레어/매직/미감정 맵 - poe.ninja Map API 사용
             # 맵 이름으로 검색 (티어별 가격 제공)
-            cache_key = f"{self.league}_Map"
-            cached_data = cache.get(cache_key)
-
-            if not cached_data:
-                import requests
-                url = f"https://poe.ninja/api/data/itemoverview"
-                params = {"league": self.league, "type": "Map"}
-                try:
-                    response = requests.get(url, params=params, timeout=10)
-                    response.raise_for_status()
-                    cached_data = response.json()
-                    cache.set(cache_key, cached_data)
-                except Exception as e:
-                    print(f"[WARNING] Map API failed: {e}", file=sys.stderr)
-                    return None
+            try:
+                cached_data = client.get_overview(self.league, "Map")
+            except Exception as e:
+                print(f"[WARNING] Map API failed: {e}", file=sys.stderr)
+                return None
 
             if cached_data:
                 lines = cached_data.get('lines', [])
@@ -1498,20 +1410,10 @@ class PriceChecker:
             base_type_raw = item_info.get("base_type", "")
             eng_base_type = self.parser.translate_korean_name(base_type_raw, "base")
 
-            from poe_ninja_api import PriceCache
-            cache = PriceCache()
+            from poe_ninja_client import get_poe_ninja_client
+            client = get_poe_ninja_client()
 
-            cache_key = f"{self.league}_ClusterJewel"
-            cached_data = cache.get(cache_key)
-
-            if not cached_data:
-                import requests
-                url = f"https://poe.ninja/api/data/itemoverview"
-                params = {"league": self.league, "type": "ClusterJewel"}
-                response = requests.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                cached_data = response.json()
-                cache.set(cache_key, cached_data)
+            cached_data = client.get_overview(self.league, "ClusterJewel")
 
             if cached_data:
                 lines = cached_data.get('lines', [])
@@ -1544,20 +1446,10 @@ class PriceChecker:
             # 한글 이름 영문 번역
             eng_name = self.parser.translate_korean_name(name, "item")
 
-            from poe_ninja_api import PriceCache
-            cache = PriceCache()
-
-            cache_key = f"{self.league}_UniqueJewel"
-            cached_data = cache.get(cache_key)
+            from poe_ninja_client import get_poe_ninja_client
+            client = get_poe_ninja_client()
 
-            if not cached_data:
-                import requests
-                url = f"https://poe.ninja/api/data/itemoverview"
-                params = {"league": self.league, "type": "UniqueJewel"}
-                response = requests.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                cached_data = response.json()
-                cache.set(cache_key, cached_data)
+            cached_data = client.get_overview(self.league, "UniqueJewel")
 
             if cached_data:
                 lines = cached_data.get('lines', [])
@@ -28,6 +28,99 @@ if sys.platform == 'win32':
 # 로컬 모듈
 from pob_item_parser import POBItemParser
 from poe_ninja_api import POENinjaAPI
+from mod_index import load_mod_index
+
+
+# 빌드 키워드 -> 유니크 모드 텍스트 검색 패턴
+UNIQUE_KEYWORD_PATTERNS = {
+    'spell_damage': ['spell damage', 'spell skill'],
+    'fire_damage': ['fire damage', 'fire resist', 'fire penetration'],
+    'cold_damage': ['cold damage', 'cold resist', 'cold penetration'],
+    'lightning_damage': ['lightning damage', 'lightning resist', 'lightning penetration'],
+    'crit_chance': ['critical strike chance', 'critical chance'],
+    'crit_multi': ['critical strike multiplier', 'critical multiplier'],
+    'max_life': ['maximum life', 'to life', 'life regeneration'],
+    'max_es': ['maximum energy shield', 'energy shield'],
+    'attack_speed': ['attack speed'],
+    'cast_speed': ['cast speed'],
+    'dot_damage': ['damage over time', 'burning damage', 'poison damage', 'bleed'],
+    'minion': ['minion', 'summon', 'zombie', 'spectre', 'golem', 'skeleton'],
+}
+
+# POB variant 태그 (예: {variant:1,2}Siege Helmet)
+_VARIANT_TAG_RE = re.compile(r'\{[^}]*\}')
+
+
+def keyword_patterns_for(keywords: List[str]) -> List[str]:
+    """빌드 키워드를 유니크 모드 검색 패턴으로 변환 (순서/중복 유지)"""
+    patterns = []
+    for kw in keywords:
+        patterns.extend(UNIQUE_KEYWORD_PATTERNS.get(kw, [kw.replace('_', ' ')]))
+    return patterns
+
+
+class UniqueKeywordIndex:
+    """uniques.json을 한 번 정규화한 검색 패턴 -> 유니크 역색인
+
+    - 유니크별 정규화 베이스 타입과 소문자 모드 텍스트
+    - 검색 패턴별 매칭 유니크 목록 (알려진 패턴은 미리, 나머지는 첫 사용 시 계산)
+    - 베이스 타입 기준 슬롯 목록
+    """
+
+    def __init__(self, uniques: Dict[str, Dict], slot_categories: Dict[str, List[str]]):
+        self.names: List[str] = list(uniques)
+        self.bases: Dict[str, str] = {}
+        self.mods: Dict[str, List[str]] = {}
+        self.slots: Dict[str, Set[str]] = {}
+        self._texts: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+
+        for name, unique_data in uniques.items():
+            base = _VARIANT_TAG_RE.sub('', unique_data.get('base_type', '')).strip()
+            mods = unique_data.get('mods', [])
+            implicits = unique_data.get('implicits', [])
+
+            self.bases[name] = base
+            self.mods[name] = mods
+            self._texts.append(' '.join(mods + implicits).lower())
+
+            base_lower = base.lower()
+            self.slots[name] = {
+                slot for slot, slot_bases in slot_categories.items()
+                if any(sb in base_lower for sb in slot_bases)
+            }
+
+        for patterns in UNIQUE_KEYWORD_PATTERNS.values():
+            for pattern in patterns:
+                self.postings(pattern)
+
+    def postings(self, pattern: str) -> List[int]:
+        """패턴이 모드 텍스트에 포함된 유니크 번호 (uniques.json 순서)"""
+        key = pattern.lower()
+        posting = self._postings.get(key)
+        if posting is None:
+            posting = [i for i, text in enumerate(self._texts) if key in text]
+            self._postings[key] = posting
+        return posting
+
+    def search(self, patterns: List[str]) -> List[Dict]:
+        """패턴 매칭 수 기준 유니크 목록 (동점은 uniques.json 순서)"""
+        scores: Dict[int, List[str]] = {}
+        for pattern in patterns:
+            for i in self.postings(pattern):
+                scores.setdefault(i, []).append(pattern)
+
+        results = []
+        for i in sorted(scores, key=lambda i: (-len(scores[i]), i)):
+            name = self.names[i]
+            results.append({
+                'name': name,
+                'base': self.bases[name],
+                'mods': self.mods[name],
+                'relevance_score': len(scores[i]),
+                'matched_keywords': scores[i]
+            })
+        return results
 
 
 @dataclass
@@ -53,7 +146,8 @@ class ItemRecommendationEngine:
         """
         self.league = league
         self.ninja_api = POENinjaAPI(league=league, use_cache=True, cache_ttl=300)  # 5분 캐시
-        self.mods_data = self._load_mods_data()
+        self.mod_index = load_mod_index()
+        self.mods_data = self.mod_index.mods
         self.uniques_data = self._load_uniques_data()
 
         # 키워드-모드 태그 매핑
@@ -104,13 +198,7 @@ class ItemRecommendationEngine:
             'jewel': ['jewel'],
         }
 
-    def _load_mods_data(self) -> List[Dict]:
-        """mods.json 로드"""
-        mods_path = Path(__file__).parent / "game_data" / "mods.json"
-        if mods_path.exists():
-            with open(mods_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return []
+        self.unique_index = UniqueKeywordIndex(self.uniques_data, self.slot_categories)
 
     def _load_uniques_data(self) -> Dict[str, Dict]:
         """uniques.json 로드
@@ -156,23 +244,11 @@ class ItemRecommendationEngine:
                 # 직접 태그로 추가
                 target_tags.add(keyword.lower())
 
-        # 모드 필터링 및 스코어링
-        scored_mods = []
-        for mod in self.mods_data:
-            mod_tags = set(mod.get('tags', []))
-
-            # 태그 매칭 스코어
-            match_score = len(target_tags & mod_tags)
-            if match_score > 0:
-                scored_mods.append({
-                    **mod,
-                    'relevance_score': match_score
-                })
-
-        # 스코어순 정렬
-        scored_mods.sort(key=lambda x: x['relevance_score'], reverse=True)
-
-        return scored_mods[:limit]
+        # 태그 역색인에서 매칭 수 상위 모드만 선택
+        return [
+            {**mod, 'relevance_score': match_score}
+            for mod, match_score in self.mod_index.top_k(target_tags, k=limit)
+        ]
 
     def find_uniques_by_mods(self, keywords: List[str], build_type: str = None) -> List[Dict]:
         """키워드에 맞는 유니크 아이템 찾기
@@ -187,70 +263,8 @@ class ItemRecommendationEngine:
         if not self.uniques_data:
             return []
 
-        # 키워드 패턴 생성
-        keyword_patterns = []
-        for kw in keywords:
-            if kw == 'spell_damage':
-                keyword_patterns.extend(['spell damage', 'spell skill'])
-            elif kw == 'fire_damage':
-                keyword_patterns.extend(['fire damage', 'fire resist', 'fire penetration'])
-            elif kw == 'cold_damage':
-                keyword_patterns.extend(['cold damage', 'cold resist', 'cold penetration'])
-            elif kw == 'lightning_damage':
-                keyword_patterns.extend(['lightning damage', 'lightning resist', 'lightning penetration'])
-            elif kw == 'crit_chance':
-                keyword_patterns.extend(['critical strike chance', 'critical chance'])
-            elif kw == 'crit_multi':
-                keyword_patterns.extend(['critical strike multiplier', 'critical multiplier'])
-            elif kw == 'max_life':
-                keyword_patterns.extend(['maximum life', 'to life', 'life regeneration'])
-            elif kw == 'max_es':
-                keyword_patterns.extend(['maximum energy shield', 'energy shield'])
-            elif kw == 'attack_speed':
-                keyword_patterns.append('attack speed')
-            elif kw == 'cast_speed':
-                keyword_patterns.append('cast speed')
-            elif kw == 'dot_damage':
-                keyword_patterns.extend(['damage over time', 'burning damage', 'poison damage', 'bleed'])
-            elif kw == 'minion':
-                keyword_patterns.extend(['minion', 'summon', 'zombie', 'spectre', 'golem', 'skeleton'])
-            else:
-                keyword_patterns.append(kw.replace('_', ' '))
-
-        # 유니크 아이템 스코어링
-        scored_uniques = []
-        for name, unique_data in self.uniques_data.items():
-            base = unique_data.get('base_type', '')
-            # POB variant 태그 제거 (예: {variant:1,2}Siege Helmet -> Siege Helmet)
-            base = re.sub(r'\{[^}]*\}', '', base).strip()
-            mods = unique_data.get('mods', [])
-            implicits = unique_data.get('implicits', [])
-
-            # 모든 모드 텍스트 합치기
-            all_mods = mods + implicits
-            all_mod_text = ' '.join(all_mods).lower()
-
-            # 패턴 매칭 스코어
-            match_score = 0
-            matched_keywords = []
-            for pattern in keyword_patterns:
-                if pattern.lower() in all_mod_text:
-                    match_score += 1
-                    matched_keywords.append(pattern)
-
-            if match_score > 0:
-                scored_uniques.append({
-                    'name': name,
-                    'base': base,
-                    'mods': mods,
-                    'relevance_score': match_score,
-                    'matched_keywords': matched_keywords
-                })
-
-        # 스코어순 정렬
-        scored_uniques.sort(key=lambda x: x['relevance_score'], reverse=True)
-
-        return scored_uniques
+        # 키워드 패턴 생성 후 역색인 병합
+        return self.unique_index.search(keyword_patterns_for(keywords))
 
     def get_price_data(self, item_names: List[str]) -> Dict[str, float]:
         """poe.ninja에서 가격 조회
@@ -310,14 +324,10 @@ class ItemRecommendationEngine:
 
         for slot in target_slots:
             slot_items = []
-            slot_bases = self.slot_categories.get(slot, [])
 
             for unique in relevant_uniques:
-                base_lower = unique.get('base', '').lower()
-
-                # 슬롯 매칭 확인
-                is_slot_match = any(sb in base_lower for sb in slot_bases)
-                if not is_slot_match:
+                # 슬롯 매칭 확인 (베이스 타입 기준, 인덱스에서 미리 계산)
+                if slot not in self.unique_index.slots.get(unique['name'], ()):
                     continue
 
                 name = unique['name']
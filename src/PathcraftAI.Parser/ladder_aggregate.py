@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ladder Aggregate
+리그/어센던시별 래더 요약 (메타 빌드, 클래스별 추천용)
+
+build_data/ladder_aggregate.json (읽기용, 작음):
+    {"version", "leagues": {리그: {"updated_at", "total", "ascendancies": {
+        어센던시: {"class", "count", "top_skills", "top_uniques", "level_bands", "representatives"}}}}}
+
+build_data/ladder_aggregate_state.json (쓰기용):
+    리그별 캐릭터 1명당 요약 1줄. 수집기가 새 빌드를 저장할 때 해당 캐릭터만 교체하고
+    바뀐 리그의 요약만 다시 계산한다 (원본 래더 파일을 다시 읽지 않음).
+
+ladder_cache_builder.save_cache(리그 전체 교체)와 poe_ladder_fetcher.save_builds(추가 수집)가
+저장 직후 update_ladder_aggregate()를 호출한다. 요약이 없거나 래더 캐시보다 오래되었으면
+조회 시 {league}_ladder_cache.json에서 한 번 다시 만든다.
+
+사용 예:
+    from ladder_aggregate import meta_builds, similar_builds
+    meta = meta_builds("Keepers", limit=5)
+    necro = similar_builds("Keepers", "Necromancer", limit=5)
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+
+BUILD_DATA_DIR = os.path.join(os.path.dirname(__file__), "build_data")
+LADDER_CACHE_DIR = os.path.join(BUILD_DATA_DIR, "ladder_cache")
+AGGREGATE_FILE = os.path.join(BUILD_DATA_DIR, "ladder_aggregate.json")
+AGGREGATE_STATE_FILE = os.path.join(BUILD_DATA_DIR, "ladder_aggregate_state.json")
+AGGREGATE_VERSION = 1
+
+TOP_SKILLS = 5
+TOP_UNIQUES = 8
+REPRESENTATIVES = 5
+
+# (라벨, 최소 레벨) - 높은 구간부터
+LEVEL_BANDS = [("100", 100), ("98-99", 98), ("95-97", 95), ("90-94", 90), ("<90", 0)]
+
+
+def level_band(level: int) -> str:
+    for label, minimum in LEVEL_BANDS:
+        if level >= minimum:
+            return label
+    return LEVEL_BANDS[-1][0]
+
+
+def character_summary(build: Dict) -> Dict:
+    """래더 빌드(parse_build_data 형식) -> 집계용 요약"""
+    items = build.get('items') or {}
+    return {
+        'character_name': build.get('character_name', ''),
+        'account_name': build.get('account_name', ''),
+        'class': build.get('class', ''),
+        'ascendancy': build.get('ascendancy') or build.get('ascendancy_class') or build.get('class') or 'Unknown',
+        'level': build.get('level', 0) or 0,
+        'rank': build.get('rank') or 0,
+        'main_skill': items.get('main_skill'),
+        'unique_items': items.get('unique_items', [])
+    }
+
+
+def _character_key(summary: Dict) -> str:
+    return f"{summary['account_name']}/{summary['character_name']}"
+
+
+def aggregate_league(characters: List[Dict]) -> Dict:
+    """캐릭터 요약 목록 -> 리그 요약"""
+    groups: Dict[str, List[Dict]] = {}
+    for character in characters:
+        groups.setdefault(character['ascendancy'], []).append(character)
+
+    ascendancies = {}
+    for ascendancy, members in groups.items():
+        skills = Counter(m['main_skill'] for m in members if m.get('main_skill'))
+        uniques = Counter(item for m in members for item in set(m.get('unique_items') or []))
+        bands = Counter(level_band(m['level']) for m in members)
+        ranked = sorted(members, key=lambda m: m['rank'] or sys.maxsize)
+        classes = Counter(m['class'] for m in members if m.get('class'))
+
+        ascendancies[ascendancy] = {
+            'class': classes.most_common(1)[0][0] if classes else '',
+            'count': len(members),
+            'top_skills': skills.most_common(TOP_SKILLS),
+            'top_uniques': uniques.most_common(TOP_UNIQUES),
+            'level_bands': {label: bands[label] for label, _ in LEVEL_BANDS if bands[label]},
+            'representatives': ranked[:REPRESENTATIVES]
+        }
+
+    return {
+        'updated_at': time.time(),
+        'total': len(characters),
+        'ascendancies': ascendancies
+    }
+
+
+def _read_json(path: str, default):
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != AGGREGATE_VERSION:
+            return default
+        return data
+    except Exception as e:
+        print(f"[WARN] Failed to read {path}: {e}", file=sys.stderr)
+        return default
+
+
+def _write_json(path: str, data: Dict) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+_write_lock = threading.Lock()
+
+
+def update_ladder_aggregate(
+    league: str,
+    builds: List[Dict],
+    replace: bool = False,
+    path: str = AGGREGATE_FILE,
+    state_path: str = AGGREGATE_STATE_FILE
+) -> Dict:
+    """
+    새로 저장된 래더 빌드를 요약에 반영
+
+    Args:
+        league: 리그 이름
+        builds: parse_build_data 형식의 빌드 목록
+        replace: True면 리그의 기존 캐릭터를 모두 교체 (래더 캐시 전체 저장)
+        path: 요약 파일
+        state_path: 캐릭터별 상태 파일
+
+    Returns:
+        리그 요약
+    """
+    with _write_lock:
+        state = _read_json(state_path, {'version': AGGREGATE_VERSION, 'leagues': {}})
+        characters = {} if replace else state['leagues'].get(league, {})
+        for build in builds:
+            summary = character_summary(build)
+            characters[_character_key(summary)] = summary
+        state['leagues'][league] = characters
+
+        league_aggregate = aggregate_league(list(characters.values()))
+        aggregate = _read_json(path, {'version': AGGREGATE_VERSION, 'leagues': {}})
+        aggregate['leagues'][league] = league_aggregate
+
+        _write_json(state_path, state)
+        _write_json(path, aggregate)
+
+    _cache.clear()
+    return league_aggregate
+
+
+def rebuild_from_ladder_cache(league: str, path: str = AGGREGATE_FILE, state_path: str = AGGREGATE_STATE_FILE) -> Optional[Dict]:
+    """{league}_ladder_cache.json에서 리그 요약 다시 만들기 (캐시 없으면 None)"""
+    cache_file = os.path.join(LADDER_CACHE_DIR, f"{league}_ladder_cache.json")
+    if not os.path.exists(cache_file):
+        return None
+    print(f"[INFO] Building ladder aggregate from {cache_file}", file=sys.stderr)
+    with open(cache_file, 'r', encoding='utf-8') as f:
+        builds = json.load(f).get('builds', [])
+    return update_ladder_aggregate(league, builds, replace=True, path=path, state_path=state_path)
+
+
+_cache: Dict[str, tuple] = {}
+_cache_lock = threading.Lock()
+
+
+def load_ladder_aggregate(path: str = AGGREGATE_FILE) -> Dict:
+    """요약 파일 (mtime이 같으면 메모리 캐시)"""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {'version': AGGREGATE_VERSION, 'leagues': {}}
+
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        aggregate = _read_json(path, {'version': AGGREGATE_VERSION, 'leagues': {}})
+        _cache[path] = (mtime, aggregate)
+        return aggregate
+
+
+def get_league_aggregate(league: str, path: str = AGGREGATE_FILE) -> Optional[Dict]:
+    """
+    리그 요약 (없거나 래더 캐시가 더 최신이면 래더 캐시에서 다시 만듦)
+
+    Returns:
+        리그 요약 또는 None (래더 데이터 없음)
+    """
+    league_aggregate = load_ladder_aggregate(path).get('leagues', {}).get(league)
+
+    cache_file = os.path.join(LADDER_CACHE_DIR, f"{league}_ladder_cache.json")
+    if path == AGGREGATE_FILE and os.path.exists(cache_file):
+        if league_aggregate is None or os.path.getmtime(cache_file) > league_aggregate['updated_at']:
+            league_aggregate = rebuild_from_ladder_cache(league)
+
+    return league_aggregate
+
+
+def meta_builds(league: str, limit: int = 5, path: str = AGGREGATE_FILE) -> Optional[List[Dict]]:
+    """
+    인기 어센던시 순 메타 빌드 (어센던시당 최고 순위 캐릭터 + 인기 스킬/유니크)
+
+    Returns:
+        빌드 목록 또는 None (래더 데이터 없음)
+    """
+    league_aggregate = get_league_aggregate(league, path)
+    if league_aggregate is None:
+        return None
+
+    total = league_aggregate['total'] or 1
+    ranked = sorted(league_aggregate['ascendancies'].items(), key=lambda kv: kv[1]['count'], reverse=True)
+
+    builds = []
+    for ascendancy, entry in ranked[:limit]:
+        representative = entry['representatives'][0] if entry['representatives'] else {}
+        builds.append({
+            'character_name': representative.get('character_name', ''),
+            'class': entry['class'],
+            'ascendancy_class': ascendancy,
+            'rank': representative.get('rank'),
+            'level': representative.get('level'),
+            'main_skill': entry['top_skills'][0][0] if entry['top_skills'] else representative.get('main_skill'),
+            'count': entry['count'],
+            'share': round(entry['count'] * 100 / total, 1),
+            'top_skills': [name for name, _ in entry['top_skills']],
+            'top_uniques': [name for name, _ in entry['top_uniques']],
+            'level_bands': entry['level_bands'],
+            'source': 'ladder'
+        })
+    return builds
+
+
+def similar_builds(league: str, ascendancy: str, limit: int = 5, path: str = AGGREGATE_FILE) -> Optional[List[Dict]]:
+    """
+    같은 어센던시(또는 기본 클래스)의 상위 캐릭터
+
+    Returns:
+        빌드 목록 또는 None (래더 데이터 없음)
+    """
+    league_aggregate = get_league_aggregate(league, path)
+    if league_aggregate is None:
+        return None
+
+    # 어센던시 이름이 우선, 없으면 기본 클래스(Witch 등)의 모든 어센던시
+    target = ascendancy.lower()
+    entries = [(name, entry) for name, entry in league_aggregate['ascendancies'].items() if name.lower() == target]
+    if not entries:
+        entries = [(name, entry) for name, entry in league_aggregate['ascendancies'].items()
+                   if (entry['class'] or '').lower() == target]
+
+    builds = [
+        {
+            **representative,
+            'ascendancy_class': name,
+            'top_skills': [skill for skill, _ in entry['top_skills']],
+            'source': 'ladder'
+        }
+        for name, entry in entries
+        for representative in entry['representatives']
+    ]
+    builds.sort(key=lambda b: b['rank'] or sys.maxsize)
+    return builds[:limit]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Ladder Aggregate')
+    parser.add_argument('--league', type=str, required=True, help='League name')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild from the ladder cache')
+    args = parser.parse_args()
+
+    if args.rebuild:
+        rebuild_from_ladder_cache(args.league)
+
+    for build in meta_builds(args.league, limit=10) or []:
+        print(f"  {build['ascendancy_class']:15s} {build['count']:5d} ({build['share']:4.1f}%)  "
+              f"{', '.join(build['top_skills'][:3])}")
@@ -23,6 +23,8 @@ from poe_ladder_fetcher import (
     parse_build_data,
     extract_unique_items
 )
+from ladder_aggregate import update_ladder_aggregate
+from build_similarity_index import refresh_similarity_index
 
 CACHE_DIR = os.path.join(os.path.dirname(__file__), "build_data", "ladder_cache")
 REQUEST_DELAY = 1.0  # POE API 속도 제한
@@ -165,6 +167,8 @@ def save_cache(builds: List[Dict], league: str):
 
     # 통계 생성
     generate_cache_stats(builds, league)
+    update_ladder_aggregate(league, builds, replace=True)
+    refresh_similarity_index()
 
 def generate_cache_stats(builds: List[Dict], league: str):
     """캐시 통계 생성"""
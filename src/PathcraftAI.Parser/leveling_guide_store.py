@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+
+"""
+Leveling Guide Store
+모든 액티브 스킬 × 어센던시 레벨링 가이드를 미리 생성해 두는 색인 저장소 (SQLite, build_data/leveling_guides.db)
+
+ActGuideSearcher.generate_leveling_guide_summary는 요청마다 스킬 1개/클래스 1개씩 가이드를 만든다.
+배치 모드는 SkillTagSystem을 한 번만 로드해 프로세스 풀 워커에 넘기고,
+스킬 단위로 19개 어센던시의 영어/한국어 가이드를 생성해 저장한다.
+
+각 가이드는 입력 데이터 해시(source_hash)를 함께 저장한다:
+    스킬 데이터(gems.json 항목 + 요구 레벨) + 공용 데이터(퀘스트 보상, 벤더 레시피, 전환 패턴, 젬 레벨)
+    + merged_translations.json (영어 가이드에도 leveling_skill_kr 등 번역 필드가 들어감)
+따라서 다시 실행하면 바뀐 젬의 항목만, 번역이 바뀌면 전체를 다시 생성한다.
+
+스킬 이름은 영어/한국어 모두 조회할 수 있다 (한국어는 SkillTagSystem.get_english_name으로 변환).
+
+사용 예:
+    python leveling_guide_store.py --build                  # 바뀐 항목만 생성
+    python leveling_guide_store.py --build --workers 8
+    python leveling_guide_store.py --get "Penance Brand" --ascendancy Inquisitor --korean
+    python leveling_guide_store.py --get "참회의 낙인" --ascendancy Inquisitor --korean
+
+    from leveling_guide_store import get_leveling_guide
+    guide = get_leveling_guide("Penance Brand", "Templar", "Inquisitor", korean=True)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from build_catalog import CLASS_ASCENDANCIES
+from skill_tag_system import (
+    SkillTagSystem, ActGuideSearcher, SkillInfo,
+    GEM_LEVELS_PATH, QUEST_REWARDS_PATH, VENDOR_RECIPES_PATH, TRANSITION_PATTERNS_PATH, TRANSLATIONS_PATH
+)
+
+# UTF-8 설정
+if sys.platform == 'win32':
+    if sys.stdout.encoding != 'utf-8':
+        sys.stdout.reconfigure(encoding='utf-8')
+    if sys.stderr.encoding != 'utf-8':
+        sys.stderr.reconfigure(encoding='utf-8')
+
+BUILD_DATA_DIR = os.path.join(os.path.dirname(__file__), "build_data")
+LEVELING_GUIDES_DB = os.path.join(BUILD_DATA_DIR, "leveling_guides.db")
+
+# 가이드 생성 로직이 바뀌면 올려서 전체 재생성
+GUIDE_FORMAT_VERSION = 1
+
+SHARED_SOURCES = (GEM_LEVELS_PATH, QUEST_REWARDS_PATH, VENDOR_RECIPES_PATH, TRANSITION_PATTERNS_PATH)
+
+# 어센던시 -> 클래스 ("Inquisitor" -> "Templar")
+ASCENDANCY_CLASSES = {
+    ascendancy.title(): char_class.title()
+    for char_class, ascendancies in CLASS_ASCENDANCIES.items()
+    for ascendancy in ascendancies
+}
+
+LANGUAGES = ("en", "kr")
+COMMIT_EVERY = 50  # 스킬 N개마다 커밋
+
+
+def file_hash(paths) -> str:
+    """파일 내용 해시 (없는 파일은 빈 내용으로 취급)"""
+    digest = hashlib.sha1()
+    for path in paths:
+        digest.update(b"\0")
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def guide_hash(skill: SkillInfo, ascendancy: str, shared_hash: str, translation_hash: str) -> str:
+    """가이드 1개(스킬 × 어센던시)의 입력 해시 (영어/한국어 공통)"""
+    skill_key = json.dumps([GUIDE_FORMAT_VERSION, skill.skill_id, skill.name, skill.tags,
+                            skill.required_level, ascendancy, shared_hash, translation_hash], ensure_ascii=False)
+    return hashlib.sha1(skill_key.encode('utf-8')).hexdigest()
+
+
+def has_korean(text: str) -> bool:
+    return any('\uac00' <= c <= '\ud7a3' for c in text)
+
+
+# ----------------------------------------------------------------------
+# 프로세스 풀 워커
+# ----------------------------------------------------------------------
+
+_worker_searcher: Optional[ActGuideSearcher] = None
+
+
+def _init_worker(skill_system: SkillTagSystem):
+    """부모가 로드한 SkillTagSystem을 그대로 사용 (fork면 상속, spawn이면 워커당 1회 전달)"""
+    global _worker_searcher
+    _worker_searcher = ActGuideSearcher(skill_system)
+
+
+def _generate_skill_guides(job: Tuple[str, List[Tuple[str, Tuple[str, ...]]]]) -> Tuple[str, List[Tuple], Optional[str]]:
+    """
+    스킬 1개의 가이드 생성 (프로세스 풀 작업 단위)
+
+    Args:
+        job: (skill_id, [(ascendancy, 생성할 언어들), ...])
+
+    Returns:
+        (skill_id, [(ascendancy, lang, guide), ...], error)
+    """
+    skill_id, targets = job
+    searcher = _worker_searcher
+    skill = searcher.skill_system.get_skill_info(skill_id)
+    rows = []
+    try:
+        for ascendancy, languages in targets:
+            english, korean = searcher.generate_leveling_guide_pair(
+                skill.name, ASCENDANCY_CLASSES.get(ascendancy, ""), ascendancy
+            )
+            if "error" in english:
+                return skill_id, [], english["error"]
+            if "en" in languages:
+                rows.append((ascendancy, "en", english))
+            if "kr" in languages:
+                rows.append((ascendancy, "kr", korean))
+    except Exception as e:
+        return skill_id, rows, str(e)
+    return skill_id, rows, None
+
+
+# ----------------------------------------------------------------------
+# 저장소
+# ----------------------------------------------------------------------
+
+class LevelingGuideStore:
+    """스킬 × 어센던시 × 언어별 레벨링 가이드 색인"""
+
+    def __init__(self, db_path: str = LEVELING_GUIDES_DB, read_only: bool = False):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            read_only: 기존 파일을 읽기 전용으로 열기 (파일/스키마를 만들지 않음)
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        if read_only:
+            self._conn = sqlite3.connect(Path(db_path).resolve().as_uri() + "?mode=ro", uri=True,
+                                         check_same_thread=False)
+            return
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS guides (
+                skill_id TEXT,
+                ascendancy TEXT,
+                lang TEXT,
+                skill_name TEXT,
+                skill_key TEXT,
+                class_name TEXT,
+                source_hash TEXT,
+                generated_at REAL,
+                payload TEXT,
+                PRIMARY KEY (skill_id, ascendancy, lang)
+            );
+            CREATE INDEX IF NOT EXISTS idx_guides_name ON guides (skill_key, ascendancy, lang);
+            """
+        )
+        self._conn.commit()
+
+    def get(self, skill_name: str, ascendancy: str, korean: bool = False) -> Optional[Dict]:
+        """저장된 가이드 (영어 스킬 이름, 대소문자 무시, 없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM guides WHERE skill_key = ? AND ascendancy = ? AND lang = ?",
+                (skill_name.lower(), ascendancy, "kr" if korean else "en")
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def stored_hashes(self) -> Dict[Tuple[str, str, str], str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT skill_id, ascendancy, lang, source_hash FROM guides").fetchall()
+        return {(skill_id, ascendancy, lang): source_hash for skill_id, ascendancy, lang, source_hash in rows}
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM guides").fetchone()[0]
+
+    def _save_rows(self, skill: SkillInfo, rows: List[Tuple[str, str, Dict]],
+                   hashes: Dict[str, str]) -> None:
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO guides VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(skill.skill_id, ascendancy, lang, skill.name, skill.name.lower(),
+              ASCENDANCY_CLASSES.get(ascendancy, ""), hashes[ascendancy], now,
+              json.dumps(guide, ensure_ascii=False))
+             for ascendancy, lang, guide in rows]
+        )
+
+    def build(self, skill_system: Optional[SkillTagSystem] = None, workers: Optional[int] = None,
+              force: bool = False) -> Dict[str, int]:
+        """
+        모든 액티브 스킬 × 어센던시 가이드 생성 (바뀐 항목만)
+
+        Args:
+            skill_system: 이미 로드한 SkillTagSystem (없으면 새로 로드)
+            workers: 프로세스 수 (1이면 현재 프로세스에서 생성)
+            force: 해시와 무관하게 전부 다시 생성
+
+        Returns:
+            {"generated": 생성한 가이드 수, "skipped": 최신 가이드 수, "removed": 삭제한 가이드 수, "failed": 실패한 스킬 수}
+        """
+        if skill_system is None:
+            skill_system = SkillTagSystem()
+
+        shared_hash = file_hash(SHARED_SOURCES)
+        translation_hash = file_hash([TRANSLATIONS_PATH])
+        stored = {} if force else self.stored_hashes()
+
+        # 1. 스킬별로 다시 생성할 (어센던시, 언어) 찾기
+        jobs = []
+        expected_hashes: Dict[str, Dict[str, str]] = {}
+        skipped = 0
+        for skill_id, skill in skill_system.SKILL_DATABASE.items():
+            per_skill = expected_hashes[skill_id] = {}
+            targets = []
+            for ascendancy in ASCENDANCY_CLASSES:
+                expected = per_skill[ascendancy] = guide_hash(skill, ascendancy, shared_hash, translation_hash)
+                stale = tuple(lang for lang in LANGUAGES if stored.get((skill_id, ascendancy, lang)) != expected)
+                skipped += len(LANGUAGES) - len(stale)
+                if stale:
+                    targets.append((ascendancy, stale))
+            if targets:
+                jobs.append((skill_id, targets))
+
+        # 2. 더 이상 없는 스킬/어센던시 삭제
+        valid = {(skill_id, ascendancy, lang) for skill_id in expected_hashes
+                 for ascendancy in ASCENDANCY_CLASSES for lang in LANGUAGES}
+        removed = [key for key in self.stored_hashes() if key not in valid]
+        with self._lock:
+            self._conn.executemany("DELETE FROM guides WHERE skill_id = ? AND ascendancy = ? AND lang = ?", removed)
+            self._conn.commit()
+
+        stats = {"generated": 0, "skipped": skipped, "removed": len(removed), "failed": 0}
+        if not jobs:
+            print(f"[OK] All {skipped} leveling guides up to date", file=sys.stderr)
+            return stats
+
+        print(f"[INFO] Generating leveling guides for {len(jobs)} skills "
+              f"({skipped} guides up to date)...", file=sys.stderr)
+
+        # 3. 스킬 단위 병렬 생성, 결과는 부모 프로세스에서만 기록
+        def store(results):
+            for done, (skill_id, rows, error) in enumerate(results, 1):
+                if error:
+                    stats["failed"] += 1
+                    print(f"[WARN] {skill_id}: {error}", file=sys.stderr)
+                    continue
+                with self._lock:
+                    self._save_rows(skill_system.SKILL_DATABASE[skill_id], rows, expected_hashes[skill_id])
+                    if done % COMMIT_EVERY == 0:
+                        self._conn.commit()
+                stats["generated"] += len(rows)
+            with self._lock:
+                self._conn.commit()
+
+        if workers == 1 or len(jobs) == 1:
+            _init_worker(skill_system)
+            store(map(_generate_skill_guides, jobs))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(skill_system,)) as pool:
+                store(pool.map(_generate_skill_guides, jobs, chunksize=4))
+
+        return stats
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_stores: Dict[bool, LevelingGuideStore] = {}
+_default_store_lock = threading.Lock()
+
+
+def get_leveling_guide_store(read_only: bool = False) -> LevelingGuideStore:
+    """공유 레벨링 가이드 저장소 (프로세스 내 쓰기용/읽기 전용 각 1개)"""
+    with _default_store_lock:
+        store = _default_stores.get(read_only)
+        if store is None:
+            if not read_only:
+                os.makedirs(BUILD_DATA_DIR, exist_ok=True)
+            store = _default_stores[read_only] = LevelingGuideStore(read_only=read_only)
+    return store
+
+
+def get_prebuilt_guide(skill_name: str, ascendancy: str, korean: bool = False,
+                       skill_system: Optional[SkillTagSystem] = None,
+                       read_only: bool = False) -> Optional[Dict]:
+    """미리 생성한 가이드 (한국어 스킬 이름은 영어로 변환 후 조회, 없거나 오류 항목이면 None)"""
+    if has_korean(skill_name):
+        skill_system = skill_system or SkillTagSystem()
+        skill_name = skill_system.get_english_name(skill_name)
+    guide = get_leveling_guide_store(read_only).get(skill_name, ascendancy, korean)
+    if guide is None or "error" in guide:
+        return None
+    return guide
+
+
+def get_leveling_guide(skill_name: str, class_name: str, ascendancy: str, korean: bool = False,
+                       skill_system: Optional[SkillTagSystem] = None) -> Dict:
+    """미리 생성한 가이드 반환 (없으면 즉석에서 생성)"""
+    if has_korean(skill_name):
+        skill_system = skill_system or SkillTagSystem()
+    guide = get_prebuilt_guide(skill_name, ascendancy, korean, skill_system)
+    if guide is not None:
+        return guide
+
+    searcher = ActGuideSearcher(skill_system or SkillTagSystem())
+    return searcher.generate_leveling_guide_summary(skill_name, class_name, ascendancy, korean=korean)
+
+
+def to_ui_guide(guide: Dict) -> Dict:
+    """한국어 가이드 -> WPF 레벨링 가이드 화면 형식 (GuideGenerator.generate_ui_compatible_guide와 같은 필드)"""
+    return {
+        "skill_name": guide.get("skill_name_kr") or guide.get("skill_name", ""),
+        "skill_name_en": guide.get("skill_name", ""),
+        "class_name": guide.get("class_name", ""),
+        "ascendancy": guide.get("ascendancy", ""),
+        "tags": guide.get("tags", []),
+        "tips": guide.get("tips_kr") or guide.get("tips", []),
+        "gem_progression": guide.get("gem_progression", []),
+        "leveling_gear": [
+            {"level": gear.get("level"), "item": gear.get("item_kr") or gear.get("item", ""),
+             "reason": gear.get("reason_kr") or gear.get("reason", "")}
+            for gear in guide.get("leveling_gear_kr", [])
+        ] or guide.get("leveling_gear", []),
+        "ascendancy_order": guide.get("ascendancy_order", []),
+        "transition_info": guide.get("transition_info"),
+        "prebuilt": True
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Leveling Guide Store')
+    parser.add_argument('--build', action='store_true', help='Generate guides for every skill × ascendancy')
+    parser.add_argument('--force', action='store_true', help='Regenerate every guide')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--get', type=str, default=None, metavar='SKILL', help='Print a stored guide as JSON')
+    parser.add_argument('--class', type=str, default='', dest='char_class')
+    parser.add_argument('--ascendancy', type=str, default='')
+    parser.add_argument('--korean', action='store_true')
+
+    args = parser.parse_args()
+
+    if args.build:
+        start = time.perf_counter()
+        result = get_leveling_guide_store().build(workers=args.workers, force=args.force)
+        print(f"[OK] {result['generated']} generated, {result['skipped']} up to date, "
+              f"{result['removed']} removed, {result['failed']} failed "
+              f"({time.perf_counter() - start:.1f}s)", file=sys.stderr)
+
+    if args.get:
+        char_class = args.char_class or ASCENDANCY_CLASSES.get(args.ascendancy, "")
+        guide = get_leveling_guide(args.get, char_class, args.ascendancy, korean=args.korean)
+        print(json.dumps(guide, ensure_ascii=False, indent=2))
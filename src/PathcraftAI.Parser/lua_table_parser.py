@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+
+"""
+Lua Table Parser
+POB 데이터 파일(Gems.lua, Mod*.lua, Bases/*.lua, StatDescriptions/*.lua 등)에 쓰이는
+Lua 테이블 구문을 Python 값으로 변환하는 단일 패스 토크나이저 + 파서
+
+지원 구문:
+- 테이블 생성자: { a = 1, ["key"] = "v", [1] = 2, "positional", }
+- 문자열: "..." / '...' / [[...]] / [==[...]==] (이스케이프 포함)
+- 숫자 (10진, 16진, 지수), true / false / nil, 단항 마이너스
+- 주석: -- 한 줄, --[[ 블록 ]]
+- 문장: return <값>, local x = <값>, x = <값>, x["k"] = <값>, x.k = <값>
+
+slpp 같은 외부 라이브러리 없이 동작한다.
+"""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+_TOKEN_RE = re.compile(
+    r"""
+      (?P<ws>\s+)
+    | (?P<comment>--\[(?P<ceq>=*)\[.*?\](?P=ceq)\]|--[^\n]*)
+    | (?P<longstr>\[(?P<leq>=*)\[.*?\](?P=leq)\])
+    | (?P<str>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    | (?P<num>0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    | (?P<op>\.\.\.|\.\.|==|~=|<=|>=|[{}\[\]=,;.()\-+*/#<>:%^])
+    """,
+    re.VERBOSE | re.DOTALL
+)
+
+_ESCAPE_RE = re.compile(r"\\(?:(\d{1,3})|x([0-9a-fA-F]{2})|z\s*|(.))", re.DOTALL)
+_SIMPLE_ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r', 'a': '\a', 'b': '\b',
+    'f': '\f', 'v': '\v', '\\': '\\', '"': '"', "'": "'", '\n': '\n'
+}
+
+_KEYWORDS = {'true': True, 'false': False, 'nil': None}
+
+
+class LuaParseError(ValueError):
+    """지원하지 않는 구문 또는 잘못된 Lua"""
+
+
+def _unescape(body: str) -> str:
+    if '\\' not in body:
+        return body
+
+    def replace(match):
+        decimal, hex_code, char = match.groups()
+        if decimal is not None:
+            return chr(int(decimal))
+        if hex_code is not None:
+            return chr(int(hex_code, 16))
+        if char is None:  # \z: 뒤따르는 공백 무시
+            return ''
+        return _SIMPLE_ESCAPES.get(char, char)
+
+    return _ESCAPE_RE.sub(replace, body)
+
+
+def tokenize(text: str) -> List[Tuple[str, Any]]:
+    """
+    Lua 소스를 토큰 리스트로 변환 (공백/주석 제외)
+
+    Returns:
+        [(kind, value), ...]  kind: 'str' | 'num' | 'name' | 'op'
+    """
+    tokens = []
+    append = tokens.append
+    pos = 0
+    length = len(text)
+
+    for match in _TOKEN_RE.finditer(text):
+        if match.start() != pos:
+            line = text.count('\n', 0, pos) + 1
+            raise LuaParseError(f"Unexpected character {text[pos]!r} at line {line}")
+        pos = match.end()
+
+        kind = match.lastgroup
+        if kind in ('ws', 'comment', 'ceq'):
+            continue
+
+        value = match.group(kind)
+        if kind == 'str':
+            append(('str', _unescape(value[1:-1])))
+        elif kind in ('longstr', 'leq'):
+            value = match.group('longstr')
+            level = len(match.group('leq'))
+            body = value[level + 2:-(level + 2)]
+            # 여는 괄호 바로 뒤의 줄바꿈은 Lua에서 무시됨
+            if body.startswith('\r\n'):
+                body = body[2:]
+            elif body.startswith('\n'):
+                body = body[1:]
+            append(('str', body))
+        elif kind == 'num':
+            if value[:2] in ('0x', '0X'):
+                append(('num', int(value, 16)))
+            elif '.' in value or 'e' in value or 'E' in value:
+                append(('num', float(value)))
+            else:
+                append(('num', int(value)))
+        else:
+            append((kind, value))
+
+    if pos != length:
+        line = text.count('\n', 0, pos) + 1
+        raise LuaParseError(f"Unexpected character {text[pos]!r} at line {line}")
+
+    return tokens
+
+
+class _Parser:
+    """토큰 리스트에 대한 재귀 하강 파서"""
+
+    def __init__(self, tokens: List[Tuple[str, Any]]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset: int = 0) -> Tuple[str, Any]:
+        index = self.pos + offset
+        if index < len(self.tokens):
+            return self.tokens[index]
+        return ('eof', None)
+
+    def next(self) -> Tuple[str, Any]:
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def expect(self, value: str):
+        token = self.next()
+        if token != ('op', value):
+            raise LuaParseError(f"Expected {value!r}, got {token[1]!r}")
+
+    def value(self) -> Any:
+        kind, value = self.next()
+
+        if kind in ('str', 'num'):
+            return value
+        if kind == 'op':
+            if value == '{':
+                return self.table()
+            if value == '-':
+                kind, number = self.next()
+                if kind != 'num':
+                    raise LuaParseError(f"Expected number after '-', got {number!r}")
+                return -number
+            if value == '...':
+                return None
+        if kind == 'name' and value in _KEYWORDS:
+            return _KEYWORDS[value]
+
+        raise LuaParseError(f"Unsupported expression starting with {value!r}")
+
+    def table(self) -> Any:
+        keyed: Dict[Any, Any] = {}
+        positional: List[Any] = []
+
+        while True:
+            kind, value = self.peek()
+            if (kind, value) == ('op', '}'):
+                self.pos += 1
+                break
+
+            if (kind, value) == ('op', '['):
+                self.pos += 1
+                key = self.value()
+                self.expect(']')
+                self.expect('=')
+                keyed[key] = self.value()
+            elif kind == 'name' and self.peek(1) == ('op', '=') and value not in _KEYWORDS:
+                self.pos += 2
+                keyed[value] = self.value()
+            else:
+                positional.append(self.value())
+
+            kind, value = self.peek()
+            if kind == 'op' and value in (',', ';'):
+                self.pos += 1
+            elif (kind, value) != ('op', '}'):
+                raise LuaParseError(f"Expected ',' or '}}' in table, got {value!r}")
+
+        return _build_table(keyed, positional)
+
+
+def _build_table(keyed: Dict[Any, Any], positional: List[Any]) -> Any:
+    """
+    Lua 테이블 -> Python 값
+
+    - 위치 값만 있거나 키가 1..n 정수뿐이면 list
+    - 그 외에는 dict (위치 값은 1부터 시작하는 정수 키)
+    """
+    if not keyed:
+        return positional
+
+    if not positional:
+        count = len(keyed)
+        if all(type(k) is int for k in keyed) and min(keyed) == 1 and max(keyed) == count:
+            return [keyed[i] for i in range(1, count + 1)]
+        return keyed
+
+    for index, item in enumerate(positional, 1):
+        keyed.setdefault(index, item)
+    return keyed
+
+
+def parse_lua_table(text: str) -> Any:
+    """
+    Lua 값 1개(주로 테이블 생성자) 파싱
+
+    Args:
+        text: "{ ... }" 형식의 Lua 소스
+
+    Returns:
+        dict / list / 기본 값
+    """
+    parser = _Parser(tokenize(text))
+    result = parser.value()
+    if parser.peek()[0] != 'eof':
+        raise LuaParseError(f"Trailing tokens after value: {parser.peek()[1]!r}")
+    return result
+
+
+def parse_lua_chunk(text: str) -> Dict[str, Any]:
+    """
+    POB 데이터 파일 전체 파싱
+
+    대입문은 변수 이름별로 모으고, return 값은 "return" 키에 담는다.
+    예: itemBases["Plate Vest"] = {...}  ->  {"itemBases": {"Plate Vest": {...}}}
+        return { ... }                    ->  {"return": {...}}
+
+    Returns:
+        {변수 이름: 값, "return": 값}
+    """
+    parser = _Parser(tokenize(text))
+    result: Dict[str, Any] = {}
+
+    while parser.peek()[0] != 'eof':
+        kind, value = parser.next()
+
+        if (kind, value) == ('op', ';'):
+            continue
+
+        if kind != 'name':
+            raise LuaParseError(f"Unexpected token {value!r} at statement start")
+
+        if value == 'return':
+            result['return'] = parser.value()
+            continue
+
+        if value == 'local':
+            kind, value = parser.next()
+            if kind != 'name':
+                raise LuaParseError(f"Expected name after 'local', got {value!r}")
+            if parser.peek() != ('op', '='):
+                result.setdefault(value, None)
+                continue
+
+        target = value
+        kind, op = parser.peek()
+        if (kind, op) == ('op', '='):
+            parser.pos += 1
+            result[target] = parser.value()
+        elif (kind, op) in (('op', '['), ('op', '.')):
+            parser.pos += 1
+            if op == '[':
+                key = parser.value()
+                parser.expect(']')
+            else:
+                key_kind, key = parser.next()
+                if key_kind != 'name':
+                    raise LuaParseError(f"Expected field name, got {key!r}")
+            parser.expect('=')
+            container = result.get(target)
+            if not isinstance(container, dict):
+                container = {}
+                result[target] = container
+            container[key] = parser.value()
+        else:
+            raise LuaParseError(f"Unsupported statement starting with {target!r}")
+
+    return result
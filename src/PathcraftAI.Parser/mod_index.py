@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mod Index
+game_data/mods.json (game_data_fetcher.extract_mod_data 출력)에 대한 역색인
+
+- 태그(modTags) -> 모드 ID
+- weightKey (가중치 > 0인 아이템 타입) -> 모드 ID
+- 상위 k개 선택은 태그별 목록을 mods.json 순서로 병합하며 크기 k의 힙만 유지
+  (매칭된 모드 전체의 점수표를 만들지 않고, 최고 점수로 k개가 차면 바로 종료)
+
+사용 예:
+    from mod_index import load_mod_index
+    index = load_mod_index()
+    for mod, score in index.top_k({'caster', 'elemental'}, k=20, affix_type='Prefix'):
+        print(mod_label(mod), score)
+"""
+
+import heapq
+import json
+import os
+import re
+import threading
+from collections import defaultdict
+from itertools import groupby
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+MODS_FILE = os.path.join(os.path.dirname(__file__), "game_data", "mods.json")
+
+# 모드 텍스트의 수치 (+(80-89), 1.5, (7-9)% 등)
+_ROLL_PATTERN = re.compile(r'[+-]?\(?\d+(?:\.\d+)?(?:-\d+(?:\.\d+)?)?\)?%?')
+_LEADING_WORDS = re.compile(r'^(?:to|of|increased|reduced|more|less)\s+', re.IGNORECASE)
+
+
+def mod_label(mod: Dict) -> str:
+    """
+    모드 -> 사람이 읽는 이름 (수치 제거)
+
+    "+(80-89) to maximum Life" -> "Maximum Life"
+    "Adds (15-20) to (28-33) Physical Damage to Attacks" -> "Adds Physical Damage to Attacks"
+    stats가 없으면 group ("AddedPhysicalDamage" -> "Added Physical Damage")
+    """
+    if mod.get('stats'):
+        text = ' '.join(_ROLL_PATTERN.sub(' ', mod['stats'][0]).split())
+        text = re.sub(r'^Adds to ', 'Adds ', text)
+        text = _LEADING_WORDS.sub('', text)
+    else:
+        text = re.sub(r'(?<=[a-z])(?=[A-Z])', ' ', mod.get('group') or mod.get('mod_id', ''))
+    return text[:1].upper() + text[1:]
+
+
+class ModIndex:
+    """태그 / 아이템 타입 기반 모드 역색인"""
+
+    def __init__(self, mods: Union[Dict[str, Dict], List[Dict]]):
+        """
+        Args:
+            mods: {mod_id: mod} 또는 mod 리스트 (extract_mod_data 형식)
+        """
+        if isinstance(mods, list):
+            mods = {mod.get('mod_id', str(i)): mod for i, mod in enumerate(mods)}
+
+        self.mods: Dict[str, Dict] = mods
+        self._order: Dict[str, int] = {}
+        self.by_tag: Dict[str, List[str]] = defaultdict(list)
+        self.by_weight_key: Dict[str, set] = defaultdict(set)
+
+        for order, (mod_id, mod) in enumerate(mods.items()):
+            self._order[mod_id] = order
+            for tag in set(mod.get('tags') or []):
+                self.by_tag[tag.lower()].append(mod_id)
+            for key, weight in zip(mod.get('weight_keys') or [], mod.get('weight_vals') or []):
+                if weight > 0:
+                    self.by_weight_key[key.lower()].add(mod_id)
+
+    def __len__(self) -> int:
+        return len(self.mods)
+
+    def spawns_on(self, mod_id: str, item_type: str) -> bool:
+        """weightKey 기준으로 해당 아이템 타입에 붙을 수 있는 모드인지"""
+        return mod_id in self.by_weight_key.get(item_type.lower(), ())
+
+    def top_k(
+        self,
+        tags: Iterable[str],
+        k: int = 50,
+        item_types: Optional[Iterable[str]] = None,
+        affix_type: Optional[str] = None,
+        distinct_group: bool = False
+    ) -> List[Tuple[Dict, int]]:
+        """
+        태그 매칭 수가 높은 모드 상위 k개
+
+        Args:
+            tags: 찾을 모드 태그
+            k: 최대 결과 수
+            item_types: weightKey 필터 (하나라도 가중치 > 0이면 통과)
+            affix_type: "Prefix" / "Suffix" 필터
+            distinct_group: 같은 group(티어 차이만 있는 모드)은 1개만 반환
+
+        Returns:
+            [(mod, 매칭 태그 수), ...]  점수 내림차순, 동점은 mods.json 순서
+        """
+        if k <= 0:
+            return []
+
+        postings = [self.by_tag[tag] for tag in {t.lower() for t in tags} if tag in self.by_tag]
+        max_score = len(postings)
+        allowed = None
+        if item_types is not None:
+            allowed = [self.by_weight_key.get(t.lower(), set()) for t in item_types]
+
+        # 태그별 목록은 mods.json 순서 -> 병합하면 같은 모드가 연속 (연속 길이 = 매칭 태그 수)
+        # heap: 상위 k개 후보의 (점수, -순서, mod_id, 그룹) 최소 힙 (점수가 갱신된 항목은 나중에 버림)
+        # best: 그룹 -> 힙 안의 유효 항목 (distinct_group이 아니면 그룹 = mod_id)
+        heap: List[Tuple[int, int, str, str]] = []
+        best: Dict[str, Tuple[int, int, str, str]] = {}
+
+        def worst():
+            while best.get(heap[0][3]) != heap[0]:
+                heapq.heappop(heap)
+            return heap[0]
+
+        for mod_id, run in groupby(heapq.merge(*postings, key=self._order.__getitem__)):
+            mod = self.mods[mod_id]
+            if allowed is not None and not any(mod_id in ids for ids in allowed):
+                continue
+            if affix_type and mod.get('type') != affix_type:
+                continue
+
+            group = (mod.get('group') or mod_id) if distinct_group else mod_id
+            entry = (sum(1 for _ in run), -self._order[mod_id], mod_id, group)
+            current = best.get(group)
+            if current is not None:
+                if entry[0] <= current[0]:
+                    continue  # 같은 그룹의 앞선 모드가 점수 같거나 높음
+            elif len(best) >= k:
+                if entry <= worst():
+                    continue
+                del best[heapq.heappop(heap)[3]]
+
+            best[group] = entry
+            heapq.heappush(heap, entry)
+
+            # 최고 점수로 k개가 찼으면 이후 모드는 순서에서 밀림
+            if len(best) >= k and worst()[0] == max_score:
+                break
+
+        ranked = sorted(best.values(), reverse=True)
+        return [(self.mods[mod_id], score) for score, _, mod_id, _ in ranked]
+
+
+_cached_index: Optional[ModIndex] = None
+_cached_signature: Optional[Tuple[str, int, int]] = None
+_cache_lock = threading.Lock()
+
+
+def load_mod_index(mods_path: str = MODS_FILE) -> ModIndex:
+    """
+    mods.json 역색인 로드 (파일이 바뀌지 않았으면 프로세스 내 캐시 재사용)
+
+    mods.json이 없으면 빈 인덱스를 반환한다.
+    """
+    global _cached_index, _cached_signature
+
+    if os.path.exists(mods_path):
+        stat = os.stat(mods_path)
+        signature = (os.path.abspath(mods_path), stat.st_mtime_ns, stat.st_size)
+    else:
+        signature = (os.path.abspath(mods_path), 0, 0)
+
+    with _cache_lock:
+        if _cached_index is not None and _cached_signature == signature:
+            return _cached_index
+
+        mods = {}
+        if signature[1]:
+            with open(mods_path, 'r', encoding='utf-8') as f:
+                mods = json.load(f)
+
+        _cached_index = ModIndex(mods)
+        _cached_signature = signature
+        return _cached_index
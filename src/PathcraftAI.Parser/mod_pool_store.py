@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mod Pool Store
+poedb 모드풀(poedb_crawler.crawl_mod_pool 출력)의 오프셋 색인 형식
+
+data/mod_pool.shards 구조:
+    1행: 헤더 JSON (개행 없음)
+         {"format", "format_version", "version", "source",
+          "blocks": {블록 이름: [오프셋, 길이, 항목 수]}}
+    이후: 블록 본문 (UTF-8 JSON 배열/객체, 오프셋은 헤더 다음 바이트 기준)
+
+블록은 아이템 타입별 1개("item_type:<타입>")와 전체 모드 색인 1개("all_mods").
+읽기는 헤더만 파싱한 뒤 필요한 블록만 mmap에서 잘라 디코딩하므로,
+요청당 메모리는 전체 풀이 아니라 사용한 슬롯 수에 비례한다.
+
+사용 예:
+    from mod_pool_store import open_mod_pool
+    pool = open_mod_pool()
+    helmet_mods = pool.mods_for("helmet_int")
+"""
+
+import os
+import sys
+import json
+import mmap
+import threading
+from typing import Dict, List, Optional
+
+MOD_POOL_JSON = os.path.join(os.path.dirname(__file__), "data", "mod_pool.json")
+MOD_POOL_SHARDS = os.path.join(os.path.dirname(__file__), "data", "mod_pool.shards")
+
+SHARD_FORMAT = "mod_pool_shards"
+SHARD_FORMAT_VERSION = 1
+ITEM_TYPE_PREFIX = "item_type:"
+ALL_MODS_BLOCK = "all_mods"
+
+
+def write_mod_pool_shards(mod_data: Dict, path: str = MOD_POOL_SHARDS) -> Dict:
+    """
+    모드풀 데이터를 오프셋 색인 파일로 저장 (임시 파일 후 교체)
+
+    Args:
+        mod_data: crawl_mod_pool 결과 ({"version", "source", "item_types", "all_mods"})
+        path: 출력 경로
+
+    Returns:
+        헤더 딕셔너리
+    """
+    blocks = []
+    for item_type, mods in mod_data.get("item_types", {}).items():
+        blocks.append((f"{ITEM_TYPE_PREFIX}{item_type}", mods))
+    blocks.append((ALL_MODS_BLOCK, mod_data.get("all_mods", {})))
+
+    index = {}
+    payloads = []
+    offset = 0
+    for name, value in blocks:
+        payload = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        index[name] = [offset, len(payload), len(value)]
+        payloads.append(payload)
+        offset += len(payload)
+
+    header = {
+        "format": SHARD_FORMAT,
+        "format_version": SHARD_FORMAT_VERSION,
+        "version": mod_data.get("version"),
+        "source": mod_data.get("source"),
+        "blocks": index
+    }
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        f.write(b"\n")
+        for payload in payloads:
+            f.write(payload)
+    os.replace(tmp_path, path)
+    return header
+
+
+class ModPoolReader:
+    """mod_pool.shards 읽기 (블록 단위 지연 로드)"""
+
+    def __init__(self, path: str = MOD_POOL_SHARDS):
+        self.path = path
+        self._file = open(path, "rb")
+        header_line = self._file.readline()
+        self.header = json.loads(header_line)
+        if self.header.get("format") != SHARD_FORMAT:
+            self._file.close()
+            raise ValueError(f"Not a mod pool shard file: {path}")
+
+        self._base = len(header_line)
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._blocks: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.header.get("version")
+
+    @property
+    def item_types(self) -> List[str]:
+        """블록이 있는 아이템 타입 목록"""
+        return [name[len(ITEM_TYPE_PREFIX):] for name in self.header["blocks"] if name.startswith(ITEM_TYPE_PREFIX)]
+
+    def count(self, item_type: str) -> int:
+        """아이템 타입의 모드 수 (블록을 읽지 않음)"""
+        entry = self.header["blocks"].get(f"{ITEM_TYPE_PREFIX}{item_type}")
+        return entry[2] if entry else 0
+
+    def _block(self, name: str):
+        with self._lock:
+            if name in self._blocks:
+                return self._blocks[name]
+            entry = self.header["blocks"].get(name)
+            if entry is None:
+                return None
+            offset, length, _ = entry
+            start = self._base + offset
+            value = json.loads(self._map[start:start + length].decode("utf-8"))
+            self._blocks[name] = value
+            return value
+
+    def mods_for(self, item_type: str) -> List[Dict]:
+        """아이템 타입(예: "helmet_int", "ring")의 모드 목록 (없으면 빈 리스트)"""
+        return self._block(f"{ITEM_TYPE_PREFIX}{item_type}") or []
+
+    def all_mods(self) -> Dict[str, Dict]:
+        """모드 이름 -> {effect, tags, item_types, ...} 전체 색인"""
+        return self._block(ALL_MODS_BLOCK) or {}
+
+    def release(self, item_type: Optional[str] = None) -> None:
+        """디코딩한 블록 해제 (None이면 전부)"""
+        with self._lock:
+            if item_type is None:
+                self._blocks.clear()
+            else:
+                self._blocks.pop(f"{ITEM_TYPE_PREFIX}{item_type}", None)
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _is_stale(shards_path: str, json_path: str) -> bool:
+    if not os.path.exists(shards_path):
+        return True
+    return os.path.exists(json_path) and os.path.getmtime(json_path) > os.path.getmtime(shards_path)
+
+
+_reader: Optional[ModPoolReader] = None
+_reader_signature = None
+_reader_lock = threading.Lock()
+
+
+def open_mod_pool(shards_path: str = MOD_POOL_SHARDS, json_path: str = MOD_POOL_JSON) -> ModPoolReader:
+    """
+    모드풀 리더 (프로세스 공용)
+
+    샤드 파일이 없거나 mod_pool.json보다 오래되었으면 JSON에서 한 번 변환한다.
+
+    Raises:
+        FileNotFoundError: 샤드 파일과 mod_pool.json 모두 없음
+    """
+    global _reader, _reader_signature
+
+    with _reader_lock:
+        if _is_stale(shards_path, json_path):
+            if not os.path.exists(json_path):
+                raise FileNotFoundError(f"Mod pool not found: {shards_path}")
+            # 매핑된 파일은 Windows에서 교체할 수 없으므로 먼저 닫음
+            if _reader is not None:
+                _reader.close()
+                _reader, _reader_signature = None, None
+            print(f"[INFO] Building mod pool shards from {json_path}", file=sys.stderr)
+            with open(json_path, "r", encoding="utf-8") as f:
+                write_mod_pool_shards(json.load(f), shards_path)
+
+        stat = os.stat(shards_path)
+        signature = (os.path.abspath(shards_path), stat.st_mtime_ns, stat.st_size)
+        if _reader is None or _reader_signature != signature:
+            if _reader is not None:
+                _reader.close()
+            _reader = ModPoolReader(shards_path)
+            _reader_signature = signature
+        return _reader
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="mod_pool.json -> mod_pool.shards 변환")
+    parser.add_argument("--input", default=MOD_POOL_JSON, help="mod_pool.json 경로")
+    parser.add_argument("--output", default=MOD_POOL_SHARDS, help="출력 샤드 파일 경로")
+    args = parser.parse_args()
+
+    with open(args.input, "r", encoding="utf-8") as f:
+        header = write_mod_pool_shards(json.load(f), args.output)
+
+    for name, (offset, length, count) in header["blocks"].items():
+        print(f"  {name:30s} offset={offset:8d} bytes={length:8d} entries={count}")
+    print(f"[OK] {args.output} ({os.path.getsize(args.output) / 1024:.1f} KB)")
@@ -3,12 +3,15 @@
 """
 Passive Tree Analyzer - 패시브 트리 추천 강화
 현재 레벨에서 목표 레벨까지 단계별 패시브 노드 추천
+
+패시브 트리 데이터(passive_tree_graph)가 있으면 트리 인접 관계를 따라
+현재 할당에서 실제로 찍을 수 있는 순서(경유 노드 포함)로 로드맵을 만든다.
 """
 
 import sys
 import json
 import argparse
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 # UTF-8 설정 (Windows)
 if sys.platform == 'win32':
@@ -18,10 +21,29 @@ if sys.platform == 'win32':
         sys.stderr.reconfigure(encoding='utf-8')
 
 
+# 노드 우선순위별 경로 가치 배율 (1=Life, 2=DPS, 3=Utility)
+PRIORITY_WEIGHT = {1: 1.5, 2: 1.2, 3: 1.0}
+
+
+def node_priority(name: str, stats: List[str] = ()) -> int:
+    """노드 이름/스탯으로 우선순위 추정 (1=Life/ES, 2=DPS, 3=Utility)"""
+    text = ' '.join([name, *stats]).lower()
+    if any(k in text for k in ['life', 'vitality', 'constitution', 'heart', 'energy shield', 'shield']):
+        return 1
+    if any(k in text for k in ['damage', 'power', 'crit', 'elemental', 'spell', 'attack']):
+        return 2
+    return 3
+
+
 class PassiveTreeAnalyzer:
     """패시브 트리 분석 및 추천"""
 
-    def __init__(self, current_level: int, target_level: int):
+    def __init__(self, current_level: int, target_level: int, graph=None):
+        """
+        Args:
+            graph: PassiveTreeGraph (None이면 우선순위만으로 정렬)
+        """
+        self.graph = graph
         self.current_level = current_level
         self.target_level = target_level
         self.current_points = self._calculate_points(current_level)
@@ -74,26 +96,77 @@ class PassiveTreeAnalyzer:
         self.missing_nodes = self.target_nodes - self.current_nodes
 
     def calculate_missing_nodes(self) -> List[Dict]:
-        """부족한 노드 목록과 우선순위 계산"""
-        missing = []
-
-        for node_id in self.missing_nodes:
-            node_data = self.node_info.get(node_id, {})
-
-            missing.append({
-                'node_id': node_id,
-                'name': node_data.get('name', f'Node {node_id}'),
-                'stats': node_data.get('stats', []),
-                'type': node_data.get('type', 'normal'),
-                'priority': node_data.get('priority', 3),
-                'category': self._categorize_node(node_data)
-            })
+        """부족한 노드 목록과 우선순위 계산
+
+        트리 그래프가 있으면 할당 가능한 순서, 없으면 우선순위 순서
+        """
+        planned = self._plan_missing_nodes()
+        if planned is not None:
+            return planned
+
+        missing = [self._missing_node(node_id) for node_id in self.missing_nodes]
 
         # 우선순위로 정렬 (1=Life 최우선, 2=DPS, 3=Utility)
         missing.sort(key=lambda x: (x['priority'], x['name']))
 
         return missing
 
+    def _missing_node(self, node_id: str, travel: bool = False) -> Dict:
+        node_data = self.node_info.get(node_id)
+        if node_data is None and self.graph is not None and node_id.isdigit():
+            node_data = self.graph.describe(int(node_id))
+            if node_data:
+                node_data['priority'] = node_priority(node_data['name'], node_data['stats'])
+        node_data = node_data or {}
+
+        node = {
+            'node_id': node_id,
+            'name': node_data.get('name', f'Node {node_id}'),
+            'stats': node_data.get('stats', []),
+            'type': node_data.get('type', 'normal'),
+            'priority': node_data.get('priority', 3),
+            'category': self._categorize_node(node_data)
+        }
+        if travel:
+            node['travel'] = True  # 목표 트리에 없는 경유 노드
+        return node
+
+    def _plan_missing_nodes(self) -> Optional[List[Dict]]:
+        """트리 인접 관계를 따라 현재 할당에서 목표까지 찍는 순서 (그래프가 없으면 None)
+
+        목표 트리 안에서 먼저 연결하고, 목표 노드만으로 닿지 않는 노드는 트리 전체 경로를 사용한다.
+        어센던시/클래스 시작 노드는 패시브 포인트를 쓰지 않으므로 제외된다.
+        """
+        if self.graph is None:
+            return None
+        targets = [int(n) for n in self.missing_nodes if n.isdigit() and int(n) in self.graph.index]
+        if not targets:
+            return None
+
+        allocated = [int(n) for n in self.current_nodes if n.isdigit() and int(n) in self.graph.index]
+        start = self.graph.start_for(targets + allocated)
+        if start is not None:
+            allocated.append(start)
+
+        values = {
+            t: self.graph.node_value(t) * PRIORITY_WEIGHT.get(self.node_info.get(str(t), {}).get('priority', 3), 1.0)
+            for t in targets
+        }
+        plan = self.graph.plan_allocation(allocated, targets, allowed=set(targets) | set(allocated), values=values)
+        order, travel = plan['order'], set(plan['travel'])
+        if plan['unreachable']:
+            extra = self.graph.plan_allocation(allocated + order, plan['unreachable'], values=values)
+            order += extra['order']
+            travel |= extra['travel']
+
+        planned = [self._missing_node(str(skill), travel=skill in travel) for skill in order]
+
+        # 그래프에 없는 노드는 우선순위 순으로 뒤에
+        known = {str(skill) for skill in self.graph.index}
+        rest = [self._missing_node(n) for n in self.missing_nodes if n not in known]
+        rest.sort(key=lambda x: (x['priority'], x['name']))
+        return planned + rest
+
     def _categorize_node(self, node_data: Dict) -> str:
         """노드 카테고리 분류"""
         stats = ' '.join(node_data.get('stats', [])).lower()
@@ -215,7 +288,8 @@ class PassiveTreeAnalyzer:
             for node in stage['nodes']:
                 node_type = node['type'].upper() if node['type'] != 'normal' else ''
                 type_str = f" [{node_type}]" if node_type else ""
-                print(f"  → {node['name']}{type_str}")
+                path_str = " (path)" if node.get('travel') else ""
+                print(f"  → {node['name']}{type_str}{path_str}")
 
                 # 스탯 표시
                 for stat in node['stats'][:2]:  # 처음 2개만
@@ -296,8 +370,12 @@ def create_mock_data() -> Tuple[int, int, List[str], Dict[str, Dict]]:
     return current_level, target_level, current_nodes, target_nodes
 
 
-def get_pob_passive_tree(pob_url: str) -> Tuple[int, List[str], Dict[str, Dict]]:
-    """POB에서 패시브 트리 데이터 추출"""
+def get_pob_passive_tree(pob_url: str, graph=None) -> Tuple[int, List[str], Dict[str, Dict]]:
+    """POB에서 패시브 트리 데이터 추출
+
+    Args:
+        graph: PassiveTreeGraph (있으면 노드 이름/스탯/종류를 트리 데이터에서 가져옴)
+    """
     try:
         from smart_build_analyzer import SmartBuildAnalyzer
 
@@ -318,46 +396,48 @@ def get_pob_passive_tree(pob_url: str) -> Tuple[int, List[str], Dict[str, Dict]]
         if tree is None:
             return target_level, [], {}
 
-        # Spec 찾기 (활성화된 패시브 트리)
-        spec = tree.find('.//Spec')
-        if spec is None:
+        # 활성화된 Spec 찾기 (activeSpec은 1부터)
+        specs = tree.findall('Spec')
+        if not specs:
             return target_level, [], {}
-
-        # 할당된 노드 추출
-        nodes = spec.findall('.//Node')
-        allocated_node_ids = []
-        node_info = {}
-
-        for node in nodes:
+        try:
+            spec = specs[int(tree.get('activeSpec', 1)) - 1]
+        except (ValueError, IndexError):
+            spec = specs[0]
+
+        # 할당된 노드 추출 (POB는 nodes="id,id,..." 속성, 구버전은 Node 요소)
+        allocated_node_ids = [n.strip() for n in (spec.get('nodes') or '').split(',') if n.strip()]
+        named_nodes = {}
+        for node in spec.findall('.//Node'):
             node_id = node.get('nodeId') or node.get('id')
             if node_id:
-                allocated_node_ids.append(node_id)
-
-                # 노드 이름과 타입 추출 (가능한 경우)
-                node_name = node.get('name', f'Node {node_id}')
-                node_type = node.get('type', 'normal')
+                named_nodes[node_id] = node
+                if node_id not in allocated_node_ids:
+                    allocated_node_ids.append(node_id)
 
-                # 간단한 카테고리 추정 (이름 기반)
-                priority = 3  # 기본값
-                stats = []
+        node_info = {}
+        for node_id in allocated_node_ids:
+            described = graph.describe(int(node_id)) if graph is not None and node_id.isdigit() else None
+            if described:
+                node_name = described['name']
+                node_type = described['type']
+                stats = described['stats']
+                priority = node_priority(node_name, stats)
+            else:
+                element = named_nodes.get(node_id)
+                node_name = element.get('name', f'Node {node_id}') if element is not None else f'Node {node_id}'
+                node_type = element.get('type', 'normal') if element is not None else 'normal'
 
                 # 노드 이름으로 카테고리 추정
-                name_lower = node_name.lower()
-                if any(k in name_lower for k in ['life', 'vitality', 'constitution', 'heart', 'energy shield', 'shield']):
-                    priority = 1
-                    stats.append('Life/ES node')
-                elif any(k in name_lower for k in ['damage', 'power', 'crit', 'elemental', 'spell', 'attack']):
-                    priority = 2
-                    stats.append('Damage node')
-                else:
-                    stats.append('Utility node')
-
-                node_info[node_id] = {
-                    'name': node_name,
-                    'stats': stats,
-                    'type': node_type,
-                    'priority': priority
-                }
+                priority = node_priority(node_name)
+                stats = [{1: 'Life/ES node', 2: 'Damage node'}.get(priority, 'Utility node')]
+
+            node_info[node_id] = {
+                'name': node_name,
+                'stats': stats,
+                'type': node_type,
+                'priority': priority
+            }
 
         return target_level, allocated_node_ids, node_info
 
@@ -366,6 +446,25 @@ def get_pob_passive_tree(pob_url: str) -> Tuple[int, List[str], Dict[str, Dict]]
         return 94, [], {}
 
 
+def get_character_passives(character_name: str) -> List[str]:
+    """캐릭터의 현재 할당 노드 (OAuth 캐릭터 응답의 passives.hashes, 실패하면 빈 목록)"""
+    try:
+        from poe_oauth import load_token, get_character_items
+
+        token_data = load_token()
+        if not token_data:
+            return []
+
+        character_data = get_character_items(token_data['access_token'], character_name)
+        character = character_data.get('character', character_data)
+        passives = character.get('passives') or character_data.get('passives') or {}
+        return [str(node_hash) for node_hash in passives.get('hashes', [])]
+
+    except Exception as e:
+        print(f"[WARN] Failed to get character passives: {e}", file=sys.stderr)
+        return []
+
+
 def get_character_level(character_name: str) -> int:
     """캐릭터 레벨 가져오기"""
     try:
@@ -400,6 +499,8 @@ def main():
 
     args = parser.parse_args()
 
+    graph = None
+
     # Mock 또는 실제 데이터 로드
     if args.mock:
         current_level, target_level, current_nodes, target_nodes_data = create_mock_data()
@@ -409,15 +510,16 @@ def main():
             if not args.json:
                 print("Loading POB passive tree...")
 
+            # 트리 인접 관계 (데이터가 없으면 우선순위 정렬로 대체)
+            from passive_tree_graph import get_passive_tree_graph
+            graph = get_passive_tree_graph()
+
             # POB에서 목표 레벨과 노드 가져오기
-            target_level, target_node_ids, target_nodes_data = get_pob_passive_tree(args.pob)
+            target_level, target_node_ids, target_nodes_data = get_pob_passive_tree(args.pob, graph)
 
-            # 캐릭터에서 현재 레벨 가져오기
+            # 캐릭터에서 현재 레벨과 할당 노드 가져오기 (노드가 없으면 클래스 시작점부터 계획)
             current_level = get_character_level(args.character)
-
-            # 현재는 캐릭터의 패시브 트리를 가져올 수 없으므로 빈 리스트 사용
-            # (POE API는 패시브 트리를 제공하지 않음)
-            current_nodes = []
+            current_nodes = get_character_passives(args.character)
 
             if not target_nodes_data:
                 if args.json:
@@ -452,7 +554,7 @@ def main():
         target_level = args.target_level
 
     # 분석기 초기화
-    analyzer = PassiveTreeAnalyzer(current_level, target_level)
+    analyzer = PassiveTreeAnalyzer(current_level, target_level, graph)
     analyzer.set_current_tree(current_nodes)
     analyzer.set_target_tree(target_nodes_data)
 
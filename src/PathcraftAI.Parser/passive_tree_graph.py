@@ -0,0 +1,537 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Passive Tree Graph
+POB 패시브 트리 데이터(TreeData/<버전>/tree.lua, GGG skilltree-export data.json과 같은 구조)를
+배열 기반 CSR 그래프로 변환하고, 현재 할당에서 목표 노드까지 실제로 찍을 수 있는 순서를 계획
+
+- 노드 인덱스 0..n-1, 인접 리스트는 indptr/indices (array('i')) 두 배열
+- 변환 결과는 game_data/passive_tree.json에 캐시 (tree.lua 파싱은 처음 한 번만)
+- 계획: 현재 트리에서 다중 시작점 BFS(모든 노드 비용 1 = Dijkstra)로 거리를 구하고,
+  "경로 비용 / 경로 가치"가 가장 좋은 목표까지 경로를 추가한 뒤
+  새로 추가된 노드에서만 거리를 갱신 (Steiner 트리 근사)
+- 마스터리는 같은 그룹 노터블을 처음 찍은 직후에 배치, 어센던시 노드는 패시브 포인트를 쓰지 않으므로 제외
+
+사용법:
+    python passive_tree_graph.py --build             # pob_repo 또는 data.json에서 캐시 생성
+    python passive_tree_graph.py --download          # GGG skilltree-export data.json 다운로드 후 생성
+    python passive_tree_graph.py --benchmark         # 120포인트 계획 시간 측정
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# UTF-8 설정
+if sys.platform == 'win32':
+    if sys.stdout.encoding != 'utf-8':
+        sys.stdout.reconfigure(encoding='utf-8')
+    if sys.stderr.encoding != 'utf-8':
+        sys.stderr.reconfigure(encoding='utf-8')
+
+BASE_DIR = Path(__file__).parent
+GRAPH_CACHE_FILE = BASE_DIR / "game_data" / "passive_tree.json"
+TREE_EXPORT_FILE = BASE_DIR / "game_data" / "tree_data.json"
+POB_TREE_DIR = BASE_DIR / "pob_repo" / "src" / "TreeData"
+TREE_EXPORT_URL = "https://raw.githubusercontent.com/grindinggear/skilltree-export/master/data.json"
+
+GRAPH_CACHE_VERSION = 1
+
+# 노드 종류
+NORMAL, NOTABLE, KEYSTONE, JEWEL, MASTERY, CLASS_START, ASCENDANCY = range(7)
+KIND_NAMES = ['normal', 'notable', 'keystone', 'jewel', 'mastery', 'class_start', 'ascendancy']
+
+# 노드 종류별 기본 가치 (경로 선택 가중치)
+KIND_VALUE = {NORMAL: 1.0, NOTABLE: 3.0, KEYSTONE: 4.0, JEWEL: 2.0}
+
+UNREACHABLE = 1 << 30
+
+
+def _values(table: Any) -> List[Any]:
+    """Lua 테이블/JSON 배열의 값 목록 (dict면 키 순서대로)"""
+    if isinstance(table, list):
+        return table
+    if isinstance(table, dict):
+        return [table[key] for key in sorted(table, key=lambda k: (not isinstance(k, int), k))]
+    return []
+
+
+def _node_kind(node: Dict) -> int:
+    if node.get('ascendancyName'):
+        return ASCENDANCY
+    if node.get('classStartIndex') is not None:
+        return CLASS_START
+    if node.get('isMastery'):
+        return MASTERY
+    if node.get('isKeystone'):
+        return KEYSTONE
+    if node.get('isNotable'):
+        return NOTABLE
+    if node.get('isJewelSocket'):
+        return JEWEL
+    return NORMAL
+
+
+class PassiveTreeGraph:
+    """배열 기반 (CSR) 패시브 트리 그래프"""
+
+    def __init__(self, nodes: List[Dict], edges: List[List[int]]):
+        """
+        Args:
+            nodes: [{'id', 'name', 'stats', 'kind', 'group', 'class_start'}]  (인덱스 순서)
+            edges: [[a, b], ...] 노드 인덱스 쌍 (무방향)
+        """
+        count = len(nodes)
+        self.node_ids = array('i', (node['id'] for node in nodes))
+        self.index: Dict[int, int] = {node['id']: i for i, node in enumerate(nodes)}
+        self.names = [node.get('name', '') for node in nodes]
+        self.stats = [tuple(node.get('stats', ())) for node in nodes]
+        self.kinds = bytes(node.get('kind', NORMAL) for node in nodes)
+        self.groups = array('i', (node.get('group') or 0 for node in nodes))
+        self.class_starts = {
+            node['class_start']: i for i, node in enumerate(nodes) if node.get('class_start') is not None
+        }
+
+        degree = [0] * count
+        for a, b in edges:
+            degree[a] += 1
+            degree[b] += 1
+        self.indptr = array('i', [0]) * (count + 1)
+        for i in range(count):
+            self.indptr[i + 1] = self.indptr[i] + degree[i]
+        self.indices = array('i', [0]) * self.indptr[count]
+        fill = list(self.indptr[:count])
+        for a, b in edges:
+            self.indices[fill[a]] = b
+            fill[a] += 1
+            self.indices[fill[b]] = a
+            fill[b] += 1
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices) // 2
+
+    # ------------------------------------------------------------------
+    # 생성 / 캐시
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_tree_data(cls, data: Dict) -> 'PassiveTreeGraph':
+        """tree.lua / data.json 구조에서 생성"""
+        raw_nodes = data.get('nodes', {})
+        items = raw_nodes.items() if isinstance(raw_nodes, dict) else enumerate(raw_nodes)
+
+        nodes = []
+        index = {}
+        raw_by_index = []
+        for key, node in items:
+            if not isinstance(node, dict):
+                continue
+            skill = node.get('skill', key)
+            try:
+                skill = int(skill)
+            except (TypeError, ValueError):
+                continue  # 'root'
+            kind = _node_kind(node)
+            index[skill] = len(nodes)
+            nodes.append({
+                'id': skill,
+                'name': node.get('name', ''),
+                'stats': [str(stat) for stat in _values(node.get('stats'))],
+                'kind': kind,
+                'group': node.get('group') or 0,
+                'class_start': node.get('classStartIndex') if kind == CLASS_START else None,
+            })
+            raw_by_index.append(node)
+
+        edges = set()
+        for i, node in enumerate(raw_by_index):
+            for other in _values(node.get('out')) + _values(node.get('in')):
+                try:
+                    j = index[int(other)]
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if i == j:
+                    continue
+                kind_i, kind_j = nodes[i]['kind'], nodes[j]['kind']
+                if MASTERY in (kind_i, kind_j):
+                    continue
+                # 어센던시는 어센던시끼리만, 클래스 시작 노드끼리는 연결하지 않음
+                if (kind_i == ASCENDANCY) != (kind_j == ASCENDANCY):
+                    continue
+                if kind_i == CLASS_START and kind_j == CLASS_START:
+                    continue
+                edges.add((min(i, j), max(i, j)))
+
+        return cls(nodes, sorted(edges))
+
+    def to_cache(self) -> Dict:
+        nodes = []
+        for i in range(len(self)):
+            node = {'id': self.node_ids[i], 'name': self.names[i], 'kind': self.kinds[i]}
+            if self.stats[i]:
+                node['stats'] = list(self.stats[i])
+            if self.groups[i]:
+                node['group'] = self.groups[i]
+            nodes.append(node)
+        for class_index, i in self.class_starts.items():
+            nodes[i]['class_start'] = class_index
+
+        edges = []
+        for a in range(len(self)):
+            for b in self.indices[self.indptr[a]:self.indptr[a + 1]]:
+                if a < b:
+                    edges.append([a, b])
+        return {'version': GRAPH_CACHE_VERSION, 'nodes': nodes, 'edges': edges}
+
+    @classmethod
+    def from_cache(cls, data: Dict) -> 'PassiveTreeGraph':
+        return cls(data['nodes'], data['edges'])
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def neighbors(self, i: int) -> array:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def kind_name(self, skill_id: int) -> Optional[str]:
+        i = self.index.get(skill_id)
+        return KIND_NAMES[self.kinds[i]] if i is not None else None
+
+    def describe(self, skill_id: int) -> Optional[Dict]:
+        """노드 정보 ({'name', 'stats', 'type'}), 트리에 없으면 None"""
+        i = self.index.get(skill_id)
+        if i is None:
+            return None
+        return {'name': self.names[i], 'stats': list(self.stats[i]), 'type': KIND_NAMES[self.kinds[i]]}
+
+    def node_value(self, skill_id: int) -> float:
+        """노드 종류별 기본 가치"""
+        i = self.index.get(skill_id)
+        return KIND_VALUE.get(self.kinds[i], 0.0) if i is not None else 0.0
+
+    def start_for(self, skill_ids: Iterable[int]) -> Optional[int]:
+        """목표 노드와 인접한 클래스 시작 노드 (skill id)"""
+        wanted = {self.index[s] for s in skill_ids if s in self.index}
+        for i in self.class_starts.values():
+            if any(j in wanted for j in self.neighbors(i)):
+                return self.node_ids[i]
+        return None
+
+    def class_start(self, class_index: int) -> Optional[int]:
+        i = self.class_starts.get(class_index)
+        return self.node_ids[i] if i is not None else None
+
+    # ------------------------------------------------------------------
+    # 계획
+    # ------------------------------------------------------------------
+
+    def plan_allocation(
+        self,
+        allocated: Iterable[int],
+        targets: Iterable[int],
+        allowed: Optional[Iterable[int]] = None,
+        values: Optional[Dict[int, float]] = None
+    ) -> Dict:
+        """현재 할당에서 목표 노드를 모두 연결하는 할당 순서
+
+        매 단계 현재 트리에서 거리/가치 비율이 가장 좋은 목표를 골라 그 경로를 추가한다.
+        반환 순서대로 찍으면 항상 이미 찍은 노드와 인접하다 (마스터리는 같은 그룹 노터블 다음).
+
+        Args:
+            allocated: 이미 할당된 노드 (클래스 시작 노드 포함, skill id)
+            targets: 찍어야 하는 노드 (skill id)
+            allowed: 경로로 쓸 수 있는 노드 (None이면 트리 전체)
+            values: 노드별 가치 (None이면 종류별 기본값)
+
+        Returns:
+            {'order': [skill id], 'travel': set(목표가 아닌 경유 노드), 'unreachable': [skill id]}
+        """
+        count = len(self)
+        indptr, indices, kinds = self.indptr, self.indices, self.kinds
+
+        passable = bytearray(count)
+        if allowed is None:
+            for i in range(count):
+                passable[i] = kinds[i] not in (MASTERY, ASCENDANCY, CLASS_START)
+        else:
+            for skill in allowed:
+                i = self.index.get(skill)
+                if i is not None and kinds[i] not in (MASTERY, ASCENDANCY, CLASS_START):
+                    passable[i] = 1
+
+        value = [0.0] * count
+        terminals: Set[int] = set()
+        masteries: List[int] = []
+        unknown: List[int] = []
+        for skill in targets:
+            i = self.index.get(skill)
+            if i is None:
+                unknown.append(skill)
+                continue
+            if kinds[i] == MASTERY:
+                masteries.append(i)
+            elif kinds[i] not in (ASCENDANCY, CLASS_START):
+                terminals.add(i)
+                passable[i] = 1
+                value[i] = (values or {}).get(skill) or KIND_VALUE.get(kinds[i], 1.0)
+
+        dist = array('i', [UNREACHABLE]) * count
+        gain = [0.0] * count  # 트리에서 이 노드까지 경로의 누적 가치
+        parent = array('i', [-1]) * count
+        in_tree = bytearray(count)
+
+        def relax(sources):
+            queue = list(sources)
+            for i in queue:
+                dist[i] = 0
+                gain[i] = 0.0
+            head = 0
+            while head < len(queue):
+                u = queue[head]
+                head += 1
+                next_dist = dist[u] + 1
+                for v in indices[indptr[u]:indptr[u + 1]]:
+                    if passable[v] and next_dist < dist[v]:
+                        dist[v] = next_dist
+                        gain[v] = gain[u] + value[v]
+                        parent[v] = u
+                        queue.append(v)
+
+        target_set = frozenset(terminals)
+        sources = [self.index[s] for s in allocated if s in self.index]
+        for i in sources:
+            in_tree[i] = 1
+        terminals.difference_update(sources)
+        relax(sources)
+
+        order: List[int] = []
+        remaining = terminals
+        while remaining:
+            best, best_score = -1, None
+            for t in remaining:
+                if dist[t] >= UNREACHABLE:
+                    continue
+                score = (dist[t] / gain[t] if gain[t] > 0 else float(dist[t]), dist[t], self.node_ids[t])
+                if best_score is None or score < best_score:
+                    best, best_score = t, score
+            if best < 0:
+                break
+
+            path = []
+            u = best
+            while not in_tree[u]:
+                path.append(u)
+                u = parent[u]
+            path.reverse()
+            for u in path:
+                in_tree[u] = 1
+                remaining.discard(u)
+            order.extend(path)
+            relax(path)
+
+        # 마스터리: 같은 그룹 노터블이 처음 할당된 직후 (이미 할당돼 있으면 맨 앞)
+        if masteries:
+            first_in_group: Dict[int, int] = {}
+            for i in sources:
+                if kinds[i] == NOTABLE:
+                    first_in_group.setdefault(self.groups[i], -1)
+            for position, i in enumerate(order):
+                if kinds[i] == NOTABLE:
+                    first_in_group.setdefault(self.groups[i], position)
+            pending = []
+            for m in masteries:
+                position = first_in_group.get(self.groups[m])
+                if position is None:
+                    unknown.append(self.node_ids[m])
+                else:
+                    pending.append((position, m))
+            for position, m in sorted(pending, reverse=True):
+                order.insert(position + 1, m)
+
+        order_ids = [self.node_ids[i] for i in order]
+        travel = {self.node_ids[i] for i in order if i not in target_set and kinds[i] != MASTERY}
+        unreachable = [self.node_ids[t] for t in remaining] + unknown
+        return {'order': order_ids, 'travel': travel, 'unreachable': unreachable}
+
+
+# ----------------------------------------------------------------------
+# 로드
+# ----------------------------------------------------------------------
+
+def latest_pob_tree_file(tree_dir: Path = POB_TREE_DIR) -> Optional[Path]:
+    """pob_repo의 가장 최신 기본 트리 (3_26 > 3_25, ruthless/alternate 제외)"""
+    if not tree_dir.exists():
+        return None
+    versions = []
+    for path in tree_dir.iterdir():
+        match = re.fullmatch(r"(\d+)_(\d+)", path.name)
+        if match and (path / "tree.lua").exists():
+            versions.append(((int(match.group(1)), int(match.group(2))), path / "tree.lua"))
+    return max(versions)[1] if versions else None
+
+
+def load_tree_data(source: Optional[Path] = None) -> Optional[Dict]:
+    """트리 원본 로드 (tree.lua 또는 data.json)"""
+    source = Path(source) if source else (latest_pob_tree_file() or TREE_EXPORT_FILE)
+    if not source.exists():
+        return None
+
+    text = source.read_text(encoding='utf-8')
+    if source.suffix == '.json':
+        return json.loads(text)
+
+    from lua_table_parser import parse_lua_chunk
+    chunk = parse_lua_chunk(text)
+    return chunk.get('return') or chunk.get('tree') or chunk
+
+
+def build_graph_cache(source: Optional[Path] = None, cache_file: Path = GRAPH_CACHE_FILE) -> Optional[PassiveTreeGraph]:
+    """원본 트리에서 그래프를 만들고 캐시 저장"""
+    data = load_tree_data(source)
+    if not data:
+        print("[ERROR] Passive tree data not found (run game_data_fetcher.py --clone or passive_tree_graph.py --download)", file=sys.stderr)
+        return None
+
+    graph = PassiveTreeGraph.from_tree_data(data)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_file.with_suffix(".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(graph.to_cache(), f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, cache_file)
+    print(f"[OK] Passive tree graph: {len(graph)} nodes, {graph.edge_count} edges -> {cache_file}", file=sys.stderr)
+    return graph
+
+
+def download_tree_export(target: Path = TREE_EXPORT_FILE) -> bool:
+    """GGG skilltree-export data.json 다운로드"""
+    import requests
+
+    try:
+        response = requests.get(TREE_EXPORT_URL, headers={'User-Agent': 'PathcraftAI/1.0'}, timeout=60)
+        response.raise_for_status()
+    except Exception as e:
+        print(f"[ERROR] Failed to download passive tree: {e}", file=sys.stderr)
+        return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(response.content)
+    return True
+
+
+_graph: Optional[PassiveTreeGraph] = None
+_graph_loaded = False
+_graph_lock = threading.Lock()
+
+
+def get_passive_tree_graph() -> Optional[PassiveTreeGraph]:
+    """공용 패시브 트리 그래프 (캐시 → 원본 변환 순, 데이터가 없으면 None)"""
+    global _graph, _graph_loaded
+    with _graph_lock:
+        if not _graph_loaded:
+            _graph_loaded = True
+            try:
+                with open(GRAPH_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == GRAPH_CACHE_VERSION:
+                    _graph = PassiveTreeGraph.from_cache(data)
+            except (OSError, ValueError):
+                pass
+            if _graph is None:
+                _graph = build_graph_cache()
+        return _graph
+
+
+def synthetic_tree_data(rings: int = 40, spokes: int = 80) -> Dict:
+    """벤치마크용 합성 트리 (실제 트리와 비슷한 규모: 노드 ~3200개)"""
+    nodes = {}
+    skill = 100
+
+    def add(**fields):
+        nonlocal skill
+        skill += 1
+        nodes[str(skill)] = {'skill': skill, 'out': [], 'in': [], **fields}
+        return skill
+
+    start = add(name='Seven', classStartIndex=0)
+    grid = [[add(name=f'Node {r}-{s}', stats=['+10 to maximum Life'] if (r + s) % 7 == 0 else ['8% increased Damage'],
+                 isNotable=(r % 5 == 4 and s % 4 == 0), group=(r // 5) * spokes + s // 4)
+             for s in range(spokes)] for r in range(rings)]
+    for r in range(rings):
+        for s in range(spokes):
+            node = nodes[str(grid[r][s])]
+            node['out'].append(str(grid[r][(s + 1) % spokes]))
+            if r + 1 < rings and s % 2 == 0:
+                node['out'].append(str(grid[r + 1][s]))
+    for s in range(0, spokes, 10):
+        nodes[str(start)]['out'].append(str(grid[0][s]))
+    # 노터블이 있는 그룹마다 마스터리 (연결 없음)
+    for r in range(4, rings, 5):
+        for s in range(0, spokes, 4):
+            add(name=f'Mastery {r}-{s}', isMastery=True, group=nodes[str(grid[r][s])]['group'])
+    return {'nodes': nodes}
+
+
+def benchmark_targets(graph: PassiveTreeGraph, start: int, points: int = 120) -> List[int]:
+    """시작 노드 주변에 흩어진 목표 (전체 경로가 약 points개가 되도록 BFS 순서에서 3개마다 1개)"""
+    origin = graph.index[start]
+    seen = {origin}
+    queue = [origin]
+    for u in queue:
+        if len(queue) >= points * 3:
+            break
+        for v in graph.neighbors(u):
+            if v not in seen and graph.kinds[v] in (NORMAL, NOTABLE, KEYSTONE, JEWEL):
+                seen.add(v)
+                queue.append(v)
+    return [graph.node_ids[i] for i in queue[1::3]]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='패시브 트리 그래프')
+    parser.add_argument('--build', action='store_true', help='원본 트리에서 그래프 캐시 생성')
+    parser.add_argument('--download', action='store_true', help='GGG skilltree-export data.json 다운로드 후 생성')
+    parser.add_argument('--source', type=str, help='원본 파일 (tree.lua 또는 data.json)')
+    parser.add_argument('--benchmark', action='store_true', help='120포인트 계획 시간 측정')
+    args = parser.parse_args()
+
+    if args.download:
+        if not download_tree_export():
+            sys.exit(1)
+        args.build = True
+
+    if args.build:
+        sys.exit(0 if build_graph_cache(Path(args.source) if args.source else None) else 1)
+
+    if args.benchmark:
+        graph = get_passive_tree_graph()
+        if graph is None:
+            print("[INFO] Using synthetic tree", file=sys.stderr)
+            graph = PassiveTreeGraph.from_tree_data(synthetic_tree_data())
+        start = graph.node_ids[next(iter(graph.class_starts.values()))]
+        targets = benchmark_targets(graph, start)
+
+        begin = time.perf_counter()
+        plan = graph.plan_allocation([start], targets)
+        elapsed = (time.perf_counter() - begin) * 1000
+        print(f"Graph: {len(graph)} nodes, {graph.edge_count} edges, {len(targets)} targets")
+        print(f"Plan: {len(plan['order'])} points ({len(plan['travel'])} travel), "
+              f"{len(plan['unreachable'])} unreachable, {elapsed:.1f} ms")
+        return
+
+    parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
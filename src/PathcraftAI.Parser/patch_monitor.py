@@ -15,13 +15,20 @@ Update Speed: 3-7 days faster than competitors
 import os
 import json
 import time
+import hashlib
 import logging
-from datetime import datetime, timedelta
+import sqlite3
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
 # Video content extraction
-from video_transcript import extract_video_content
+from video_transcript import extract_video_content, extract_video_contents
+
+# Patch note full-text search
+from patch_note_index import find_relevant_patch_notes
 
 # OpenAI for patch analysis
 from openai import OpenAI
@@ -44,8 +51,8 @@ try:
 except ImportError:
     feedparser = None
 
-# YouTube API
-from googleapiclient.discovery import build
+# YouTube API (공용 할당량 추적 클라이언트)
+from youtube_client import get_youtube_client
 
 # Configure logging
 logging.basicConfig(
@@ -54,6 +61,109 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-source polling timeouts (seconds)
+DEFAULT_SOURCE_TIMEOUTS = {
+    'youtube': 20,
+    'twitter': 20,
+    'reddit': 30,
+    'rss': 15
+}
+
+
+class ProcessedPatchStore:
+    """
+    Processed-item store for deduplication (SQLite)
+
+    Items are keyed by a hash of their source ID, so membership checks are a
+    single primary-key lookup and marking an item is one INSERT instead of a
+    full file rewrite. Legacy JSON state files are migrated on first open.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        legacy = self._read_legacy_json(db_path)
+        if legacy is not None:
+            os.replace(db_path, db_path + '.json.bak')
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS processed (
+                item_hash TEXT PRIMARY KEY,
+                item_id TEXT NOT NULL,
+                source TEXT,
+                severity TEXT,
+                processed_at TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        if legacy:
+            for item_id, info in legacy.items():
+                self.mark(item_id, info.get('source'), info.get('severity'), info.get('processed_at'))
+            logger.info(f"Migrated {len(legacy)} processed items from legacy JSON state")
+
+    @staticmethod
+    def _read_legacy_json(db_path: str) -> Optional[Dict[str, Any]]:
+        """Return legacy JSON state if db_path is an old-style JSON file"""
+        db_file = Path(db_path)
+        if not db_file.exists():
+            return None
+        with open(db_file, 'rb') as f:
+            if f.read(16) == b'SQLite format 3\x00':
+                return None
+        try:
+            with open(db_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load processed patches: {e}")
+            return {}
+
+    @staticmethod
+    def item_hash(item_id: Any) -> str:
+        return hashlib.sha1(str(item_id).encode('utf-8')).hexdigest()
+
+    def __contains__(self, item_id: Any) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM processed WHERE item_hash = ?",
+                (self.item_hash(item_id),)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM processed").fetchone()[0]
+
+    def mark(
+        self,
+        item_id: Any,
+        source: Optional[str],
+        severity: Optional[str],
+        processed_at: Optional[str] = None
+    ):
+        """Mark an item as processed"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO processed (item_hash, item_id, source, severity, processed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    self.item_hash(item_id),
+                    str(item_id),
+                    source,
+                    severity,
+                    processed_at or datetime.utcnow().isoformat()
+                )
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
 
 class PatchMonitor:
     """
@@ -69,7 +179,8 @@ class PatchMonitor:
         reddit_client_id: Optional[str] = None,
         reddit_client_secret: Optional[str] = None,
         openai_api_key: Optional[str] = None,
-        db_path: str = "patch_monitor.db"
+        db_path: str = "patch_monitor.db",
+        source_timeouts: Optional[Dict[str, float]] = None
     ):
         """
         Initialize Patch Monitor
@@ -81,6 +192,7 @@ class PatchMonitor:
             reddit_client_secret: Reddit OAuth client secret
             openai_api_key: OpenAI API key for GPT-4 analysis
             db_path: SQLite database path for tracking processed patches
+            source_timeouts: Per-source polling timeouts in seconds
         """
         # Load from environment if not provided
         self.youtube_api_key = youtube_api_key or os.environ.get('YOUTUBE_API_KEY')
@@ -90,7 +202,9 @@ class PatchMonitor:
         self.openai_api_key = openai_api_key or os.environ.get('PATHCRAFT_OPENAI_KEY')
 
         self.db_path = db_path
-        self.processed_patches = self._load_processed_patches()
+        self.processed_patches = ProcessedPatchStore(db_path)
+        self.source_timeouts = {**DEFAULT_SOURCE_TIMEOUTS, **(source_timeouts or {})}
+        self._inflight: Dict[str, Future] = {}  # source -> poll still running from an earlier cycle
 
         # Initialize API clients
         self._init_clients()
@@ -99,7 +213,7 @@ class PatchMonitor:
         """Initialize API clients"""
         # YouTube
         if self.youtube_api_key:
-            self.youtube = build('youtube', 'v3', developerKey=self.youtube_api_key)
+            self.youtube = get_youtube_client(self.youtube_api_key)
         else:
             self.youtube = None
             logger.warning("YouTube API key not provided")
@@ -129,26 +243,6 @@ class PatchMonitor:
             self.openai_client = None
             logger.warning("OpenAI API key not provided")
 
-    def _load_processed_patches(self) -> Dict[str, Any]:
-        """Load processed patches from database"""
-        db_file = Path(self.db_path)
-        if db_file.exists():
-            try:
-                with open(db_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Failed to load processed patches: {e}")
-                return {}
-        return {}
-
-    def _save_processed_patches(self):
-        """Save processed patches to database"""
-        try:
-            with open(self.db_path, 'w', encoding='utf-8') as f:
-                json.dump(self.processed_patches, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"Failed to save processed patches: {e}")
-
     def monitor_youtube(self, hours_ago: int = 24) -> List[Dict[str, Any]]:
         """
         Monitor GGG YouTube channel for new patch videos
@@ -159,7 +253,7 @@ class PatchMonitor:
         Returns:
             List of new patch videos
         """
-        if not self.youtube:
+        if not self.youtube or not self.youtube.available:
             logger.warning("YouTube API not available")
             return []
 
@@ -170,21 +264,14 @@ class PatchMonitor:
             channel_id = "UC0cmyGhMARccWBw0EZP-G_Q"
 
             # Calculate time threshold
-            published_after = (datetime.utcnow() - timedelta(hours=hours_ago)).isoformat() + 'Z'
-
-            request = self.youtube.search().list(
-                part='snippet',
-                channelId=channel_id,
-                publishedAfter=published_after,
-                type='video',
-                maxResults=10,
-                order='date'
-            )
-            response = request.execute()
+            published_after = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+
+            # Uploads playlist costs 1 unit per page instead of 100 for search.list
+            items = self.youtube.recent_uploads(channel_id, published_after, background=True)
 
             new_videos = []
-            for item in response.get('items', []):
-                video_id = item['id']['videoId']
+            for item in items:
+                video_id = item['contentDetails']['videoId']
                 title = item['snippet']['title']
                 description = item['snippet']['description']
 
@@ -198,7 +285,7 @@ class PatchMonitor:
                             'title': title,
                             'description': description,
                             'url': f'https://www.youtube.com/watch?v={video_id}',
-                            'published_at': item['snippet']['publishedAt']
+                            'published_at': item['contentDetails'].get('videoPublishedAt') or item['snippet']['publishedAt']
                         })
 
             return new_videos
@@ -390,8 +477,10 @@ class PatchMonitor:
             # Extract content
             content = ""
             if news_item['source'] == 'youtube':
-                # Extract video content with 3-stage fallback
-                video_result = extract_video_content(news_item['url'], self.youtube_api_key, self.openai_api_key)
+                # Extract video content with 3-stage fallback (prefetched in monitor_all_sources)
+                video_result = news_item.get('video_content') or extract_video_content(
+                    news_item['url'], self.youtube_api_key, self.openai_api_key
+                )
                 if video_result['success']:
                     content = video_result['content']
                     logger.info(f"[AI Analysis] Extracted video content using {video_result['method']}")
@@ -447,6 +536,81 @@ Focus on:
                 'summary': f'Analysis failed: {str(e)}'
             }
 
+    @staticmethod
+    def _item_id(news_item: Dict[str, Any]) -> Optional[Any]:
+        return news_item.get('video_id') or news_item.get('tweet_id') or news_item.get('post_id') or news_item.get('entry_id')
+
+    @staticmethod
+    def _submit_daemon(name: str, poll) -> Future:
+        """
+        Run a poller on its own daemon thread
+
+        A poller that hangs past its timeout keeps running in the background,
+        but as a daemon thread it never blocks interpreter exit.
+        """
+        future = Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(poll())
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name=f"patch-poll-{name}", daemon=True).start()
+        return future
+
+    def _poll_sources(self, hours_ago: int) -> List[Dict[str, Any]]:
+        """
+        Poll all sources concurrently
+
+        Each source gets its own timeout measured from the start of the cycle,
+        so a cycle takes about as long as the slowest source (capped by its
+        timeout). Items already seen in this cycle are dropped. A source whose
+        poll from an earlier cycle is still running is skipped, so a hung
+        source holds at most one thread.
+        """
+        pollers = {
+            'youtube': lambda: self.monitor_youtube(hours_ago),
+            'twitter': lambda: self.monitor_twitter(hours_ago),
+            'reddit': lambda: self.monitor_reddit(hours_ago),
+            'rss': self.monitor_rss
+        }
+
+        started = time.monotonic()
+        futures = {}
+        for name, poll in pollers.items():
+            previous = self._inflight.get(name)
+            if previous is not None and not previous.done():
+                logger.warning(f"[{name}] Previous poll still running, skipping this cycle")
+                continue
+            futures[name] = self._inflight[name] = self._submit_daemon(name, poll)
+
+        all_news = []
+        seen = set()
+        for name, future in futures.items():
+            remaining = self.source_timeouts[name] - (time.monotonic() - started)
+            try:
+                items = future.result(timeout=max(remaining, 0))
+            except FutureTimeoutError:
+                logger.warning(f"[{name}] Timed out after {self.source_timeouts[name]}s")
+                continue
+            except Exception as e:
+                logger.error(f"[{name}] Error: {e}")
+                continue
+
+            for item in items:
+                item_id = self._item_id(item)
+                if item_id in seen:
+                    continue
+                seen.add(item_id)
+                all_news.append(item)
+
+        logger.info(f"Polled {len(futures)} sources in {time.monotonic() - started:.1f}s")
+
+        return all_news
+
     def monitor_all_sources(self, hours_ago: int = 24) -> List[Dict[str, Any]]:
         """
         Monitor all sources for new patches
@@ -462,22 +626,18 @@ Focus on:
         logger.info(f"Time window: Last {hours_ago} hours")
         logger.info("="*60)
 
-        all_news = []
-
-        # Monitor YouTube
-        all_news.extend(self.monitor_youtube(hours_ago))
-
-        # Monitor Twitter
-        all_news.extend(self.monitor_twitter(hours_ago))
-
-        # Monitor Reddit
-        all_news.extend(self.monitor_reddit(hours_ago))
-
-        # Monitor RSS
-        all_news.extend(self.monitor_rss())
+        all_news = self._poll_sources(hours_ago)
 
         logger.info(f"\nFound {len(all_news)} new patch announcements")
 
+        # Extract all video content in one batch (cached videos skip the network)
+        video_urls = [item['url'] for item in all_news if item['source'] == 'youtube']
+        if video_urls:
+            video_contents = extract_video_contents(video_urls, self.youtube_api_key, self.openai_api_key)
+            for item in all_news:
+                if item['source'] == 'youtube':
+                    item['video_content'] = video_contents[item['url']]
+
         # Analyze each patch
         for news_item in all_news:
             logger.info(f"\nAnalyzing: {news_item.get('title', news_item.get('text', 'Unknown'))[:50]}...")
@@ -485,19 +645,33 @@ Focus on:
             news_item['analysis'] = analysis
 
             # Mark as processed
-            item_id = news_item.get('video_id') or news_item.get('tweet_id') or news_item.get('post_id') or news_item.get('entry_id')
+            item_id = self._item_id(news_item)
             if item_id:
-                self.processed_patches[str(item_id)] = {
-                    'processed_at': datetime.utcnow().isoformat(),
-                    'source': news_item['source'],
-                    'severity': analysis.get('severity')
-                }
-
-        # Save processed patches
-        self._save_processed_patches()
+                self.processed_patches.mark(item_id, news_item['source'], analysis.get('severity'))
 
         return all_news
 
+    def find_related_patch_notes(self, analysis: Dict[str, Any], limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Find earlier patch notes that mention the skills/items in analysis['impact']
+
+        Args:
+            analysis: Patch analysis from GPT-4
+            limit: Maximum number of notes
+
+        Returns:
+            Matching patch notes (best match first)
+        """
+        impact = analysis.get('impact', [])
+        if not impact:
+            return []
+
+        try:
+            return find_relevant_patch_notes(impact, limit=limit)
+        except Exception as e:
+            logger.error(f"[Patch Index] Search failed: {e}")
+            return []
+
     def should_update_pathcraft(self, analysis: Dict[str, Any]) -> bool:
         """
         Determine if PathcraftAI should auto-update based on patch analysis
@@ -518,6 +692,16 @@ Focus on:
                 logger.info(f"[Auto-Update] ✅ Triggering update (severity: {severity})")
                 return True
 
+            # Impact lists concrete names ("Righteous Fire") that patch notes have covered before
+            related = self.find_related_patch_notes(analysis)
+            if related:
+                analysis['related_patches'] = [note['patch_id'] for note in related]
+                logger.info(
+                    f"[Auto-Update] ✅ Triggering update (severity: {severity}, "
+                    f"related patches: {', '.join(analysis['related_patches'])})"
+                )
+                return True
+
         logger.info(f"[Auto-Update] ⏸️ No update needed (severity: {severity})")
         return False
 
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+"""
+Patch Note Full-Text Index
+패치 노트 본문에 대한 증분 전문 검색 인덱스 (SQLite FTS5, BM25 랭킹)
+
+patch_scraper가 노트를 저장할 때마다 갱신되며, 수동으로 추가/수정된 노트 파일은
+sync()가 mtime을 비교해 변경된 것만 다시 색인한다.
+공유 인덱스는 처음 열 때와 patch_index.json이 바뀌었을 때만 sync()하므로 검색 1건은 FTS 조회 1번이다.
+본문은 노트 파일의 full_body(원문 전체)를 색인하고, 없으면 500자 미리보기(body)를 쓴다.
+
+사용 예:
+    from patch_note_index import find_relevant_patch_notes
+    find_relevant_patch_notes("Righteous Fire")
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Union
+
+PATCH_NOTES_DIR = os.path.join(os.path.dirname(__file__), "patch_notes")
+PATCH_INDEX_FILE = os.path.join(PATCH_NOTES_DIR, "patch_index.json")
+PATCH_FTS_DB = os.path.join(PATCH_NOTES_DIR, "patch_notes_fts.db")
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def build_match_query(terms: Union[str, List[str]]) -> Optional[str]:
+    """
+    검색어를 FTS5 MATCH 쿼리로 변환
+
+    각 검색어는 하나의 구(phrase)로 취급하고, 여러 검색어는 OR로 묶는다.
+    예: ["Righteous Fire", "Vaal RF"] -> '"righteous fire" OR "vaal rf"'
+    """
+    if isinstance(terms, str):
+        terms = [terms]
+
+    phrases = []
+    for term in terms:
+        tokens = _TOKEN_PATTERN.findall(term.lower())
+        if tokens:
+            phrases.append('"' + " ".join(tokens) + '"')
+
+    if not phrases:
+        return None
+    return " OR ".join(dict.fromkeys(phrases))
+
+
+class PatchNoteIndex:
+    """패치 노트 전문 검색 인덱스"""
+
+    def __init__(self, db_path: str = PATCH_FTS_DB):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._synced_index_mtime: Optional[int] = None  # 마지막 sync() 시점의 patch_index.json mtime
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS notes (
+                patch_id TEXT PRIMARY KEY,
+                date TEXT,
+                title TEXT,
+                file TEXT,
+                url TEXT,
+                source_mtime INTEGER
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+                patch_id UNINDEXED,
+                title,
+                body,
+                tokenize = 'unicode61 remove_diacritics 2'
+            );
+            """
+        )
+        self._conn.commit()
+
+    def add_note(self, patch_note: Dict, file_name: str, body: Optional[str] = None):
+        """
+        패치 노트 1개 색인 (기존 항목은 교체)
+
+        Args:
+            patch_note: patch_scraper.parse_patch_note() 형식의 데이터
+            file_name: patch_notes/ 안의 파일 이름
+            body: 색인할 본문 (없으면 full_body, 그것도 없으면 500자 미리보기 body)
+        """
+        patch_id = patch_note['patch_id']
+        file_path = os.path.join(PATCH_NOTES_DIR, file_name)
+        mtime = os.stat(file_path).st_mtime_ns if os.path.exists(file_path) else 0
+
+        with self._lock:
+            self._conn.execute("DELETE FROM notes_fts WHERE patch_id = ?", (patch_id,))
+            self._conn.execute(
+                "INSERT INTO notes_fts (patch_id, title, body) VALUES (?, ?, ?)",
+                (patch_id, patch_note.get('title', ''),
+                 body if body is not None else (patch_note.get('full_body') or patch_note.get('body', '')))
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO notes (patch_id, date, title, file, url, source_mtime) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    patch_id,
+                    patch_note.get('date', ''),
+                    patch_note.get('title', ''),
+                    file_name,
+                    patch_note.get('full_text_url') or patch_note.get('official_url', ''),
+                    mtime
+                )
+            )
+            self._conn.commit()
+
+    def remove_note(self, patch_id: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM notes_fts WHERE patch_id = ?", (patch_id,))
+            self._conn.execute("DELETE FROM notes WHERE patch_id = ?", (patch_id,))
+            self._conn.commit()
+
+    def sync(self, patch_index: Optional[Dict[str, Dict]] = None) -> int:
+        """
+        patch_index.json 기준 증분 동기화
+
+        파일 mtime이 바뀐 노트만 다시 색인하고, 인덱스에서 빠진 노트는 삭제한다.
+
+        Returns:
+            다시 색인한 노트 수
+        """
+        index_mtime = os.stat(PATCH_INDEX_FILE).st_mtime_ns if os.path.exists(PATCH_INDEX_FILE) else None
+        if patch_index is None:
+            if index_mtime is None:
+                self._synced_index_mtime = None
+                return 0
+            with open(PATCH_INDEX_FILE, 'r', encoding='utf-8') as f:
+                patch_index = json.load(f)
+        self._synced_index_mtime = index_mtime
+
+        with self._lock:
+            indexed = dict(self._conn.execute("SELECT patch_id, source_mtime FROM notes").fetchall())
+
+        updated = 0
+        for patch_id, info in patch_index.items():
+            file_path = os.path.join(PATCH_NOTES_DIR, info['file'])
+            if not os.path.exists(file_path):
+                continue
+            if indexed.get(patch_id) == os.stat(file_path).st_mtime_ns:
+                continue
+
+            with open(file_path, 'r', encoding='utf-8') as f:
+                self.add_note(json.load(f), info['file'])
+            updated += 1
+
+        for patch_id in set(indexed) - set(patch_index):
+            self.remove_note(patch_id)
+
+        return updated
+
+    def sync_if_changed(self) -> int:
+        """patch_index.json이 마지막 sync() 이후 바뀌었을 때만 동기화 (파일 1개 stat)"""
+        index_mtime = os.stat(PATCH_INDEX_FILE).st_mtime_ns if os.path.exists(PATCH_INDEX_FILE) else None
+        if index_mtime == self._synced_index_mtime:
+            return 0
+        return self.sync()
+
+    def search(self, terms: Union[str, List[str]], limit: int = 5) -> List[Dict]:
+        """
+        스킬/아이템 이름 등으로 관련 패치 노트 검색 (BM25 순)
+
+        Args:
+            terms: 검색어 또는 검색어 리스트 (OR)
+            limit: 최대 결과 수
+
+        Returns:
+            [{patch_id, date, title, file, url, score, snippet}, ...]
+        """
+        match_query = build_match_query(terms)
+        if not match_query:
+            return []
+
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT n.patch_id, n.date, n.title, n.file, n.url,
+                       bm25(notes_fts) AS score,
+                       snippet(notes_fts, -1, '[', ']', '...', 16)
+                FROM notes_fts
+                JOIN notes n ON n.patch_id = notes_fts.patch_id
+                WHERE notes_fts MATCH ?
+                ORDER BY score
+                LIMIT ?
+                """,
+                (match_query, limit)
+            ).fetchall()
+
+        return [
+            {
+                'patch_id': patch_id,
+                'date': date,
+                'title': title,
+                'file': file_name,
+                'url': url,
+                'score': score,
+                'snippet': snippet
+            }
+            for patch_id, date, title, file_name, url, score, snippet in rows
+        ]
+
+    def latest(self, count: int = 3) -> List[Dict]:
+        """날짜 기준 최신 패치 노트 메타데이터"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT patch_id, date, title, file, url FROM notes ORDER BY date DESC LIMIT ?",
+                (count,)
+            ).fetchall()
+        return [
+            {'patch_id': p, 'date': d, 'title': t, 'file': f, 'url': u}
+            for p, d, t, f, u in rows
+        ]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_index: Optional[PatchNoteIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_patch_note_index(sync: bool = True) -> PatchNoteIndex:
+    """
+    공유 패치 노트 인덱스 (프로세스 내 1개)
+
+    Args:
+        sync: patch_index.json이 바뀌었으면 증분 동기화 (처음 열 때는 항상)
+    """
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            os.makedirs(PATCH_NOTES_DIR, exist_ok=True)
+            _default_index = PatchNoteIndex()
+    if sync:
+        _default_index.sync_if_changed()
+    return _default_index
+
+
+def find_relevant_patch_notes(terms: Union[str, List[str]], limit: int = 5) -> List[Dict]:
+    """스킬/아이템 이름과 관련된 패치 노트 검색"""
+    return get_patch_note_index().search(terms, limit=limit)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Patch Note Full-Text Index')
+    parser.add_argument('--query', type=str, help='Skill or item name to search for')
+    parser.add_argument('--limit', type=int, default=5, help='Maximum results')
+    parser.add_argument('--rebuild', action='store_true', help='Drop and rebuild the index')
+
+    args = parser.parse_args()
+
+    if args.rebuild and os.path.exists(PATCH_FTS_DB):
+        os.remove(PATCH_FTS_DB)
+
+    index = get_patch_note_index(sync=False)
+    updated = index.sync()
+    print(f"[OK] Indexed {updated} changed patch notes")
+
+    if args.query:
+        for result in index.search(args.query, limit=args.limit):
+            print(f"  {result['patch_id']:12s} - {result['date']} - {result['title'][:50]}")
+            print(f"      {result['snippet']}")
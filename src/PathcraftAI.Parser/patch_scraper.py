@@ -13,6 +13,8 @@ import sys
 from datetime import datetime
 from typing import List, Dict, Optional
 
+from patch_note_index import get_patch_note_index
+
 # Reddit JSON API 사용 (API key 불필요)
 REDDIT_API_BASE = "https://www.reddit.com"
 SUBREDDIT = "pathofexile"
@@ -151,6 +153,7 @@ def parse_patch_note(post: Dict) -> Optional[Dict]:
         "reddit_url": url,
         "official_url": official_url,
         "body": body[:500],  # 처음 500자만 저장 (미리보기)
+        "full_body": body,  # 전문 검색 인덱스용 원문
         "full_text_url": official_url if official_url else url,
         "community_reaction": {
             "upvotes": score,
@@ -231,6 +234,9 @@ def collect_all_patch_notes(max_posts: int = 500):
     patch_index = load_patch_index()
     print(f"[INFO] Existing patches in index: {len(patch_index)}")
 
+    # 전문 검색 인덱스 (새 노트는 저장 즉시 색인)
+    note_index = get_patch_note_index(sync=False)
+
     # Reddit에서 패치 노트 검색
     collected = 0
     skipped = 0
@@ -273,10 +279,12 @@ def collect_all_patch_notes(max_posts: int = 500):
                 "title": patch_note['title'],
                 "file": f"patch_{patch_id.replace('.', '_')}.json"
             }
+            note_index.add_note(patch_note, patch_index[patch_id]['file'])
             collected += 1
 
     # 인덱스 저장
     save_patch_index(patch_index)
+    note_index.sync(patch_index)
 
     print("=" * 60)
     print(f"Collection Summary:")
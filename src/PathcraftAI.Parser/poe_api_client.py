@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+POE Account API Client
+OAuth 인증이 필요한 pathofexile.com API 호출이 공유하는 클라이언트
+
+- 공유 requests.Session (keep-alive)
+- 토큰 만료 1시간 전 선제 갱신 (refresh_access_token), 401이면 1회 갱신 후 재시도
+- GGG Rate Limit 헤더(X-Rate-Limit-Policy/Rules/<rule>/<rule>-State) 추적:
+  한도에 닿기 전에 대기, 429면 Retry-After 존중
+  상태는 build_data/poe_api_cache/rate_limits.json에 저장해 연속 실행되는 스크립트가 공유
+- 같은 요청이 동시에 들어오면 한 번만 보내고 결과 공유
+- 캐릭터 목록/캐릭터 아이템 응답은 짧은 TTL로 디스크 캐시
+  (추천 → 비교 → 업그레이드가 각각 별도 프로세스여도 캐릭터당 1회 요청)
+
+사용 예:
+    from poe_api_client import get_poe_api_client
+    client = get_poe_api_client()
+    characters = client.get_characters()
+    character = client.get_character("MyCharacter")
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from poe_oauth import POE_API_BASE, load_token, save_token, refresh_access_token
+
+API_CACHE_DIR = Path(__file__).parent / "build_data" / "poe_api_cache"
+RATE_LIMIT_FILE = API_CACHE_DIR / "rate_limits.json"
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
+
+TOKEN_REFRESH_MARGIN = 3600   # 만료까지 이 시간(초) 이내면 선제 갱신
+CHARACTER_LIST_TTL = 120      # 캐릭터 목록 캐시 (초)
+CHARACTER_TTL = 300           # 캐릭터 아이템/패시브 캐시 (초)
+RATE_LIMIT_MARGIN = 1         # 윈도우별 남겨둘 요청 수
+MAX_RATE_WAIT = 60            # 이보다 오래 기다려야 하면 PoeRateLimited
+REQUEST_TIMEOUT = 15
+
+
+class PoeAuthError(Exception):
+    """사용 가능한 OAuth 토큰이 없음 (재인증 필요)"""
+
+
+class PoeRateLimited(Exception):
+    """GGG Rate Limit 대기 시간이 MAX_RATE_WAIT를 넘음"""
+
+    def __init__(self, policy: str, wait: float):
+        super().__init__(f"Rate limited by {policy} for {wait:.0f}s")
+        self.policy = policy
+        self.wait = wait
+
+
+def parse_rate_limit_header(value: Optional[str]) -> List[Tuple[int, int, int]]:
+    """'hits:period:restriction,...' 형식 파싱 -> [(hits, period, restriction)]"""
+    windows = []
+    for part in (value or "").split(","):
+        fields = part.strip().split(":")
+        if len(fields) != 3:
+            continue
+        try:
+            windows.append(tuple(int(field) for field in fields))
+        except ValueError:
+            continue
+    return windows
+
+
+class RateLimitTracker:
+    """GGG Rate Limit 정책별 상태 (프로세스 간 파일 공유)"""
+
+    def __init__(self, path: Path = RATE_LIMIT_FILE):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.policies: Dict[str, Dict] = {}
+        self.endpoints: Dict[str, str] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.policies = data.get("policies", {})
+            self.endpoints = data.get("endpoints", {})
+        except (OSError, ValueError):
+            pass
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"policies": self.policies, "endpoints": self.endpoints}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[WARN] Failed to save rate limit state: {e}", file=sys.stderr)
+
+    def wait_time(self, endpoint: str) -> Tuple[Optional[str], float]:
+        """요청 전에 기다려야 하는 시간 (정책 이름, 초)"""
+        now = time.time()
+        with self._lock:
+            policy = self.endpoints.get(endpoint)
+            state = self.policies.get(policy) if policy else None
+            if not state:
+                return policy, 0.0
+
+            wait = state.get("restricted_until", 0) - now
+            for max_hits, hits, reset_at in state.get("windows", []):
+                if reset_at > now and hits >= max_hits - RATE_LIMIT_MARGIN:
+                    wait = max(wait, reset_at - now)
+            return policy, max(wait, 0.0)
+
+    def record_request(self, endpoint: str) -> None:
+        """응답 전에 현재 윈도우 카운트를 미리 올림 (동시 요청이 한도를 넘지 않도록)"""
+        with self._lock:
+            state = self.policies.get(self.endpoints.get(endpoint))
+            if state:
+                for window in state.get("windows", []):
+                    window[1] += 1
+
+    def update(self, endpoint: str, headers, retry_after: Optional[float] = None) -> None:
+        """응답 헤더로 상태 갱신"""
+        policy = headers.get("X-Rate-Limit-Policy")
+        if not policy:
+            return
+
+        now = time.time()
+        windows = []
+        restricted = 0
+        for rule in (headers.get("X-Rate-Limit-Rules") or "").split(","):
+            rule = rule.strip()
+            if not rule:
+                continue
+            limits = parse_rate_limit_header(headers.get(f"X-Rate-Limit-{rule}"))
+            states = parse_rate_limit_header(headers.get(f"X-Rate-Limit-{rule}-State"))
+            current = {period: (hits, active) for hits, period, active in states}
+            for max_hits, period, _ in limits:
+                hits, active = current.get(period, (0, 0))
+                restricted = max(restricted, active)
+                windows.append([max_hits, hits, now + period])
+
+        if retry_after:
+            restricted = max(restricted, retry_after)
+
+        with self._lock:
+            self.endpoints[endpoint] = policy
+            self.policies[policy] = {
+                "windows": windows,
+                "restricted_until": now + restricted if restricted else 0,
+                "updated_at": now
+            }
+            self._save()
+
+
+class ResponseCache:
+    """API 응답 디스크 캐시 (계정별, TTL)"""
+
+    def __init__(self, cache_dir: Path = API_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, key: str, ttl: float) -> Optional[Dict]:
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("key") != key or time.time() - entry.get("fetched_at", 0) > ttl:
+            return None
+        return entry.get("data")
+
+    def set(self, key: str, data) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"key": key, "fetched_at": time.time(), "data": data}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARN] Failed to cache API response: {e}", file=sys.stderr)
+
+
+class _InFlight:
+    """진행 중인 요청 (동일 요청 병합용)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class PoeApiClient:
+    """OAuth 인증 POE API 클라이언트"""
+
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        token_file: str = "poe_token.json",
+        client_id: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limits: Optional[RateLimitTracker] = None
+    ):
+        """
+        Args:
+            access_token: 고정 토큰 (None이면 token_file에서 로드, 자동 갱신)
+            token_file: poe_oauth.save_token이 저장한 토큰 파일
+            client_id: 토큰 갱신용 클라이언트 ID (None이면 POE_CLIENT_ID 환경변수)
+            session: HTTP 세션 (None이면 새로 생성)
+            cache: 응답 캐시 (None이면 build_data/poe_api_cache)
+            rate_limits: Rate Limit 상태 (None이면 기본 파일)
+        """
+        self.token_file = token_file
+        self.client_id = client_id or os.environ.get('POE_CLIENT_ID', 'pathcraftai')
+        self.cache = cache or ResponseCache()
+        self.rate_limits = rate_limits or RateLimitTracker()
+
+        self.session = session or requests.Session()
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept': 'application/json',
+            'Accept-Language': 'en-US,en;q=0.9,ko;q=0.8'
+        })
+
+        self._static_token = access_token
+        self._token: Optional[Dict] = None
+        self.issued_tokens = set()  # 이 클라이언트가 사용한 토큰 (갱신 전 토큰을 받은 호출자도 같은 클라이언트로)
+        self._token_lock = threading.Lock()
+        self._inflight: Dict[str, _InFlight] = {}
+        self._inflight_lock = threading.Lock()
+        self.requests_sent = 0
+
+    # ------------------------------------------------------------------
+    # 토큰
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _expires_in(token: Dict) -> Optional[float]:
+        expires_at = token.get('expires_at')
+        if not expires_at:
+            return None
+        try:
+            return (datetime.fromisoformat(expires_at) - datetime.now()).total_seconds()
+        except ValueError:
+            return None
+
+    def _refresh(self, token: Dict) -> Dict:
+        """refresh_token으로 갱신 후 저장 (username/sub 등 기존 필드 유지)"""
+        refresh_token = token.get('refresh_token')
+        if not refresh_token:
+            raise PoeAuthError("No refresh token found. Please re-authenticate.")
+        refreshed = {**token, **refresh_access_token(self.client_id, refresh_token)}
+        save_token(refreshed, self.token_file)
+        return refreshed
+
+    def access_token(self, force_refresh: bool = False) -> str:
+        """유효한 액세스 토큰 (만료 임박 시 선제 갱신)"""
+        if self._static_token:
+            return self._static_token
+
+        with self._token_lock:
+            # 다른 프로세스가 갱신했을 수 있으므로 매번 파일 기준으로 확인
+            token = load_token(self.token_file) or self._token
+            if not token or not token.get('access_token'):
+                raise PoeAuthError("No OAuth token found. Please authenticate first.")
+            self.issued_tokens.add(token['access_token'])
+
+            expires_in = self._expires_in(token)
+            if force_refresh or (expires_in is not None and expires_in < TOKEN_REFRESH_MARGIN):
+                print("[INFO] Access token expired or expiring soon, refreshing...", file=sys.stderr)
+                try:
+                    token = self._refresh(token)
+                except Exception as e:
+                    if expires_in is not None and expires_in <= 0:
+                        raise PoeAuthError(f"Failed to refresh token: {e}") from e
+                    print(f"[WARN] Token refresh failed, using current token: {e}", file=sys.stderr)
+
+            self._token = token
+            self.issued_tokens.add(token['access_token'])
+            return token['access_token']
+
+    def account_key(self) -> str:
+        """캐시 구분용 계정 키 (토큰 갱신과 무관하게 유지)"""
+        access_token = self.access_token()
+        token = self._token or {}
+        account = token.get('sub') or token.get('username')
+        if account:
+            return str(account)
+        return hashlib.sha1(access_token.encode('utf-8')).hexdigest()[:16]
+
+    # ------------------------------------------------------------------
+    # 요청
+    # ------------------------------------------------------------------
+
+    def _wait_for_rate_limit(self, endpoint: str) -> None:
+        policy, wait = self.rate_limits.wait_time(endpoint)
+        if wait <= 0:
+            return
+        if wait > MAX_RATE_WAIT:
+            raise PoeRateLimited(policy, wait)
+        print(f"[INFO] Rate limit ({policy}): waiting {wait:.1f}s", file=sys.stderr)
+        time.sleep(wait)
+
+    def _send(self, path: str, params: Optional[Dict]):
+        endpoint = path.split("/", 1)[0]
+        refreshed = False
+        rate_limited = False
+
+        while True:
+            self._wait_for_rate_limit(endpoint)
+            headers = {'Authorization': f'Bearer {self.access_token()}'}
+            self.rate_limits.record_request(endpoint)
+            self.requests_sent += 1
+            response = self.session.get(
+                f"{POE_API_BASE}/{path}", headers=headers, params=params, timeout=REQUEST_TIMEOUT
+            )
+
+            retry_after = None
+            if response.status_code == 429:
+                try:
+                    retry_after = float(response.headers.get('Retry-After', 0))
+                except ValueError:
+                    retry_after = None
+            self.rate_limits.update(endpoint, response.headers, retry_after)
+
+            if response.status_code == 401 and not refreshed and not self._static_token:
+                self.access_token(force_refresh=True)
+                refreshed = True
+                continue
+            if response.status_code == 429 and not rate_limited:
+                rate_limited = True
+                continue  # 다음 루프에서 Retry-After만큼 대기 (MAX_RATE_WAIT 초과 시 예외)
+
+            response.raise_for_status()
+            return response.json()
+
+    def get(self, path: str, params: Optional[Dict] = None, ttl: float = 0):
+        """GET 요청 (캐시 → 진행 중인 동일 요청 → 새 요청 순)
+
+        Args:
+            path: POE_API_BASE 이후 경로 (예: 'character/Name')
+            params: 쿼리 파라미터
+            ttl: 캐시 유효 시간 (0이면 캐시하지 않음)
+        """
+        query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        key = f"{self.account_key()}|{path}?{query}"
+
+        if ttl:
+            cached = self.cache.get(key, ttl)
+            if cached is not None:
+                return cached
+
+        with self._inflight_lock:
+            call = self._inflight.get(key)
+            owner = call is None
+            if owner:
+                call = self._inflight[key] = _InFlight()
+
+        if not owner:
+            call.done.wait()
+            if call.error:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._send(path, params)
+            if ttl:
+                self.cache.set(key, call.result)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            call.done.set()
+
+    def get_profile(self) -> Dict:
+        """사용자 프로필 (account:profile)"""
+        return self.get("profile")
+
+    def get_characters(self, realm: str = 'pc') -> Dict:
+        """캐릭터 목록 응답 ({'characters': [...]})"""
+        return self.get("character", {'realm': realm}, ttl=CHARACTER_LIST_TTL)
+
+    def get_character(self, character_name: str, realm: str = 'pc') -> Dict:
+        """캐릭터 아이템/패시브 응답 ({'character': {...}, 'items': [...]})"""
+        return self.get(f"character/{character_name}", {'realm': realm}, ttl=CHARACTER_TTL)
+
+
+_clients: Dict[Optional[str], PoeApiClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_poe_api_client(access_token: Optional[str] = None) -> PoeApiClient:
+    """프로세스 공용 POE API 클라이언트
+
+    access_token이 없거나 저장된 토큰(갱신 전 토큰 포함)과 같으면 토큰 파일 기반 클라이언트(자동 갱신)를,
+    다른 토큰이면 그 토큰 전용 클라이언트를 반환한다.
+    """
+    with _clients_lock:
+        if access_token:
+            stored = load_token() or {}
+            default = _clients.get(None)
+            if stored.get('access_token') == access_token or (default and access_token in default.issued_tokens):
+                access_token = None
+
+        client = _clients.get(access_token)
+        if client is None:
+            client = _clients[access_token] = PoeApiClient(access_token=access_token)
+        return client
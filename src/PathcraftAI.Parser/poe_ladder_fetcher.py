@@ -12,6 +12,9 @@ import time
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 
+from ladder_aggregate import update_ladder_aggregate
+from build_similarity_index import refresh_similarity_index
+
 # POE Official API
 POE_API_BASE = "https://www.pathofexile.com/api"
 POE_CHARACTER_WINDOW = "https://www.pathofexile.com/character-window"
@@ -417,6 +420,10 @@ def save_builds(builds: List[Dict], league: str):
         # 인덱스 업데이트
         update_build_index(league, filename, len(builds))
 
+        # 메타 빌드 요약 갱신
+        update_ladder_aggregate(league, builds)
+        refresh_similarity_index()
+
     except Exception as e:
         print(f"[ERROR] Failed to save builds: {e}")
 
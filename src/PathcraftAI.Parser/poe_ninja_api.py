@@ -3,17 +3,17 @@
 """
 POE.Ninja API Client with Caching
 실제 시장 가격 데이터 확인 (캐싱 지원)
+
+HTTP 요청과 가격 저장소는 poe_ninja_client.PoeNinjaClient를 공유한다.
 """
 
 import sys
-import os
-import requests
-import json
 import time
 import threading
-from pathlib import Path
 from typing import Dict, List, Optional
 
+from poe_ninja_client import PriceCache, get_poe_ninja_client  # noqa: F401 (PriceCache 재노출)
+
 # UTF-8 설정
 if sys.platform == 'win32':
     if sys.stdout.encoding != 'utf-8':
@@ -22,102 +22,6 @@ if sys.platform == 'win32':
         sys.stderr.reconfigure(encoding='utf-8')
 
 
-class PriceCache:
-    """파일 기반 가격 캐시 시스템"""
-
-    def __init__(self, cache_dir: str = None, ttl_seconds: int = 3600):
-        """
-        Args:
-            cache_dir: 캐시 디렉토리 경로 (None이면 기본 경로 사용)
-            ttl_seconds: 캐시 유효 시간 (기본 1시간)
-        """
-        if cache_dir is None:
-            # 기본 캐시 디렉토리
-            script_dir = Path(__file__).parent
-            cache_dir = script_dir / "build_data" / "ninja_cache"
-
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.ttl_seconds = ttl_seconds
-        self._lock = threading.Lock()
-
-    def _get_cache_path(self, key: str) -> Path:
-        """캐시 파일 경로 반환"""
-        # 안전한 파일명으로 변환
-        safe_key = key.replace("/", "_").replace(":", "_").replace("?", "_")
-        return self.cache_dir / f"{safe_key}.json"
-
-    def get(self, key: str) -> Optional[Dict]:
-        """캐시에서 데이터 가져오기
-
-        Returns:
-            캐시된 데이터 또는 None (만료되었거나 없는 경우)
-        """
-        cache_path = self._get_cache_path(key)
-
-        with self._lock:
-            if not cache_path.exists():
-                return None
-
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-
-                # TTL 확인
-                cached_time = cache_data.get('timestamp', 0)
-                if time.time() - cached_time > self.ttl_seconds:
-                    return None  # 만료됨
-
-                return cache_data.get('data')
-
-            except Exception as e:
-                print(f"[WARN] Cache read error for {key}: {e}", file=sys.stderr)
-                return None
-
-    def set(self, key: str, data: Dict) -> None:
-        """캐시에 데이터 저장"""
-        cache_path = self._get_cache_path(key)
-
-        cache_data = {
-            'timestamp': time.time(),
-            'data': data
-        }
-
-        with self._lock:
-            try:
-                with open(cache_path, 'w', encoding='utf-8') as f:
-                    json.dump(cache_data, f, ensure_ascii=False)
-            except Exception as e:
-                print(f"[WARN] Cache write error for {key}: {e}", file=sys.stderr)
-
-    def is_valid(self, key: str) -> bool:
-        """캐시가 유효한지 확인"""
-        return self.get(key) is not None
-
-    def clear(self) -> None:
-        """모든 캐시 삭제"""
-        with self._lock:
-            for cache_file in self.cache_dir.glob("*.json"):
-                try:
-                    cache_file.unlink()
-                except Exception:
-                    pass
-
-    def get_age(self, key: str) -> Optional[float]:
-        """캐시 나이 (초) 반환"""
-        cache_path = self._get_cache_path(key)
-
-        if not cache_path.exists():
-            return None
-
-        try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            return time.time() - cache_data.get('timestamp', 0)
-        except Exception:
-            return None
-
-
 class POENinjaAPI:
     """POE.Ninja API 클라이언트 (캐싱 지원)"""
 
@@ -130,13 +34,11 @@ class POENinjaAPI:
         """
         self.league = league
         self.base_url = "https://poe.ninja/api/data"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'PathcraftAI/1.0'
-        })
+        self._client = get_poe_ninja_client()
         self._divine_chaos_rate = None
         self.use_cache = use_cache
-        self._cache = PriceCache(ttl_seconds=cache_ttl) if use_cache else None
+        self.cache_ttl = cache_ttl
+        self._cache = self._client.cache if use_cache else None
         self._all_prices_cache = None  # 메모리 캐시
         self._background_refresh_thread = None
 
@@ -144,6 +46,18 @@ class POENinjaAPI:
         """캐시 키 생성"""
         return f"{self.league}_{data_type}"
 
+    def _fetch_overview(self, item_type: str) -> Dict:
+        """overview 데이터 (use_cache면 cache_ttl 안의 저장본 사용, 응답은 항상 저장)"""
+        return self._client.get_overview(
+            self.league, item_type, force=not self.use_cache, max_age=self.cache_ttl
+        )
+
+    def _fetch_overviews(self, item_types: List[str]) -> Dict[str, Optional[Dict]]:
+        """여러 타입을 동시에 가져오기 (실패한 타입은 None)"""
+        return self._client.fetch_overviews(
+            self.league, item_types, force=not self.use_cache, max_age=self.cache_ttl
+        )
+
     def preload_cache(self, background: bool = True) -> None:
         """모든 가격 데이터를 미리 로드
 
@@ -163,50 +77,22 @@ class POENinjaAPI:
             self._load_all_prices()
 
     def _load_all_prices(self) -> None:
-        """모든 가격 데이터 로드 (내부 메서드)"""
+        """모든 가격 데이터 로드 (내부 메서드, 타입별 동시 요청)"""
         try:
             print("[INFO] Loading poe.ninja price data...", file=sys.stderr)
 
-            # Divine 환율 먼저
-            self.get_divine_chaos_rate()
-
-            # 모든 아이템 타입 로드
             types_to_load = [
-                ("Currency", "currencyoverview"),
-                ("UniqueWeapon", "itemoverview"),
-                ("UniqueArmour", "itemoverview"),
-                ("UniqueAccessory", "itemoverview"),
-                ("UniqueJewel", "itemoverview"),
-                ("UniqueFlask", "itemoverview"),
+                "Currency",
+                "UniqueWeapon",
+                "UniqueArmour",
+                "UniqueAccessory",
+                "UniqueJewel",
+                "UniqueFlask",
             ]
+            self._fetch_overviews(types_to_load)
 
-            for item_type, endpoint in types_to_load:
-                cache_key = self._get_cache_key(item_type)
-
-                # 캐시가 유효하면 스킵
-                if self._cache and self._cache.is_valid(cache_key):
-                    continue
-
-                try:
-                    url = f"{self.base_url}/{endpoint}"
-                    params = {
-                        "league": self.league,
-                        "type": item_type,
-                        "language": "en"
-                    }
-
-                    response = self.session.get(url, params=params, timeout=15)
-                    response.raise_for_status()
-
-                    data = response.json()
-                    if self._cache:
-                        self._cache.set(cache_key, data)
-
-                    # 요청 간격 (rate limiting)
-                    time.sleep(0.5)
-
-                except Exception as e:
-                    print(f"[WARN] Failed to load {item_type}: {e}", file=sys.stderr)
+            # Divine 환율 (방금 저장된 Currency 사용)
+            self.get_divine_chaos_rate()
 
             print("[INFO] Price data loaded successfully", file=sys.stderr)
 
@@ -225,24 +111,11 @@ class POENinjaAPI:
 
         all_prices = {}
 
-        # 각 타입별로 캐시에서 가져오기
-        for item_type in ["UniqueWeapon", "UniqueArmour", "UniqueAccessory", "UniqueJewel", "UniqueFlask"]:
-            cache_key = self._get_cache_key(item_type)
-
-            # 캐시에서 가져오기
-            if self._cache:
-                cached_data = self._cache.get(cache_key)
-                if cached_data:
-                    prices = self._parse_item_prices(cached_data)
-                    all_prices.update(prices)
-                    continue
-
-            # 캐시 없으면 API 호출
-            try:
-                prices = self._get_prices_by_type(item_type)
-                all_prices.update(prices)
-            except Exception as e:
-                print(f"[WARN] Failed to get {item_type} prices: {e}", file=sys.stderr)
+        # 저장소에 없는 타입만 동시에 요청
+        item_types = ["UniqueWeapon", "UniqueArmour", "UniqueAccessory", "UniqueJewel", "UniqueFlask"]
+        for item_type, data in self._fetch_overviews(item_types).items():
+            if data:
+                all_prices.update(self._parse_item_prices(data))
 
         self._all_prices_cache = all_prices
         return all_prices
@@ -286,32 +159,20 @@ class POENinjaAPI:
             ('UniqueJewel', 'jewel'),
         ]
 
+        overviews = self._fetch_overviews([api_type for api_type, _ in item_types])
         for api_type, _ in item_types:
-            try:
-                url = f"{self.base_url}/itemoverview"
-                params = {
-                    'league': self.league,
-                    'type': api_type
-                }
-
-                response = self.session.get(url, params=params, timeout=15)
-                response.raise_for_status()
-
-                data = response.json()
-                if data and 'lines' in data:
-                    for item in data['lines']:
-                        name = item.get('name', '')
-                        base_type = item.get('baseType', '')
-                        chaos_value = item.get('chaosValue', 0)
-
-                        if name and chaos_value > 0:
-                            result[name] = {
-                                'base_type': base_type,
-                                'price': chaos_value
-                            }
-
-            except Exception as e:
-                print(f"[WARN] Failed to get {api_type}: {e}", file=sys.stderr)
+            data = overviews.get(api_type)
+            if data and 'lines' in data:
+                for item in data['lines']:
+                    name = item.get('name', '')
+                    base_type = item.get('baseType', '')
+                    chaos_value = item.get('chaosValue', 0)
+
+                    if name and chaos_value > 0:
+                        result[name] = {
+                            'base_type': base_type,
+                            'price': chaos_value
+                        }
 
         return result
 
@@ -347,35 +208,8 @@ class POENinjaAPI:
         if self._divine_chaos_rate is not None:
             return self._divine_chaos_rate
 
-        # 캐시에서 먼저 확인
-        cache_key = self._get_cache_key("Currency")
-        if self._cache:
-            cached_data = self._cache.get(cache_key)
-            if cached_data:
-                lines = cached_data.get('lines', [])
-                for item in lines:
-                    if item.get('currencyTypeName') == 'Divine Orb':
-                        self._divine_chaos_rate = item.get('chaosEquivalent', 150.0)
-                        return self._divine_chaos_rate
-
-        # 캐시 없으면 API 호출
         try:
-            url = f"{self.base_url}/currencyoverview"
-            params = {
-                "league": self.league,
-                "type": "Currency",
-                "language": "en"
-            }
-
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # 캐시에 저장
-            if self._cache:
-                self._cache.set(cache_key, data)
-
+            data = self._fetch_overview("Currency")
             lines = data.get('lines', [])
 
             for item in lines:
@@ -528,17 +362,7 @@ class POENinjaAPI:
     def get_unique_item_prices(self) -> Dict[str, float]:
         """유니크 아이템 가격 가져오기"""
         try:
-            url = f"{self.base_url}/itemoverview"
-            params = {
-                "league": self.league,
-                "type": "UniqueJewel",
-                "language": "en"
-            }
-
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
+            data = self._fetch_overview("UniqueJewel")
             lines = data.get('lines', [])
 
             prices = {}
@@ -572,32 +396,8 @@ class POENinjaAPI:
 
     def _get_prices_by_type(self, item_type: str) -> Dict[str, float]:
         """타입별 가격 조회 (캐시 사용)"""
-        # 캐시 확인
-        cache_key = self._get_cache_key(item_type)
-        if self._cache:
-            cached_data = self._cache.get(cache_key)
-            if cached_data:
-                return self._parse_item_prices_divine(cached_data)
-
-        # 캐시 없으면 API 호출
         try:
-            url = f"{self.base_url}/itemoverview"
-            params = {
-                "league": self.league,
-                "type": item_type,
-                "language": "en"
-            }
-
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # 캐시에 저장
-            if self._cache:
-                self._cache.set(cache_key, data)
-
-            return self._parse_item_prices_divine(data)
+            return self._parse_item_prices_divine(self._fetch_overview(item_type))
 
         except Exception as e:
             print(f"[ERROR] Failed to get {item_type} prices: {e}", file=sys.stderr)
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+POE.Ninja HTTP Client
+모든 poe.ninja 호출이 공유하는 HTTP 클라이언트 + 가격 저장소
+
+- 연결 풀 (keep-alive), httpx[http2]가 설치되어 있으면 HTTP/2 사용
+- 429/5xx 및 연결 오류 재시도 (지수 백오프, Retry-After 존중)
+- overview 응답은 PriceCache(build_data/ninja_cache)에 write-through 저장
+  (POENinjaAPI, poe_ninja_fetcher, farming_strategy_system, item_price_checker가 같은 파일을 공유)
+- 여러 카테고리를 동시에 요청해 리그 전체 갱신 시간이 가장 느린 카테고리 수준으로 단축
+
+사용 예:
+    from poe_ninja_client import get_poe_ninja_client
+    client = get_poe_ninja_client()
+    data = client.get_overview("Keepers", "Scarab")
+    all_data = client.fetch_overviews("Keepers", ["Currency", "Scarab", "Essence"])
+"""
+
+import sys
+import json
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx HTTP/2 지원 여부)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+POE_NINJA_API_BASE = "https://poe.ninja/api/data"
+USER_AGENT = "PathcraftAI/1.0"
+
+# currencyoverview 엔드포인트를 쓰는 타입 (나머지는 itemoverview)
+CURRENCY_OVERVIEW_TYPES = {"Currency", "Fragment"}
+
+DEFAULT_PRICE_TTL = 3600  # 가격 캐시 기본 유효 시간 (초)
+DEFAULT_MAX_WORKERS = 8
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class PriceCache:
+    """파일 기반 가격 캐시 시스템"""
+
+    def __init__(self, cache_dir: str = None, ttl_seconds: int = 3600):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 경로 (None이면 기본 경로 사용)
+            ttl_seconds: 캐시 유효 시간 (기본 1시간)
+        """
+        if cache_dir is None:
+            # 기본 캐시 디렉토리
+            script_dir = Path(__file__).parent
+            cache_dir = script_dir / "build_data" / "ninja_cache"
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+    def _get_cache_path(self, key: str) -> Path:
+        """캐시 파일 경로 반환"""
+        # 안전한 파일명으로 변환
+        safe_key = key.replace("/", "_").replace(":", "_").replace("?", "_")
+        return self.cache_dir / f"{safe_key}.json"
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Dict]:
+        """캐시에서 데이터 가져오기
+
+        Args:
+            key: 캐시 키
+            max_age: 허용 나이 (초, None이면 ttl_seconds)
+
+        Returns:
+            캐시된 데이터 또는 None (만료되었거나 없는 경우)
+        """
+        cache_path = self._get_cache_path(key)
+        ttl = self.ttl_seconds if max_age is None else max_age
+
+        with self._lock:
+            if not cache_path.exists():
+                return None
+
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    cache_data = json.load(f)
+
+                # TTL 확인
+                cached_time = cache_data.get('timestamp', 0)
+                if time.time() - cached_time > ttl:
+                    return None  # 만료됨
+
+                return cache_data.get('data')
+
+            except Exception as e:
+                print(f"[WARN] Cache read error for {key}: {e}", file=sys.stderr)
+                return None
+
+    def set(self, key: str, data: Dict) -> None:
+        """캐시에 데이터 저장"""
+        cache_path = self._get_cache_path(key)
+
+        cache_data = {
+            'timestamp': time.time(),
+            'data': data
+        }
+
+        with self._lock:
+            try:
+                tmp_path = cache_path.with_suffix('.json.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(cache_data, f, ensure_ascii=False)
+                tmp_path.replace(cache_path)
+            except Exception as e:
+                print(f"[WARN] Cache write error for {key}: {e}", file=sys.stderr)
+
+    def is_valid(self, key: str) -> bool:
+        """캐시가 유효한지 확인"""
+        return self.get(key) is not None
+
+    def clear(self) -> None:
+        """모든 캐시 삭제"""
+        with self._lock:
+            for cache_file in self.cache_dir.glob("*.json"):
+                try:
+                    cache_file.unlink()
+                except Exception:
+                    pass
+
+    def get_age(self, key: str) -> Optional[float]:
+        """캐시 나이 (초) 반환"""
+        cache_path = self._get_cache_path(key)
+
+        if not cache_path.exists():
+            return None
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache_data = json.load(f)
+            return time.time() - cache_data.get('timestamp', 0)
+        except Exception:
+            return None
+
+
+class PoeNinjaHTTPError(Exception):
+    """poe.ninja가 오류 상태 코드를 반환 (재시도 후)"""
+
+    def __init__(self, status_code: int, url: str):
+        super().__init__(f"HTTP {status_code} for {url}")
+        self.status_code = status_code
+        self.url = url
+
+
+def overview_endpoint(item_type: str) -> str:
+    """타입별 overview 엔드포인트"""
+    return "currencyoverview" if item_type in CURRENCY_OVERVIEW_TYPES else "itemoverview"
+
+
+def overview_cache_key(league: str, item_type: str, endpoint: Optional[str] = None) -> str:
+    """가격 저장소 키 (POENinjaAPI와 동일한 형식, 기본이 아닌 엔드포인트는 따로 저장)"""
+    if endpoint and endpoint != overview_endpoint(item_type):
+        return f"{league}_{item_type}_{endpoint}"
+    return f"{league}_{item_type}"
+
+
+class PoeNinjaClient:
+    """poe.ninja 공용 HTTP 클라이언트"""
+
+    def __init__(
+        self,
+        cache: Optional[PriceCache] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 15,
+        use_http2: bool = True
+    ):
+        """
+        Args:
+            cache: 가격 저장소 (None이면 기본 PriceCache)
+            max_workers: 동시 요청 수 (연결 풀 크기)
+            retries: 재시도 횟수
+            backoff: 백오프 기본 대기 (초, 시도마다 2배)
+            timeout: 요청 타임아웃 (초)
+            use_http2: httpx[http2]가 있으면 HTTP/2 사용
+        """
+        self.cache = cache or PriceCache(ttl_seconds=DEFAULT_PRICE_TTL)
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+        self.http2 = use_http2 and HTTP2_AVAILABLE
+        if self.http2:
+            self._http = httpx.Client(
+                http2=True,
+                headers={'User-Agent': USER_AGENT},
+                limits=httpx.Limits(max_connections=max_workers, max_keepalive_connections=max_workers)
+            )
+            self._transport_errors = (httpx.TransportError,)
+        else:
+            self._http = requests.Session()
+            self._http.headers.update({'User-Agent': USER_AGENT})
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+            self._http.mount("https://", adapter)
+            self._http.mount("http://", adapter)
+            self._transport_errors = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after:
+            try:
+                return min(float(retry_after), 60.0)
+            except ValueError:
+                pass
+        return self.backoff * (2 ** attempt) * (1 + random.random() * 0.25)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: Optional[float] = None
+    ):
+        """GET 요청 (재시도/백오프 포함, 같은 연결 풀 사용)
+
+        poe.ninja 외의 poecdn 이미지 등도 이 메서드로 요청한다.
+
+        Returns:
+            응답 객체 (status_code < 400, 304 포함)
+
+        Raises:
+            PoeNinjaHTTPError: 재시도 후에도 오류 상태 코드
+            requests/httpx 연결 오류: 재시도 후에도 연결 실패
+        """
+        timeout = timeout or self.timeout
+
+        for attempt in range(self.retries + 1):
+            try:
+                response = self._http.get(url, params=params, headers=headers, timeout=timeout)
+            except self._transport_errors:
+                if attempt == self.retries:
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                continue
+
+            if response.status_code in RETRY_STATUSES and attempt < self.retries:
+                time.sleep(self._retry_delay(attempt, response.headers.get('Retry-After')))
+                continue
+            if response.status_code >= 400:
+                raise PoeNinjaHTTPError(response.status_code, url)
+            return response
+
+    def get_json(self, url: str, params: Optional[Dict] = None, timeout: Optional[float] = None):
+        """GET 요청 후 JSON 반환 (재시도/백오프 포함)"""
+        return self.get(url, params=params, timeout=timeout).json()
+
+    def get_overview(
+        self,
+        league: str,
+        item_type: str,
+        force: bool = False,
+        max_age: Optional[float] = None,
+        endpoint: Optional[str] = None
+    ) -> Dict:
+        """overview 데이터 (가격 저장소 우선, 없거나 만료되면 요청 후 저장)
+
+        Args:
+            league: 리그 이름
+            item_type: poe.ninja 타입 (Currency, Scarab, UniqueWeapon 등)
+            force: 저장소를 건너뛰고 새로 요청 (결과는 저장)
+            max_age: 저장소 허용 나이 (초, None이면 저장소 TTL)
+            endpoint: 엔드포인트 강제 (None이면 overview_endpoint, 응답 형식이 달라 저장 키도 다름)
+        """
+        endpoint = endpoint or overview_endpoint(item_type)
+        key = overview_cache_key(league, item_type, endpoint)
+        if not force:
+            cached = self.cache.get(key, max_age=max_age)
+            if cached is not None:
+                return cached
+
+        url = f"{POE_NINJA_API_BASE}/{endpoint}"
+        data = self.get_json(url, params={"league": league, "type": item_type, "language": "en"})
+        self.cache.set(key, data)
+        return data
+
+    def fetch_overviews(
+        self,
+        league: str,
+        item_types: Iterable[str],
+        force: bool = False,
+        max_age: Optional[float] = None
+    ) -> Dict[str, Optional[Dict]]:
+        """여러 타입을 동시에 가져오기
+
+        Returns:
+            {타입: 데이터 또는 None(실패)}  입력 순서 유지
+        """
+        item_types = list(dict.fromkeys(item_types))
+
+        def fetch(item_type):
+            try:
+                return self.get_overview(league, item_type, force=force, max_age=max_age)
+            except Exception as e:
+                print(f"[WARN] poe.ninja {item_type} ({league}): {e}", file=sys.stderr)
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(len(item_types), 1))) as pool:
+            return dict(zip(item_types, pool.map(fetch, item_types)))
+
+    def map_concurrent(self, func, items: Iterable):
+        """임의의 요청 함수를 클라이언트 동시성 한도로 병렬 실행 (입력 순서 유지)"""
+        items = list(items)
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as pool:
+            return list(pool.map(func, items))
+
+
+_default_client: Optional[PoeNinjaClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_poe_ninja_client() -> PoeNinjaClient:
+    """프로세스 공용 poe.ninja 클라이언트"""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = PoeNinjaClient()
+        return _default_client
@@ -5,23 +5,22 @@ poe.ninja API Fetcher
 Complete POE game data collection from poe.ninja API
 """
 
-import requests
 import json
 import os
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import time
+from concurrent.futures import ThreadPoolExecutor
+
+from poe_ninja_client import PoeNinjaHTTPError, get_poe_ninja_client
+from image_cache import IMAGE_CDN_BASE, IMAGES_DIR, MANIFEST_SAVE_EVERY, get_image_cache  # noqa: F401
 
 # poe.ninja API Configuration
 POE_NINJA_BASE = "https://poe.ninja/api/data"
 POE_NINJA_BUILDS = "https://poe.ninja/api/data/GetBuildOverview"
-IMAGE_CDN_BASE = "https://web.poecdn.com"
 HEADERS = {'User-Agent': 'PathcraftAI/1.0'}
 
 # Data Storage
 GAME_DATA_DIR = os.path.join(os.path.dirname(__file__), "game_data")
-IMAGES_DIR = os.path.join(GAME_DATA_DIR, "images")
 METADATA_FILE = os.path.join(GAME_DATA_DIR, "poe_ninja_metadata.json")
 
 # Available Item Categories
@@ -98,7 +97,8 @@ def get_current_leagues() -> List[str]:
     """
     try:
         # poe.ninja itemoverview endpoint를 사용하여 활성 리그 확인
-        url = "https://poe.ninja/api/data/itemoverview"
+        url = f"{POE_NINJA_BASE}/itemoverview"
+        client = get_poe_ninja_client()
 
         # Note: poe.ninja는 짧은 리그 이름 사용
         # 2025년 11월 기준: Keepers (3.27 - Keepers of the Flame) 현재 활성
@@ -115,22 +115,19 @@ def get_current_leagues() -> List[str]:
             'Hardcore'
         ]
 
-        active_leagues = []
-        for league in test_leagues:
+        def is_active(league: str) -> bool:
             try:
-                test_response = requests.get(
-                    url,
-                    params={'type': 'UniqueWeapon', 'league': league},
-                    headers=HEADERS,
-                    timeout=5
-                )
+                data = client.get_json(url, params={'type': 'UniqueWeapon', 'league': league}, timeout=5)
                 # 데이터가 있으면 활성 리그로 간주
-                if test_response.status_code == 200:
-                    data = test_response.json()
-                    if data.get('lines') and len(data['lines']) > 0:
-                        active_leagues.append(league)
-            except:
-                continue
+                return bool(data.get('lines'))
+            except Exception:
+                return False
+
+        # 리그별 확인을 동시에 실행 (순서 유지)
+        active_leagues = [
+            league for league, active in zip(test_leagues, client.map_concurrent(is_active, test_leagues))
+            if active
+        ]
 
         if active_leagues:
             print(f"[INFO] Found active leagues: {', '.join(active_leagues)}")
@@ -161,7 +158,7 @@ def get_latest_temp_league() -> str:
     # Fallback to Standard if no temp league found
     return 'Standard'
 
-def fetch_category_data(league: str, category_key: str, category_type: str) -> Optional[Dict[str, Any]]:
+def fetch_category_data(league: str, category_key: str, category_type: str, force: bool = True) -> Optional[Dict[str, Any]]:
     """
     Fetch data for a specific category from poe.ninja
 
@@ -169,21 +166,15 @@ def fetch_category_data(league: str, category_key: str, category_type: str) -> O
         league: League name (e.g., 'Standard')
         category_key: Internal category key (e.g., 'unique_weapons')
         category_type: poe.ninja API type (e.g., 'UniqueWeapon')
+        force: Skip the shared price store and always request (response is still stored)
 
     Returns:
         API response data or None
     """
-    url = f"{POE_NINJA_BASE}/itemoverview"
-    params = {
-        'league': league,
-        'type': category_type
-    }
-
     try:
         print(f"[INFO] Fetching {category_key} ({category_type})...")
-        response = requests.get(url, headers=HEADERS, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        # game_data 파일은 Currency/Fragment도 itemoverview 형식 (name/chaosValue) 유지
+        data = get_poe_ninja_client().get_overview(league, category_type, force=force, endpoint="itemoverview")
 
         lines = data.get('lines', [])
         print(f"[OK] {category_key}: {len(lines)} items")
@@ -196,11 +187,11 @@ def fetch_category_data(league: str, category_key: str, category_type: str) -> O
             'fetched_at': datetime.now().isoformat()
         }
 
-    except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 404:
+    except PoeNinjaHTTPError as e:
+        if e.status_code == 404:
             print(f"[SKIP] {category_key}: Not available for {league}")
         else:
-            print(f"[ERROR] {category_key}: HTTP {e.response.status_code}")
+            print(f"[ERROR] {category_key}: HTTP {e.status_code}")
         return None
     except Exception as e:
         print(f"[ERROR] {category_key}: {e}")
@@ -224,9 +215,7 @@ def fetch_build_overview(league: str = 'Standard', overview: str = 'delirium') -
 
     try:
         print(f"[INFO] Fetching build overview for {league} ({overview})...")
-        response = requests.get(POE_NINJA_BUILDS, headers=HEADERS, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        data = get_poe_ninja_client().get_json(POE_NINJA_BUILDS, params=params, timeout=30)
 
         builds = data.get('builds', [])
         print(f"[OK] Build overview: {len(builds)} characters")
@@ -238,11 +227,11 @@ def fetch_build_overview(league: str = 'Standard', overview: str = 'delirium') -
             'fetched_at': datetime.now().isoformat()
         }
 
-    except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 404:
+    except PoeNinjaHTTPError as e:
+        if e.status_code == 404:
             print(f"[SKIP] Build overview: Not available for {league}")
         else:
-            print(f"[ERROR] Build overview: HTTP {e.response.status_code}")
+            print(f"[ERROR] Build overview: HTTP {e.status_code}")
         return None
     except Exception as e:
         print(f"[ERROR] Build overview: {e}")
@@ -321,55 +310,28 @@ def analyze_builds_by_item(builds_data: Dict, item_name: str) -> Dict[str, Any]:
         'max_level': max(levels) if levels else 0
     }
 
-def download_image(image_url: str, category: str) -> Optional[str]:
+def download_image(image_url: str, category: str = None) -> Optional[str]:
     """
-    Download image from CDN
+    Get a local copy of an image from the shared image cache
+
+    Images are keyed by URL hash (see image_cache.ImageCache), so the category
+    no longer affects where the file is stored.
 
     Args:
         image_url: Full or relative image URL
-        category: Category name for organizing images
+        category: Category name (kept for compatibility, unused)
 
     Returns:
         Local file path or None
     """
-    try:
-        # Handle relative URLs
-        if image_url.startswith('/'):
-            full_url = f"{IMAGE_CDN_BASE}{image_url}"
-        else:
-            full_url = image_url
-
-        # Create category directory
-        category_dir = os.path.join(IMAGES_DIR, category)
-        os.makedirs(category_dir, exist_ok=True)
-
-        # Generate filename from URL
-        filename = image_url.split('/')[-1].split('?')[0]  # Remove query params
-        if not filename:
-            return None
-
-        local_path = os.path.join(category_dir, filename)
-
-        # Skip if already downloaded
-        if os.path.exists(local_path):
-            return local_path
-
-        # Download image
-        response = requests.get(full_url, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-
-        with open(local_path, 'wb') as f:
-            f.write(response.content)
-
-        return local_path
-
-    except Exception as e:
-        print(f"[WARN] Failed to download image {image_url}: {e}")
-        return None
+    cache = get_image_cache()
+    path, _ = cache.fetch(image_url)
+    cache.flush(min_unsaved=MANIFEST_SAVE_EVERY)
+    return path
 
 def download_images_parallel(items: List[Dict], category: str, max_workers: int = 10) -> int:
     """
-    Download images in parallel
+    Download images in parallel (only missing or changed images are transferred)
 
     Args:
         items: List of items with 'icon' field
@@ -377,25 +339,23 @@ def download_images_parallel(items: List[Dict], category: str, max_workers: int
         max_workers: Number of parallel downloads
 
     Returns:
-        Number of successfully downloaded images
+        Number of images available locally
     """
     image_urls = [item.get('icon') for item in items if item.get('icon')]
 
     if not image_urls:
         return 0
 
-    print(f"[INFO] Downloading {len(image_urls)} images for {category}...")
-
-    downloaded = 0
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(download_image, url, category): url for url in image_urls}
+    print(f"[INFO] Syncing {len(image_urls)} images for {category}...")
 
-        for future in as_completed(futures):
-            if future.result():
-                downloaded += 1
+    cache = get_image_cache()
+    cache.max_workers = max_workers
+    stats = cache.sync(image_urls)
 
-    print(f"[OK] Downloaded {downloaded}/{len(image_urls)} images for {category}")
-    return downloaded
+    print(f"[OK] {category}: {stats['available']}/{len(image_urls)} images "
+          f"({stats['downloaded']} downloaded, {stats['not_modified']} not modified, "
+          f"{stats['cached']} cached, {stats['failed']} failed)")
+    return stats['available']
 
 def collect_all_data(league: str = 'Standard', download_images_flag: bool = False, collect_builds: bool = True) -> Dict[str, Any]:
     """
@@ -434,9 +394,21 @@ def collect_all_data(league: str = 'Standard', download_images_flag: bool = Fals
         }
     }
 
-    # Fetch all categories
+    # Fetch all categories concurrently (build overview in the same pool)
+    client = get_poe_ninja_client()
+    with ThreadPoolExecutor(max_workers=client.max_workers) as executor:
+        category_futures = {
+            category_key: executor.submit(fetch_category_data, league, category_key, category_type)
+            for category_key, category_type in ITEM_CATEGORIES.items()
+        }
+        builds_future = executor.submit(fetch_build_overview, league) if collect_builds else None
+
+        fetched = {key: future.result() for key, future in category_futures.items()}
+        builds_data = builds_future.result() if builds_future else None
+
+    # Save in category order
     for category_key, category_type in ITEM_CATEGORIES.items():
-        data = fetch_category_data(league, category_key, category_type)
+        data = fetched[category_key]
 
         if not data:
             metadata['statistics']['failed_categories'] += 1
@@ -469,9 +441,6 @@ def collect_all_data(league: str = 'Standard', download_images_flag: bool = Fals
             print(f"[ERROR] Failed to save {category_key}: {e}")
             metadata['statistics']['failed_categories'] += 1
 
-        # Rate limiting
-        time.sleep(0.5)
-
     # Collect build overview data
     if collect_builds:
         print()
@@ -479,7 +448,6 @@ def collect_all_data(league: str = 'Standard', download_images_flag: bool = Fals
         print("Collecting Build Overview Data")
         print("=" * 60)
 
-        builds_data = fetch_build_overview(league)
         if builds_data:
             # Save build overview
             builds_file = os.path.join(GAME_DATA_DIR, "builds_overview.json")
@@ -221,17 +221,8 @@ def get_user_profile(access_token: str) -> Dict:
         }
     """
 
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-        'Accept': 'application/json',
-        'Accept-Language': 'en-US,en;q=0.9,ko;q=0.8'
-    }
-
-    response = requests.get(f"{POE_API_BASE}/profile", headers=headers)
-    response.raise_for_status()
-
-    return response.json()
+    from poe_api_client import get_poe_api_client
+    return get_poe_api_client(access_token).get_profile()
 
 
 def get_user_characters(access_token: str, realm: str = 'pc') -> list[Dict]:
@@ -255,19 +246,8 @@ def get_user_characters(access_token: str, realm: str = 'pc') -> list[Dict]:
         ]
     """
 
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-        'Accept': 'application/json',
-        'Accept-Language': 'en-US,en;q=0.9,ko;q=0.8'
-    }
-
-    params = {'realm': realm}
-
-    response = requests.get(f"{POE_API_BASE}/character", headers=headers, params=params)
-    response.raise_for_status()
-
-    return response.json()
+    from poe_api_client import get_poe_api_client
+    return get_poe_api_client(access_token).get_characters(realm)
 
 
 def get_character_items(access_token: str, character_name: str, realm: str = 'pc') -> Dict:
@@ -301,21 +281,9 @@ def get_character_items(access_token: str, character_name: str, realm: str = 'pc
         }
     """
 
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-        'Accept': 'application/json',
-        'Accept-Language': 'en-US,en;q=0.9,ko;q=0.8'
-    }
-
-    params = {'realm': realm}
-
-    # POE API: /character/{character_name}
-    response = requests.get(f"{POE_API_BASE}/character/{character_name}",
-                           headers=headers, params=params)
-    response.raise_for_status()
-
-    return response.json()
+    # POE API: /character/{character_name} (공용 클라이언트: 짧은 TTL 캐시 + Rate Limit 준수)
+    from poe_api_client import get_poe_api_client
+    return get_poe_api_client(access_token).get_character(character_name, realm)
 
 
 def authenticate_user(client_id: str, client_secret: str, scopes: list[str]) -> Dict:
@@ -444,8 +412,11 @@ def save_token(token_data: Dict, filename: str = "poe_token.json"):
         expires_in = token_data['expires_in']
         token_data['expires_at'] = (datetime.now() + timedelta(seconds=expires_in)).isoformat()
 
-    with open(filepath, 'w', encoding='utf-8') as f:
+    # 다른 프로세스/스레드가 읽는 중일 수 있으므로 임시 파일에 쓰고 교체
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
         json.dump(token_data, f, indent=2)
+    os.replace(tmp_path, filepath)
 
     print(f"[OK] Token saved to: {filepath}", file=sys.stderr)
 
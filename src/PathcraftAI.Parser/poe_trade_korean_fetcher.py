@@ -337,10 +337,12 @@ def merge_translations(
             if key in trade_api:
                 merged[key].update(trade_api[key])
 
-    # 저장
+    # 저장 (읽는 쪽은 json.load만 하므로 들여쓰기 없이 압축 저장)
     if output_path:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(merged, f, ensure_ascii=False, indent=2)
+        tmp_path = output_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(merged, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, output_path)
         print(f"[완료] 병합된 번역 저장됨: {output_path}")
 
     return merged
@@ -4,23 +4,30 @@ poedb.tw 크롤러
 - 젬 required_level
 - 벤더 레시피
 
+페이지는 crawler_core.CrawlerSession을 통해 가져온다 (호스트별 속도 제한 + HTML 스냅샷 캐시).
+스냅샷이 유효하면 네트워크 없이 파싱하므로 파서 수정 후 재실행이 빠르다.
+
 사용법:
     python poedb_crawler.py --target quest_rewards
     python poedb_crawler.py --target gem_levels
     python poedb_crawler.py --target vendor_recipes
     python poedb_crawler.py --target all
+    python poedb_crawler.py --target mod_pool --offline   # 스냅샷만 사용
+    python poedb_crawler.py --target all --refresh        # 모든 스냅샷 재검증
 """
 
-import requests
 from bs4 import BeautifulSoup
 import json
-import time
 import os
 import sys
 import argparse
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+from crawler_core import CrawlerSession, DEFAULT_SNAPSHOT_TTL
+from mod_index import load_mod_index, mod_label
+from mod_pool_store import write_mod_pool_shards
+
 # Selenium imports for dynamic content
 try:
     from selenium import webdriver
@@ -43,17 +50,44 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7"
 }
-REQUEST_DELAY = 1.5  # 초 (서버 부담 방지)
+REQUEST_DELAY = 1.5  # 호스트당 평균 요청 간격 (초, 서버 부담 방지)
+CRAWL_WORKERS = 4
 DATA_DIR = Path(__file__).parent / "data"
 
+_crawler: Optional[CrawlerSession] = None
+
+
+def get_crawler() -> CrawlerSession:
+    """poedb 공용 크롤러 세션"""
+    global _crawler
+    if _crawler is None:
+        configure_crawler()
+    return _crawler
+
+
+def configure_crawler(offline: bool = False, refresh: bool = False, workers: int = CRAWL_WORKERS) -> CrawlerSession:
+    """
+    크롤러 세션 설정
+
+    Args:
+        offline: 스냅샷만 사용 (네트워크 요청 없음)
+        refresh: 스냅샷 TTL 무시하고 모두 조건부 GET으로 재검증
+        workers: 동시 요청 수
+    """
+    global _crawler
+    _crawler = CrawlerSession(
+        headers=HEADERS,
+        requests_per_second=1 / REQUEST_DELAY,
+        ttl=0 if refresh else DEFAULT_SNAPSHOT_TTL,
+        offline=offline,
+        max_workers=workers
+    )
+    return _crawler
+
 
 def fetch_page(url: str) -> BeautifulSoup:
-    """페이지 가져오기"""
-    print(f"  Fetching: {url}")
-    response = requests.get(url, headers=HEADERS, timeout=30)
-    response.raise_for_status()
-    time.sleep(REQUEST_DELAY)
-    return BeautifulSoup(response.text, "html.parser")
+    """페이지 가져오기 (스냅샷 캐시 우선)"""
+    return BeautifulSoup(get_crawler().fetch(url), "html.parser")
 
 
 def crawl_quest_rewards() -> Dict[str, Any]:
@@ -574,19 +608,20 @@ def crawl_mod_pool() -> Dict[str, Any]:
         ("Warstaves", "warstaff")
     ]
 
+    # 페이지는 동시에 가져오고 (호스트 속도 제한 적용) 파싱은 순서대로
+    page_urls = {poedb_page: f"{BASE_URL}/us/{poedb_page}" for poedb_page, _ in item_types}
+    pages = get_crawler().fetch_many(page_urls.values())
+
     for poedb_page, item_type in item_types:
         print(f"  크롤링: {item_type}...")
 
         try:
-            # poedb.tw URL 패턴
-            url = f"{BASE_URL}/us/{poedb_page}#ModifiersCalc"
-            response = requests.get(url, headers=HEADERS, timeout=30)
-
-            if response.status_code != 200:
-                print(f"    ⚠ 페이지 로드 실패: {poedb_page} ({response.status_code})")
+            html = pages[page_urls[poedb_page]]
+            if isinstance(html, Exception):
+                print(f"    ⚠ 페이지 로드 실패: {poedb_page} ({html})")
                 continue
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(html, "html.parser")
 
             item_mods = []
 
@@ -686,9 +721,6 @@ def crawl_mod_pool() -> Dict[str, Any]:
 
             print(f"    ✓ {item_type}: {len(item_mods)}개 모드")
 
-            # 요청 간 딜레이
-            time.sleep(REQUEST_DELAY)
-
         except Exception as e:
             print(f"    ✗ 에러: {e}")
             import traceback
@@ -745,12 +777,25 @@ def extract_mod_tags(effect: str) -> List[str]:
     return tags
 
 
-def get_important_mods_for_build(build_type: str) -> Dict[str, List[str]]:
+# 빌드 타입별 모드 태그 (POB modTags 기준)
+BUILD_TYPE_MOD_TAGS = {
+    "spell": ["caster", "elemental", "fire", "cold", "lightning", "gem", "critical", "life", "resistance"],
+    "attack": ["attack", "physical", "elemental", "speed", "critical", "life", "resistance"],
+    "minion": ["minion", "gem", "life", "resistance"],
+    "dot": ["damage", "ailment", "chaos", "fire", "cold", "life", "resistance"],
+}
+
+
+def get_important_mods_for_build(build_type: str, limit: int = 10) -> Dict[str, List[str]]:
     """
     빌드 타입에 따른 중요 모드 추출
 
+    game_data/mods.json이 있으면 모드 역색인(mod_index)에서 태그 매칭 상위 모드를
+    그룹별 1개씩 골라 수치를 뺀 이름(mod_label)으로 반환하고, 없으면 기본 키워드 목록을 반환한다.
+
     Args:
         build_type: spell, attack, minion, dot 등
+        limit: prefix/suffix별 최대 모드 수 (역색인 사용 시)
 
     Returns:
         prefix와 suffix 중요 모드 목록
@@ -760,6 +805,17 @@ def get_important_mods_for_build(build_type: str) -> Dict[str, List[str]]:
         "suffix": []
     }
 
+    mod_index = load_mod_index()
+    tags = BUILD_TYPE_MOD_TAGS.get(build_type)
+    if tags and len(mod_index):
+        for affix in ("prefix", "suffix"):
+            # 다른 그룹도 이름이 같을 수 있어 (예: 로컬/글로벌) 여유 있게 가져와 중복 제거
+            top_mods = mod_index.top_k(tags, k=limit * 2, affix_type=affix.capitalize(), distinct_group=True)
+            labels = dict.fromkeys(mod_label(mod) for mod, _ in top_mods)
+            important_mods[affix] = list(labels)[:limit]
+        if important_mods["prefix"] or important_mods["suffix"]:
+            return important_mods
+
     # 빌드 타입별 중요 키워드
     if build_type == "spell":
         important_mods["prefix"] = [
@@ -853,8 +909,13 @@ def main():
         default="all",
         help="크롤링 대상"
     )
+    parser.add_argument("--offline", action="store_true", help="HTML 스냅샷만 사용 (네트워크 요청 없음)")
+    parser.add_argument("--refresh", action="store_true", help="스냅샷 TTL 무시하고 재검증")
+    parser.add_argument("--workers", type=int, default=CRAWL_WORKERS, help="동시 요청 수")
     args = parser.parse_args()
 
+    crawler = configure_crawler(offline=args.offline, refresh=args.refresh, workers=args.workers)
+
     print("=" * 50)
     print("poedb.tw 크롤러 시작")
     print("=" * 50)
@@ -874,9 +935,12 @@ def main():
     if args.target in ["mod_pool", "all"]:
         data = crawl_mod_pool()
         save_data(data, "mod_pool.json")
+        header = write_mod_pool_shards(data, str(DATA_DIR / "mod_pool.shards"))
+        print(f"✓ 샤드 색인 저장: mod_pool.shards ({len(header['blocks'])}개 블록)")
 
     print("\n" + "=" * 50)
-    print("크롤링 완료!")
+    print(f"크롤링 완료! (스냅샷 {crawler.stats['cached']}, 304 {crawler.stats['not_modified']}, "
+          f"다운로드 {crawler.stats['downloaded']})")
     print("=" * 50)
 
 
@@ -10,14 +10,16 @@ Target:
 - 1000+ base items
 - Total: 30,000+ translations
 
+Pages are fetched through crawler_core.CrawlerSession (per-host token bucket,
+HTML snapshot cache with conditional GETs), so reruns parse cached pages locally.
+
 Usage:
     python poedb_mass_scraper.py --output poe_kr_full.json --workers 10
+    python poedb_mass_scraper.py --offline     # parse cached snapshots only
 """
 
-import requests
 from bs4 import BeautifulSoup
 import json
-import time
 from typing import Dict, List, Optional, Set
 import argparse
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -25,6 +27,8 @@ import logging
 from tqdm import tqdm
 import re
 
+from crawler_core import CrawlerSession, DEFAULT_SNAPSHOT_TTL
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -34,16 +38,29 @@ class POEDBMassScraper:
 
     BASE_URL_KR = "https://poedb.tw/kr"
     BASE_URL_US = "https://poedb.tw/us"
-
-    def __init__(self, workers: int = 10):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+    REQUESTS_PER_SECOND = 4.0
+
+    def __init__(self, workers: int = 10, requests_per_second: float = REQUESTS_PER_SECOND,
+                 offline: bool = False, refresh: bool = False):
+        self.crawler = CrawlerSession(
+            headers={'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'},
+            requests_per_second=requests_per_second,
+            burst=workers,
+            ttl=0 if refresh else DEFAULT_SNAPSHOT_TTL,
+            offline=offline,
+            max_workers=workers,
+            timeout=15,
+            verbose=False
+        )
+        self.session = self.crawler.session
         self.workers = workers
         self.translations = {}
         self.failed_urls = []
 
+    def _get_soup(self, url: str) -> BeautifulSoup:
+        """Fetch a page through the snapshot cache and parse it"""
+        return BeautifulSoup(self.crawler.fetch(url), 'html.parser')
+
     def extract_korean_name(self, url_path: str) -> Optional[str]:
         """
         Extract Korean name from poedb.tw/kr/{url_path}
@@ -57,11 +74,7 @@ class POEDBMassScraper:
         url = f"{self.BASE_URL_KR}/{url_path}"
 
         try:
-            response = self.session.get(url, timeout=15)
-            if response.status_code != 200:
-                return None
-
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._get_soup(url)
             title = soup.find('title')
             if not title:
                 return None
@@ -85,8 +98,7 @@ class POEDBMassScraper:
 
         # Get skill list page
         url = f"{self.BASE_URL_KR}/Skill_Gems"
-        response = self.session.get(url, timeout=15)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = self._get_soup(url)
 
         # Extract all skill gem URLs
         skill_urls = set()
@@ -118,7 +130,6 @@ class POEDBMassScraper:
                         self.failed_urls.append(url)
                     finally:
                         pbar.update(1)
-                        time.sleep(0.1)  # Rate limiting
 
         logger.info(f"Scraped {len(translations)} skill gems")
         return translations
@@ -137,8 +148,7 @@ class POEDBMassScraper:
         for category in categories:
             try:
                 url = f"{self.BASE_URL_KR}/{category}"
-                response = self.session.get(url, timeout=15)
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self._get_soup(url)
 
                 for link in soup.find_all('a', href=True):
                     href = link['href']
@@ -148,7 +158,6 @@ class POEDBMassScraper:
                             all_items.add(item_name)
 
                 logger.info(f"Found {len(all_items)} items in {category}")
-                time.sleep(1)
             except Exception as e:
                 logger.warning(f"Failed to fetch {category}: {e}")
 
@@ -172,7 +181,6 @@ class POEDBMassScraper:
                         self.failed_urls.append(url)
                     finally:
                         pbar.update(1)
-                        time.sleep(0.1)
 
         logger.info(f"Scraped {len(translations)} unique items")
         return translations
@@ -189,8 +197,7 @@ class POEDBMassScraper:
         for category in categories:
             try:
                 url = f"{self.BASE_URL_KR}/{category}"
-                response = self.session.get(url, timeout=15)
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self._get_soup(url)
 
                 for link in soup.find_all('a', href=True):
                     href = link['href']
@@ -200,7 +207,6 @@ class POEDBMassScraper:
                             all_items.add(item_name)
 
                 logger.info(f"Found {len(all_items)} items in {category}")
-                time.sleep(1)
             except Exception as e:
                 logger.warning(f"Failed to fetch {category}: {e}")
 
@@ -224,7 +230,6 @@ class POEDBMassScraper:
                         self.failed_urls.append(url)
                     finally:
                         pbar.update(1)
-                        time.sleep(0.1)
 
         logger.info(f"Scraped {len(translations)} base items")
         return translations
@@ -238,8 +243,7 @@ class POEDBMassScraper:
         translations = {}
 
         try:
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._get_soup(url)
 
             # Extract passive skill names from tables
             for table in soup.find_all('table'):
@@ -267,8 +271,7 @@ class POEDBMassScraper:
         translations = {}
 
         try:
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._get_soup(url)
 
             # Extract mod names from tables
             for table in soup.find_all('table'):
@@ -295,8 +298,7 @@ class POEDBMassScraper:
         translations = {}
 
         try:
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._get_soup(url)
 
             # Extract Atlas passive names
             for table in soup.find_all('table'):
@@ -325,8 +327,7 @@ class POEDBMassScraper:
         for category in categories:
             try:
                 url = f"{self.BASE_URL_KR}/{category}"
-                response = self.session.get(url, timeout=15)
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self._get_soup(url)
 
                 for table in soup.find_all('table'):
                     for row in table.find_all('tr'):
@@ -339,7 +340,6 @@ class POEDBMassScraper:
                                 all_mods[korean_text] = english_text
 
                 logger.info(f"Found {len(all_mods)} mods in {category}")
-                time.sleep(1)
             except Exception as e:
                 logger.warning(f"Failed to fetch {category}: {e}")
 
@@ -413,6 +413,9 @@ class POEDBMassScraper:
         logger.info("-" * 60)
         logger.info(f"TOTAL:           {len(all_translations):5d}")
         logger.info(f"Failed URLs:     {len(self.failed_urls):5d}")
+        logger.info(f"Pages: {self.crawler.stats['cached']} cached, "
+                    f"{self.crawler.stats['not_modified']} not modified, "
+                    f"{self.crawler.stats['downloaded']} downloaded")
         logger.info("=" * 60)
 
         return all_translations
@@ -448,10 +451,17 @@ def main():
                        help='Number of parallel workers (default: 10)')
     parser.add_argument('--skills-only', action='store_true',
                        help='Only scrape skill gems (fast test)')
+    parser.add_argument('--rate', type=float, default=POEDBMassScraper.REQUESTS_PER_SECOND,
+                       help='Max requests per second to poedb.tw (default: 4)')
+    parser.add_argument('--offline', action='store_true',
+                       help='Parse cached HTML snapshots only (no network)')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Revalidate every cached snapshot')
 
     args = parser.parse_args()
 
-    scraper = POEDBMassScraper(workers=args.workers)
+    scraper = POEDBMassScraper(workers=args.workers, requests_per_second=args.rate,
+                               offline=args.offline, refresh=args.refresh)
 
     if args.skills_only:
         logger.info("Running in SKILLS-ONLY mode (fast test)")
@@ -12,6 +12,8 @@ from typing import List, Dict
 from collections import Counter
 import argparse
 
+from build_catalog import refresh_build_catalog
+
 # UTF-8 설정
 if sys.platform == 'win32':
     if sys.stdout.encoding != 'utf-8':
@@ -234,35 +236,33 @@ def collect_youtube_builds_for_keywords(keywords: List[str], league_version: str
     all_builds = []
 
     try:
-        from youtube_build_collector import search_youtube_builds
+        from youtube_build_collector import collect_youtube_builds
     except ImportError:
         print("[ERROR] youtube_build_collector module not found")
         return []
 
-    for i, keyword in enumerate(keywords, 1):
-        print(f"[{i}/{len(keywords)}] Searching for: {keyword}")
-
-        try:
-            builds = search_youtube_builds(
-                keyword=keyword,
-                league_version=league_version,
-                max_results=3  # 각 키워드당 상위 3개
-            )
-
-            # 키워드 태그 추가
-            for build in builds:
-                build['build_keyword'] = keyword
-                build['source'] = 'youtube'
-
-            all_builds.extend(builds)
-            print(f"[OK] Found {len(builds)} builds for {keyword}")
-
-        except Exception as e:
-            print(f"[ERROR] Failed to search for {keyword}: {e}")
+    # 검색은 배치 요청 하나로, 영상 상세는 50개씩 묶어서 조회
+    builds_by_keyword = collect_youtube_builds(
+        keywords,
+        league_version=league_version,
+        max_results=3  # 각 키워드당 상위 3개
+    )
+
+    for keyword in keywords:
+        builds = builds_by_keyword.get(keyword)
+        if builds is None:
+            print(f"[WARN] Skipped {keyword} (quota deferred)")
             continue
 
-        print()
+        # 키워드 태그 추가
+        for build in builds:
+            build['build_keyword'] = keyword
+            build['source'] = 'youtube'
+
+        all_builds.extend(builds)
+        print(f"[OK] Found {len(builds)} builds for {keyword}")
 
+    print()
     print(f"[OK] Total builds collected: {len(all_builds)}")
     print()
 
@@ -322,6 +322,8 @@ def create_build_database(league: str, league_version: str = "3.27") -> Dict:
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(database, f, indent=2, ensure_ascii=False)
 
+    refresh_build_catalog()
+
     print("=" * 80)
     print("BUILD DATABASE CREATED")
     print("=" * 80)
@@ -74,6 +74,55 @@ OUTPUT_FILE = os.path.join(
     "precached_popular_builds.json"
 )
 
+YOUTUBE_OUTPUT_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "build_data",
+    "precached_youtube_builds.json"
+)
+
+
+def all_popular_keywords() -> List[str]:
+    """POPULAR_BUILD_KEYWORDS 전체 (중복 제거, 순서 유지)"""
+    keywords = []
+    for value in POPULAR_BUILD_KEYWORDS.values():
+        if isinstance(value, dict):
+            for asc_keywords in value.values():
+                keywords.extend(asc_keywords)
+        else:
+            keywords.extend(value)
+    return list(dict.fromkeys(keywords))
+
+
+def collect_popular_youtube_builds(league_version: str = "3.27", max_per_keyword: int = 3) -> Dict:
+    """
+    POPULAR_BUILD_KEYWORDS 전체의 YouTube 빌드 가이드 수집
+
+    검색은 배치 요청으로 묶고 영상 상세는 50개씩 조회한다. 할당량의 백그라운드 몫을 넘는
+    키워드는 다음 실행으로 미뤄지며, 24시간 캐시가 있는 키워드는 API를 호출하지 않는다.
+    """
+    from youtube_build_collector import collect_youtube_builds
+
+    keywords = all_popular_keywords()
+    builds_by_keyword = collect_youtube_builds(keywords, league_version=league_version, max_results=max_per_keyword)
+
+    data = {
+        "metadata": {
+            "collected_at": datetime.now().isoformat(),
+            "patch": league_version,
+            "keywords": len(keywords),
+            "collected_keywords": len(builds_by_keyword),
+            "deferred_keywords": [k for k in keywords if k not in builds_by_keyword]
+        },
+        "builds_by_keyword": builds_by_keyword
+    }
+
+    os.makedirs(os.path.dirname(YOUTUBE_OUTPUT_FILE), exist_ok=True)
+    with open(YOUTUBE_OUTPUT_FILE, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+    print(f"[OK] {len(builds_by_keyword)}/{len(keywords)} keywords collected -> {YOUTUBE_OUTPUT_FILE}")
+    return data
+
 def collect_popular_builds(max_per_category: int = 3) -> Dict:
     """
     인기 빌드 사전 수집
@@ -281,11 +330,14 @@ if __name__ == "__main__":
     parser.add_argument('--collect', action='store_true', help='Collect popular builds')
     parser.add_argument('--max-per-category', type=int, default=3, help='Max builds per category')
     parser.add_argument('--leveling-guide', action='store_true', help='Create leveling guide template')
+    parser.add_argument('--youtube', action='store_true', help='Collect YouTube build guides for all keywords')
 
     args = parser.parse_args()
 
     if args.collect:
         collect_popular_builds(max_per_category=args.max_per_category)
+    elif args.youtube:
+        collect_popular_youtube_builds(max_per_keyword=args.max_per_category)
     elif args.leveling_guide:
         create_leveling_guide_template()
     else:
@@ -0,0 +1,483 @@
+# -*- coding: utf-8 -*-
+
+"""
+Search Job Queue
+빌드 검색 결과 캐시 + 백그라운드 갱신 작업 큐 (SQLite, build_data/search_jobs.db)
+
+테이블:
+    search_cache   (키워드, 리그, 소스)별 검색 결과와 수집 시각
+    jobs           갱신 작업. 같은 (키워드, 리그, 소스)의 대기/실행 중 작업은 하나만 존재
+    keyword_hits   키워드별 검색 횟수 (자주 찾는 키워드를 미리 갱신)
+    workers        워커 프로세스 heartbeat
+
+stale-while-revalidate:
+    소스별 ttl 안이면 fresh, ttl~max_stale 사이면 stale 결과를 즉시 돌려주고 갱신 작업을 큐에 넣는다.
+    max_stale을 넘은 결과는 없는 것으로 취급한다.
+
+작업은 요청한 CLI 프로세스가 끝나도 DB에 남고, serve()를 실행한 워커 프로세스의
+스레드들이 처리한다. 같은 키의 동시 수집은 프로세스 안에서는 하나로 합치고(coalescing),
+다른 프로세스가 실행 중인 작업은 결과가 저장될 때까지 잠시 기다린다.
+
+사용 예:
+    from search_job_queue import get_search_job_queue
+    queue = get_search_job_queue()
+    queue.register_source("reddit", fetch_reddit, ttl=12 * 3600)
+    entry = queue.get("Death's Oath", "Keepers", "reddit")   # 캐시 (없거나 오래되면 갱신 예약)
+    builds = queue.fetch("Death's Oath", "Keepers", "reddit")  # 지금 수집
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+BUILD_DATA_DIR = os.path.join(os.path.dirname(__file__), "build_data")
+SEARCH_JOBS_DB = os.path.join(BUILD_DATA_DIR, "search_jobs.db")
+
+DEFAULT_TTL = 24 * 3600
+DEFAULT_MAX_STALE = 7 * 24 * 3600
+
+# 작업 재시도 간격 (초) - 횟수를 넘으면 failed
+RETRY_DELAYS = [60, 300, 1800]
+# 실행 중 작업을 다른 워커가 가져갈 수 있게 되는 시간 (워커가 죽은 경우)
+LEASE_SECONDS = 600
+# 다른 프로세스가 수집 중인 키를 기다리는 최대 시간
+COALESCE_WAIT = 15.0
+
+POLL_INTERVAL = 1.0
+HEARTBEAT_INTERVAL = 10.0
+WORKER_STALE = 60.0
+
+# 자주 찾는 키워드: 최근 HOT_DAYS일 동안 HOT_MIN_HITS번 이상 검색
+HOT_DAYS = 7
+HOT_MIN_HITS = 2
+HOT_LIMIT = 100
+# ttl의 이 비율이 지나면 만료 전에 미리 갱신
+REFRESH_AHEAD = 0.8
+SWEEP_INTERVAL = 300.0
+
+
+def keyword_key(keyword: str) -> str:
+    """대소문자/공백 차이를 무시한 키워드 키"""
+    return " ".join(keyword.lower().split())
+
+
+class SearchJobQueue:
+    """검색 캐시와 갱신 작업 큐"""
+
+    def __init__(self, db_path: str = SEARCH_JOBS_DB):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS search_cache (
+                keyword_key TEXT,
+                league TEXT,
+                source TEXT,
+                keyword TEXT,
+                builds TEXT,
+                fetched_at REAL,
+                PRIMARY KEY (keyword_key, league, source)
+            );
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY,
+                keyword_key TEXT,
+                league TEXT,
+                source TEXT,
+                keyword TEXT,
+                status TEXT,
+                priority INTEGER,
+                attempts INTEGER DEFAULT 0,
+                enqueued_at REAL,
+                run_after REAL,
+                started_at REAL,
+                finished_at REAL,
+                worker TEXT,
+                error TEXT
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_active ON jobs (keyword_key, league, source)
+                WHERE status IN ('pending', 'running');
+            CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, priority, run_after);
+            CREATE TABLE IF NOT EXISTS keyword_hits (
+                keyword_key TEXT,
+                league TEXT,
+                keyword TEXT,
+                hits INTEGER,
+                last_hit REAL,
+                PRIMARY KEY (keyword_key, league)
+            );
+            CREATE TABLE IF NOT EXISTS workers (
+                id TEXT PRIMARY KEY,
+                pid INTEGER,
+                heartbeat REAL
+            );
+            """
+        )
+        self._conn.commit()
+
+        self._sources: Dict[str, Dict] = {}
+        self._inflight: Dict[tuple, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 소스
+    # ------------------------------------------------------------------
+
+    def register_source(
+        self,
+        name: str,
+        fetch: Callable[[str, str], List[Dict]],
+        ttl: float = DEFAULT_TTL,
+        max_stale: float = DEFAULT_MAX_STALE
+    ) -> None:
+        """
+        검색 소스 등록
+
+        Args:
+            name: 소스 이름 (예: "reddit")
+            fetch: (keyword, league) -> 빌드 목록. 실패하면 예외
+            ttl: 이 시간(초) 안의 결과는 fresh
+            max_stale: 이 시간(초)을 넘은 결과는 사용하지 않음
+        """
+        self._sources[name] = {'fetch': fetch, 'ttl': ttl, 'max_stale': max_stale}
+
+    @property
+    def sources(self) -> List[str]:
+        return list(self._sources)
+
+    # ------------------------------------------------------------------
+    # 캐시
+    # ------------------------------------------------------------------
+
+    def cached(self, keyword: str, league: str, source: str) -> Optional[Dict]:
+        """
+        캐시된 결과
+
+        Returns:
+            {"builds", "fetched_at", "age", "fresh"} 또는 None (없거나 max_stale 초과)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT builds, fetched_at FROM search_cache WHERE keyword_key = ? AND league = ? AND source = ?",
+                (keyword_key(keyword), league, source)
+            ).fetchone()
+        if row is None:
+            return None
+
+        config = self._sources.get(source, {})
+        age = time.time() - row[1]
+        if age > config.get('max_stale', DEFAULT_MAX_STALE):
+            return None
+        return {
+            'builds': json.loads(row[0]),
+            'fetched_at': row[1],
+            'age': age,
+            'fresh': age <= config.get('ttl', DEFAULT_TTL)
+        }
+
+    def store(self, keyword: str, league: str, source: str, builds: List[Dict]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (keyword_key(keyword), league, source, keyword,
+                 json.dumps(builds, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+
+    def record_hit(self, keyword: str, league: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO keyword_hits VALUES (?, ?, ?, 1, ?)
+                ON CONFLICT (keyword_key, league) DO UPDATE SET hits = hits + 1, last_hit = excluded.last_hit
+                """,
+                (keyword_key(keyword), league, keyword, time.time())
+            )
+            self._conn.commit()
+
+    def get(self, keyword: str, league: str, source: str, priority: int = 0) -> Optional[Dict]:
+        """
+        stale-while-revalidate 조회
+
+        fresh가 아니면(없거나 stale) 갱신 작업을 큐에 넣고, 있는 결과는 그대로 돌려준다.
+        """
+        entry = self.cached(keyword, league, source)
+        if entry is None or not entry['fresh']:
+            self.enqueue(keyword, league, source, priority=priority)
+        return entry
+
+    # ------------------------------------------------------------------
+    # 작업
+    # ------------------------------------------------------------------
+
+    def enqueue(self, keyword: str, league: str, source: str, priority: int = 0, delay: float = 0) -> bool:
+        """
+        갱신 작업 추가 (같은 키의 대기/실행 중 작업이 있으면 무시)
+
+        Returns:
+            새 작업을 추가했으면 True
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                INSERT OR IGNORE INTO jobs (keyword_key, league, source, keyword, status, priority, enqueued_at, run_after)
+                VALUES (?, ?, ?, ?, 'pending', ?, ?, ?)
+                """,
+                (keyword_key(keyword), league, source, keyword, priority, now, now + delay)
+            )
+            if cursor.rowcount == 0 and priority:
+                # 이미 대기 중이면 우선순위만 올림
+                self._conn.execute(
+                    "UPDATE jobs SET priority = MAX(priority, ?) WHERE keyword_key = ? AND league = ? "
+                    "AND source = ? AND status = 'pending'",
+                    (priority, keyword_key(keyword), league, source)
+                )
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def claim(self, worker_id: str) -> Optional[Dict]:
+        """실행할 작업 하나 가져오기 (등록된 소스만, 우선순위 높은 순)"""
+        if not self._sources:
+            return None
+        now = time.time()
+        placeholders = ",".join("?" * len(self._sources))
+        with self._lock:
+            # 워커가 죽어 남은 실행 중 작업은 다시 대기로
+            self._conn.execute(
+                "UPDATE jobs SET status = 'pending' WHERE status = 'running' AND started_at < ?",
+                (now - LEASE_SECONDS,)
+            )
+            row = self._conn.execute(
+                f"""
+                SELECT id, keyword, league, source, attempts FROM jobs
+                WHERE status = 'pending' AND run_after <= ? AND source IN ({placeholders})
+                ORDER BY priority DESC, enqueued_at LIMIT 1
+                """,
+                (now, *self._sources)
+            ).fetchone()
+            if row is None:
+                self._conn.commit()
+                return None
+            # 다른 프로세스가 먼저 가져갔으면 rowcount 0
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = 'running', started_at = ?, worker = ?, attempts = attempts + 1 "
+                "WHERE id = ? AND status = 'pending'",
+                (now, worker_id, row[0])
+            )
+            self._conn.commit()
+        if cursor.rowcount == 0:
+            return None
+        return {'id': row[0], 'keyword': row[1], 'league': row[2], 'source': row[3], 'attempts': row[4] + 1}
+
+    def _finish(self, job: Dict, error: Optional[str] = None) -> None:
+        now = time.time()
+        with self._lock:
+            if error is None:
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'done', finished_at = ?, error = NULL WHERE id = ?",
+                    (now, job['id'])
+                )
+            elif job['attempts'] <= len(RETRY_DELAYS):
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'pending', run_after = ?, error = ? WHERE id = ?",
+                    (now + RETRY_DELAYS[job['attempts'] - 1], error, job['id'])
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'failed', finished_at = ?, error = ? WHERE id = ?",
+                    (now, error, job['id'])
+                )
+            # 끝난 작업 기록은 하루만 보관
+            self._conn.execute(
+                "DELETE FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?",
+                (now - 86400,)
+            )
+            self._conn.commit()
+
+    def run_job(self, job: Dict) -> None:
+        try:
+            self.fetch(job['keyword'], job['league'], job['source'], wait_running=False)
+        except Exception as e:
+            print(f"[WARN] {job['source']} job failed for {job['keyword']}: {e}", file=sys.stderr)
+            self._finish(job, str(e))
+        else:
+            self._finish(job)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs WHERE status IN ('pending', 'running')").fetchone()[0]
+
+    def _running_elsewhere(self, keyword: str, league: str, source: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM jobs WHERE keyword_key = ? AND league = ? AND source = ? "
+                "AND status = 'running' AND started_at >= ?",
+                (keyword_key(keyword), league, source, time.time() - LEASE_SECONDS)
+            ).fetchone()
+        return row is not None
+
+    # ------------------------------------------------------------------
+    # 수집 (coalescing)
+    # ------------------------------------------------------------------
+
+    def fetch(self, keyword: str, league: str, source: str, wait_running: bool = True) -> List[Dict]:
+        """
+        소스에서 지금 수집해 캐시에 저장
+
+        같은 프로세스에서 같은 키를 수집 중이면 그 결과를 기다리고,
+        wait_running이면 다른 프로세스의 실행 중 작업도 COALESCE_WAIT초까지 기다린다.
+        """
+        key = (keyword_key(keyword), league, source)
+
+        with self._inflight_lock:
+            event = self._inflight.get(key)
+            owner = event is None
+            if owner:
+                event = threading.Event()
+                self._inflight[key] = event
+
+        if not owner:
+            event.wait()
+            entry = self.cached(keyword, league, source)
+            return entry['builds'] if entry else []
+
+        try:
+            started = time.time()
+            if wait_running and self._running_elsewhere(keyword, league, source):
+                while time.time() - started < COALESCE_WAIT:
+                    entry = self.cached(keyword, league, source)
+                    if entry and entry['fetched_at'] >= started:
+                        return entry['builds']
+                    time.sleep(0.25)
+
+            builds = self._sources[source]['fetch'](keyword, league) or []
+            self.store(keyword, league, source, builds)
+            return builds
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    # ------------------------------------------------------------------
+    # 자주 찾는 키워드
+    # ------------------------------------------------------------------
+
+    def hot_keywords(self, days: int = HOT_DAYS, min_hits: int = HOT_MIN_HITS, limit: int = HOT_LIMIT) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT keyword, league, hits FROM keyword_hits WHERE last_hit >= ? AND hits >= ? "
+                "ORDER BY hits DESC LIMIT ?",
+                (time.time() - days * 86400, min_hits, limit)
+            ).fetchall()
+        return [{'keyword': keyword, 'league': league, 'hits': hits} for keyword, league, hits in rows]
+
+    def schedule_hot_refresh(self) -> int:
+        """
+        자주 찾는 키워드의 결과가 만료되기 전에 갱신 작업 추가
+
+        Returns:
+            추가한 작업 수
+        """
+        added = 0
+        for hot in self.hot_keywords():
+            for source, config in self._sources.items():
+                entry = self.cached(hot['keyword'], hot['league'], source)
+                if entry is None or entry['age'] >= config['ttl'] * REFRESH_AHEAD:
+                    added += self.enqueue(hot['keyword'], hot['league'], source, priority=hot['hits'])
+        return added
+
+    # ------------------------------------------------------------------
+    # 워커
+    # ------------------------------------------------------------------
+
+    def _heartbeat(self, worker_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO workers VALUES (?, ?, ?)",
+                (worker_id, os.getpid(), time.time())
+            )
+            self._conn.execute("DELETE FROM workers WHERE heartbeat < ?", (time.time() - WORKER_STALE * 10,))
+            self._conn.commit()
+
+    def worker_alive(self) -> bool:
+        """최근 heartbeat를 보낸 워커 프로세스가 있는지"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM workers WHERE heartbeat >= ?", (time.time() - WORKER_STALE,)
+            ).fetchone()
+        return row is not None
+
+    def _worker_loop(self, worker_id: str, stop: threading.Event) -> None:
+        while not stop.is_set():
+            job = self.claim(worker_id)
+            if job is None:
+                stop.wait(POLL_INTERVAL)
+                continue
+            print(f"[INFO] {worker_id}: {job['source']} / {job['keyword']} ({job['league']})", file=sys.stderr)
+            self.run_job(job)
+
+    def serve(self, workers: int = 2, idle_exit: Optional[float] = None, stop: Optional[threading.Event] = None) -> None:
+        """
+        워커 스레드로 작업 처리 (현재 프로세스를 워커 프로세스로 사용)
+
+        Args:
+            workers: 워커 스레드 수
+            idle_exit: 이 시간(초) 동안 처리할 작업이 없으면 종료 (None이면 계속 실행)
+            stop: 외부에서 종료할 때 set
+        """
+        stop = stop or threading.Event()
+        process_id = f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        threads = []
+        for index in range(workers):
+            worker_id = f"worker-{process_id}-{index}"
+            thread = threading.Thread(target=self._worker_loop, args=(worker_id, stop), daemon=True)
+            thread.start()
+            threads.append(thread)
+
+        print(f"[OK] Search job workers started ({workers} threads, pid {os.getpid()})", file=sys.stderr)
+        last_sweep = 0.0
+        last_activity = time.time()
+        try:
+            while not stop.is_set():
+                self._heartbeat(process_id)
+                now = time.time()
+                if now - last_sweep >= SWEEP_INTERVAL:
+                    added = self.schedule_hot_refresh()
+                    if added:
+                        print(f"[INFO] Scheduled {added} hot keyword refreshes", file=sys.stderr)
+                    last_sweep = now
+
+                if self.pending_count():
+                    last_activity = now
+                elif idle_exit is not None and now - last_activity >= idle_exit:
+                    print("[INFO] No pending search jobs, workers exiting", file=sys.stderr)
+                    break
+                stop.wait(HEARTBEAT_INTERVAL)
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join(timeout=5)
+            with self._lock:
+                self._conn.execute("DELETE FROM workers WHERE id = ?", (process_id,))
+                self._conn.commit()
+
+
+_queue: Optional[SearchJobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_search_job_queue() -> SearchJobQueue:
+    """검색 작업 큐 (프로세스 공용)"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = SearchJobQueue()
+        return _queue
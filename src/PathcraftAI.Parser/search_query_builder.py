@@ -3,10 +3,14 @@
 """
 Search Query Builder
 자연어 입력을 YouTube 검색 쿼리로 변환 (AI 해석 없이 키워드 매핑)
+
+스킬/클래스/스타일 사전은 import 시 하나의 구문 트라이(PhraseMatcher)로 컴파일되고,
+입력은 한 번만 소문자화해 왼쪽부터 가장 긴 구문을 찾는다. 비용은 입력 길이 x 최장 구문 길이에
+비례하므로 SkillTagSystem의 전체 스킬(수백 개)을 추가해도 느려지지 않는다.
 """
 
 import sys
-import re
+import weakref
 from typing import List, Dict, Tuple, Optional
 
 # UTF-8 설정
@@ -145,12 +149,44 @@ class SearchQueryBuilder:
         "어센던트": "Ascendant",
     }
 
-    def __init__(self, league_version: str = "3.27"):
+    # 예산 키워드 (고예산이 우선)
+    BUDGET_KEYWORDS = {
+        "저예산": "budget",
+        "리그 스타터": "budget",
+        "가성비": "budget",
+        "budget": "budget",
+        "cheap": "budget",
+        "starter": "budget",
+        "고예산": "expensive",
+        "expensive": "expensive",
+        "endgame": "expensive",
+    }
+
+    # 콘텐츠 키워드 (스타일로도 사용)
+    CONTENT_KEYWORDS = {
+        "델브": "delve",
+        "시뮬": "simulacrum",
+        "우버": "uber",
+        "심연": "abyss",
+    }
+
+    # 다른 게임과 구분하는 키워드
+    GAME_KEYWORDS = ["poe", "path of exile"]
+
+    ASCENDANCIES = frozenset([
+        "Necromancer", "Elementalist", "Occultist", "Deadeye", "Raider", "Pathfinder",
+        "Slayer", "Gladiator", "Champion", "Juggernaut", "Berserker", "Chieftain",
+        "Inquisitor", "Hierophant", "Guardian", "Assassin", "Saboteur", "Trickster", "Ascendant"
+    ])
+
+    def __init__(self, league_version: str = "3.27", skill_system=None):
         """
         Args:
             league_version: 리그 버전 (3.27, 3.26 등)
+            skill_system: SkillTagSystem (주면 전체 스킬 이름/한국어 번역까지 인식)
         """
         self.league_version = league_version
+        self.matcher = matcher_for_skill_system(skill_system) if skill_system is not None else INTENT_MATCHER
 
     def build_query(self, natural_input: str) -> str:
         """자연어 입력을 YouTube 검색 쿼리로 변환
@@ -159,42 +195,20 @@ class SearchQueryBuilder:
             natural_input: 자연어 입력 (예: "사이클론 탱키 빌드")
 
         Returns:
-            YouTube 검색 쿼리 (예: "Cyclone tank tanky defensive build guide 3.27")
+            YouTube 검색 쿼리 (예: "POE Cyclone tank tanky build guide 3.27")
         """
-        tokens = natural_input.lower().split()
+        intent = self.parse_input(natural_input)
         query_parts = []
 
-        # 스킬 이름 찾기
-        skill_found = False
-        for korean, english in self.SKILL_NAMES.items():
-            if korean.lower() in natural_input.lower():
-                query_parts.append(english)
-                skill_found = True
-                break
-
-        # 영어 스킬 이름 직접 입력 처리
-        if not skill_found:
-            for token in tokens:
-                # 일반적인 영어 스킬 이름
-                if token.capitalize() in ["Cyclone", "Arc", "Fireball", "Zombies", "Spectres"]:
-                    query_parts.append(token.capitalize())
-                    skill_found = True
-                    break
-
-        # 클래스 이름 찾기
-        for korean, english in self.CLASS_NAMES.items():
-            if korean.lower() in natural_input.lower():
-                query_parts.append(english)
-                break
+        if intent["skill"]:
+            query_parts.append(intent["skill"])
 
-        # 스타일 키워드 찾기
-        style_keywords = []
-        for korean, english_list in self.STYLE_KEYWORDS.items():
-            if korean in natural_input.lower():
-                style_keywords.extend(english_list[:2])  # 최대 2개
+        # 전직 또는 기본 클래스 (입력에 먼저 나온 쪽)
+        if intent["class_mention"]:
+            query_parts.append(intent["class_mention"])
 
-        if style_keywords:
-            query_parts.extend(list(set(style_keywords)))
+        # 스타일 키워드 (스타일당 최대 2개)
+        query_parts.extend(intent["query_styles"])
 
         # 기본 검색어 추가
         query_parts.append("build")
@@ -202,72 +216,219 @@ class SearchQueryBuilder:
         query_parts.append(self.league_version)
 
         # POE 추가 (다른 게임과 구분)
-        if "poe" not in natural_input.lower() and "path of exile" not in natural_input.lower():
+        if not intent["mentions_poe"]:
             query_parts.insert(0, "POE")
 
         return " ".join(query_parts)
 
     def parse_input(self, natural_input: str) -> Dict:
-        """자연어 입력을 구조화된 데이터로 파싱
+        """자연어 입력을 구조화된 데이터로 파싱 (한 번의 스캔)
 
         Args:
             natural_input: 자연어 입력
 
         Returns:
-            파싱된 데이터 (skill, class, styles, etc.)
+            파싱된 데이터
+            - skill / skills: 첫 스킬 / 등장 순서의 모든 스킬
+            - class / ascendancy / class_mention: 기본 클래스 / 전직 / 입력에 먼저 나온 쪽
+            - styles / query_styles: 스타일 키워드 전체 / 검색어용 (스타일당 2개)
+            - budget ("budget" | "expensive"), content, mentions_poe
         """
         result = {
             "skill": None,
+            "skills": [],
             "class": None,
             "ascendancy": None,
+            "class_mention": None,
             "styles": [],
+            "query_styles": [],
             "budget": None,
             "content": None,
+            "mentions_poe": False,
             "raw_input": natural_input,
         }
 
-        # 스킬 찾기
-        for korean, english in self.SKILL_NAMES.items():
-            if korean.lower() in natural_input.lower():
-                result["skill"] = english
-                break
-
-        # 클래스 찾기
-        for korean, english in self.CLASS_NAMES.items():
-            if korean.lower() in natural_input.lower():
-                # 전직인지 기본 클래스인지 구분
-                ascendancies = ["Necromancer", "Elementalist", "Occultist", "Deadeye",
-                              "Raider", "Pathfinder", "Slayer", "Gladiator", "Champion",
-                              "Juggernaut", "Berserker", "Chieftain", "Inquisitor",
-                              "Hierophant", "Guardian", "Assassin", "Saboteur", "Trickster",
-                              "Ascendant"]
-                if english in ascendancies:
-                    result["ascendancy"] = english
-                else:
-                    result["class"] = english
-                break
-
-        # 스타일 찾기
-        for korean, english_list in self.STYLE_KEYWORDS.items():
-            if korean in natural_input.lower():
+        for _, _, entry in self.matcher.scan(natural_input):
+            kinds = entry["kinds"]
+
+            # 스킬/전직/클래스는 하나의 구문에 하나만 (우선순위 순)
+            for kind in ENTITY_PRIORITY:
+                if kind in kinds:
+                    value = kinds[kind]
+                    if kind == "skill":
+                        if value not in result["skills"]:
+                            result["skills"].append(value)
+                    elif result[kind] is None:
+                        result[kind] = value
+                    if kind != "skill" and result["class_mention"] is None:
+                        result["class_mention"] = value
+                    break
+
+            if "style" in kinds:
+                english_list = kinds["style"]
                 result["styles"].extend(english_list)
+                result["query_styles"].extend(english_list[:2])
+
+            if "budget" in kinds and result["budget"] != "expensive":
+                result["budget"] = kinds["budget"]
 
-        # 예산 찾기
-        budget_keywords = ["저예산", "리그 스타터", "가성비", "budget", "cheap", "starter"]
-        for kw in budget_keywords:
-            if kw in natural_input.lower():
-                result["budget"] = "budget"
-                break
+            if "content" in kinds and result["content"] is None:
+                result["content"] = kinds["content"]
 
-        expensive_keywords = ["고예산", "expensive", "endgame"]
-        for kw in expensive_keywords:
-            if kw in natural_input.lower():
-                result["budget"] = "expensive"
-                break
+            if "game" in kinds:
+                result["mentions_poe"] = True
 
+        result["skill"] = result["skills"][0] if result["skills"] else None
+        result["styles"] = list(dict.fromkeys(result["styles"]))
+        result["query_styles"] = list(dict.fromkeys(result["query_styles"]))
         return result
 
 
+# 같은 구문이 여러 종류에 속하면 앞쪽이 우선 (예: "guardian" - 전직 > 클래스)
+ENTITY_PRIORITY = ("skill", "ascendancy", "class")
+
+_END = "\0"
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+class PhraseMatcher:
+    """여러 구문을 한 번에 찾는 트라이 (왼쪽부터 가장 긴 구문 우선)
+
+    - 대소문자와 공백을 무시한다 ("번개화살" == "번개 화살", "tornado shot" == "TornadoShot")
+    - 영어 구문은 단어 경계에서만 일치 ("arc"는 "search"에서 찾지 않음)
+    - 한글 구문은 뒤에 조사가 붙어도 일치 ("사이클론으로")
+    """
+
+    def __init__(self):
+        self._root: Dict = {}
+        self.max_length = 0
+        self.size = 0
+
+    def add(self, phrase: str, kind: str, value) -> None:
+        """구문 추가 (같은 구문의 같은 종류는 먼저 추가한 값 유지)"""
+        key = "".join(phrase.lower().split())
+        if not key:
+            return
+
+        node = self._root
+        for ch in key:
+            node = node.setdefault(ch, {})
+
+        entry = node.get(_END)
+        if entry is None:
+            entry = node[_END] = {
+                "phrase": phrase,
+                "bound_left": _is_word_char(key[0]),
+                "bound_right": _is_word_char(key[-1]),
+                "kinds": {}
+            }
+            self.size += 1
+            self.max_length = max(self.max_length, len(key))
+        entry["kinds"].setdefault(kind, value)
+
+    def scan(self, text: str) -> List[Tuple[int, int, Dict]]:
+        """
+        텍스트에서 겹치지 않는 구문 찾기
+
+        Returns:
+            [(시작, 끝, 항목)] - 원문 기준 위치, 등장 순서
+        """
+        lowered = text.lower()
+        positions = [i for i, ch in enumerate(lowered) if not ch.isspace()]
+        compact = "".join(lowered[i] for i in positions)
+        length = len(compact)
+
+        matches = []
+        i = 0
+        while i < length:
+            start = positions[i]
+            left_ok = start == 0 or not _is_word_char(lowered[start - 1])
+
+            node = self._root
+            best = None
+            j = i
+            while j < length and j - i < self.max_length:
+                node = node.get(compact[j])
+                if node is None:
+                    break
+                entry = node.get(_END)
+                if entry is not None and (left_ok or not entry["bound_left"]):
+                    end = positions[j] + 1
+                    if not entry["bound_right"] or end == len(lowered) or not _is_word_char(lowered[end]):
+                        best = (j, entry)
+                j += 1
+
+            if best is None:
+                i += 1
+                continue
+            j, entry = best
+            matches.append((start, positions[j] + 1, entry))
+            i = j + 1
+
+        return matches
+
+
+def compile_intent_matcher(extra_skills: Optional[Dict[str, str]] = None) -> PhraseMatcher:
+    """
+    SearchQueryBuilder 사전 -> PhraseMatcher
+
+    Args:
+        extra_skills: 추가 스킬 구문 -> 영어 스킬명 (기본 사전과 겹치면 기본 사전 우선)
+    """
+    builder = SearchQueryBuilder
+    matcher = PhraseMatcher()
+
+    for korean, english in builder.SKILL_NAMES.items():
+        matcher.add(korean, "skill", english)
+        matcher.add(english, "skill", english)
+    for phrase, english in (extra_skills or {}).items():
+        matcher.add(phrase, "skill", english)
+
+    for korean, english in builder.CLASS_NAMES.items():
+        kind = "ascendancy" if english in builder.ASCENDANCIES else "class"
+        matcher.add(korean, kind, english)
+        matcher.add(english, kind, english)
+
+    for korean, english_list in builder.STYLE_KEYWORDS.items():
+        matcher.add(korean, "style", english_list)
+    for phrase, budget in builder.BUDGET_KEYWORDS.items():
+        matcher.add(phrase, "budget", budget)
+    for korean, content in builder.CONTENT_KEYWORDS.items():
+        matcher.add(korean, "content", content)
+    for phrase in builder.GAME_KEYWORDS:
+        matcher.add(phrase, "game", True)
+
+    return matcher
+
+
+def skill_system_names(skill_system) -> Dict[str, str]:
+    """SkillTagSystem -> 스킬 구문(영어 이름, 한국어 번역) -> 영어 스킬명"""
+    names = {}
+    for skill in skill_system.SKILL_DATABASE.values():
+        names[skill.name] = skill.name
+    for english, korean in skill_system.translations.items():
+        if korean:
+            names.setdefault(korean, english)
+    return names
+
+
+INTENT_MATCHER = compile_intent_matcher()
+
+_skill_system_matchers = weakref.WeakKeyDictionary()
+
+
+def matcher_for_skill_system(skill_system) -> PhraseMatcher:
+    """SkillTagSystem의 전체 스킬을 포함한 매처 (시스템당 한 번 컴파일)"""
+    matcher = _skill_system_matchers.get(skill_system)
+    if matcher is None:
+        matcher = compile_intent_matcher(skill_system_names(skill_system))
+        _skill_system_matchers[skill_system] = matcher
+    return matcher
+
+
 def build_search_query(natural_input: str, league_version: str = "3.27") -> str:
     """편의 함수: 자연어 입력을 검색 쿼리로 변환
 
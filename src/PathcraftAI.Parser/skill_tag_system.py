@@ -9,10 +9,17 @@ import sys
 import re
 import json
 import os
+import hashlib
 import requests
 from typing import List, Dict, Set, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # UTF-8 설정
 if sys.platform == 'win32':
     if sys.stdout.encoding != 'utf-8':
@@ -29,6 +36,14 @@ QUEST_REWARDS_PATH = os.path.join(DATA_DIR, "quest_rewards.json")
 VENDOR_RECIPES_PATH = os.path.join(DATA_DIR, "vendor_recipes.json")
 TRANSITION_PATTERNS_PATH = os.path.join(DATA_DIR, "build_transition_patterns.json")
 TRANSLATIONS_PATH = os.path.join(DATA_DIR, "merged_translations.json")
+SKILL_SIMILARITY_PATH = os.path.join(GAME_DATA_DIR, "skill_similarity.json")
+
+SIMILARITY_FORMAT_VERSION = 2  # 2: content_key 저장
+SIMILAR_TOP_K = 20          # 스킬당 저장할 유사 스킬 수
+MIN_SHARED_TAGS = 2         # 유사 스킬 최소 태그 일치 수
+LEVELING_SKILLS_PER_TAG = 5
+LEVELING_MAX_LEVEL = 28
+SIMILARITY_BLOCK_ROWS = 512  # 한 번에 계산할 행 수 (n × 512 행렬)
 
 
 @dataclass
@@ -41,6 +56,177 @@ class SkillInfo:
     is_transfigured: bool = False
 
 
+def is_leveling_candidate(skill: SkillInfo) -> bool:
+    """레벨링에 좋은 스킬 (레벨 요구 낮고, Vaal/변형 아닌 것)"""
+    return (skill.required_level <= LEVELING_MAX_LEVEL and not skill.is_transfigured
+            and "vaal" not in skill.name.lower())
+
+
+def similarity_source_hash() -> str:
+    """유사도 테이블 버전 키 (gems.json + gem_levels.json 내용)"""
+    digest = hashlib.sha1(f"{SIMILARITY_FORMAT_VERSION}:{SIMILAR_TOP_K}".encode('utf-8'))
+    for path in (GEMS_JSON_PATH, GEM_LEVELS_PATH):
+        digest.update(b"\0")
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def skill_content_key(skills: Dict[str, SkillInfo]) -> str:
+    """테이블 계산에 쓰이는 스킬 내용 (ID, 이름, 태그, 레벨, 변형 여부) 해시"""
+    digest = hashlib.sha1()
+    for skill_id, skill in skills.items():
+        digest.update(f"{skill_id}\0{skill.name}\0{','.join(skill.tags)}\0"
+                      f"{skill.required_level}\0{int(skill.is_transfigured)}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _popcount(words: "np.ndarray") -> "np.ndarray":
+    """uint64 배열의 원소별 비트 수"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words)
+    bits = np.unpackbits(np.ascontiguousarray(words).view(np.uint8), axis=-1)
+    return bits.reshape(words.shape + (64,)).sum(axis=-1)
+
+
+def _top_k_numpy(masks: List[int], tag_count: int, top_k: int) -> List[List[Tuple[int, int]]]:
+    """태그 비트셋 행렬의 AND popcount로 스킬별 상위 k개 (일치 수 내림차순, 동률은 원래 순서)"""
+    count = len(masks)
+    words = max(1, (tag_count + 63) // 64)
+    bits = np.zeros((count, words), dtype=np.uint64)
+    for i, mask in enumerate(masks):
+        for w in range(words):
+            bits[i, w] = (mask >> (64 * w)) & 0xFFFFFFFFFFFFFFFF
+
+    result = []
+    for start in range(0, count, SIMILARITY_BLOCK_ROWS):
+        block = bits[start:start + SIMILARITY_BLOCK_ROWS]
+        overlap = np.zeros((len(block), count), dtype=np.int32)
+        for w in range(words):
+            overlap += _popcount(block[:, w, None] & bits[None, :, w]).astype(np.int32)
+        rows = np.arange(len(block))
+        overlap[rows, rows + start] = 0
+        order = np.argsort(-overlap, axis=1, kind='stable')[:, :top_k]
+        shared = np.take_along_axis(overlap, order, axis=1)
+        for row_order, row_shared in zip(order.tolist(), shared.tolist()):
+            result.append([(j, n) for j, n in zip(row_order, row_shared) if n >= MIN_SHARED_TAGS])
+    return result
+
+
+def _top_k_python(masks: List[int], top_k: int) -> List[List[Tuple[int, int]]]:
+    """numpy 없을 때: 정수 비트셋 AND + 비트 수"""
+    result = []
+    for i, mask in enumerate(masks):
+        row = []
+        for j, other in enumerate(masks):
+            if i != j:
+                shared = bin(mask & other).count("1")
+                if shared >= MIN_SHARED_TAGS:
+                    row.append((j, shared))
+        row.sort(key=lambda x: x[1], reverse=True)
+        result.append(row[:top_k])
+    return result
+
+
+class SkillSimilarityTable:
+    """스킬 태그 비트셋으로 미리 계산한 유사 스킬 / 레벨링 스킬 테이블
+
+    gems.json 버전(source_hash)마다 한 번 계산해 game_data에 저장하고,
+    조회는 스킬당 k개 목록만 읽음
+    """
+
+    def __init__(self, source_hash: str, similar: Dict[str, List[Tuple[str, int]]],
+                 leveling_by_tag: Dict[str, List[str]], leveling: Dict[str, List[str]],
+                 top_k: int = SIMILAR_TOP_K, content_key: str = ""):
+        self.source_hash = source_hash
+        self.content_key = content_key
+        self.similar = similar
+        self.leveling_by_tag = leveling_by_tag
+        self.leveling = leveling
+        self.top_k = top_k
+
+    def __len__(self) -> int:
+        return len(self.similar)
+
+    @classmethod
+    def build(cls, skills: Dict[str, SkillInfo], source_hash: str = "",
+              top_k: int = SIMILAR_TOP_K) -> "SkillSimilarityTable":
+        ids = list(skills)
+        tag_bits: Dict[str, int] = {}
+        masks = []
+        for skill_id in ids:
+            mask = 0
+            for tag in skills[skill_id].tags:
+                mask |= 1 << tag_bits.setdefault(tag, len(tag_bits))
+            masks.append(mask)
+
+        if NUMPY_AVAILABLE and ids:
+            rows = _top_k_numpy(masks, len(tag_bits), top_k)
+        else:
+            rows = _top_k_python(masks, top_k)
+        similar = {skill_id: [(ids[j], shared) for j, shared in row] for skill_id, row in zip(ids, rows)}
+
+        # 태그별 레벨링 스킬 (SKILL_DATABASE 순서로 앞의 5개)
+        leveling_by_tag: Dict[str, List[str]] = {}
+        for skill_id in ids:
+            skill = skills[skill_id]
+            if not is_leveling_candidate(skill):
+                continue
+            for tag in dict.fromkeys(skill.tags):
+                picked = leveling_by_tag.setdefault(tag, [])
+                if len(picked) < LEVELING_SKILLS_PER_TAG:
+                    picked.append(skill_id)
+
+        # 메인 스킬별 레벨링 스킬 (태그별 추천의 합집합, 레벨 순)
+        position = {skill_id: i for i, skill_id in enumerate(ids)}
+        leveling = {}
+        for skill_id in ids:
+            recommended = {rec_id for tag in skills[skill_id].tags
+                           for rec_id in leveling_by_tag.get(tag, []) if rec_id != skill_id}
+            leveling[skill_id] = sorted(recommended, key=lambda x: (skills[x].required_level, position[x]))
+
+        return cls(source_hash, similar, leveling_by_tag, leveling, top_k, skill_content_key(skills))
+
+    def to_dict(self) -> Dict:
+        return {
+            "format_version": SIMILARITY_FORMAT_VERSION,
+            "source_hash": self.source_hash,
+            "content_key": self.content_key,
+            "top_k": self.top_k,
+            "similar": {k: [list(pair) for pair in v] for k, v in self.similar.items()},
+            "leveling_by_tag": self.leveling_by_tag,
+            "leveling": self.leveling
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> Optional["SkillSimilarityTable"]:
+        if data.get("format_version") != SIMILARITY_FORMAT_VERSION:
+            return None
+        similar = {k: [(other, shared) for other, shared in v] for k, v in data.get("similar", {}).items()}
+        return cls(data.get("source_hash", ""), similar, data.get("leveling_by_tag", {}),
+                   data.get("leveling", {}), data.get("top_k", SIMILAR_TOP_K), data.get("content_key", ""))
+
+    @classmethod
+    def load(cls, path: str = SKILL_SIMILARITY_PATH) -> Optional["SkillSimilarityTable"]:
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except Exception as e:
+            print(f"[WARN] Failed to load skill similarity table: {e}")
+            return None
+
+    def save(self, path: str = SKILL_SIMILARITY_PATH):
+        """임시 파일에 쓴 뒤 교체"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+
 class SkillTagSystem:
     """스킬 태그 시스템 - gems.json에서 데이터 로드"""
 
@@ -52,8 +238,12 @@ class SkillTagSystem:
         self.transition_patterns = []  # 빌드 전환 패턴 (크롤링 데이터)
         self.translations = {}  # 영한 번역 데이터
         self.reverse_translations = {}  # 한영 역번역 데이터
+        self.lower_translations = {}  # 소문자 영어 -> 한국어
+        self.similarity: Optional[SkillSimilarityTable] = None  # 유사/레벨링 스킬 테이블
+        self._wide_similarity: Optional[SkillSimilarityTable] = None  # max_results > SIMILAR_TOP_K 조회용
         self._load_gem_data()
         self._load_poedb_data()
+        self._load_similarity_table()
         self._load_transition_patterns()
         self._load_translations()
 
@@ -70,6 +260,9 @@ class SkillTagSystem:
                 self.translations = data.get("skills", {})
                 # skills_kr: 한국어 -> 영어
                 self.reverse_translations = {k.lower(): v for k, v in data.get("skills_kr", {}).items()}
+                # 대소문자 무관 조회용 (먼저 나온 키 우선)
+                for key, value in self.translations.items():
+                    self.lower_translations.setdefault(key.lower(), value)
 
             print(f"[INFO] Loaded {len(self.translations)} skill translations")
 
@@ -84,12 +277,7 @@ class SkillTagSystem:
             return result
 
         # 대소문자 무관 매칭
-        english_lower = english_name.lower()
-        for key, value in self.translations.items():
-            if key.lower() == english_lower:
-                return value
-
-        return english_name
+        return self.lower_translations.get(english_name.lower(), english_name)
 
     def get_english_name(self, korean_name: str) -> str:
         """한국어 스킬명을 영어로 변환"""
@@ -652,6 +840,31 @@ class SkillTagSystem:
         except Exception as e:
             print(f"[ERROR] Failed to load gems.json: {e}")
 
+    def _load_similarity_table(self):
+        """유사 스킬 테이블 로드 (gems.json/gem_levels.json이 바뀌었으면 다시 계산해 저장)"""
+        if not self.SKILL_DATABASE:
+            return
+
+        source_hash = similarity_source_hash()
+        table = SkillSimilarityTable.load()
+        if table and table.source_hash == source_hash \
+                and table.content_key == skill_content_key(self.SKILL_DATABASE):
+            self.similarity = table
+            return
+
+        self.similarity = SkillSimilarityTable.build(self.SKILL_DATABASE, source_hash)
+        try:
+            self.similarity.save()
+            print(f"[INFO] Built skill similarity table ({len(self.similarity)} skills)")
+        except OSError as e:
+            print(f"[WARN] Failed to save skill similarity table: {e}")
+
+    def _similarity_table(self) -> SkillSimilarityTable:
+        """현재 SKILL_DATABASE와 맞는 테이블 (스킬 내용이 바뀌었으면 메모리에서만 다시 계산)"""
+        if self.similarity is None or self.similarity.content_key != skill_content_key(self.SKILL_DATABASE):
+            self.similarity = SkillSimilarityTable.build(self.SKILL_DATABASE)
+        return self.similarity
+
     def _load_poedb_data(self):
         """poedb.tw 크롤링 데이터 로드 (gem_levels, quest_rewards, vendor_recipes)"""
         # 젬 레벨 데이터 로드
@@ -786,15 +999,8 @@ class SkillTagSystem:
         return useful_recipes[:10]  # 상위 10개
 
     def get_leveling_skills_by_tag(self, tag: str) -> List[str]:
-        """태그에 맞는 레벨링 스킬 추천 (동적 생성)"""
-        result = []
-        for skill_id, skill_info in self.SKILL_DATABASE.items():
-            if tag in skill_info.tags:
-                # 레벨링에 좋은 스킬 (레벨 요구 낮고, Vaal/변형 아닌 것)
-                if skill_info.required_level <= 28 and not skill_info.is_transfigured:
-                    if "vaal" not in skill_info.name.lower():
-                        result.append(skill_id)
-        return result[:5]  # 상위 5개만
+        """태그에 맞는 레벨링 스킬 추천 (상위 5개, 미리 계산된 테이블)"""
+        return list(self._similarity_table().leveling_by_tag.get(tag, []))
 
     def get_skill_info(self, skill_id: str) -> Optional[SkillInfo]:
         """스킬 ID로 스킬 정보 가져오기"""
@@ -855,53 +1061,26 @@ class SkillTagSystem:
         return None
 
     def get_similar_skills(self, skill_id: str, max_results: int = 5) -> List[SkillInfo]:
-        """같은 태그를 가진 유사 스킬 찾기"""
-        skill = self.get_skill_info(skill_id)
-        if not skill:
+        """같은 태그를 가진 유사 스킬 찾기 (태그 일치 수 순, 최소 2개)"""
+        if skill_id not in self.SKILL_DATABASE:
             return []
 
-        similar = []
-        skill_tags = set(skill.tags)
-
-        for other_id, other_skill in self.SKILL_DATABASE.items():
-            if other_id == skill_id:
-                continue
-
-            other_tags = set(other_skill.tags)
-            overlap = len(skill_tags & other_tags)
-
-            if overlap >= 2:  # 최소 2개 태그 일치
-                similar.append((other_skill, overlap))
-
-        # 태그 일치 수로 정렬
-        similar.sort(key=lambda x: x[1], reverse=True)
-        return [s[0] for s in similar[:max_results]]
+        table = self._similarity_table()
+        if max_results > table.top_k:
+            # 더 긴 목록은 한 번 계산해 두고 같은 스킬 내용이면 재사용
+            wide = self._wide_similarity
+            if wide is None or wide.content_key != table.content_key or wide.top_k < max_results:
+                wide = SkillSimilarityTable.build(self.SKILL_DATABASE, top_k=max_results)
+                self._wide_similarity = wide
+            table = wide
+        return [self.SKILL_DATABASE[other_id] for other_id, _ in table.similar.get(skill_id, [])[:max_results]]
 
     def get_leveling_skills(self, skill_id: str) -> List[SkillInfo]:
-        """메인 스킬에 맞는 레벨링 스킬 추천"""
-        skill = self.get_skill_info(skill_id)
-        if not skill:
+        """메인 스킬에 맞는 레벨링 스킬 추천 (레벨 순)"""
+        if skill_id not in self.SKILL_DATABASE:
             return []
 
-        recommended = set()
-
-        # 태그 기반 추천 (동적)
-        for tag in skill.tags:
-            for rec_id in self.get_leveling_skills_by_tag(tag):
-                if rec_id != skill_id:
-                    rec_skill = self.get_skill_info(rec_id)
-                    if rec_skill:
-                        recommended.add(rec_skill.skill_id)
-
-        # 레벨 순으로 정렬
-        result = []
-        for sid in recommended:
-            skill_info = self.get_skill_info(sid)
-            if skill_info:
-                result.append(skill_info)
-
-        result.sort(key=lambda x: x.required_level)
-        return result
+        return [self.SKILL_DATABASE[rec_id] for rec_id in self._similarity_table().leveling.get(skill_id, [])]
 
     def build_leveling_progression(self, target_skill_id: str) -> Dict:
         """타겟 스킬을 위한 레벨링 진행 생성"""
@@ -1196,7 +1375,7 @@ class ActGuideSearcher:
         if quest_info:
             summary["quest_info"] = quest_info
             # no-transition이면 이미 위에서 팁 추가됨
-            is_no_transition = summary.get("transition_info", {}).get("type") == "no_transition"
+            is_no_transition = (summary.get("transition_info") or {}).get("type") == "no_transition"
             if not is_no_transition:
                 summary["tips"].append(f"Get {skill_name} from '{quest_info['quest']}' (Act {quest_info['act']})")
 
@@ -1233,6 +1412,13 @@ class ActGuideSearcher:
 
         return summary
 
+    def generate_leveling_guide_pair(self, skill_name: str, class_name: str, ascendancy: str) -> Tuple[Dict, Dict]:
+        """영어/한국어 가이드를 한 번에 생성 (배치용 - 요약은 한 번만 만들고 번역)"""
+        summary = self.generate_leveling_guide_summary(skill_name, class_name, ascendancy)
+        if "error" in summary:
+            return summary, summary
+        return summary, self._convert_to_korean(summary)
+
     def _convert_to_korean(self, summary: Dict) -> Dict:
         """가이드 요약을 한국어로 변환"""
         kr_summary = summary.copy()
@@ -1712,10 +1898,13 @@ def main():
     searcher = ActGuideSearcher(skill_system)
 
     if result["main_skill"]:
-        guide = searcher.generate_leveling_guide_summary(
+        # 미리 생성한 가이드 우선 (leveling_guide_store --build)
+        from leveling_guide_store import get_leveling_guide
+        guide = get_leveling_guide(
             result["main_skill"]["name"],
             result["class"],
-            result["ascendancy"]
+            result["ascendancy"],
+            skill_system=skill_system
         )
 
         print("=" * 80)
@@ -9,6 +9,8 @@ import json
 import os
 from typing import List, Dict, Optional
 from poe_ladder_fetcher import get_character_items, get_character_passive_skills, parse_build_data
+from build_catalog import refresh_build_catalog
+from build_similarity_index import refresh_similarity_index
 
 # 유명 스트리머 목록 (계정 이름 또는 캐릭터 이름)
 STREAMERS = {
@@ -210,6 +212,8 @@ def save_streamer_builds(builds: Dict[str, List[Dict]], league: str):
         json.dump(index, f, ensure_ascii=False, indent=2)
 
     print(f"[OK] Saved index: {index_file}")
+    refresh_build_catalog()
+    refresh_similarity_index()
 
 if __name__ == "__main__":
     import argparse
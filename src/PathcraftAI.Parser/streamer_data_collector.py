@@ -7,7 +7,7 @@ YouTube API를 사용하여 스트리머 데이터 수집 및 Tier 기준 검증
 import json
 import os
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
 # .env 파일 지원
@@ -123,37 +123,26 @@ TIER_CRITERIA = {
 }
 
 
+POE_KEYWORDS = ['poe', 'path of exile', '패스오브엑자일', '패오엑', 'pob',
+                'build', '빌드', 'league', '리그', 'settlers', 'keepers']
+
+
 def get_channel_id(youtube, channel_name: str) -> Optional[str]:
-    """채널명으로 채널 ID 검색"""
+    """채널명으로 채널 ID 검색 (youtube_channels.json에 영구 저장)"""
     try:
-        search_response = youtube.search().list(
-            q=channel_name,
-            part='snippet',
-            type='channel',
-            maxResults=1
-        ).execute()
-
-        items = search_response.get('items', [])
-        if items:
-            return items[0]['snippet']['channelId']
-        return None
+        return youtube.resolve_channel_id(channel_name, background=True)
     except Exception as e:
         print(f"[ERROR] Failed to get channel ID for {channel_name}: {e}", file=sys.stderr)
         return None
 
 
 def get_channel_stats(youtube, channel_id: str) -> Optional[Dict]:
-    """채널 통계 정보 가져오기"""
+    """채널 통계 정보 가져오기 (channel_details로 미리 받은 채널은 API 호출 없음)"""
     try:
-        channel_response = youtube.channels().list(
-            part='statistics,snippet',
-            id=channel_id
-        ).execute()
-
-        items = channel_response.get('items', [])
-        if items:
-            stats = items[0]['statistics']
-            snippet = items[0]['snippet']
+        item = youtube.channel_details([channel_id], background=True).get(channel_id)
+        if item:
+            stats = item['statistics']
+            snippet = item['snippet']
             return {
                 'title': snippet['title'],
                 'subscribers': int(stats.get('subscriberCount', 0)),
@@ -169,59 +158,23 @@ def get_channel_stats(youtube, channel_id: str) -> Optional[Dict]:
 def get_recent_videos(youtube, channel_id: str, days: int = 90) -> List[Dict]:
     """최근 N일 내 POE 관련 영상 가져오기"""
     try:
-        published_after = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%dT00:00:00Z')
-
-        # 채널의 업로드 재생목록 ID 가져오기
-        channel_response = youtube.channels().list(
-            part='contentDetails',
-            id=channel_id
-        ).execute()
+        published_after = datetime.now(timezone.utc) - timedelta(days=days)
 
-        items = channel_response.get('items', [])
-        if not items:
-            return []
-
-        uploads_playlist_id = items[0]['contentDetails']['relatedPlaylists']['uploads']
-
-        # 재생목록에서 영상 가져오기
+        # 업로드 재생목록은 최신순 - 기준일보다 오래된 영상이 나오면 멈춤
         videos = []
-        next_page_token = None
-
-        while True:
-            playlist_response = youtube.playlistItems().list(
-                part='snippet,contentDetails',
-                playlistId=uploads_playlist_id,
-                maxResults=50,
-                pageToken=next_page_token
-            ).execute()
-
-            for item in playlist_response.get('items', []):
-                published_at = item['snippet']['publishedAt']
-                published_date = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-
-                # 날짜 필터
-                if published_date < datetime.now(published_date.tzinfo) - timedelta(days=days):
-                    continue
-
-                title = item['snippet']['title'].lower()
-                description = item['snippet'].get('description', '').lower()
-
-                # POE 관련 영상인지 확인
-                poe_keywords = ['poe', 'path of exile', '패스오브엑자일', '패오엑', 'pob',
-                               'build', '빌드', 'league', '리그', 'settlers', 'keepers']
-
-                is_poe = any(kw in title or kw in description for kw in poe_keywords)
-
-                if is_poe:
-                    videos.append({
-                        'video_id': item['contentDetails']['videoId'],
-                        'title': item['snippet']['title'],
-                        'published_at': published_at
-                    })
-
-            next_page_token = playlist_response.get('nextPageToken')
-            if not next_page_token:
-                break
+        for item in youtube.recent_uploads(channel_id, published_after, background=True):
+            title = item['snippet']['title'].lower()
+            description = item['snippet'].get('description', '').lower()
+
+            # POE 관련 영상인지 확인
+            is_poe = any(kw in title or kw in description for kw in POE_KEYWORDS)
+
+            if is_poe:
+                videos.append({
+                    'video_id': item['contentDetails']['videoId'],
+                    'title': item['snippet']['title'],
+                    'published_at': item['snippet']['publishedAt']
+                })
 
         return videos
 
@@ -231,27 +184,18 @@ def get_recent_videos(youtube, channel_id: str, days: int = 90) -> List[Dict]:
 
 
 def get_video_stats(youtube, video_ids: List[str]) -> Dict[str, Dict]:
-    """영상 통계 정보 가져오기 (조회수, 좋아요)"""
+    """영상 통계 정보 가져오기 (조회수, 좋아요) - 50개씩 묶어서 조회"""
     stats = {}
 
-    # YouTube API는 한 번에 50개까지만 처리
-    for i in range(0, len(video_ids), 50):
-        batch = video_ids[i:i+50]
-        try:
-            video_response = youtube.videos().list(
-                part='statistics',
-                id=','.join(batch)
-            ).execute()
-
-            for item in video_response.get('items', []):
-                video_id = item['id']
-                video_stats = item['statistics']
-                stats[video_id] = {
-                    'views': int(video_stats.get('viewCount', 0)),
-                    'likes': int(video_stats.get('likeCount', 0))
-                }
-        except Exception as e:
-            print(f"[ERROR] Failed to get video stats: {e}", file=sys.stderr)
+    try:
+        for video_id, item in youtube.video_details(video_ids, background=True).items():
+            video_stats = item['statistics']
+            stats[video_id] = {
+                'views': int(video_stats.get('viewCount', 0)),
+                'likes': int(video_stats.get('likeCount', 0))
+            }
+    except Exception as e:
+        print(f"[ERROR] Failed to get video stats: {e}", file=sys.stderr)
 
     return stats
 
@@ -283,21 +227,18 @@ def determine_tier(subscribers: int, video_count: int, avg_views: float, days: i
 def collect_streamer_data(api_key: Optional[str] = None) -> Dict:
     """모든 스트리머 데이터 수집"""
 
-    if api_key is None:
-        api_key = os.environ.get('YOUTUBE_API_KEY')
+    from youtube_client import get_youtube_client, GOOGLE_API_AVAILABLE
+
+    youtube = get_youtube_client(api_key)
 
-    if not api_key:
+    if not youtube.api_key:
         print("[ERROR] YOUTUBE_API_KEY not found", file=sys.stderr)
         return {}
 
-    try:
-        from googleapiclient.discovery import build
-    except ImportError:
+    if not GOOGLE_API_AVAILABLE:
         print("[ERROR] google-api-python-client not installed", file=sys.stderr)
         return {}
 
-    youtube = build('youtube', 'v3', developerKey=api_key)
-
     results = {
         'collected_at': datetime.now().isoformat(),
         'english': [],
@@ -312,20 +253,26 @@ def collect_streamer_data(api_key: Optional[str] = None) -> Dict:
     }
 
     # API 호출 카운터 (할당량 모니터링)
-    api_calls = 0
+    quota_before = youtube.quota.summary()
 
+    # 1. 채널 ID 찾기 (저장된 채널은 API 호출 없음)
+    channel_ids = {}
     for lang in ['english', 'korean']:
-        print(f"\n{'='*60}", file=sys.stderr)
-        print(f"Collecting {lang.upper()} streamers...", file=sys.stderr)
-        print(f"{'='*60}", file=sys.stderr)
+        for streamer in STREAMERS[lang]:
+            channel_ids[streamer['name']] = streamer.get('channel_id') or get_channel_id(youtube, streamer['name'])
 
+    # 2. 채널 통계 (전체 채널을 50개씩 묶어서 한 번에)
+    try:
+        youtube.channel_details([cid for cid in channel_ids.values() if cid], background=True)
+    except Exception as e:
+        print(f"[ERROR] Failed to prefetch channel stats: {e}", file=sys.stderr)
+
+    # 3. 최근 90일 POE 영상
+    pending = []
+    for lang in ['english', 'korean']:
         for streamer in STREAMERS[lang]:
             name = streamer['name']
-            print(f"\n[INFO] Processing: {name}", file=sys.stderr)
-
-            # 1. 채널 ID 찾기
-            channel_id = get_channel_id(youtube, name)
-            api_calls += 1
+            channel_id = channel_ids[name]
 
             if not channel_id:
                 print(f"[WARN] Channel not found: {name}", file=sys.stderr)
@@ -336,73 +283,72 @@ def collect_streamer_data(api_key: Optional[str] = None) -> Dict:
                 })
                 continue
 
-            # 2. 채널 통계
             channel_stats = get_channel_stats(youtube, channel_id)
-            api_calls += 1
-
             if not channel_stats:
                 print(f"[WARN] Failed to get stats: {name}", file=sys.stderr)
                 continue
 
-            # 3. 최근 90일 POE 영상
             recent_videos = get_recent_videos(youtube, channel_id, days=90)
-            api_calls += 2  # channel + playlist API
-
-            # 4. 영상 조회수 통계
-            avg_views = 0
-            if recent_videos:
-                video_ids = [v['video_id'] for v in recent_videos]
-                video_stats = get_video_stats(youtube, video_ids)
-                api_calls += (len(video_ids) // 50) + 1
-
-                total_views = sum(s['views'] for s in video_stats.values())
-                avg_views = total_views / len(video_stats) if video_stats else 0
-
-            # 5. Tier 결정
-            actual_tier = determine_tier(
-                subscribers=channel_stats['subscribers'],
-                video_count=len(recent_videos),
-                avg_views=avg_views,
-                days=90
-            )
-
-            streamer_data = {
-                'name': name,
-                'channel_id': channel_id,
-                'channel_title': channel_stats['title'],
-                'subscribers': channel_stats['subscribers'],
-                'poe_videos_90d': len(recent_videos),
-                'avg_views': round(avg_views),
-                'expected_tier': streamer['expected_tier'],
-                'actual_tier': actual_tier,
-                'tier_match': actual_tier == streamer['expected_tier'],
-                'status': 'qualified' if actual_tier > 0 else 'unqualified'
-            }
+            pending.append((lang, streamer, channel_id, channel_stats, recent_videos))
+
+    # 4. 영상 조회수 통계 (모든 스트리머의 영상을 50개씩 묶어서 조회)
+    video_stats = get_video_stats(youtube, [v['video_id'] for *_, videos in pending for v in videos])
+
+    for lang, streamer, channel_id, channel_stats, recent_videos in pending:
+        name = streamer['name']
+        print(f"\n[INFO] Processing: {name}", file=sys.stderr)
+
+        views = [video_stats[v['video_id']]['views'] for v in recent_videos if v['video_id'] in video_stats]
+        avg_views = sum(views) / len(views) if views else 0
+
+        # 5. Tier 결정
+        actual_tier = determine_tier(
+            subscribers=channel_stats['subscribers'],
+            video_count=len(recent_videos),
+            avg_views=avg_views,
+            days=90
+        )
+
+        streamer_data = {
+            'name': name,
+            'channel_id': channel_id,
+            'channel_title': channel_stats['title'],
+            'subscribers': channel_stats['subscribers'],
+            'poe_videos_90d': len(recent_videos),
+            'avg_views': round(avg_views),
+            'expected_tier': streamer['expected_tier'],
+            'actual_tier': actual_tier,
+            'tier_match': actual_tier == streamer['expected_tier'],
+            'status': 'qualified' if actual_tier > 0 else 'unqualified'
+        }
 
-            results[lang].append(streamer_data)
-
-            # 통계 업데이트
-            results['summary']['total'] += 1
-            if actual_tier == 1:
-                results['summary']['tier_1'] += 1
-            elif actual_tier == 2:
-                results['summary']['tier_2'] += 1
-            elif actual_tier == 3:
-                results['summary']['tier_3'] += 1
-            else:
-                results['summary']['unqualified'] += 1
-
-            # 결과 출력
-            tier_str = f"Tier {actual_tier}" if actual_tier > 0 else "Unqualified"
-            match_str = "✓" if streamer_data['tier_match'] else "✗"
-
-            print(f"       Subscribers: {channel_stats['subscribers']:,}", file=sys.stderr)
-            print(f"       POE Videos (90d): {len(recent_videos)}", file=sys.stderr)
-            print(f"       Avg Views: {avg_views:,.0f}", file=sys.stderr)
-            print(f"       Expected: Tier {streamer['expected_tier']} | Actual: {tier_str} {match_str}", file=sys.stderr)
-
-    results['api_calls'] = api_calls
-    print(f"\n[INFO] Total API calls: {api_calls}", file=sys.stderr)
+        results[lang].append(streamer_data)
+
+        # 통계 업데이트
+        results['summary']['total'] += 1
+        if actual_tier == 1:
+            results['summary']['tier_1'] += 1
+        elif actual_tier == 2:
+            results['summary']['tier_2'] += 1
+        elif actual_tier == 3:
+            results['summary']['tier_3'] += 1
+        else:
+            results['summary']['unqualified'] += 1
+
+        # 결과 출력
+        tier_str = f"Tier {actual_tier}" if actual_tier > 0 else "Unqualified"
+        match_str = "✓" if streamer_data['tier_match'] else "✗"
+
+        print(f"       Subscribers: {channel_stats['subscribers']:,}", file=sys.stderr)
+        print(f"       POE Videos (90d): {len(recent_videos)}", file=sys.stderr)
+        print(f"       Avg Views: {avg_views:,.0f}", file=sys.stderr)
+        print(f"       Expected: Tier {streamer['expected_tier']} | Actual: {tier_str} {match_str}", file=sys.stderr)
+
+    quota_after = youtube.quota.summary()
+    results['api_calls'] = sum(quota_after['calls'].values()) - sum(quota_before['calls'].values())
+    results['quota_units'] = quota_after['units'] - quota_before['units']
+    print(f"\n[INFO] Total API calls: {results['api_calls']} ({results['quota_units']} quota units, "
+          f"{quota_after['remaining']:,} remaining today)", file=sys.stderr)
 
     return results
 
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+빌드 유사도 인덱스 벤치마크
+200,000개 합성 래더/스트리머 빌드로 인덱스 생성 후 POB 유사 빌드 검색 시간 측정 및
+전체 빌드 직접 비교(정확한 가중 Jaccard) 결과와 비교
+
+사용법:
+    python test_build_similarity_index.py
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+
+# UTF-8 설정
+if sys.platform == 'win32':
+    if sys.stdout.encoding != 'utf-8':
+        sys.stdout.reconfigure(encoding='utf-8')
+    if sys.stderr.encoding != 'utf-8':
+        sys.stderr.reconfigure(encoding='utf-8')
+
+from build_similarity_index import (
+    NUMPY_AVAILABLE, BuildSimilarityIndex, feature_hashes, ladder_build_features,
+    pob_xml_features, weighted_jaccard
+)
+
+QUERY_LIMIT_MS = 20
+INDEX_SIZE = 200000
+LADDER_FILES = 4
+STREAMERS = {"Ziz": 40, "Mathil": 40}
+LEAGUE = "Benchmark"
+QUERIES = 20
+
+CLASSES = {
+    "Witch": ["Occultist", "Necromancer", "Elementalist"],
+    "Shadow": ["Assassin", "Saboteur", "Trickster"],
+    "Ranger": ["Deadeye", "Raider", "Pathfinder"],
+    "Duelist": ["Slayer", "Gladiator", "Champion"],
+    "Marauder": ["Juggernaut", "Berserker", "Chieftain"],
+    "Templar": ["Inquisitor", "Hierophant", "Guardian"],
+    "Scion": ["Ascendant"]
+}
+SKILLS = ["Righteous Fire", "Lightning Arrow", "Boneshatter", "Kinetic Fusillade", "Raise Spectre",
+          "Toxic Rain", "Cyclone", "Tornado Shot", "Arc", "Summon Raging Spirit"]
+UNIQUES = ["Mageblood", "Headhunter", "Aegis Aurora", "Death's Oath", "Ashes of the Stars",
+           "Progenitor", "Kalandra's Touch", "Dawnbreaker", "Bottled Faith", "Forbidden Flame"]
+
+
+def synthetic_builds(size: int, seed: int, prefix: str = "Char"):
+    """parse_build_data 형식의 합성 빌드 (어센던시/스킬별 공통 트리 + 개인 노드)"""
+    rng = random.Random(seed)
+    builds = []
+    for number in range(size):
+        base = rng.choice(list(CLASSES))
+        ascendancy = rng.choice(CLASSES[base])
+        skill = rng.choice(SKILLS)
+        archetype = random.Random(f"{ascendancy}/{skill}")
+        core = archetype.sample(range(1, 60000), 100)
+        nodes = rng.sample(core, 90) + [rng.randint(1, 60000) for _ in range(20)]
+        builds.append({
+            "character_name": f"{prefix}{number}",
+            "account_name": f"Account{number % 4000}",
+            "class": base,
+            "ascendancy": ascendancy,
+            "level": rng.randint(85, 100),
+            "rank": number + 1,
+            "items": {
+                "unique_items": rng.sample(UNIQUES, rng.randint(0, 4)),
+                "main_skill": skill,
+                "has_items": True
+            },
+            "passive_tree": {"allocated_nodes": nodes, "has_passives": True}
+        })
+    return builds
+
+
+def pob_xml_for(build) -> str:
+    """합성 빌드 -> POB XML (노드 일부를 바꿔 완전히 같지는 않게)"""
+    nodes = build["passive_tree"]["allocated_nodes"][:-5] + [1, 2, 3, 4, 5]
+    items = "".join(
+        f"<Item>Rarity: UNIQUE\n{unique}\nBase</Item>" for unique in build["items"]["unique_items"]
+    )
+    return (
+        f'<PathOfBuilding><Build className="{build["class"]}" ascendClassName="{build["ascendancy"]}"/>'
+        f'<Tree><Spec active="true" nodes="{",".join(map(str, nodes))}"/></Tree>'
+        f'<Items>{items}</Items>'
+        f'<Skills><Skill enabled="true"><Gem nameSpec="{build["items"]["main_skill"]}"/></Skill></Skills>'
+        f'</PathOfBuilding>'
+    )
+
+
+def write_json(path: str, data) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def test_build_similarity_index():
+    print("=" * 80)
+    print(f"Build Similarity Index Benchmark ({INDEX_SIZE} builds)")
+    print("=" * 80)
+
+    if not NUMPY_AVAILABLE:
+        print("[SKIP] numpy not installed")
+        return True
+
+    streamer_total = sum(STREAMERS.values())
+    per_file = (INDEX_SIZE - streamer_total) // LADDER_FILES
+    ladder = []
+    failures = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = os.path.join(tmp, "build_data")
+        for part in range(LADDER_FILES):
+            builds = synthetic_builds(per_file, seed=part, prefix=f"Part{part}_")
+            ladder.extend(builds)
+            write_json(os.path.join(data_dir, "ladder_cache", f"{LEAGUE}{part}_ladder_cache.json"),
+                       {"builds": builds})
+
+        # 스트리머 빌드 (index_{league}.json에 등록된 파일 이름 규칙)
+        streamer_builds = {}
+        for offset, (streamer, count) in enumerate(STREAMERS.items()):
+            builds = synthetic_builds(count, seed=100 + offset, prefix=f"{streamer}_")
+            streamer_builds[streamer] = builds
+            write_json(os.path.join(data_dir, "streamer_builds", f"{streamer}_{LEAGUE}0.json"), builds)
+        write_json(os.path.join(data_dir, "streamer_builds", f"index_{LEAGUE}0.json"),
+                   {"streamers": {name: {"characters": [1]} for name in STREAMERS}})
+
+        index = BuildSimilarityIndex(index_dir=os.path.join(data_dir, "similarity_index"), data_dir=data_dir)
+        start = time.perf_counter()
+        index.refresh()
+        print(f"Index build: {time.perf_counter() - start:.1f} s, {index.size} builds")
+        if index.size != per_file * LADDER_FILES + streamer_total:
+            failures += 1
+            print(f"[FAIL] Indexed {index.size} builds")
+
+        # 같은 리그(파트 0 + 스트리머) 검색
+        rng = random.Random(42)
+        league = f"{LEAGUE}0"
+        pool = ladder[:per_file] + [b for builds in streamer_builds.values() for b in builds]
+        pool_hashes = [feature_hashes(ladder_build_features(b)) for b in pool]
+
+        index.query(pob_xml_features(pob_xml_for(pool[0])), league=league)  # mmap 워밍업
+        timings = []
+        misses = 0
+        for _ in range(QUERIES):
+            reference = rng.choice(pool)
+            features = pob_xml_features(pob_xml_for(reference))
+            start = time.perf_counter()
+            results = index.query(features, league=league, limit=10)
+            timings.append((time.perf_counter() - start) * 1000)
+
+            # 전체 직접 비교의 최고 유사도와 비교
+            query_hashes = feature_hashes(features)
+            best = max(weighted_jaccard(query_hashes, hashes) for hashes in pool_hashes)
+            if not results or abs(results[0]["similarity"] - round(best, 4)) > 1e-4:
+                misses += 1
+
+        timings.sort()
+        median = timings[len(timings) // 2]
+        print()
+        print(f"query median: {median:6.2f} ms, max: {timings[-1]:6.2f} ms")
+        print(f"top-1 matches exact scan: {QUERIES - misses}/{QUERIES}")
+        if median > QUERY_LIMIT_MS:
+            failures += 1
+            print(f"[FAIL] query slower than {QUERY_LIMIT_MS} ms")
+        if misses > QUERIES // 10:
+            failures += 1
+            print("[FAIL] Index top-1 differs from exact scan too often")
+
+        # 스트리머 빌드는 source/streamer_name 유지
+        reference = streamer_builds["Mathil"][0]
+        results = index.query(pob_xml_features(pob_xml_for(reference)), league=league, limit=1)
+        if not results or results[0]["source"] != "streamer" or results[0]["streamer_name"] != "Mathil":
+            failures += 1
+            print(f"[FAIL] Streamer build lost its source: {results[:1]}")
+        if index.query(pob_xml_features(pob_xml_for(ladder[0])), league=league, limit=1)[0]["source"] != "ladder":
+            failures += 1
+            print("[FAIL] Ladder build not tagged as ladder")
+
+        # 색인에 없는 리그는 빈 결과 (추천 엔진은 인기/스트리머 점수로 대체)
+        if index.query(pob_xml_features(pob_xml_for(ladder[0])), league="Other"):
+            failures += 1
+            print("[FAIL] Unknown league returned results")
+        index.close()
+
+    if failures:
+        print(f"[FAIL] {failures} failures")
+        return False
+
+    print("[OK] Index matches exact scan and queries within time limit")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if test_build_similarity_index() else 1)
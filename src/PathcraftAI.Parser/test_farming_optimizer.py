@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파밍 세팅 최적화 벤치마크
+전체 전략 카탈로그(farming_strategies.json)에 대해 (예산, 빌드 파워) 쿼리 응답 시간 측정 및
+완전 탐색 결과와 비교
+
+사용법:
+    python test_farming_optimizer.py          # 샘플 가격
+    python test_farming_optimizer.py --live   # poe.ninja 현재 가격
+"""
+
+import sys
+import time
+import math
+import random
+from itertools import product
+
+# UTF-8 설정
+if sys.platform == 'win32':
+    if sys.stdout.encoding != 'utf-8':
+        sys.stdout.reconfigure(encoding='utf-8')
+    if sys.stderr.encoding != 'utf-8':
+        sys.stderr.reconfigure(encoding='utf-8')
+
+from farming_optimizer import (
+    FarmingSetupOptimizer, POWER_LEVELS, MAP_DEVICE_SCARAB_SLOTS, COMBO_PROFIT_FACTOR
+)
+from farming_strategy_system import get_profit_matrix
+
+QUERY_LIMIT_MS = 50
+BUDGETS = [0, 5, 10, 20, 30, 40, 50, 75, 100, 150, 200, 300]
+
+
+def sample_prices(seed: int = 42):
+    """카탈로그의 모든 스카랍에 대한 샘플 가격"""
+    rng = random.Random(seed)
+    return {name: round(rng.uniform(0.5, 30), 1) for name in get_profit_matrix().scarab_names}
+
+
+def brute_force(optimizer: FarmingSetupOptimizer, budget: int, power_level: str) -> float:
+    """전략별 세팅(또는 미선택)의 모든 조합을 열거한 맵 내 최대 순수익"""
+    groups = [rows for _, rows in optimizer._candidates(power_level, None)]
+    best = -math.inf
+    for choice in product(*[(None,) + rows for rows in groups]):
+        rows = [r for r in choice if r is not None]
+        if not rows:
+            continue
+        if sum(optimizer.row_cost[r] for r in rows) > budget:
+            continue
+        if sum(optimizer.row_slots[r] for r in rows) > MAP_DEVICE_SCARAB_SLOTS:
+            continue
+        # 메인은 수입이 가장 큰 행
+        incomes = sorted((optimizer.row_income[r] for r in rows), reverse=True)
+        value = incomes[0] + COMBO_PROFIT_FACTOR * sum(incomes[1:])
+        value -= sum(optimizer.row_cost_per_hour[r] for r in rows)
+        best = max(best, value)
+    return best
+
+
+def test_farming_optimizer(live: bool = False):
+    print("=" * 80)
+    print("Farming Setup Optimizer Benchmark")
+    print("=" * 80)
+
+    if live:
+        optimizer = FarmingSetupOptimizer.from_live_prices()
+    else:
+        optimizer = FarmingSetupOptimizer(sample_prices(), divine_ratio=150)
+
+    matrix = optimizer.matrix
+    print(f"Strategies: {len(matrix.strategies)}")
+    print(f"Scarab setups: {len(matrix.rows)}")
+    print(f"Scarab types: {len(matrix.scarab_names)}")
+    print()
+
+    failures = 0
+    slowest = 0.0
+    total = 0.0
+
+    for power_level in POWER_LEVELS:
+        for budget in BUDGETS:
+            start = time.perf_counter()
+            plan = optimizer.optimize(budget, power_level)
+            elapsed = (time.perf_counter() - start) * 1000
+            slowest = max(slowest, elapsed)
+            total += elapsed
+
+            if "error" in plan:
+                print(f"  {power_level:9s} {budget:4d}c: {plan['error']}")
+                continue
+
+            names = " + ".join(s["strategy_key"] + "/" + str(s["investment_level"]) for s in plan["strategies"])
+            print(f"  {power_level:9s} {budget:4d}c: {plan['net_chaos_per_hour']:8.1f}c/h "
+                  f"cost {plan['cost_per_map']:5.1f}c  {names}  ({elapsed:.2f} ms)")
+
+            if plan["cost_per_map"] > budget + 1e-9:
+                failures += 1
+                print(f"[FAIL] budget exceeded: {plan['cost_per_map']} > {budget}")
+
+            if plan["type"] == "map":
+                expected = brute_force(optimizer, budget, power_level)
+                if abs(expected - plan["net_chaos_per_hour"]) > 1e-6:
+                    failures += 1
+                    print(f"[FAIL] not optimal: {plan['net_chaos_per_hour']} vs brute force {expected}")
+
+    # 메인 전략 고정 쿼리
+    for key, rows in matrix.strategy_rows.items():
+        if rows:
+            start = time.perf_counter()
+            optimizer.optimize(100, "god_tier", primary=key)
+            elapsed = (time.perf_counter() - start) * 1000
+            slowest = max(slowest, elapsed)
+
+    queries = len(POWER_LEVELS) * len(BUDGETS)
+    print()
+    print(f"Queries: {queries}, total {total:.1f} ms, slowest {slowest:.2f} ms (limit {QUERY_LIMIT_MS} ms)")
+
+    if slowest > QUERY_LIMIT_MS:
+        failures += 1
+        print(f"[FAIL] query slower than {QUERY_LIMIT_MS} ms")
+
+    if failures:
+        print(f"[FAIL] {failures} failures")
+        return False
+
+    print("[OK] All queries optimal and within time limit")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if test_farming_optimizer(live="--live" in sys.argv) else 1)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+래더 요약 벤치마크
+10,000명 합성 래더로 요약 생성 후 메타 빌드 / 클래스별 추천 조회 시간 측정 및
+원본 데이터 직접 집계 결과와 비교
+
+사용법:
+    python test_ladder_aggregate.py
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+from collections import Counter
+
+# UTF-8 설정
+if sys.platform == 'win32':
+    if sys.stdout.encoding != 'utf-8':
+        sys.stdout.reconfigure(encoding='utf-8')
+    if sys.stderr.encoding != 'utf-8':
+        sys.stderr.reconfigure(encoding='utf-8')
+
+import ladder_aggregate
+from ladder_aggregate import update_ladder_aggregate, meta_builds, similar_builds
+
+QUERY_LIMIT_MS = 50
+LADDER_SIZE = 10000
+LEAGUE = "Benchmark"
+
+CLASSES = {
+    "Witch": ["Occultist", "Necromancer", "Elementalist"],
+    "Shadow": ["Assassin", "Saboteur", "Trickster"],
+    "Ranger": ["Deadeye", "Raider", "Pathfinder"],
+    "Duelist": ["Slayer", "Gladiator", "Champion"],
+    "Marauder": ["Juggernaut", "Berserker", "Chieftain"],
+    "Templar": ["Inquisitor", "Hierophant", "Guardian"],
+    "Scion": ["Ascendant"]
+}
+SKILLS = ["Righteous Fire", "Lightning Arrow", "Boneshatter", "Kinetic Fusillade", "Raise Spectre",
+          "Toxic Rain", "Cyclone", "Tornado Shot", "Arc", "Summon Raging Spirit"]
+UNIQUES = ["Mageblood", "Headhunter", "Aegis Aurora", "Death's Oath", "Ashes of the Stars",
+           "Progenitor", "Kalandra's Touch", "Dawnbreaker", "Bottled Faith", "Forbidden Flame"]
+
+
+def synthetic_ladder(size: int = LADDER_SIZE, seed: int = 7):
+    """parse_build_data 형식의 합성 래더"""
+    rng = random.Random(seed)
+    builds = []
+    for rank in range(1, size + 1):
+        base = rng.choice(list(CLASSES))
+        builds.append({
+            "character_name": f"Char{rank}",
+            "account_name": f"Account{rank % 4000}",
+            "class": base,
+            "ascendancy": rng.choice(CLASSES[base]),
+            "level": rng.randint(85, 100),
+            "rank": rank,
+            "items": {
+                "unique_items": rng.sample(UNIQUES, rng.randint(0, 4)),
+                "main_skill": rng.choice(SKILLS),
+                "has_items": True
+            },
+            "passive_tree": {"allocated_nodes": [rng.randint(1, 60000) for _ in range(120)], "has_passives": True}
+        })
+    return builds
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def test_ladder_aggregate():
+    print("=" * 80)
+    print(f"Ladder Aggregate Benchmark ({LADDER_SIZE} characters)")
+    print("=" * 80)
+
+    builds = synthetic_ladder()
+    failures = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ladder_aggregate.json")
+        state_path = os.path.join(tmp, "ladder_aggregate_state.json")
+
+        _, elapsed = timed(update_ladder_aggregate, LEAGUE, builds, replace=True, path=path, state_path=state_path)
+        print(f"Full build: {elapsed:.1f} ms, aggregate {os.path.getsize(path) / 1024:.1f} KB, "
+              f"state {os.path.getsize(state_path) / 1024:.1f} KB")
+
+        # 추가 수집 (100명 갱신)
+        batch = synthetic_ladder(100, seed=8)
+        _, elapsed = timed(update_ladder_aggregate, LEAGUE, batch, path=path, state_path=state_path)
+        print(f"Incremental update (100 characters): {elapsed:.1f} ms")
+        by_key = {f"{b['account_name']}/{b['character_name']}": b for b in builds}
+        by_key.update({f"{b['account_name']}/{b['character_name']}": b for b in batch})
+        expected_builds = list(by_key.values())
+
+        # 새 프로세스처럼 메모리 캐시 비우고 조회
+        ladder_aggregate._cache.clear()
+        meta, meta_ms = timed(meta_builds, LEAGUE, 5, path)
+        similar, similar_ms = timed(similar_builds, LEAGUE, "Necromancer", 5, path)
+        by_class, class_ms = timed(similar_builds, LEAGUE, "Witch", 5, path)
+        print()
+        print(f"meta_builds (cold):          {meta_ms:6.2f} ms")
+        print(f"similar_builds Necromancer:  {similar_ms:6.2f} ms")
+        print(f"similar_builds Witch:        {class_ms:6.2f} ms")
+
+        for name, elapsed in (("meta_builds", meta_ms), ("similar_builds", similar_ms), ("similar_builds (class)", class_ms)):
+            if elapsed > QUERY_LIMIT_MS:
+                failures += 1
+                print(f"[FAIL] {name} slower than {QUERY_LIMIT_MS} ms")
+
+        # 직접 집계와 비교
+        counts = Counter(b["ascendancy"] for b in expected_builds)
+        expected_top = [asc for asc, _ in counts.most_common(5)]
+        if sorted(b["count"] for b in meta) != sorted((counts[a] for a in expected_top)):
+            failures += 1
+            print(f"[FAIL] meta counts {[b['count'] for b in meta]} vs {[counts[a] for a in expected_top]}")
+
+        necro = sorted((b for b in expected_builds if b["ascendancy"] == "Necromancer"), key=lambda b: b["rank"])
+        if [b["character_name"] for b in similar] != [b["character_name"] for b in necro[:5]]:
+            failures += 1
+            print("[FAIL] Necromancer representatives differ from ladder order")
+
+        witch = sorted((b for b in expected_builds if b["class"] == "Witch"), key=lambda b: b["rank"])
+        if [b["character_name"] for b in by_class] != [b["character_name"] for b in witch[:5]]:
+            failures += 1
+            print("[FAIL] Witch representatives differ from ladder order")
+
+        print()
+        for build in meta:
+            print(f"  {build['ascendancy_class']:13s} {build['count']:5d} ({build['share']:4.1f}%)  "
+                  f"#{build['rank']} {build['character_name']}  {', '.join(build['top_skills'][:3])}")
+
+    if failures:
+        print(f"[FAIL] {failures} failures")
+        return False
+
+    print("[OK] Aggregate matches ladder and queries within time limit")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if test_ladder_aggregate() else 1)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+패시브 트리 그래프 테스트
+합성 트리(실제 트리 규모)에서 할당 계획이 항상 인접한 순서인지, 마스터리가 그룹 노터블 다음인지, 120포인트 계획이 100ms 안에 끝나는지 확인
+
+사용법:
+    python test_passive_tree_graph.py
+"""
+
+import sys
+import time
+
+# UTF-8 설정
+if sys.platform == 'win32':
+    if sys.stdout.encoding != 'utf-8':
+        sys.stdout.reconfigure(encoding='utf-8')
+    if sys.stderr.encoding != 'utf-8':
+        sys.stderr.reconfigure(encoding='utf-8')
+
+from passive_tree_graph import PassiveTreeGraph, synthetic_tree_data, benchmark_targets, MASTERY, NOTABLE
+from passive_tree_analyzer import PassiveTreeAnalyzer
+
+PLAN_LIMIT_MS = 100.0
+
+
+def check_order(graph: PassiveTreeGraph, allocated, order) -> bool:
+    """order대로 찍을 때 매 노드가 이미 찍은 노드와 인접한지 (마스터리는 같은 그룹 노터블을 찍은 뒤인지)"""
+    taken = {graph.index[s] for s in allocated}
+    for skill in order:
+        i = graph.index[skill]
+        if graph.kinds[i] == MASTERY:
+            if not any(graph.kinds[j] == NOTABLE and graph.groups[j] == graph.groups[i] for j in taken):
+                print(f"[FAIL] mastery {skill} comes before a notable of its group")
+                return False
+        elif not any(j in taken for j in graph.neighbors(i)):
+            print(f"[FAIL] {skill} is not adjacent to the allocated tree")
+            return False
+        taken.add(i)
+    return True
+
+
+def test_passive_tree_graph():
+    print("=" * 80)
+    print("Passive Tree Graph Test")
+    print("=" * 80)
+
+    data = synthetic_tree_data()
+    graph = PassiveTreeGraph.from_tree_data(data)
+    cached = PassiveTreeGraph.from_cache(graph.to_cache())
+    failures = 0
+
+    if (list(cached.indptr), list(cached.indices)) != (list(graph.indptr), list(graph.indices)):
+        failures += 1
+        print("[FAIL] cache round trip changed the adjacency")
+
+    start = graph.node_ids[next(iter(graph.class_starts.values()))]
+    targets = benchmark_targets(graph, start)
+
+    begin = time.perf_counter()
+    plan = graph.plan_allocation([start], targets)
+    elapsed = (time.perf_counter() - begin) * 1000
+    print(f"Graph: {len(graph)} nodes, {graph.edge_count} edges")
+    print(f"Plan: {len(plan['order'])} points for {len(targets)} targets ({len(plan['travel'])} travel), {elapsed:.1f} ms")
+
+    if not check_order(graph, [start], plan['order']):
+        failures += 1
+    if set(targets) - set(plan['order']) or plan['unreachable']:
+        failures += 1
+        print(f"[FAIL] targets left out: {plan['unreachable']}")
+    if elapsed > PLAN_LIMIT_MS:
+        failures += 1
+        print(f"[FAIL] planning slower than {PLAN_LIMIT_MS} ms")
+
+    # 마스터리: 그룹의 첫 노드가 아니라 첫 노터블 바로 다음
+    notable = next(i for i in range(len(graph)) if graph.kinds[i] == NOTABLE)
+    mastery = next(i for i in range(len(graph))
+                   if graph.kinds[i] == MASTERY and graph.groups[i] == graph.groups[notable])
+    plan = graph.plan_allocation([start], [graph.node_ids[notable], graph.node_ids[mastery]])
+    order = plan['order']
+    print(f"Mastery plan: {len(order)} points")
+    if graph.node_ids[mastery] not in order or plan['unreachable']:
+        failures += 1
+        print(f"[FAIL] mastery left out: {plan['unreachable']}")
+    elif order.index(graph.node_ids[mastery]) != order.index(graph.node_ids[notable]) + 1:
+        failures += 1
+        print("[FAIL] mastery not placed right after its group's notable")
+    elif graph.groups[graph.index[order[0]]] != graph.groups[notable]:
+        failures += 1
+        print("[FAIL] mastery test path does not enter the group before the notable")
+    elif not check_order(graph, [start], order):
+        failures += 1
+
+    # 이미 찍은 노터블의 그룹 마스터리는 맨 앞
+    plan = graph.plan_allocation([start] + order[:order.index(graph.node_ids[mastery])],
+                                 [graph.node_ids[mastery], targets[-1]])
+    if plan['order'][:1] != [graph.node_ids[mastery]]:
+        failures += 1
+        print("[FAIL] mastery of an allocated notable not placed first")
+
+    # 노터블 없이 마스터리만 목표면 할당 불가
+    plan = graph.plan_allocation([start], [graph.node_ids[mastery]])
+    if plan['order'] or plan['unreachable'] != [graph.node_ids[mastery]]:
+        failures += 1
+        print("[FAIL] mastery without its notable was planned")
+
+    # 목표 트리(연결된 120노드) 안에서만 계획: 경유 노드 없이 전부 할당
+    tree_nodes = [graph.node_ids[i] for i in range(1, 121)]
+    analyzer = PassiveTreeAnalyzer(10, 100, graph)
+    analyzer.set_current_tree([])
+    analyzer.set_target_tree({str(skill): {'name': graph.names[graph.index[skill]], 'priority': 3}
+                              for skill in tree_nodes})
+    missing = analyzer.calculate_missing_nodes()
+    order = [int(node['node_id']) for node in missing]
+    if sorted(order) != sorted(tree_nodes) or any(node.get('travel') for node in missing):
+        failures += 1
+        print("[FAIL] analyzer plan does not cover the target tree exactly")
+    elif not check_order(graph, [start], order):
+        failures += 1
+
+    if failures:
+        print(f"[FAIL] {failures} failures")
+        return False
+
+    print("[OK] Allocation order follows tree adjacency")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if test_passive_tree_graph() else 1)
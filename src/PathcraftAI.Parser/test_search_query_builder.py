@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검색 의도 파서 테스트
+자연어 한국어 검색어 코퍼스로 SearchQueryBuilder.parse_input 결과를 확인하고,
+SkillTagSystem 규모(수백 개 스킬)로 확장한 매처의 조회 시간을 측정
+
+사용법:
+    python test_search_query_builder.py
+"""
+
+import sys
+import time
+
+# UTF-8 설정
+if sys.platform == 'win32':
+    if sys.stdout.encoding != 'utf-8':
+        sys.stdout.reconfigure(encoding='utf-8')
+    if sys.stderr.encoding != 'utf-8':
+        sys.stderr.reconfigure(encoding='utf-8')
+
+from search_query_builder import SearchQueryBuilder, compile_intent_matcher
+
+# (입력, 기대값) - 기대값에 없는 키는 확인하지 않음
+KOREAN_QUERY_CORPUS = [
+    ("사이클론 탱키 빌드", {"skill": "Cyclone", "styles": ["tank", "tanky", "defensive"]}),
+    ("사이클론으로 탱키하게 가고 싶어요", {"skill": "Cyclone", "styles": ["tank", "tanky", "defensive"]}),
+    ("번개화살 데드아이 빌드 추천해줘", {"skill": "Lightning Arrow", "ascendancy": "Deadeye", "class": None}),
+    ("번개 화살 딜러", {"skill": "Lightning Arrow", "styles": ["damage", "dps"]}),
+    ("네크로맨서 좀비 빌드", {"skill": "Zombies", "ascendancy": "Necromancer"}),
+    ("저예산 리그 스타터", {"budget": "budget", "skill": None}),
+    ("고예산 엔드게임 빌드 알려줘", {"budget": "expensive"}),
+    ("가성비 좋은 신성한 불길 저거너트", {"skill": "Righteous Fire", "ascendancy": "Juggernaut", "budget": "budget"}),
+    ("독성 비 레인저 매핑용", {"skill": "Toxic Rain", "class": "Ranger", "styles": ["mapping", "clear speed"]}),
+    ("칼날 소용돌이 보스킬러", {"skill": "Blade Vortex", "styles": ["boss killer", "bossing"]}),
+    ("방어막 오컬티스트 황폐", {"skill": "Bane", "ascendancy": "Occultist", "styles": ["energy shield", "ES"]}),
+    ("폭딜 나오는 폭발 화살 빌드", {"skill": "Explosive Arrow", "styles": ["high damage", "boss killer", "millions dps"]}),
+    ("델브 깊이 파는 빌드", {"content": "delve", "styles": ["delve", "deep delve"]}),
+    ("시뮬 클리어 가능한 엘리멘탈리스트", {"content": "simulacrum", "ascendancy": "Elementalist"}),
+    ("우버 보스 잡는 빌드", {"content": "uber"}),
+    ("얼음 창 위치 빌드", {"skill": "Ice Spear", "class": "Witch"}),
+    ("마녀로 해골 소환", {"skill": "Skeletons", "class": "Witch"}),
+    ("폭풍 낙인 인퀴지터", {"skill": "Storm Brand", "ascendancy": "Inquisitor"}),
+    ("폭풍 부름 빌드", {"skill": "Storm Call"}),
+    ("정수 흡수 전염 트릭스터", {"skill": "Essence Drain", "skills": ["Essence Drain", "Contagion"], "ascendancy": "Trickster"}),
+    ("망령 소환 빌드 poe", {"skill": "Spectres", "mentions_poe": True}),
+    ("Path of Exile 토템 치프틴", {"skill": "Totem", "ascendancy": "Chieftain", "mentions_poe": True}),
+    ("Cyclone tank build", {"skill": "Cyclone"}),
+    ("tornado shot deadeye", {"skill": "Tornado Shot", "ascendancy": "Deadeye"}),
+    ("search arc witch", {"skill": "Arc", "class": "Witch"}),
+    ("research build", {"skill": None}),
+    ("빙하 폭포 빌드 초보", {"skill": "Glacial Cascade"}),
+    ("회피 높은 패스파인더", {"ascendancy": "Pathfinder", "styles": ["evasion", "dodge"]}),
+    ("블록 글래디에이터", {"ascendancy": "Gladiator", "styles": ["block", "max block"]}),
+    ("속도 빠른 매핑 빌드", {"styles": ["fast", "speed", "zoom", "mapping", "clear speed"]}),
+    ("듀얼리스트 슬레이어 사이클론", {"class": "Duelist", "ascendancy": "Slayer", "class_mention": "Duelist"}),
+    ("탱커 가디언 오라", {"ascendancy": "Guardian", "styles": ["tank", "tanky", "defensive"]}),
+]
+
+QUERY_CORPUS = [
+    ("사이클론 탱키 빌드", "POE Cyclone tank tanky build guide 3.27"),
+    ("네크로맨서 좀비", "POE Zombies Necromancer build guide 3.27"),
+    ("poe 번개 화살", "Lightning Arrow build guide 3.27"),
+]
+
+# 스킬 수백 개 규모 확장 시 1건당 허용 시간
+QUERY_LIMIT_MS = 1.0
+SYNTHETIC_SKILLS = 800
+
+
+def check_corpus(builder: SearchQueryBuilder) -> int:
+    failures = 0
+    for text, expected in KOREAN_QUERY_CORPUS:
+        parsed = builder.parse_input(text)
+        wrong = {key: parsed[key] for key, value in expected.items() if parsed[key] != value}
+        if wrong:
+            failures += 1
+            print(f"[FAIL] {text!r}: got {wrong}, expected { {k: expected[k] for k in wrong} }")
+
+    for text, expected in QUERY_CORPUS:
+        query = builder.build_query(text)
+        if query != expected:
+            failures += 1
+            print(f"[FAIL] build_query({text!r}) = {query!r}, expected {expected!r}")
+    return failures
+
+
+def synthetic_skill_names(count: int):
+    """SkillTagSystem 규모의 스킬 이름 (영어 + 한국어 번역)"""
+    names = {}
+    for index in range(count):
+        english = f"Synthetic Skill {index:03d} of Testing"
+        names[english] = english
+        names[f"합성 스킬 {index:03d}"] = english
+    return names
+
+
+def benchmark(matcher, texts, rounds: int = 200) -> float:
+    """parse_input 1건당 평균 시간 (ms)"""
+    builder = SearchQueryBuilder("3.27")
+    builder.matcher = matcher
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            builder.parse_input(text)
+    return (time.perf_counter() - start) * 1000 / (rounds * len(texts))
+
+
+def test_search_query_builder():
+    print("=" * 80)
+    print(f"Search Query Builder Intent Test ({len(KOREAN_QUERY_CORPUS)} Korean queries)")
+    print("=" * 80)
+
+    failures = check_corpus(SearchQueryBuilder("3.27"))
+
+    # SkillTagSystem 전체 스킬 규모로 확장
+    extended = compile_intent_matcher(synthetic_skill_names(SYNTHETIC_SKILLS))
+    builder = SearchQueryBuilder("3.27")
+    builder.matcher = extended
+    failures += check_corpus(builder)
+
+    parsed = builder.parse_input("합성 스킬 417 가디언 빌드")
+    if parsed["skill"] != "Synthetic Skill 417 of Testing" or parsed["ascendancy"] != "Guardian":
+        failures += 1
+        print(f"[FAIL] extended skill not matched: {parsed['skill']}, {parsed['ascendancy']}")
+
+    texts = [text for text, _ in KOREAN_QUERY_CORPUS]
+    base = SearchQueryBuilder("3.27").matcher
+    base_ms = benchmark(base, texts)
+    extended_ms = benchmark(extended, texts)
+    print(f"Base matcher:     {base.size:5d} phrases  {base_ms:.4f} ms/query")
+    print(f"Extended matcher: {extended.size:5d} phrases  {extended_ms:.4f} ms/query")
+    if extended_ms > QUERY_LIMIT_MS:
+        failures += 1
+        print(f"[FAIL] extended matcher slower than {QUERY_LIMIT_MS} ms/query")
+
+    if failures:
+        print(f"[FAIL] {failures} failures")
+        return False
+
+    print("[OK] All queries parsed as expected")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if test_search_query_builder() else 1)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스킬 유사도 테이블 검증
+합성 스킬 데이터베이스에서 미리 계산한 유사/레벨링 스킬 테이블이
+기존 전체 스캔(get_similar_skills / get_leveling_skills 원래 구현)과 같은지 확인
+
+사용법:
+    python test_skill_similarity.py
+"""
+
+import sys
+import random
+
+# UTF-8 설정
+if sys.platform == 'win32':
+    if sys.stdout.encoding != 'utf-8':
+        sys.stdout.reconfigure(encoding='utf-8')
+    if sys.stderr.encoding != 'utf-8':
+        sys.stderr.reconfigure(encoding='utf-8')
+
+import skill_tag_system
+from skill_tag_system import SkillInfo, SkillTagSystem, SIMILAR_TOP_K
+
+SKILL_COUNT = 600
+TAGS = ["spell", "attack", "projectile", "area", "fire", "cold", "lightning", "chaos", "physical",
+        "minion", "duration", "melee", "bow", "totem", "trap", "mine", "channelling", "aura", "curse",
+        "movement", "strike", "slam", "nova", "chaining", "orb", "brand", "warcry", "golem", "herald"]
+
+
+def synthetic_database(seed: int = 3):
+    rng = random.Random(seed)
+    database = {}
+    for i in range(SKILL_COUNT):
+        skill_id = f"Skill{i}"
+        database[skill_id] = SkillInfo(
+            name=f"{'Vaal ' if rng.random() < 0.05 else ''}Skill {i}",
+            skill_id=skill_id,
+            tags=rng.sample(TAGS, rng.randint(1, 7)),
+            required_level=rng.randint(1, 70),
+            is_transfigured=rng.random() < 0.1
+        )
+    return database
+
+
+def make_system(database) -> SkillTagSystem:
+    """파일 로드 없이 SKILL_DATABASE만 가진 SkillTagSystem"""
+    system = SkillTagSystem.__new__(SkillTagSystem)
+    system.SKILL_DATABASE = database
+    system.similarity = None
+    system._wide_similarity = None
+    return system
+
+
+def scan_similar(database, skill_id, max_results):
+    """기존 get_similar_skills (전체 스캔)"""
+    skill_tags = set(database[skill_id].tags)
+    similar = []
+    for other_id, other in database.items():
+        if other_id == skill_id:
+            continue
+        overlap = len(skill_tags & set(other.tags))
+        if overlap >= 2:
+            similar.append((other_id, overlap))
+    similar.sort(key=lambda x: x[1], reverse=True)
+    return [other_id for other_id, _ in similar[:max_results]]
+
+
+def scan_leveling(database, skill_id):
+    """기존 get_leveling_skills (태그별 앞의 5개 합집합)"""
+    recommended = set()
+    for tag in database[skill_id].tags:
+        picked = [
+            other_id for other_id, other in database.items()
+            if tag in other.tags and other.required_level <= 28 and not other.is_transfigured
+            and "vaal" not in other.name.lower()
+        ][:5]
+        recommended.update(other_id for other_id in picked if other_id != skill_id)
+    return recommended
+
+
+def check(system, database, label):
+    failures = 0
+    for skill_id in database:
+        for max_results in (5, SIMILAR_TOP_K, SIMILAR_TOP_K + 15):
+            got = [s.skill_id for s in system.get_similar_skills(skill_id, max_results)]
+            expected = scan_similar(database, skill_id, max_results)
+            if got != expected:
+                failures += 1
+                print(f"[FAIL] {label} similar {skill_id} (max {max_results}): {got[:5]} vs {expected[:5]}")
+                break
+
+        leveling = system.get_leveling_skills(skill_id)
+        levels = [s.required_level for s in leveling]
+        if {s.skill_id for s in leveling} != scan_leveling(database, skill_id) or levels != sorted(levels):
+            failures += 1
+            print(f"[FAIL] {label} leveling {skill_id}")
+    return failures
+
+
+def test_skill_similarity():
+    print("=" * 80)
+    print(f"Skill Similarity Table ({SKILL_COUNT} skills)")
+    print("=" * 80)
+
+    failures = 0
+    database = synthetic_database()
+
+    failures += check(make_system(database), database, "numpy" if skill_tag_system.NUMPY_AVAILABLE else "python")
+    if skill_tag_system.NUMPY_AVAILABLE:
+        skill_tag_system.NUMPY_AVAILABLE = False
+        try:
+            failures += check(make_system(database), database, "python")
+        finally:
+            skill_tag_system.NUMPY_AVAILABLE = True
+
+    # 넓은 테이블은 한 번만 계산
+    system = make_system(database)
+    system.get_similar_skills("Skill0", SIMILAR_TOP_K + 10)
+    wide = system._wide_similarity
+    system.get_similar_skills("Skill1", SIMILAR_TOP_K + 5)
+    if system._wide_similarity is not wide:
+        failures += 1
+        print("[FAIL] Wide table rebuilt for a smaller max_results")
+
+    # 스킬 수가 같아도 태그가 바뀌면 다시 계산
+    table = system._similarity_table()
+    database["Skill0"].tags = ["herald", "golem", "warcry"]
+    if system._similarity_table() is table:
+        failures += 1
+        print("[FAIL] Table not rebuilt after a tag change")
+    failures += check(system, database, "after edit")
+
+    if failures:
+        print(f"[FAIL] {failures} failures")
+        return False
+
+    print("[OK] Similarity table matches the full scan")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if test_skill_similarity() else 1)
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+유니크 키워드 역색인 골든 테스트
+UniqueKeywordIndex 결과가 기존 전체 스캔 방식(find_uniques_by_mods)과 동일한지 확인
+
+game_data/uniques.json이 있으면 전체 데이터로, 없으면 내장 샘플로 비교한다.
+"""
+
+import sys
+import json
+import re
+import time
+from itertools import combinations
+from pathlib import Path
+
+# UTF-8 설정
+if sys.platform == 'win32':
+    if sys.stdout.encoding != 'utf-8':
+        sys.stdout.reconfigure(encoding='utf-8')
+    if sys.stderr.encoding != 'utf-8':
+        sys.stderr.reconfigure(encoding='utf-8')
+
+from item_recommendation_engine import UniqueKeywordIndex, UNIQUE_KEYWORD_PATTERNS, keyword_patterns_for
+
+
+SAMPLE_UNIQUES = {
+    "Goldrim": {
+        "base_type": "Leather Cap",
+        "mods": ["+(30-50) to Evasion Rating", "10% increased Rarity of Items found",
+                 "+(30-40)% to all Elemental Resistances"],
+        "implicits": []
+    },
+    "Rise of the Phoenix": {
+        "base_type": "{variant:1,2}Mirrored Spiked Shield",
+        "mods": ["+(25-30)% to Fire Resistance", "+5% to maximum Fire Resistance",
+                 "Regenerate 0.5% of Life per second per Fire damage"],
+        "implicits": ["+3% Chance to Block"]
+    },
+    "Shavronne's Wrappings": {
+        "base_type": "Occultist's Vestment",
+        "mods": ["+(100-150) to maximum Energy Shield", "Chaos Damage does not bypass Energy Shield",
+                 "(10-15)% increased Spell Damage"],
+        "implicits": []
+    },
+    "Bones of Ullr": {
+        "base_type": "Silk Slippers",
+        "mods": ["+1 to Level of all Raise Zombie Gems", "+1 to Level of all Raise Spectre Gems",
+                 "+1 to maximum number of Raised Zombies", "20% increased Movement Speed"],
+        "implicits": []
+    },
+    "Marylene's Fallacy": {
+        "base_type": "Lion Pelt",
+        "mods": ["+(140-160) to Accuracy Rating", "40% increased Critical Strike Chance",
+                 "Non-critical strikes deal 40% less Damage", "+(20-30)% to Critical Strike Multiplier"],
+        "implicits": []
+    },
+    "The Taming": {
+        "base_type": "Prismatic Ring",
+        "mods": ["30% increased Elemental Damage with Attack Skills", "10% increased Attack Speed",
+                 "10% increased Cast Speed", "Damage over Time"],
+        "implicits": ["+(8-10)% to all Elemental Resistances"]
+    },
+    "Mageblood": {
+        "base_type": "Heavy Belt",
+        "mods": ["+(20-30) to Strength", "+(15-25) to maximum Life",
+                 "Magic Utility Flask Effects cannot be removed"],
+        "implicits": ["+(25-35) to Strength"]
+    },
+}
+
+
+def legacy_find_uniques(uniques_data, keywords):
+    """기존 find_uniques_by_mods 구현 (전체 스캔)"""
+    keyword_patterns = []
+    for kw in keywords:
+        if kw == 'spell_damage':
+            keyword_patterns.extend(['spell damage', 'spell skill'])
+        elif kw == 'fire_damage':
+            keyword_patterns.extend(['fire damage', 'fire resist', 'fire penetration'])
+        elif kw == 'cold_damage':
+            keyword_patterns.extend(['cold damage', 'cold resist', 'cold penetration'])
+        elif kw == 'lightning_damage':
+            keyword_patterns.extend(['lightning damage', 'lightning resist', 'lightning penetration'])
+        elif kw == 'crit_chance':
+            keyword_patterns.extend(['critical strike chance', 'critical chance'])
+        elif kw == 'crit_multi':
+            keyword_patterns.extend(['critical strike multiplier', 'critical multiplier'])
+        elif kw == 'max_life':
+            keyword_patterns.extend(['maximum life', 'to life', 'life regeneration'])
+        elif kw == 'max_es':
+            keyword_patterns.extend(['maximum energy shield', 'energy shield'])
+        elif kw == 'attack_speed':
+            keyword_patterns.append('attack speed')
+        elif kw == 'cast_speed':
+            keyword_patterns.append('cast speed')
+        elif kw == 'dot_damage':
+            keyword_patterns.extend(['damage over time', 'burning damage', 'poison damage', 'bleed'])
+        elif kw == 'minion':
+            keyword_patterns.extend(['minion', 'summon', 'zombie', 'spectre', 'golem', 'skeleton'])
+        else:
+            keyword_patterns.append(kw.replace('_', ' '))
+
+    scored_uniques = []
+    for name, unique_data in uniques_data.items():
+        base = unique_data.get('base_type', '')
+        base = re.sub(r'\{[^}]*\}', '', base).strip()
+        mods = unique_data.get('mods', [])
+        implicits = unique_data.get('implicits', [])
+        all_mod_text = ' '.join(mods + implicits).lower()
+
+        match_score = 0
+        matched_keywords = []
+        for pattern in keyword_patterns:
+            if pattern.lower() in all_mod_text:
+                match_score += 1
+                matched_keywords.append(pattern)
+
+        if match_score > 0:
+            scored_uniques.append({
+                'name': name,
+                'base': base,
+                'mods': mods,
+                'relevance_score': match_score,
+                'matched_keywords': matched_keywords
+            })
+
+    scored_uniques.sort(key=lambda x: x['relevance_score'], reverse=True)
+    return scored_uniques
+
+
+def legacy_slot_match(base, slot_bases):
+    """기존 recommend_items 슬롯 매칭"""
+    base_lower = base.lower()
+    return any(sb in base_lower for sb in slot_bases)
+
+
+def load_uniques():
+    uniques_path = Path(__file__).parent / "game_data" / "uniques.json"
+    if uniques_path.exists():
+        with open(uniques_path, 'r', encoding='utf-8') as f:
+            return json.load(f), "game_data/uniques.json"
+    return SAMPLE_UNIQUES, "built-in sample"
+
+
+def test_unique_keyword_index():
+    """역색인 결과 = 기존 전체 스캔 결과"""
+    print("=" * 80)
+    print("Unique Keyword Index Golden Test")
+    print("=" * 80)
+
+    uniques, source = load_uniques()
+    print(f"Uniques: {len(uniques)} ({source})")
+
+    # ItemRecommendationEngine.slot_categories 일부
+    slot_categories = {
+        'helmet': ['helmet', 'helm', 'mask', 'crown', 'hood', 'circlet', 'burgonet', 'tricorne', 'cap', 'cage', 'hauberk', 'bascinet', 'sallet', 'coif', 'casque', 'plate'],
+        'body': ['body armour', 'body', 'robe', 'vest', 'vestment', 'garb', 'armour', 'brigandine', 'doublet', 'jerkin', 'tunic', 'jacket', 'coat', 'raiment', 'regalia', 'silks', 'wrap', 'wyrmscale', 'dragonscale', 'lamellar', 'plate', 'chainmail', 'ringmail'],
+        'boots': ['boots', 'greaves', 'slippers', 'shoes'],
+        'ring': ['ring'],
+        'shield': ['shield', 'buckler', 'tower', 'kite'],
+    }
+
+    start = time.perf_counter()
+    index = UniqueKeywordIndex(uniques, slot_categories)
+    print(f"Index build: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    keyword_pool = list(UNIQUE_KEYWORD_PATTERNS) + ['movement_speed', 'accuracy', 'strength']
+    queries = [[kw] for kw in keyword_pool]
+    queries += [list(combo) for combo in combinations(keyword_pool[:8], 3)]
+    queries.append(['spell_damage', 'fire_damage', 'fire_damage'])  # 중복 키워드
+
+    legacy_time = 0.0
+    index_time = 0.0
+    failures = 0
+
+    for keywords in queries:
+        start = time.perf_counter()
+        expected = legacy_find_uniques(uniques, keywords)
+        legacy_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = index.search(keyword_patterns_for(keywords))
+        index_time += time.perf_counter() - start
+
+        if actual != expected:
+            failures += 1
+            print(f"[FAIL] {keywords}: {len(actual)} results vs {len(expected)} expected")
+
+    for name, unique_data in uniques.items():
+        base = re.sub(r'\{[^}]*\}', '', unique_data.get('base_type', '')).strip()
+        for slot, slot_bases in slot_categories.items():
+            if (slot in index.slots[name]) != legacy_slot_match(base, slot_bases):
+                failures += 1
+                print(f"[FAIL] slot mismatch: {name} / {slot}")
+
+    print(f"Queries: {len(queries)}")
+    print(f"Legacy scan: {legacy_time * 1000:.1f} ms")
+    print(f"Index merge: {index_time * 1000:.1f} ms")
+
+    if failures:
+        print(f"[FAIL] {failures} mismatches")
+        return False
+
+    print("[OK] Index results identical to legacy scan")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if test_unique_keyword_index() else 1)
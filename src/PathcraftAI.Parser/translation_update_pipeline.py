@@ -19,7 +19,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
 
 # 같은 디렉토리의 모듈 임포트
-from awakened_translation_extractor import extract_all_awakened_translations
+from awakened_translation_extractor import update_awakened_translations, file_sha256
 from poe_trade_korean_fetcher import POETradeKoreanFetcher, merge_translations
 
 
@@ -146,18 +146,25 @@ class TranslationUpdatePipeline:
 
         return False, "Cache is valid"
 
+    def merge_source_hashes(self) -> Dict[str, Optional[str]]:
+        """병합 입력 파일들의 해시"""
+        return {
+            'awakened': file_sha256(self.awakened_file),
+            'trade_api': file_sha256(self.trade_api_file),
+            'poecharm': file_sha256(self.poecharm_file),
+        }
+
     def update_awakened_data(self) -> bool:
-        """Awakened POE Trade 데이터 업데이트"""
+        """Awakened POE Trade 데이터 업데이트 (스트리밍, 변경된 네임스페이스만 재작성)"""
         print("[INFO] Updating Awakened POE Trade data...", file=sys.stderr)
 
         try:
-            translations = extract_all_awakened_translations()
-
-            with open(self.awakened_file, 'w', encoding='utf-8') as f:
-                json.dump(translations, f, ensure_ascii=False, indent=2)
+            result = update_awakened_translations(output_dir=self.data_dir)
 
-            print(f"[OK] Awakened data: {len(translations.get('items', {}))} items, "
-                  f"{len(translations.get('stats', {}))} stats", file=sys.stderr)
+            if result['changed']:
+                print(f"[OK] Awakened data: rewrote {', '.join(result['rewritten'])}", file=sys.stderr)
+            else:
+                print("[OK] Awakened data unchanged", file=sys.stderr)
             return True
         except Exception as e:
             print(f"[ERROR] Failed to update Awakened data: {e}", file=sys.stderr)
@@ -178,8 +185,15 @@ class TranslationUpdatePipeline:
             print(f"[ERROR] Failed to update Trade API data: {e}", file=sys.stderr)
             return False
 
-    def merge_all_data(self) -> bool:
-        """모든 데이터 병합"""
+    def merge_all_data(self, force: bool = False) -> bool:
+        """모든 데이터 병합 (입력 파일 해시가 바뀐 경우에만)"""
+        source_hashes = self.merge_source_hashes()
+        if (not force
+                and os.path.exists(self.merged_file)
+                and self.load_cache().get('merge_source_hashes') == source_hashes):
+            print("[INFO] Merge inputs unchanged - skipping merge", file=sys.stderr)
+            return True
+
         print("[INFO] Merging all translation data...", file=sys.stderr)
 
         try:
@@ -227,7 +241,7 @@ class TranslationUpdatePipeline:
             success = False
 
         # 3. 데이터 병합
-        if success and not self.merge_all_data():
+        if success and not self.merge_all_data(force=force):
             success = False
 
         # 캐시 업데이트
@@ -236,6 +250,7 @@ class TranslationUpdatePipeline:
                 'last_update': datetime.now().isoformat(),
                 'poe_version': self.get_poe_patch_version(),
                 'current_league': self.get_current_league(),
+                'merge_source_hashes': self.merge_source_hashes(),
             }
             self.save_cache(cache)
 
@@ -11,7 +11,7 @@ import json
 import sys
 import argparse
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Set
 
 # UTF-8 설정
 if sys.platform == 'win32':
@@ -21,6 +21,11 @@ if sys.platform == 'win32':
         sys.stderr.reconfigure(encoding='utf-8')
 
 
+# Gap 분석 대상 스탯 (분석 순서)
+RESISTANCE_NAMES = {'fire_res': 'Fire', 'cold_res': 'Cold', 'lightning_res': 'Lightning'}
+GAP_STATS = ['fire_res', 'cold_res', 'lightning_res', 'dps', 'life', 'energy_shield']
+
+
 class UpgradePathPlanner:
     def __init__(self, budget_chaos: int = 100):
         """
@@ -75,7 +80,13 @@ class UpgradePathPlanner:
 
         return True
 
-    def analyze_gaps(self, current_stats: Dict, target_stats: Dict) -> List[Dict]:
+    def analyze_gaps(
+        self,
+        current_stats: Dict,
+        target_stats: Dict,
+        previous_gaps: Optional[List[Dict]] = None,
+        changed_stats: Optional[Set[str]] = None
+    ) -> List[Dict]:
         """
         현재와 목표 사이의 Gap 분석 및 우선순위 설정
 
@@ -84,81 +95,99 @@ class UpgradePathPlanner:
         2. DPS (10,000 이상 차이)
         3. Life/ES (500 이상 차이)
         4. 방어 메커니즘
+
+        Args:
+            previous_gaps: 같은 목표에 대한 이전 분석 결과
+            changed_stats: previous_gaps 이후 바뀐 스탯 키 (None이면 전체 재계산)
         """
+        incremental = previous_gaps is not None and changed_stats is not None
         gaps = []
 
-        # 1. 저항 Gap (최우선)
-        resistances = [
-            ('Fire', 'fire_res'),
-            ('Cold', 'cold_res'),
-            ('Lightning', 'lightning_res')
-        ]
+        for stat_key in GAP_STATS:
+            if incremental and stat_key not in changed_stats:
+                gaps.extend(g for g in previous_gaps if g.get('stat_key') == stat_key)
+            else:
+                gap = self._stat_gap(stat_key, current_stats, target_stats)
+                if gap:
+                    gaps.append(gap)
+
+        # 우선순위와 심각도로 정렬
+        severity_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+        gaps.sort(key=lambda x: (x['priority'], severity_order.get(x['severity'], 99)))
 
-        for res_name, res_key in resistances:
-            current = current_stats.get(res_key, 0)
-            target = target_stats.get(res_key, 75)  # 기본 목표 75%
+        return gaps
+
+    @staticmethod
+    def _stat_gap(stat_key: str, current_stats: Dict, target_stats: Dict) -> Optional[Dict]:
+        """스탯 하나의 Gap (목표에 도달했으면 None)"""
+        # 1. 저항 Gap (최우선)
+        if stat_key in RESISTANCE_NAMES:
+            current = current_stats.get(stat_key, 0)
+            target = target_stats.get(stat_key, 75)  # 기본 목표 75%
 
             if current < target:
-                gap = target - current
-                gaps.append({
+                return {
                     'priority': 1,
                     'category': 'Resistance',
-                    'stat': res_name,
+                    'stat': RESISTANCE_NAMES[stat_key],
+                    'stat_key': stat_key,
                     'current': current,
                     'target': target,
-                    'gap': gap,
+                    'gap': target - current,
                     'severity': 'critical' if current < 60 else 'high'
-                })
+                }
 
         # 2. DPS Gap
-        current_dps = current_stats.get('dps', 0)
-        target_dps = target_stats.get('dps', 0)
-
-        if target_dps - current_dps > 10000:
-            gaps.append({
-                'priority': 2,
-                'category': 'DPS',
-                'stat': 'Total DPS',
-                'current': current_dps,
-                'target': target_dps,
-                'gap': target_dps - current_dps,
-                'severity': 'high' if (target_dps - current_dps) > 100000 else 'medium'
-            })
+        elif stat_key == 'dps':
+            current_dps = current_stats.get('dps', 0)
+            target_dps = target_stats.get('dps', 0)
+
+            if target_dps - current_dps > 10000:
+                return {
+                    'priority': 2,
+                    'category': 'DPS',
+                    'stat': 'Total DPS',
+                    'stat_key': stat_key,
+                    'current': current_dps,
+                    'target': target_dps,
+                    'gap': target_dps - current_dps,
+                    'severity': 'high' if (target_dps - current_dps) > 100000 else 'medium'
+                }
 
         # 3. Life/ES Gap
-        current_life = current_stats.get('life', 0)
-        target_life = target_stats.get('life', 0)
-
-        if current_life > 1 and target_life - current_life > 500:  # CI 빌드 제외
-            gaps.append({
-                'priority': 3,
-                'category': 'Defense',
-                'stat': 'Life',
-                'current': current_life,
-                'target': target_life,
-                'gap': target_life - current_life,
-                'severity': 'medium'
-            })
-
-        current_es = current_stats.get('energy_shield', 0)
-        target_es = target_stats.get('energy_shield', 0)
-
-        if target_es - current_es > 500:
-            gaps.append({
-                'priority': 3,
-                'category': 'Defense',
-                'stat': 'Energy Shield',
-                'current': current_es,
-                'target': target_es,
-                'gap': target_es - current_es,
-                'severity': 'medium'
-            })
+        elif stat_key == 'life':
+            current_life = current_stats.get('life', 0)
+            target_life = target_stats.get('life', 0)
+
+            if current_life > 1 and target_life - current_life > 500:  # CI 빌드 제외
+                return {
+                    'priority': 3,
+                    'category': 'Defense',
+                    'stat': 'Life',
+                    'stat_key': stat_key,
+                    'current': current_life,
+                    'target': target_life,
+                    'gap': target_life - current_life,
+                    'severity': 'medium'
+                }
 
-        # 우선순위와 심각도로 정렬
-        severity_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-        gaps.sort(key=lambda x: (x['priority'], severity_order.get(x['severity'], 99)))
+        elif stat_key == 'energy_shield':
+            current_es = current_stats.get('energy_shield', 0)
+            target_es = target_stats.get('energy_shield', 0)
+
+            if target_es - current_es > 500:
+                return {
+                    'priority': 3,
+                    'category': 'Defense',
+                    'stat': 'Energy Shield',
+                    'stat_key': stat_key,
+                    'current': current_es,
+                    'target': target_es,
+                    'gap': target_es - current_es,
+                    'severity': 'medium'
+                }
 
-        return gaps
+        return None
 
     def generate_upgrade_steps(self, gaps: List[Dict], current_stats: Dict) -> List[Dict]:
         """Gap을 기반으로 단계별 업그레이드 계획 생성"""
@@ -303,6 +332,32 @@ class UpgradePathPlanner:
 
         print("=" * 80)
 
+    def plan_tracked(self, character_name: str, current_stats: Dict, target_stats: Dict) -> List[Dict]:
+        """스냅샷 히스토리 기준으로 바뀐 스탯의 Gap만 다시 계산
+
+        Gap이 이전과 같으면 저장된 업그레이드 단계를 그대로 사용한다.
+        """
+        from character_snapshots import get_snapshot_store, stats_key
+
+        store = get_snapshot_store()
+        target_key = stats_key({'target': target_stats, 'budget': self.budget_chaos})
+        previous, changed_stats, revision = store.incremental(character_name, "upgrade", target_key)
+
+        gaps = self.analyze_gaps(
+            current_stats, target_stats,
+            previous_gaps=previous['gaps'] if previous else None,
+            changed_stats=changed_stats
+        )
+        if previous and gaps == previous['gaps']:
+            self.upgrade_steps = previous['steps']
+        else:
+            self.generate_upgrade_steps(gaps, current_stats)
+
+        if revision:
+            store.save_analysis(character_name, "upgrade", target_key, revision,
+                                {'gaps': gaps, 'steps': self.upgrade_steps})
+        return self.upgrade_steps
+
     def export_json(self) -> Dict:
         """JSON 형식으로 출력 (UI 연동용)"""
         return {
@@ -326,6 +381,7 @@ def main():
     args = parser.parse_args()
 
     planner = UpgradePathPlanner(budget_chaos=args.budget)
+    snapshot = None
 
     # Market 데이터 로드
     if not args.json:
@@ -342,7 +398,7 @@ def main():
     if args.pob and args.character:
         # POB URL과 캐릭터 이름으로 비교 (compare_build.py 재사용)
         try:
-            from compare_build import get_current_character_stats, get_pob_target_stats
+            from compare_build import fetch_character_stats, get_pob_target_stats
             from poe_oauth import load_token
 
             if not args.json:
@@ -357,7 +413,7 @@ def main():
                     print("[ERROR] POE account not connected")
                 return
 
-            current_stats = get_current_character_stats(token_data['access_token'], args.character)
+            current_stats, snapshot = fetch_character_stats(token_data['access_token'], args.character)
             target_stats = get_pob_target_stats(args.pob, silent=args.json)
 
             if not current_stats or not target_stats:
@@ -409,16 +465,22 @@ def main():
             print("[INFO] Use --pob <url> --character <name> OR --current-file <file> --target-file <file> OR --mock")
         return
 
-    # Gap 분석
-    gaps = planner.analyze_gaps(current_stats, target_stats)
+    if snapshot:
+        # 마지막 확인 이후 바뀐 스탯만 다시 분석
+        planner.plan_tracked(args.character, current_stats, target_stats)
+    else:
+        # Gap 분석
+        gaps = planner.analyze_gaps(current_stats, target_stats)
 
-    # 업그레이드 경로 생성
-    steps = planner.generate_upgrade_steps(gaps, current_stats)
+        # 업그레이드 경로 생성
+        steps = planner.generate_upgrade_steps(gaps, current_stats)
 
     # 출력
     if args.json:
         # JSON 모드
         result = planner.export_json()
+        if snapshot:
+            result['changes'] = snapshot.get('changes')
         print(json.dumps(result, ensure_ascii=False, indent=2))
     else:
         # 텍스트 모드
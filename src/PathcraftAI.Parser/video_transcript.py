@@ -3,14 +3,21 @@ Video Content Extraction Module with 3-Stage Fallback
 Priority: 1 (YouTube Transcript API) -> 2 (Description) -> 3 (Whisper)
 
 GGG always provides English subtitles, so success rate is ~99%
+
+Extraction results are cached in a SQLite transcript store keyed by video ID,
+so already-seen videos never hit the network again.
 """
 
 import os
 import re
-from typing import Optional, Dict, Any
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
-from googleapiclient.discovery import build
+from youtube_client import get_youtube_client, QuotaExhausted
 import logging
 
 # Configure logging
@@ -20,6 +27,102 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+TRANSCRIPT_DB_PATH = os.path.join(os.path.dirname(__file__), "video_transcripts.db")
+
+# Failed extractions are retried after this long (successes never expire)
+FAILURE_RETRY_HOURS = 6
+
+
+class TranscriptStore:
+    """
+    Video transcript cache (SQLite, keyed by video ID)
+
+    Stores the extracted content together with the extraction method and
+    fetch time. Safe to share between worker threads.
+    """
+
+    def __init__(self, db_path: str = TRANSCRIPT_DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS transcripts (
+                video_id TEXT PRIMARY KEY,
+                success INTEGER NOT NULL,
+                content TEXT,
+                method TEXT,
+                error TEXT,
+                fetched_at TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result, or None if missing or a stale failure"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT success, content, method, error, fetched_at FROM transcripts WHERE video_id = ?",
+                (video_id,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        success, content, method, error, fetched_at = row
+        if not success:
+            fetched = datetime.fromisoformat(fetched_at)
+            if fetched.tzinfo is None:
+                # Entries written before timestamps carried an offset were naive UTC
+                fetched = fetched.replace(tzinfo=timezone.utc)
+            if datetime.now(timezone.utc) >= fetched + timedelta(hours=FAILURE_RETRY_HOURS):
+                return None
+
+        return {
+            'success': bool(success),
+            'content': content,
+            'method': method,
+            'video_id': video_id,
+            'error': error,
+            'fetched_at': fetched_at,
+            'cached': True
+        }
+
+    def put(self, result: Dict[str, Any]):
+        """Store an extraction result (overwrites any previous entry)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transcripts (video_id, success, content, method, error, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    result['video_id'],
+                    1 if result['success'] else 0,
+                    result.get('content'),
+                    result.get('method'),
+                    result.get('error'),
+                    result['fetched_at']
+                )
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_store: Optional[TranscriptStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_transcript_store() -> TranscriptStore:
+    """Shared process-wide transcript store"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = TranscriptStore()
+        return _default_store
+
 
 def extract_video_id(url: str) -> Optional[str]:
     """
@@ -98,36 +201,49 @@ def get_description_stage2(video_id: str, api_key: Optional[str] = None) -> Opti
     Returns:
         Description text or None if failed
     """
-    try:
-        logger.info(f"[Stage 2] Attempting video description extraction for {video_id}")
+    logger.info(f"[Stage 2] Attempting video description extraction for {video_id}")
+    return get_descriptions_stage2_batch([video_id], api_key).get(video_id)
 
-        if not api_key:
-            api_key = os.environ.get('YOUTUBE_API_KEY')
 
-        if not api_key:
-            logger.warning("[Stage 2] ❌ No YouTube API key provided")
-            return None
+def get_descriptions_stage2_batch(video_ids: List[str], api_key: Optional[str] = None) -> Dict[str, str]:
+    """
+    Stage 2 (batched): fetch descriptions for many videos at once
 
-        youtube = build('youtube', 'v3', developerKey=api_key)
+    Goes through the shared quota-tracked YouTube client: one videos.list unit
+    per 50 IDs, drawn from the background quota share.
 
-        request = youtube.videos().list(
-            part='snippet',
-            id=video_id
-        )
-        response = request.execute()
+    Args:
+        video_ids: YouTube video IDs
+        api_key: YouTube Data API v3 key (optional, uses env var if not provided)
 
-        if not response.get('items'):
-            logger.warning(f"[Stage 2] ❌ No video found for ID {video_id}")
-            return None
+    Returns:
+        Dict of video_id -> description (videos without a description are omitted)
+    """
+    if not video_ids:
+        return {}
 
-        description = response['items'][0]['snippet']['description']
+    client = get_youtube_client(api_key)
+    if not client.available:
+        logger.warning("[Stage 2] ❌ No YouTube API key provided")
+        return {}
 
-        logger.info(f"[Stage 2] ✅ SUCCESS - Description length: {len(description)} chars")
-        return description
+    descriptions = {}
+    try:
+        videos = client.video_details(video_ids, background=True)
+
+        for video_id, item in videos.items():
+            description = item['snippet'].get('description')
+            if description:
+                descriptions[video_id] = description
+
+        logger.info(f"[Stage 2] ✅ Descriptions fetched for {len(descriptions)}/{len(video_ids)} videos")
 
+    except QuotaExhausted as e:
+        logger.warning(f"[Stage 2] ❌ YouTube quota exhausted: {e}")
     except Exception as e:
-        logger.error(f"[Stage 2] ❌ Error: {str(e)}")
-        return None
+        logger.error(f"[Stage 2] ❌ Batch error: {str(e)}")
+
+    return descriptions
 
 
 def get_whisper_stage3(video_id: str, api_key: Optional[str] = None) -> Optional[str]:
@@ -162,10 +278,112 @@ def get_whisper_stage3(video_id: str, api_key: Optional[str] = None) -> Optional
         return None
 
 
+def _make_result(
+    video_id: Optional[str],
+    content: Optional[str],
+    method: Optional[str],
+    error: Optional[str] = None
+) -> Dict[str, Any]:
+    return {
+        'success': content is not None,
+        'content': content,
+        'method': method,
+        'video_id': video_id,
+        'error': error,
+        'fetched_at': datetime.now(timezone.utc).isoformat(),
+        'cached': False
+    }
+
+
+def extract_video_contents(
+    video_urls: List[str],
+    youtube_api_key: Optional[str] = None,
+    openai_api_key: Optional[str] = None,
+    max_workers: int = 4,
+    store: Optional[TranscriptStore] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract content for many videos concurrently
+
+    Cached videos are answered from the transcript store without network
+    access. For the rest, Stage 1 runs first (one transcript request per
+    video, in a thread pool); Stage 2 (one batched description request)
+    covers only the videos Stage 1 could not, and Stage 3 only the videos
+    where both failed.
+
+    Args:
+        video_urls: YouTube video URLs
+        youtube_api_key: YouTube Data API v3 key (optional)
+        openai_api_key: OpenAI API key for Whisper (optional)
+        max_workers: Concurrent Stage 1 / Stage 3 requests
+        store: Transcript store (defaults to the shared store)
+
+    Returns:
+        Dict of video_url -> result (same shape as extract_video_content)
+    """
+    if store is None:
+        store = get_transcript_store()
+
+    results: Dict[str, Dict[str, Any]] = {}
+    pending: Dict[str, List[str]] = {}  # video_id -> urls
+
+    for url in video_urls:
+        video_id = extract_video_id(url)
+        if not video_id:
+            results[url] = _make_result(None, None, None, 'Invalid YouTube URL')
+            continue
+
+        cached = store.get(video_id)
+        if cached:
+            results[url] = cached
+        else:
+            pending.setdefault(video_id, []).append(url)
+
+    if not pending:
+        return results
+
+    video_ids = list(pending)
+    logger.info(f"Extracting content for {len(video_ids)} videos ({len(results)} cached)")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        transcripts = dict(zip(video_ids, executor.map(get_transcript_stage1, video_ids)))
+
+        # Stage 2 only for videos without a transcript (GGG videos almost always have one)
+        missing = [video_id for video_id in video_ids if not transcripts.get(video_id)]
+        descriptions = get_descriptions_stage2_batch(missing, youtube_api_key) if missing else {}
+
+        extracted: Dict[str, Dict[str, Any]] = {}
+        failed = []
+        for video_id in video_ids:
+            if transcripts.get(video_id):
+                extracted[video_id] = _make_result(video_id, transcripts[video_id], 'stage1_transcript')
+            elif descriptions.get(video_id):
+                extracted[video_id] = _make_result(video_id, descriptions[video_id], 'stage2_description')
+            else:
+                failed.append(video_id)
+
+        # Stage 3: Whisper Fallback (최후의 수단)
+        whisper = executor.map(lambda vid: get_whisper_stage3(vid, openai_api_key), failed)
+        for video_id, content in zip(failed, whisper):
+            if content:
+                extracted[video_id] = _make_result(video_id, content, 'stage3_whisper')
+            else:
+                logger.error(f"❌ ALL STAGES FAILED for video {video_id}")
+                extracted[video_id] = _make_result(video_id, None, None, 'All extraction methods failed')
+
+    for video_id, result in extracted.items():
+        store.put(result)
+        for url in pending[video_id]:
+            results[url] = result
+
+    return results
+
+
 def extract_video_content(
     video_url: str,
     youtube_api_key: Optional[str] = None,
-    openai_api_key: Optional[str] = None
+    openai_api_key: Optional[str] = None,
+    store: Optional[TranscriptStore] = None
 ) -> Dict[str, Any]:
     """
     Extract video content with 3-stage fallback strategy
@@ -174,6 +392,7 @@ def extract_video_content(
         video_url: YouTube video URL
         youtube_api_key: YouTube Data API v3 key (optional)
         openai_api_key: OpenAI API key for Whisper (optional)
+        store: Transcript store (defaults to the shared store)
 
     Returns:
         Dict with:
@@ -182,62 +401,10 @@ def extract_video_content(
             - method: str (stage1_transcript | stage2_description | stage3_whisper)
             - video_id: str
             - error: str (if failed)
+            - fetched_at: str (UTC ISO timestamp of the extraction)
+            - cached: bool (True if served from the transcript store)
     """
-    video_id = extract_video_id(video_url)
-
-    if not video_id:
-        return {
-            'success': False,
-            'content': None,
-            'method': None,
-            'video_id': None,
-            'error': 'Invalid YouTube URL'
-        }
-
-    logger.info(f"Extracting content for video: {video_id}")
-
-    # Stage 1: YouTube Transcript API (99% success for GGG)
-    content = get_transcript_stage1(video_id)
-    if content:
-        return {
-            'success': True,
-            'content': content,
-            'method': 'stage1_transcript',
-            'video_id': video_id,
-            'error': None
-        }
-
-    # Stage 2: Video Description Fallback
-    content = get_description_stage2(video_id, youtube_api_key)
-    if content:
-        return {
-            'success': True,
-            'content': content,
-            'method': 'stage2_description',
-            'video_id': video_id,
-            'error': None
-        }
-
-    # Stage 3: Whisper Fallback (최후의 수단)
-    content = get_whisper_stage3(video_id, openai_api_key)
-    if content:
-        return {
-            'success': True,
-            'content': content,
-            'method': 'stage3_whisper',
-            'video_id': video_id,
-            'error': None
-        }
-
-    # All stages failed (extremely rare)
-    logger.error(f"❌ ALL STAGES FAILED for video {video_id}")
-    return {
-        'success': False,
-        'content': None,
-        'method': None,
-        'video_id': video_id,
-        'error': 'All extraction methods failed'
-    }
+    return extract_video_contents([video_url], youtube_api_key, openai_api_key, store=store)[video_url]
 
 
 def main():
@@ -259,6 +426,7 @@ def main():
     print(f"Success: {result['success']}")
     print(f"Video ID: {result['video_id']}")
     print(f"Method: {result['method']}")
+    print(f"Fetched: {result['fetched_at']} ({'cached' if result['cached'] else 'fresh'})")
 
     if result['success']:
         content_preview = result['content'][:500] + "..." if len(result['content']) > 500 else result['content']
@@ -89,6 +89,130 @@ def save_to_cache(keyword: str, league_version: str, builds: List[Dict]):
     except Exception as e:
         print(f"[CACHE] Error saving cache: {e}")
 
+def _search_items_file(keyword: str, league_version: str) -> str:
+    """영상 상세 조회 전 검색 결과 임시 캐시 경로"""
+    cache_dir = os.path.join(os.path.dirname(__file__), "build_data", "youtube_cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    safe_keyword = re.sub(r'[^\w\s-]', '', keyword).strip().replace(' ', '_')
+    return os.path.join(cache_dir, f"{safe_keyword}_{league_version}.search.json")
+
+
+def load_search_items(keyword: str, league_version: str) -> Optional[List[Dict]]:
+    """
+    상세 조회를 못 한 검색 결과 (24시간 유효)
+
+    검색(100 units)은 했지만 할당량이 모자라 영상 상세를 못 가져온 키워드는
+    다음 실행에서 검색 없이 상세 조회만 한다.
+    """
+    path = _search_items_file(keyword, league_version)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if (datetime.now() - datetime.fromisoformat(data['cached_at'])).total_seconds() > 24 * 3600:
+            return None
+        return data['items']
+    except Exception as e:
+        print(f"[CACHE] Error loading search items: {e}")
+        return None
+
+
+def save_search_items(keyword: str, league_version: str, items: List[Dict]):
+    try:
+        with open(_search_items_file(keyword, league_version), 'w', encoding='utf-8') as f:
+            json.dump({'keyword': keyword, 'cached_at': datetime.now().isoformat(), 'items': items},
+                      f, ensure_ascii=False)
+    except Exception as e:
+        print(f"[CACHE] Error saving search items: {e}")
+
+
+def clear_search_items(keyword: str, league_version: str):
+    path = _search_items_file(keyword, league_version)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def search_query(keyword: str, league_version: str) -> str:
+    """키워드 -> YouTube 검색어"""
+    return f"poe {league_version} {keyword} build guide"
+
+
+def builds_from_search(search_items: List[Dict], videos: Dict[str, Dict]) -> List[Dict]:
+    """
+    검색 결과 + 영상 상세 -> POB 링크가 있는 빌드 목록
+
+    Args:
+        search_items: search.list 항목
+        videos: 영상 ID -> videos.list 항목 (YouTubeClient.video_details)
+    """
+    builds = []
+
+    for item in search_items:
+        video_id = item['id']['videoId']
+        snippet = item['snippet']
+
+        video_data = videos.get(video_id)
+        if not video_data:
+            continue
+
+        description = video_data['snippet']['description']
+        statistics = video_data['statistics']
+
+        # POB 링크 추출
+        pob_links = extract_pob_links(description)
+
+        if pob_links:
+            # 썸네일 URL 추출 (medium: 320x180)
+            thumbnails = video_data['snippet'].get('thumbnails', {})
+            thumbnail_url = (
+                thumbnails.get('medium', {}).get('url') or
+                thumbnails.get('default', {}).get('url') or
+                f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg"
+            )
+
+            build = {
+                'video_id': video_id,
+                'title': snippet['title'],
+                'channel': snippet['channelTitle'],
+                'published_at': snippet['publishedAt'],
+                'url': f"https://www.youtube.com/watch?v={video_id}",
+                'thumbnail': thumbnail_url,
+                'views': int(statistics.get('viewCount', 0)),
+                'likes': int(statistics.get('likeCount', 0)),
+                'pob_links': pob_links,
+                'description_snippet': description[:500],
+                'source': 'youtube'
+            }
+            builds.append(build)
+
+            print(f"[FOUND] {snippet['title'][:60]}...")
+            print(f"        Channel: {snippet['channelTitle']}")
+            print(f"        POB Links: {len(pob_links)}")
+            print()
+
+    return builds
+
+
+def _get_client(api_key: Optional[str]):
+    """YouTube 클라이언트 (API 키/라이브러리 없으면 None)"""
+    from youtube_client import get_youtube_client, GOOGLE_API_AVAILABLE
+
+    client = get_youtube_client(api_key)
+    if not client.api_key:
+        print("[ERROR] YOUTUBE_API_KEY not found")
+        print("[INFO] Please set YOUTUBE_API_KEY environment variable")
+        print("[INFO] Get your API key from: https://console.cloud.google.com/apis/credentials")
+        return None
+
+    if not GOOGLE_API_AVAILABLE:
+        print("[ERROR] google-api-python-client not installed")
+        print("[INFO] Run: pip install google-api-python-client")
+        return None
+
+    return client
+
+
 def search_youtube_builds(
     keyword: str,
     league_version: str = "3.27",
@@ -126,91 +250,25 @@ def search_youtube_builds(
             return cached[:max_results]
 
     # API 키 확인 (인자 > 환경변수 > .env)
-    if api_key is None:
-        api_key = os.environ.get('YOUTUBE_API_KEY')
-
-    if not api_key:
-        print("[ERROR] YOUTUBE_API_KEY not found")
-        print("[INFO] Please set YOUTUBE_API_KEY environment variable")
-        print("[INFO] Get your API key from: https://console.cloud.google.com/apis/credentials")
-        return []
-
-    try:
-        from googleapiclient.discovery import build
-    except ImportError:
-        print("[ERROR] google-api-python-client not installed")
-        print("[INFO] Run: pip install google-api-python-client")
+    client = _get_client(api_key)
+    if client is None:
         return []
 
     try:
-        # YouTube API 클라이언트 생성
-        youtube = build('youtube', 'v3', developerKey=api_key)
-
-        # 검색 쿼리
-        search_query = f"poe {league_version} {keyword} build guide"
-
-        print(f"[INFO] Searching YouTube for: {search_query}")
+        query = search_query(keyword, league_version)
+        print(f"[INFO] Searching YouTube for: {query}")
 
-        # 검색 실행
-        search_response = youtube.search().list(
-            q=search_query,
-            part='id,snippet',
-            maxResults=max_results,
+        search_items = client.search(
+            query,
+            max_results=max_results,
             type='video',
             order='relevance',
             relevanceLanguage='en'
-        ).execute()
-
-        builds = []
-
-        for item in search_response.get('items', []):
-            video_id = item['id']['videoId']
-            snippet = item['snippet']
-
-            # 비디오 상세 정보 가져오기 (description 포함)
-            video_response = youtube.videos().list(
-                part='snippet,statistics',
-                id=video_id
-            ).execute()
-
-            if not video_response.get('items'):
-                continue
-
-            video_data = video_response['items'][0]
-            description = video_data['snippet']['description']
-            statistics = video_data['statistics']
-
-            # POB 링크 추출
-            pob_links = extract_pob_links(description)
-
-            if pob_links:
-                # 썸네일 URL 추출 (medium: 320x180)
-                thumbnails = video_data['snippet'].get('thumbnails', {})
-                thumbnail_url = (
-                    thumbnails.get('medium', {}).get('url') or
-                    thumbnails.get('default', {}).get('url') or
-                    f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg"
-                )
-
-                build = {
-                    'video_id': video_id,
-                    'title': snippet['title'],
-                    'channel': snippet['channelTitle'],
-                    'published_at': snippet['publishedAt'],
-                    'url': f"https://www.youtube.com/watch?v={video_id}",
-                    'thumbnail': thumbnail_url,
-                    'views': int(statistics.get('viewCount', 0)),
-                    'likes': int(statistics.get('likeCount', 0)),
-                    'pob_links': pob_links,
-                    'description_snippet': description[:500],
-                    'source': 'youtube'
-                }
-                builds.append(build)
-
-                print(f"[FOUND] {snippet['title'][:60]}...")
-                print(f"        Channel: {snippet['channelTitle']}")
-                print(f"        POB Links: {len(pob_links)}")
-                print()
+        )
+
+        # 비디오 상세 정보 (description 포함) - 검색 결과 전체를 한 번에 조회
+        videos = client.video_details([item['id']['videoId'] for item in search_items])
+        builds = builds_from_search(search_items, videos)
 
         print(f"[OK] Found {len(builds)} videos with POB links")
 
@@ -225,6 +283,99 @@ def search_youtube_builds(
         return []
 
 
+def collect_youtube_builds(
+    keywords: List[str],
+    league_version: str = "3.27",
+    max_results: int = 10,
+    api_key: Optional[str] = None,
+    use_cache: bool = True
+) -> Dict[str, List[Dict]]:
+    """
+    여러 키워드의 YouTube 빌드를 한 번에 수집 (백그라운드 갱신용)
+
+    캐시가 유효한 키워드는 건너뛰고, 나머지 검색은 배치 요청 하나로 보낸 뒤
+    모든 검색 결과의 영상 상세를 50개씩 묶어 조회한다. 백그라운드 할당량이 모자라면
+    남은 키워드는 결과에서 빠지고 다음 실행에서 수집된다.
+    검색 결과는 상세 조회 전에 저장해 두므로, 상세 조회가 할당량에 막혀도
+    다음 실행에서 검색을 다시 하지 않는다.
+
+    Returns:
+        키워드 -> 빌드 리스트
+    """
+    results = {}
+    pending = []
+    for keyword in dict.fromkeys(keywords):
+        # 빈 결과도 캐시로 인정 (같은 날 같은 검색에 100 units를 다시 쓰지 않음)
+        cached = load_from_cache(keyword, league_version) if use_cache else None
+        if cached is not None:
+            results[keyword] = cached[:max_results]
+        else:
+            pending.append(keyword)
+
+    print(f"[INFO] YouTube keywords: {len(results)} cached, {len(pending)} to search")
+    if not pending:
+        return results
+
+    client = _get_client(api_key)
+    if client is None:
+        return results
+
+    from youtube_client import QuotaExhausted
+
+    # 1. 검색 (이전 실행에서 검색만 하고 상세를 못 가져온 키워드는 저장된 결과 사용)
+    searched = {}
+    for keyword in pending:
+        items = load_search_items(keyword, league_version)
+        if items is not None:
+            searched[keyword] = items[:max_results]
+
+    queries = {keyword: search_query(keyword, league_version) for keyword in pending if keyword not in searched}
+    try:
+        search_results = client.search_many(
+            list(queries.values()),
+            max_results=max_results,
+            background=True,
+            type='video',
+            order='relevance',
+            relevanceLanguage='en'
+        ) if queries else {}
+    except Exception as e:
+        print(f"[ERROR] YouTube search failed: {e}")
+        search_results = {}
+
+    for keyword, query in queries.items():
+        if query in search_results:
+            searched[keyword] = search_results[query]
+            save_search_items(keyword, league_version, search_results[query])
+
+    # 2. 영상 상세 (50개씩 1 unit)
+    video_ids = [item['id']['videoId'] for items in searched.values() for item in items]
+    try:
+        videos = client.video_details(video_ids, background=True) if video_ids else {}
+    except QuotaExhausted as e:
+        print(f"[WARN] Video details deferred to the next run ({len(searched)} keywords searched): {e}")
+        videos = None
+    except Exception as e:
+        print(f"[ERROR] YouTube video details failed: {e}")
+        videos = None
+
+    if videos is not None:
+        for keyword, items in searched.items():
+            builds = builds_from_search(items, videos)
+            results[keyword] = builds
+            clear_search_items(keyword, league_version)
+            if use_cache:
+                save_to_cache(keyword, league_version, builds)
+
+    deferred = [keyword for keyword in pending if keyword not in results]
+    if deferred:
+        print(f"[WARN] Deferred {len(deferred)} keywords to the next run: {', '.join(deferred)}")
+
+    quota = client.quota.summary()
+    print(f"[INFO] YouTube quota used today: {quota['units']:,} units (remaining {quota['remaining']:,})")
+    return results
+
+
 def extract_pob_links(text: str) -> List[str]:
     """
     텍스트에서 POB 링크 추출
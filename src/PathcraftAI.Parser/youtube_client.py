@@ -0,0 +1,468 @@
+# -*- coding: utf-8 -*-
+"""
+YouTube Client
+YouTube Data API v3 공용 접근 계층 (일일 할당량 추적, 배치 조회, 채널 ID 메모)
+
+- 영상 상세(videos.list)는 ID 50개씩 한 번에 조회하고 프로세스 안에서 재사용
+- 여러 검색/조회 요청은 배치 HTTP 요청 하나로 묶어 왕복 횟수를 줄임
+- 채널 이름 -> 채널 ID (search.list, 100 units)와 업로드 재생목록 ID는
+  build_data/youtube_channels.json에 영구 저장 (찾지 못한 채널은 CHANNEL_MISS_TTL 동안만 기억)
+- 사용한 할당량은 build_data/youtube_quota.json에 기록 (태평양 시간 자정 초기화)
+
+할당량 배분:
+    INTERACTIVE_RESERVE는 사용자 요청(빌드 검색 등) 몫으로 남겨둔다.
+    백그라운드 갱신(키워드 일괄 수집, 스트리머 데이터 수집)은 하루를 REFRESH_WINDOWS 구간으로 나눠
+    현재 구간까지의 누적 한도만 사용하고, 넘는 작업은 다음 실행으로 미룬다.
+
+사용 예:
+    from youtube_client import get_youtube_client
+    client = get_youtube_client()
+    results = client.search_many(["poe 3.27 Righteous Fire build guide"], max_results=5, background=True)
+    videos = client.video_details(video_ids)
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+# .env 파일 지원
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+try:
+    from googleapiclient.discovery import build as build_service
+    GOOGLE_API_AVAILABLE = True
+except ImportError:
+    GOOGLE_API_AVAILABLE = False
+
+BUILD_DATA_DIR = os.path.join(os.path.dirname(__file__), "build_data")
+QUOTA_FILE = os.path.join(BUILD_DATA_DIR, "youtube_quota.json")
+CHANNELS_FILE = os.path.join(BUILD_DATA_DIR, "youtube_channels.json")
+
+# 요청당 할당량 단위 (https://developers.google.com/youtube/v3/determine_quota_cost)
+QUOTA_COSTS = {
+    'search': 100,
+    'videos': 1,
+    'channels': 1,
+    'playlistItems': 1
+}
+DAILY_QUOTA = 10000
+INTERACTIVE_RESERVE = 2000
+REFRESH_WINDOWS = 4
+
+MAX_IDS_PER_CALL = 50
+MAX_BATCH_REQUESTS = 50
+VIDEO_CACHE_TTL = 3600
+CHANNEL_MISS_TTL = 7 * 86400  # 찾지 못한 채널 이름은 이 기간 뒤 다시 검색
+
+
+class QuotaExhausted(Exception):
+    """오늘 할당량(또는 백그라운드 몫)을 다 썼음"""
+
+
+def quota_day(now: Optional[datetime] = None) -> Tuple[str, float]:
+    """할당량 기준 날짜(태평양 시간)와 하루 중 경과 비율"""
+    try:
+        from zoneinfo import ZoneInfo
+        tz = ZoneInfo("America/Los_Angeles")
+    except Exception:
+        tz = timezone(timedelta(hours=-8))
+
+    local = (now or datetime.now(timezone.utc)).astimezone(tz)
+    elapsed = (local.hour * 3600 + local.minute * 60 + local.second) / 86400
+    return local.strftime('%Y-%m-%d'), elapsed
+
+
+def _write_json(path: str, data: Dict) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+class QuotaTracker:
+    """일일 할당량 사용량 (여러 프로세스가 같은 파일을 공유)"""
+
+    def __init__(self, path: str = QUOTA_FILE, daily_limit: int = DAILY_QUOTA, reserve: int = INTERACTIVE_RESERVE):
+        self.path = path
+        self.daily_limit = daily_limit
+        self.reserve = reserve
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict:
+        day, _ = quota_day()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('date') == day:
+                return state
+        except (OSError, ValueError):
+            pass
+        return {'date': day, 'units': 0, 'calls': {}}
+
+    @property
+    def used(self) -> int:
+        return self._load()['units']
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.daily_limit - self.used)
+
+    def background_allowance(self) -> int:
+        """지금 백그라운드 작업이 더 쓸 수 있는 단위 수"""
+        _, elapsed = quota_day()
+        window = min(int(elapsed * REFRESH_WINDOWS), REFRESH_WINDOWS - 1)
+        cap = (self.daily_limit - self.reserve) * (window + 1) // REFRESH_WINDOWS
+        return max(0, cap - self.used)
+
+    def available(self, background: bool = False) -> int:
+        return self.background_allowance() if background else self.remaining
+
+    def spend(self, resource: str, calls: int = 1) -> None:
+        with self._lock:
+            state = self._load()
+            state['units'] += QUOTA_COSTS[resource] * calls
+            state['calls'][resource] = state['calls'].get(resource, 0) + calls
+            _write_json(self.path, state)
+
+    def exhaust(self) -> None:
+        """API가 quotaExceeded를 돌려주면 오늘 남은 할당량을 0으로 기록"""
+        with self._lock:
+            state = self._load()
+            state['units'] = max(state['units'], self.daily_limit)
+            _write_json(self.path, state)
+
+    def summary(self) -> Dict:
+        state = self._load()
+        return {
+            'date': state['date'],
+            'units': state['units'],
+            'remaining': max(0, self.daily_limit - state['units']),
+            'background_allowance': self.background_allowance(),
+            'calls': dict(state['calls'])
+        }
+
+
+def _is_quota_error(error: Exception) -> bool:
+    message = str(error)
+    return 'quotaExceeded' in message or 'dailyLimitExceeded' in message
+
+
+class YouTubeClient:
+    """YouTube Data API 래퍼 (모든 호출이 할당량에 기록됨)"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        service=None,
+        quota: Optional[QuotaTracker] = None,
+        channels_path: str = CHANNELS_FILE
+    ):
+        self.api_key = api_key or os.environ.get('YOUTUBE_API_KEY')
+        self.quota = quota or get_quota_tracker()
+        self.channels_path = channels_path
+        self._service = service
+        self._channels = self._load_channels()
+        self._videos: Dict[str, Tuple[float, Dict]] = {}
+        self._channel_details: Dict[str, Dict] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def available(self) -> bool:
+        return self._service is not None or (bool(self.api_key) and GOOGLE_API_AVAILABLE)
+
+    @property
+    def service(self):
+        if self._service is None:
+            if not self.api_key:
+                raise RuntimeError("YOUTUBE_API_KEY not found")
+            if not GOOGLE_API_AVAILABLE:
+                raise RuntimeError("google-api-python-client not installed")
+            self._service = build_service('youtube', 'v3', developerKey=self.api_key, cache_discovery=False)
+        return self._service
+
+    # ------------------------------------------------------------------
+    # 실행 (할당량 확인 + 배치)
+    # ------------------------------------------------------------------
+
+    def _execute(self, resource: str, request, background: bool = False) -> Dict:
+        return self._execute_many(resource, [request], background)[0] or {}
+
+    def _execute_many(self, resource: str, requests: List, background: bool = False) -> List[Optional[Dict]]:
+        """
+        같은 종류의 요청 여러 개를 배치 HTTP 요청으로 실행
+
+        Returns:
+            요청 순서대로 응답 (실패한 요청은 None)
+
+        Raises:
+            QuotaExhausted: 요청 전체를 실행할 할당량이 없음
+        """
+        if not requests:
+            return []
+
+        units = QUOTA_COSTS[resource] * len(requests)
+        if units > self.quota.available(background):
+            raise QuotaExhausted(f"YouTube quota: {units} units needed for {resource}, "
+                                 f"{self.quota.available(background)} available")
+
+        responses: List[Optional[Dict]] = [None] * len(requests)
+        errors: List[Exception] = []
+
+        with self._lock:
+            self.quota.spend(resource, len(requests))
+
+            if len(requests) == 1 or not hasattr(self.service, 'new_batch_http_request'):
+                for index, request in enumerate(requests):
+                    try:
+                        responses[index] = request.execute()
+                    except Exception as e:
+                        errors.append(e)
+            else:
+                def callback(request_id, response, exception):
+                    if exception is not None:
+                        errors.append(exception)
+                    else:
+                        responses[int(request_id)] = response
+
+                for start in range(0, len(requests), MAX_BATCH_REQUESTS):
+                    batch = self.service.new_batch_http_request(callback=callback)
+                    for offset, request in enumerate(requests[start:start + MAX_BATCH_REQUESTS]):
+                        batch.add(request, request_id=str(start + offset))
+                    batch.execute()
+
+        for error in errors:
+            if _is_quota_error(error):
+                self.quota.exhaust()
+                raise QuotaExhausted(str(error))
+        if errors:
+            if len(errors) == len(requests):
+                raise errors[0]
+            print(f"[WARN] {len(errors)}/{len(requests)} YouTube {resource} requests failed: {errors[0]}", file=sys.stderr)
+        return responses
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, max_results: int = 10, background: bool = False, **params) -> List[Dict]:
+        """search.list (100 units) -> 검색 결과 항목"""
+        request = self.service.search().list(q=query, part='id,snippet', maxResults=max_results, **params)
+        return self._execute('search', request, background).get('items', [])
+
+    def search_many(self, queries: List[str], max_results: int = 10, background: bool = True, **params) -> Dict[str, List[Dict]]:
+        """
+        여러 검색어를 한 번의 배치 요청으로 검색
+
+        할당량이 모자라면 앞에서부터 가능한 만큼만 검색하고 나머지는 결과에서 빠진다
+        (다음 실행에서 다시 시도).
+
+        Returns:
+            검색어 -> 검색 결과 항목
+        """
+        unique = list(dict.fromkeys(queries))
+        affordable = min(len(unique), self.quota.available(background) // QUOTA_COSTS['search'])
+        if affordable < len(unique):
+            print(f"[WARN] YouTube quota allows {affordable}/{len(unique)} searches now, "
+                  f"deferring {len(unique) - affordable}", file=sys.stderr)
+        if affordable == 0:
+            return {}
+
+        scheduled = unique[:affordable]
+        requests = [
+            self.service.search().list(q=query, part='id,snippet', maxResults=max_results, **params)
+            for query in scheduled
+        ]
+        responses = self._execute_many('search', requests, background)
+        return {
+            query: response.get('items', [])
+            for query, response in zip(scheduled, responses)
+            if response is not None
+        }
+
+    # ------------------------------------------------------------------
+    # 영상
+    # ------------------------------------------------------------------
+
+    def video_details(self, video_ids: List[str], background: bool = False) -> Dict[str, Dict]:
+        """
+        영상 상세 (snippet, statistics) - ID 50개당 1 unit
+
+        Returns:
+            영상 ID -> videos.list 항목 (삭제/비공개 영상은 빠짐)
+        """
+        now = time.time()
+        details = {}
+        missing = []
+        for video_id in dict.fromkeys(video_ids):
+            cached = self._videos.get(video_id)
+            if cached and now - cached[0] < VIDEO_CACHE_TTL:
+                details[video_id] = cached[1]
+            else:
+                missing.append(video_id)
+
+        if missing:
+            requests = [
+                self.service.videos().list(
+                    part='snippet,statistics',
+                    id=','.join(missing[start:start + MAX_IDS_PER_CALL]),
+                    maxResults=MAX_IDS_PER_CALL
+                )
+                for start in range(0, len(missing), MAX_IDS_PER_CALL)
+            ]
+            for response in self._execute_many('videos', requests, background):
+                for item in (response or {}).get('items', []):
+                    self._videos[item['id']] = (now, item)
+                    details[item['id']] = item
+
+        return details
+
+    # ------------------------------------------------------------------
+    # 채널
+    # ------------------------------------------------------------------
+
+    def _load_channels(self) -> Dict:
+        try:
+            with open(self.channels_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # 이전 형식은 찾지 못한 채널을 None으로 영구 저장했으므로 버림
+            names = {key: cid for key, cid in data.get('names', {}).items() if cid}
+            return {'names': names, 'uploads': data.get('uploads', {}), 'missing': data.get('missing', {})}
+        except (OSError, ValueError):
+            return {'names': {}, 'uploads': {}, 'missing': {}}
+
+    def _save_channels(self) -> None:
+        _write_json(self.channels_path, self._channels)
+
+    def resolve_channel_id(self, channel_name: str, background: bool = False) -> Optional[str]:
+        """채널 이름 -> 채널 ID (찾으면 영구 저장, 없는 채널은 CHANNEL_MISS_TTL 동안만 기록)"""
+        key = channel_name.strip().lower()
+        if key in self._channels['names']:
+            return self._channels['names'][key]
+        missed_at = self._channels['missing'].get(key)
+        if missed_at and time.time() - missed_at < CHANNEL_MISS_TTL:
+            return None
+
+        items = self.search(channel_name, max_results=1, background=background, type='channel')
+        channel_id = items[0]['snippet']['channelId'] if items else None
+
+        with self._lock:
+            if channel_id:
+                self._channels['names'][key] = channel_id
+                self._channels['missing'].pop(key, None)
+            else:
+                self._channels['missing'][key] = time.time()
+            self._save_channels()
+        return channel_id
+
+    def channel_details(self, channel_ids: List[str], background: bool = False) -> Dict[str, Dict]:
+        """
+        채널 상세 (snippet, statistics, contentDetails) - ID 50개당 1 unit
+
+        Returns:
+            채널 ID -> channels.list 항목
+        """
+        missing = [cid for cid in dict.fromkeys(channel_ids) if cid not in self._channel_details]
+        if missing:
+            requests = [
+                self.service.channels().list(
+                    part='snippet,statistics,contentDetails',
+                    id=','.join(missing[start:start + MAX_IDS_PER_CALL]),
+                    maxResults=MAX_IDS_PER_CALL
+                )
+                for start in range(0, len(missing), MAX_IDS_PER_CALL)
+            ]
+            uploads_changed = False
+            for response in self._execute_many('channels', requests, background):
+                for item in (response or {}).get('items', []):
+                    self._channel_details[item['id']] = item
+                    uploads = item.get('contentDetails', {}).get('relatedPlaylists', {}).get('uploads')
+                    if uploads and self._channels['uploads'].get(item['id']) != uploads:
+                        self._channels['uploads'][item['id']] = uploads
+                        uploads_changed = True
+            if uploads_changed:
+                with self._lock:
+                    self._save_channels()
+
+        return {cid: self._channel_details[cid] for cid in channel_ids if cid in self._channel_details}
+
+    def uploads_playlist(self, channel_id: str, background: bool = False) -> Optional[str]:
+        """채널의 업로드 재생목록 ID (영구 저장)"""
+        if channel_id not in self._channels['uploads']:
+            self.channel_details([channel_id], background)
+        return self._channels['uploads'].get(channel_id)
+
+    def recent_uploads(self, channel_id: str, published_after: datetime, background: bool = False) -> List[Dict]:
+        """
+        published_after 이후 업로드한 영상 (playlistItems.list)
+
+        업로드 재생목록은 최신순이므로 기준보다 오래된 영상이 나오면 페이지 넘김을 멈춘다.
+        """
+        playlist_id = self.uploads_playlist(channel_id, background)
+        if not playlist_id:
+            return []
+
+        items = []
+        page_token = None
+        while True:
+            response = self._execute('playlistItems', self.service.playlistItems().list(
+                part='snippet,contentDetails',
+                playlistId=playlist_id,
+                maxResults=MAX_IDS_PER_CALL,
+                pageToken=page_token
+            ), background)
+
+            reached_cutoff = False
+            for item in response.get('items', []):
+                published_at = item['contentDetails'].get('videoPublishedAt') or item['snippet']['publishedAt']
+                if datetime.fromisoformat(published_at.replace('Z', '+00:00')) < published_after:
+                    reached_cutoff = True
+                    continue
+                items.append(item)
+
+            page_token = response.get('nextPageToken')
+            if reached_cutoff or not page_token:
+                return items
+
+
+_quota: Optional[QuotaTracker] = None
+_clients: Dict[Optional[str], YouTubeClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_quota_tracker() -> QuotaTracker:
+    """할당량 추적기 (프로세스 공용)"""
+    global _quota
+    with _clients_lock:
+        if _quota is None:
+            _quota = QuotaTracker()
+        return _quota
+
+
+def get_youtube_client(api_key: Optional[str] = None) -> YouTubeClient:
+    """YouTube 클라이언트 (API 키별 프로세스 공용, 할당량과 채널 메모는 공유)"""
+    quota = get_quota_tracker()
+    key = api_key or os.environ.get('YOUTUBE_API_KEY')
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = YouTubeClient(api_key=key, quota=quota)
+            _clients[key] = client
+        return client
+
+
+if __name__ == "__main__":
+    summary = get_quota_tracker().summary()
+    print(f"Date (Pacific): {summary['date']}")
+    print(f"Units used: {summary['units']:,} / {DAILY_QUOTA:,} (remaining {summary['remaining']:,})")
+    print(f"Background allowance now: {summary['background_allowance']:,}")
+    for resource, calls in sorted(summary['calls'].items()):
+        print(f"  {resource:15s} {calls:5d} calls")